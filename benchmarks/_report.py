@@ -0,0 +1,15 @@
+# benchmarks/_report.py
+# 벤치마크 공통 결과 출력
+
+import statistics
+
+
+def summarize(label: str, timings: list[float]) -> None:
+    """측정 결과 요약(ms)을 출력합니다."""
+    ordered = sorted(timings)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    print(
+        f"{label:<10} mean={statistics.mean(timings) * 1000:8.3f}ms "
+        f"median={statistics.median(timings) * 1000:8.3f}ms "
+        f"p95={p95 * 1000:8.3f}ms"
+    )
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# benchmarks/bench_commit_latency.py
+# SQLite PRAGMA 설정(WAL 등) 적용 전후의 로그 저장 커밋 지연 시간 비교
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Any
+
+# 직접 실행 시 패키지 경로 설정
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir)))
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks._report import summarize
+from pacekeeper.database.sqlite_pragmas import DEFAULT_PRAGMAS, apply_sqlite_pragmas
+from pacekeeper.repository.entities import Base, Log
+
+
+def measure_commit_latency(pragmas: dict[str, Any] | None, commits: int) -> list[float]:
+    """
+    임시 데이터베이스에 로그를 한 건씩 저장/커밋하며 커밋당 소요 시간(초)을 측정합니다.
+    pragmas가 None이면 SQLite 기본 설정(rollback journal, synchronous=FULL)을 사용합니다.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_engine(
+            f"sqlite:///{os.path.join(tmp_dir, 'bench.db')}",
+            connect_args={"check_same_thread": False}
+        )
+        if pragmas is not None:
+            event.listen(engine, "connect", lambda conn, _record: apply_sqlite_pragmas(conn, pragmas))
+
+        Base.metadata.create_all(engine)
+        session_factory = sessionmaker(bind=engine)
+
+        timings = []
+        for i in range(commits):
+            now = datetime.now()
+            session = session_factory()
+            start = time.perf_counter()
+            session.add(Log(message=f"#벤치마크 커밋 {i}", tags="[]", started_at=now, ended_at=now))
+            session.commit()
+            timings.append(time.perf_counter() - start)
+            session.close()
+
+        engine.dispose()
+    return timings
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="SQLite 커밋 지연 시간 벤치마크")
+    parser.add_argument("--commits", type=int, default=200, help="측정할 커밋 수 (기본값: 200)")
+    args = parser.parse_args()
+
+    print(f"커밋 {args.commits}회 측정 중...")
+    summarize("before", measure_commit_latency(None, args.commits))
+    summarize("after", measure_commit_latency(DEFAULT_PRAGMAS, args.commits))
+
+
+if __name__ == "__main__":
+    main()
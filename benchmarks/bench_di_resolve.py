@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# benchmarks/bench_di_resolve.py
+# DI 컨테이너 해결(resolve) 벤치마크
+#
+# 1) 트랜지언트 해결 비용: 캐시한 생성 계획 사용 vs 매번 생성자 시그니처를 분석하던 기존 방식
+# 2) 앱 시작 시 서비스 해결: 저장소와 SoundManager를 지연 싱글톤으로 등록했을 때와
+#    모두 즉시 생성했을 때의 해결 시간과 실제 생성된 인스턴스 수
+#
+# 사용 예:
+#   python benchmarks/bench_di_resolve.py --resolves 20000
+
+import argparse
+import inspect
+import os
+import sys
+import tempfile
+import time
+
+# 직접 실행 시 패키지 경로 설정
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir)))
+
+from icecream import ic
+
+from benchmarks._report import summarize
+from pacekeeper.container import DIContainer, ServiceRegistry
+from pacekeeper.utils.app_paths import DATA_DIR_ENV
+
+
+class Config:
+    pass
+
+
+class Repository:
+    def __init__(self, config: Config, name="repo"):
+        self.config = config
+        self.name = name
+
+
+class Service:
+    def __init__(self, repository: Repository, config: Config, retries=3):
+        self.repository = repository
+        self.config = config
+        self.retries = retries
+
+
+def resolve_without_plan(container: DIContainer, interface: type):
+    """기존 방식: 해결할 때마다 inspect.signature로 생성자를 분석"""
+    registration = container._services[interface]
+    if registration.lifecycle == 'singleton':
+        return container.resolve(interface)
+    implementation = registration.implementation
+    signature = inspect.signature(implementation.__init__)
+    kwargs = {}
+    for param_name, param in signature.parameters.items():
+        if param_name == 'self':
+            continue
+        if param.annotation != inspect.Parameter.empty:
+            kwargs[param_name] = resolve_without_plan(container, param.annotation)
+        elif param.default == inspect.Parameter.empty:
+            raise ValueError(f"Cannot resolve dependency: {param_name} in {implementation}")
+    return implementation(**kwargs)
+
+
+def time_resolves(resolve, interface: type, count: int) -> list[float]:
+    """resolve(interface)를 count번 호출하고 호출별 소요 시간(초)을 반환"""
+    timings = []
+    for _ in range(count):
+        start = time.perf_counter()
+        resolve(interface)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def resolve_app_services(lazy: bool) -> tuple[float, int, int]:
+    """
+    main.py와 같은 서비스들을 해결하고 (소요 시간, 해결한 수, 실제 생성된 인스턴스 수) 반환
+
+    Args:
+        lazy: False면 지연 등록을 모두 즉시 생성으로 바꿔 등록
+    """
+    from pacekeeper.controllers.config_controller import ConfigController
+    from pacekeeper.controllers.sound_manager import SoundManager
+    from pacekeeper.database import DatabaseSessionManager
+    from pacekeeper.interfaces.services.i_category_service import ICategoryService
+    from pacekeeper.interfaces.services.i_log_service import ILogService
+    from pacekeeper.interfaces.services.i_stats_service import IStatsService
+    from pacekeeper.interfaces.services.i_tag_service import ITagService
+
+    container = DIContainer()
+    ServiceRegistry.register_all_services(container)
+    if not lazy:
+        for interface, registration in list(container._services.items()):
+            if registration.lazy:
+                container.register_singleton(interface, registration.implementation)
+
+    interfaces = (ConfigController, DatabaseSessionManager, ICategoryService, ILogService,
+                  ITagService, IStatsService, SoundManager)
+    start = time.perf_counter()
+    for interface in interfaces:
+        container.resolve(interface)
+    elapsed = time.perf_counter() - start
+
+    # 지연 싱글톤 프록시는 _proxies에만 있으므로 _singletons에는 실제 생성된 인스턴스만 있음
+    created = len(container._singletons)
+    container.resolve(DatabaseSessionManager).close_all_sessions()
+    return elapsed, len(interfaces), created
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="DI 컨테이너 해결 벤치마크")
+    parser.add_argument("--resolves", type=int, default=20000, help="트랜지언트 해결 횟수 (기본값: 20000)")
+    args = parser.parse_args()
+
+    ic.disable()
+
+    container = DIContainer()
+    container.register_singleton(Config, Config)
+    container.register_transient(Repository, Repository)
+    container.register_transient(Service, Service)
+
+    baseline = time_resolves(lambda interface: resolve_without_plan(container, interface), Service, args.resolves)
+    summarize("resolve (매번 시그니처 분석)", baseline)
+    planned = time_resolves(container.resolve, Service, args.resolves)
+    summarize("resolve (생성 계획 캐시)", planned)
+    print(f"[트랜지언트] {args.resolves}회 해결: {sum(baseline) * 1000:.1f}ms → {sum(planned) * 1000:.1f}ms "
+          f"({sum(baseline) / sum(planned):.1f}배)")
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        from pacekeeper.database import DatabaseSessionManager
+
+        os.environ[DATA_DIR_ENV] = data_dir
+        # 데이터베이스 경로는 모듈 임포트 시 정해지므로 싱글톤을 임시 DB로 먼저 생성
+        DatabaseSessionManager(f"sqlite:///{os.path.join(data_dir, 'bench.db')}")
+        # 모듈 임포트와 데이터베이스 파일 생성 비용이 비교에 섞이지 않도록 한 번 미리 실행
+        resolve_app_services(lazy=False)
+        eager_time, resolved, eager_created = resolve_app_services(lazy=False)
+        lazy_time, _, lazy_created = resolve_app_services(lazy=True)
+        print(f"[앱 시작] 서비스 {resolved}개 해결: 즉시 생성 {eager_time * 1000:.2f}ms (인스턴스 {eager_created}개)  "
+              f"지연 싱글톤 {lazy_time * 1000:.2f}ms (인스턴스 {lazy_created}개)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# benchmarks/bench_event_bus.py
+# 설정 변경 알림(EventBus) 마이크로 벤치마크
+#
+# 수백 개의 구독자가 각자 설정 키 하나를 관찰할 때, 설정 하나를 바꾸는 비용을
+# 모든 옵저버를 호출하던 기존 리스트 방식과 비교하고, 한 차례에 몰린 변경이 묶여 전달되는지 확인합니다.
+#
+# 사용 예:
+#   python benchmarks/bench_event_bus.py --subscribers 500 --changes 10000
+
+import argparse
+import gc
+import os
+import sys
+import time
+from typing import Any
+
+# 직접 실행 시 패키지 경로 설정
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir)))
+
+from icecream import ic
+
+from pacekeeper.services.settings_schema import SETTING_KEYS
+from pacekeeper.utils.event_bus import EventBus
+
+
+class Subscriber:
+    """설정 키 하나에만 관심이 있는 구독자 (다이얼로그 위젯 등)"""
+
+    def __init__(self, key: str) -> None:
+        self.key = key
+        self.calls = 0
+
+    def on_settings_changed(self, key: str, old_value: Any, new_value: Any) -> None:
+        self.calls += 1
+
+
+class ListObservers:
+    """기존 방식: 옵저버 리스트에 강한 참조로 보관하고 모든 변경을 모든 옵저버에게 전달"""
+
+    def __init__(self) -> None:
+        self._observers: list[Subscriber] = []
+
+    def add_observer(self, observer: Subscriber) -> None:
+        if observer not in self._observers:
+            self._observers.append(observer)
+
+    def notify(self, key: str, old_value: Any, new_value: Any) -> None:
+        for observer in self._observers:
+            observer.on_settings_changed(key, old_value, new_value)
+
+
+def time_call(fn, *args) -> float:
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="설정 변경 알림 버스 마이크로 벤치마크")
+    parser.add_argument("--subscribers", type=int, default=500, help="구독자 수 (기본값: 500)")
+    parser.add_argument("--changes", type=int, default=10000, help="설정 변경 횟수 (기본값: 10000)")
+    args = parser.parse_args()
+
+    ic.disable()
+    keys = sorted(SETTING_KEYS)
+    subscribers = [Subscriber(keys[i % len(keys)]) for i in range(args.subscribers)]
+    changed_keys = [keys[i % len(keys)] for i in range(args.changes)]
+    print(f"구독자 {args.subscribers}개 (설정 키 {len(keys)}개에 분산), 변경 {args.changes}회")
+
+    # 구독 등록 비용 (리스트는 중복 확인이 O(n))
+    observers = ListObservers()
+    list_add = time_call(lambda: [observers.add_observer(s) for s in subscribers])
+    bus = EventBus()
+    bus_add = time_call(lambda: [bus.subscribe(s.key, s.on_settings_changed) for s in subscribers])
+    print(f"[등록] 리스트 {list_add * 1000:8.2f}ms  버스 {bus_add * 1000:8.2f}ms")
+
+    # 변경 전달 비용 (즉시 전달)
+    def notify_all(notify):
+        for i, key in enumerate(changed_keys):
+            notify(key, i, i + 1)
+
+    for subscriber in subscribers:
+        subscriber.calls = 0
+    list_time = time_call(notify_all, observers.notify)
+    list_calls = sum(s.calls for s in subscribers)
+
+    for subscriber in subscribers:
+        subscriber.calls = 0
+    bus_time = time_call(notify_all, bus.publish)
+    bus_calls = sum(s.calls for s in subscribers)
+    print(f"[전달] 리스트 {list_time * 1000:8.2f}ms (콜백 {list_calls}회)  "
+          f"버스 {bus_time * 1000:8.2f}ms (콜백 {bus_calls}회)  {list_time / bus_time:.1f}배")
+
+    # 한 차례에 몰린 변경 묶음 전달 (scheduler가 예약한 flush를 직접 호출)
+    scheduled = []
+    batched = EventBus(scheduler=scheduled.append)
+    for subscriber in subscribers:
+        batched.subscribe(subscriber.key, subscriber.on_settings_changed)
+        subscriber.calls = 0
+    batch_time = time_call(notify_all, batched.publish)
+    for flush in scheduled:
+        batch_time += time_call(flush)
+    batch_calls = sum(s.calls for s in subscribers)
+    print(f"[묶음] 예약 {len(scheduled)}회, {batch_time * 1000:8.2f}ms (콜백 {batch_calls}회, "
+          f"키당 구독자에게 한 번씩)")
+
+    # 사라진 구독자는 구독 해제 없이 제거됨 (리스트 방식은 강한 참조로 구독자를 계속 붙잡고 있음)
+    kept = len(observers._observers)
+    del observers, subscriber
+    subscribers.clear()
+    gc.collect()
+    remaining = sum(bus.subscriber_count(key) for key in keys)
+    print(f"[약한 참조] 구독자 삭제 후 남은 구독 {remaining}개 (리스트 방식은 {kept}개 유지)")
+
+
+if __name__ == "__main__":
+    main()
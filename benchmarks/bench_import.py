@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# benchmarks/bench_import.py
+# 로그 일괄 가져오기(LogService.import_logs) 처리량 벤치마크
+#
+# 합성 로그 파일을 만든 뒤 빈 임시 DB로 가져오는 시간을 측정하고,
+# 로그를 한 개씩 저장하는 기존 경로(create_study_log와 같은 트랜잭션 구성)와 처리량을 비교합니다.
+#
+# 사용 예:
+#   python benchmarks/bench_import.py --rows 100000
+#   python benchmarks/bench_import.py --rows 100000 --format jsonl
+
+import argparse
+import csv
+import json
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+# 직접 실행 시 패키지 경로 설정
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir)))
+
+from icecream import ic
+
+from benchmarks.bench_logger_overhead import configure_logger
+from create_dummy_data import ACTIVITIES, CATEGORIES, LOG_MESSAGE_TEMPLATES, TAG_WORDS
+
+# 가져오기 목표 시간(초)과 기준 행 수
+TARGET_SECONDS = 10
+TARGET_ROWS = 100000
+
+
+def write_import_file(path: str, num_rows: int, import_format: str, seed: int = 42) -> None:
+    """
+    다른 시간 기록 앱의 내보내기와 비슷한 합성 로그 파일 생성
+    (CSV는 Description / Start date / Start time / Duration / Tags 컬럼, JSONL은 이 앱의 내보내기 형식)
+    """
+    rng = random.Random(seed)
+    vocabulary = list(dict.fromkeys(word for words in TAG_WORDS.values() for word in words))
+    current = datetime.now().replace(microsecond=0) - timedelta(minutes=60 * num_rows)
+
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        writer = None
+        if import_format == "csv":
+            writer = csv.writer(file)
+            writer.writerow(["Description", "Start date", "Start time", "Duration", "Tags"])
+
+        for _ in range(num_rows):
+            tags = rng.sample(vocabulary, rng.randint(0, 3))
+            message = rng.choice(LOG_MESSAGE_TEMPLATES).format(
+                tag1=f"#{tags[0]}" if tags else rng.choice(vocabulary),
+                tag2=rng.choice(vocabulary),
+                activity=rng.choice(ACTIVITIES[rng.choice(CATEGORIES)["name"]])
+            )
+            current += timedelta(minutes=rng.randint(30, 90))
+            minutes = rng.randint(15, 60)
+
+            if writer is not None:
+                # 첫 번째 태그는 메시지에, 나머지는 Tags 컬럼에만 기록
+                writer.writerow([
+                    message, current.strftime("%Y-%m-%d"), current.strftime("%H:%M:%S"),
+                    f"{minutes // 60:02d}:{minutes % 60:02d}:00", ", ".join(tags[1:])
+                ])
+            else:
+                file.write(json.dumps({
+                    "started_at": current.isoformat(sep=" "),
+                    "ended_at": (current + timedelta(minutes=minutes)).isoformat(sep=" "),
+                    "message": message,
+                    "tags": tags,
+                }, ensure_ascii=False) + "\n")
+
+
+def per_row_import(log_service, path: str, import_format: str, num_rows: int) -> int:
+    """
+    기존 방식: 한 행마다 트랜잭션 하나로 태그 조회/생성, 로그 저장, 통계 갱신 (create_study_log와 같은 구성)
+    """
+    from itertools import islice
+
+    from pacekeeper.database import UnitOfWork
+    from pacekeeper.repository.entities import Log
+    from pacekeeper.services.log_import import iter_records, record_to_log
+    from pacekeeper.utils.functions import extract_tags
+
+    saved = 0
+    with open(path, encoding="utf-8-sig", newline="") as file:
+        for record in islice(iter_records(file, import_format), num_rows):
+            log = record_to_log(record) if record else None
+            if log is None:
+                continue
+            with UnitOfWork() as uow:
+                tag_ids = log_service.tag_repo.ensure_tags(extract_tags(log.message), uow.session)
+                new_log = Log(started_at=log.started_at, ended_at=log.ended_at, message=log.message, tags=json.dumps(tag_ids))
+                log_service.repository.save_log(new_log, uow.session)
+                log_service.stats_repo.add_logs([new_log.id], uow.session)
+            saved += 1
+    return saved
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="로그 일괄 가져오기 처리량 벤치마크")
+    parser.add_argument("--rows", type=int, default=TARGET_ROWS, help=f"가져올 행 수 (기본값: {TARGET_ROWS})")
+    parser.add_argument("--format", choices=("csv", "jsonl"), default="csv", help="파일 형식 (기본값: csv)")
+    parser.add_argument("--baseline-rows", type=int, default=1000, help="기존 방식으로 저장할 행 수 (기본값: 1000, 0이면 생략)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # 사용자 로그 파일과 디버그 출력에 벤치마크 기록이 남지 않도록 비활성화
+        configure_logger(logging.getLogger("PaceKeeper"), "disabled", os.path.join(tmp_dir, "bench.log"))
+        ic.disable()
+
+        from pacekeeper.database import DatabaseSessionManager
+        from pacekeeper.repository.log_repository import LogRepository
+        from pacekeeper.repository.stats_repository import StatsRepository
+        from pacekeeper.repository.tag_repository import TagRepository
+        from pacekeeper.services.log_service import LogService
+
+        path = os.path.join(tmp_dir, f"import.{args.format}")
+        start = time.perf_counter()
+        write_import_file(path, args.rows, args.format)
+        print(f"가져올 파일 생성 {time.perf_counter() - start:.1f}s: {args.rows}행, {os.path.getsize(path) / 1e6:.1f}MB")
+
+        session_manager = DatabaseSessionManager(f"sqlite:///{os.path.join(tmp_dir, 'bench.db')}")
+        log_service = LogService(LogRepository(session_manager), TagRepository(session_manager), StatsRepository(session_manager))
+
+        start = time.perf_counter()
+        result = log_service.import_logs(path, args.format)
+        elapsed = time.perf_counter() - start
+        print(f"일괄 가져오기: {result}")
+        print(f"일괄 가져오기 {elapsed:.2f}s ({result.imported / elapsed:,.0f}행/s)")
+
+        # 같은 파일을 다시 가져오면 모두 중복으로 건너뜀
+        start = time.perf_counter()
+        again = log_service.import_logs(path, args.format)
+        print(f"재가져오기(중복 확인) {time.perf_counter() - start:.2f}s: {again}")
+
+        if args.baseline_rows:
+            # 일괄 가져오기와 겹치지 않도록 다른 시드의 파일 사용
+            baseline_path = os.path.join(tmp_dir, f"baseline.{args.format}")
+            write_import_file(baseline_path, args.baseline_rows, args.format, seed=7)
+            start = time.perf_counter()
+            saved = per_row_import(log_service, baseline_path, args.format, args.baseline_rows)
+            baseline_elapsed = time.perf_counter() - start
+            print(f"한 행씩 저장 {baseline_elapsed:.2f}s ({saved / baseline_elapsed:,.0f}행/s, {saved}행)")
+
+        # 목표: 10만 행을 10초 안에 (행 수가 다르면 같은 처리량으로 환산)
+        budget = TARGET_SECONDS * args.rows / TARGET_ROWS
+        verdict = "통과" if elapsed < budget else "초과"
+        print(f"일괄 가져오기 {elapsed:.2f}s (목표 {budget:.1f}s 미만): {verdict}")
+
+        session_manager.engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# benchmarks/bench_logger_overhead.py
+# DesktopLogger 기록 방식(비활성 / 동기 파일 기록 / 큐 기반 비동기 기록)에 따른 Repository 호출 지연 시간 비교
+
+import argparse
+import logging
+import logging.handlers
+import os
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import datetime
+
+# 직접 실행 시 패키지 경로 설정
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir)))
+
+from benchmarks._report import summarize
+from pacekeeper.utils.desktop_logger import DesktopLogger, install_queue_logging, shutdown_queue_logging
+
+LOGGER_MODES = ("disabled", "sync", "async")
+
+
+def configure_logger(logger: logging.Logger, mode: str, log_file: str) -> None:
+    """
+    벤치마크용으로 "PaceKeeper" 로거의 기록 방식을 설정합니다.
+    (사용자 로그 디렉토리 대신 임시 파일에 기록)
+    """
+    shutdown_queue_logging(logger)
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    logger.disabled = mode == "disabled"
+
+    handler = logging.handlers.RotatingFileHandler(log_file, maxBytes=1024 * 1024, backupCount=7, encoding="utf-8")
+    handler.setFormatter(logging.Formatter('%(asctime)s [%(levelname)s] %(message)s'))
+    if mode == "async":
+        install_queue_logging(logger, handler)
+    else:
+        logger.addHandler(handler)
+
+
+def measure(call: Callable[[], object], repeat: int) -> list[float]:
+    """call을 repeat회 실행하며 호출당 소요 시간(초)을 측정합니다."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="로거 설정별 Repository 호출 지연 시간 벤치마크")
+    parser.add_argument("--repeat", type=int, default=500, help="작업별 호출 횟수 (기본값: 500)")
+    parser.add_argument("--rows", type=int, default=1000, help="미리 넣어 둘 로그 수 (기본값: 1000)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        logger = logging.getLogger("PaceKeeper")
+        log_file = os.path.join(tmp_dir, "bench.log")
+        # DesktopLogger가 사용자 로그 파일을 열지 않도록 먼저 핸들러를 설정
+        configure_logger(logger, "disabled", log_file)
+
+        from pacekeeper.database import DatabaseSessionManager
+        from pacekeeper.repository.entities import Log
+        from pacekeeper.repository.log_repository import LogRepository
+
+        session_manager = DatabaseSessionManager(f"sqlite:///{os.path.join(tmp_dir, 'bench.db')}")
+        repository = LogRepository(session_manager)
+        now = datetime.now()
+        for i in range(args.rows):
+            repository.save_log(Log(message=f"벤치마크 로그 {i}", tags="[]", started_at=now, ended_at=now))
+
+        desktop_logger = DesktopLogger("PaceKeeper")
+        operations: dict[str, Callable[[], object]] = {
+            "log_system_event": lambda: desktop_logger.log_system_event("벤치마크 이벤트"),
+            "get_recent_logs": lambda: repository.get_recent_logs(20),
+            "get_logs_page": lambda: repository.get_logs_page(None, None, 100),
+            "save_log": lambda: repository.save_log(
+                Log(message="#벤치마크 저장", tags="[]", started_at=now, ended_at=now)
+            ),
+        }
+
+        print(f"로그 {args.rows}건, 작업별 {args.repeat}회 호출")
+        for name, call in operations.items():
+            print(f"[{name}]")
+            for mode in LOGGER_MODES:
+                configure_logger(logger, mode, log_file)
+                summarize(mode, measure(call, args.repeat))
+
+        shutdown_queue_logging(logger)
+        session_manager.engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# benchmarks/bench_query_counts.py
+# UI 동작별 SQL 문장 수 측정 및 허용 개수(statement budget) 확인
+#
+# 합성 데이터가 들어 있는 임시 데이터베이스로 메인 윈도우를 만들고, 최근 로그 갱신과
+# 로그/통계 다이얼로그 열기가 실행하는 문장 수를 저장소 메서드별로 보고합니다.
+# 동작별 허용 개수를 넘으면 실행된 문장 목록을 출력하고 종료 코드 1로 끝납니다.
+#
+# 사용 예:
+#   python benchmarks/bench_query_counts.py --logs 2000
+
+import argparse
+import os
+import sys
+import tempfile
+
+# 직접 실행 시 패키지 경로 설정
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir)))
+
+from icecream import ic
+
+from pacekeeper.utils.app_paths import DATA_DIR_ENV
+
+# 동작별 허용 문장 수 (결과 콜백이 이어서 제출한 조회 포함)
+ACTION_BUDGETS: dict[str, int] = {
+    "recent_logs": 3,
+    "LogDialog": 2,
+    "StatsDialog": 2,
+}
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="UI 동작별 SQL 문장 수 측정")
+    parser.add_argument("--logs", type=int, default=2000, help="생성할 로그 수 (기본값: 2000)")
+    args = parser.parse_args()
+
+    ic.disable()
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        # 데이터베이스 경로는 모듈 임포트 시 정해지므로 환경 변수를 먼저 설정
+        os.environ[DATA_DIR_ENV] = data_dir
+
+        from PyQt5.QtWidgets import QApplication
+
+        from benchmarks.dataset import generate_dataset
+        from pacekeeper.database import DatabaseSessionManager, StatementBudget, StatementBudgetExceeded, query_action
+        from pacekeeper.main import create_main_window
+        from pacekeeper.views.log_dialog import LogDialog
+        from pacekeeper.views.stats_dialog import StatsDialog
+
+        session_manager = DatabaseSessionManager()
+        generate_dataset(session_manager, args.logs)
+
+        app = QApplication(sys.argv)
+        window = create_main_window(app)
+        controller = window.main_controller
+        db_worker = controller.db_worker
+
+        def settle() -> None:
+            """작업 스레드의 조회와 결과 콜백이 이어서 제출한 조회까지 모두 끝날 때까지 대기"""
+            while db_worker._pending:
+                db_worker.wait_for_done()
+                app.processEvents()
+
+        settle()
+
+        def run(action: str, open_dialog=None) -> None:
+            """동작 하나를 실행하고 작업 스레드의 조회까지 끝난 뒤 문장 수 확인"""
+            budget = StatementBudget(session_manager.engine, ACTION_BUDGETS[action], action)
+            with budget:
+                if open_dialog is None:
+                    controller.refresh_recent_logs()
+                else:
+                    with query_action(action):
+                        dialog = open_dialog()
+                settle()
+            print(budget.report(f"{action} (허용 {budget.max_statements}개)"))
+            if open_dialog is not None:
+                dialog.deleteLater()
+
+        actions = (
+            ("recent_logs", None),
+            ("LogDialog", lambda: LogDialog(window, controller.config_ctrl, controller.log_service,
+                                            controller.tag_service, db_worker)),
+            ("StatsDialog", lambda: StatsDialog(window, controller.config_ctrl, controller.stats_service,
+                                                controller.tag_service, controller.category_service, db_worker)),
+        )
+        failed = False
+        for action, open_dialog in actions:
+            try:
+                run(action, open_dialog)
+            except StatementBudgetExceeded as e:
+                print(f"허용 개수 초과: {e}")
+                failed = True
+
+        session_manager.close_all_sessions()
+        if failed:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
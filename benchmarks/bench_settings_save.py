@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# benchmarks/bench_settings_save.py
+# 설정 저장(SettingsManager) 벤치마크
+#
+# set_setting을 연속으로 호출했을 때(설정 다이얼로그 저장, 볼륨 슬라이더 드래그 등)
+# 호출 시간과 실제 파일 기록 횟수를 측정하고, 매 호출마다 파일 전체를 다시 쓰는 방식과 비교합니다.
+#
+# 사용 예:
+#   python benchmarks/bench_settings_save.py --calls 1000
+#   python benchmarks/bench_settings_save.py --calls 1000 --interval-ms 2
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+# 직접 실행 시 패키지 경로 설정
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir)))
+
+from icecream import ic
+
+from benchmarks._report import summarize
+from pacekeeper.consts.settings import SET_ALARM_VOLUME
+from pacekeeper.services.settings_manager import SETTINGS_SAVE_MAX_DELAY_SECONDS, SettingsManager
+from pacekeeper.utils.app_paths import DATA_DIR_ENV
+
+
+def run_calls(manager: SettingsManager, calls: int, interval: float, save_each: bool) -> list[float]:
+    """
+    볼륨 값을 바꾸며 set_setting을 calls번 호출하고 호출별 소요 시간(초)을 반환
+
+    Args:
+        manager: 설정 관리자
+        calls: 호출 횟수
+        interval: 호출 사이 간격(초) - 슬라이더 드래그처럼 시간에 걸쳐 변경되는 경우
+        save_each: True면 매 호출 후 save_settings()로 즉시 저장 (기존 방식)
+    """
+    timings = []
+    for i in range(calls):
+        start = time.perf_counter()
+        manager.set_setting(SET_ALARM_VOLUME, i % 101)
+        if save_each:
+            manager.save_settings()
+        timings.append(time.perf_counter() - start)
+        if interval:
+            time.sleep(interval)
+    return timings
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="설정 지연 저장 벤치마크")
+    parser.add_argument("--calls", type=int, default=1000, help="set_setting 호출 횟수 (기본값: 1000)")
+    parser.add_argument("--interval-ms", type=float, default=0.0, help="호출 사이 간격(ms) (기본값: 0)")
+    parser.add_argument("--delay", type=float, default=0.5, help="지연 저장 대기 시간(초) (기본값: 0.5)")
+    args = parser.parse_args()
+
+    ic.disable()
+    interval = args.interval_ms / 1000
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        os.environ[DATA_DIR_ENV] = data_dir
+
+        # 기존 방식: 매 호출마다 config.json 전체를 다시 씀
+        manager = SettingsManager(save_delay=args.delay)
+        baseline_writes = manager.save_count
+        timings = run_calls(manager, args.calls, interval, save_each=True)
+        print(f"[매 호출 즉시 저장] 파일 기록 {manager.save_count - baseline_writes}회")
+        summarize("set_setting + save_settings", timings)
+
+        # 지연 저장: 변경은 메모리에만 반영하고 저장 스레드가 합쳐서 기록
+        manager = SettingsManager(save_delay=args.delay)
+        baseline_writes = manager.save_count
+        started = time.perf_counter()
+        timings = run_calls(manager, args.calls, interval, save_each=False)
+        elapsed = time.perf_counter() - started
+        summarize("set_setting (지연 저장)", timings)
+
+        # 마지막 변경 후 대기 시간이 지나 저장될 때까지 기다린 뒤 종료 시 flush
+        time.sleep(args.delay + 0.2)
+        manager.flush()
+        writes = manager.save_count - baseline_writes
+        # 변경이 이어지는 동안은 최대 대기 시간마다 한 번, 마지막 변경 후 한 번 저장
+        bound = int(elapsed // SETTINGS_SAVE_MAX_DELAY_SECONDS) + 1
+        print(f"[지연 저장] 호출 {args.calls}회 ({elapsed:.2f}s) → 파일 기록 {writes}회 (상한 {bound}회)")
+
+        reloaded = SettingsManager(save_delay=args.delay)
+        expected = (args.calls - 1) % 101
+        saved = reloaded.get_setting(SET_ALARM_VOLUME)
+        print(f"저장된 마지막 값: {saved} (기대값 {expected})")
+        if writes > bound or saved != expected:
+            print("경고: 파일 기록 횟수가 상한을 넘었거나 마지막 값이 저장되지 않았습니다.")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# benchmarks/bench_startup.py
+# 앱 시작 시간(프로세스 시작 → 메인 윈도우 첫 표시) 측정 및 python -X importtime 기반 임포트 시간 분석
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+# 직접 실행 시 패키지 경로 설정
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir)))
+
+from benchmarks._report import summarize
+from pacekeeper.utils.app_paths import DATA_DIR_ENV
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+
+# 자식 프로세스가 메인 윈도우를 표시한 뒤 출력하는 표식
+READY_MARKER = "STARTUP_READY"
+
+# 시작 시 임포트되지 않아야 하는 모듈 (처음 사용할 때 임포트)
+LAZY_MODULES = (
+    "pacekeeper.views.log_dialog",
+    "pacekeeper.views.category_dialog",
+    "pacekeeper.views.settings_dialog",
+    "pacekeeper.views.stats_dialog",
+    "pacekeeper.views.log_export_task",
+    "pacekeeper.views.log_import_task",
+    "PyQt5.QtMultimedia",
+)
+
+# 자식 프로세스에서 실행할 코드: main()과 같은 순서로 메인 윈도우를 만들고 표시한 뒤 종료
+CHILD_CODE = f"""
+import sys
+from PyQt5.QtWidgets import QApplication
+from pacekeeper.main import create_main_window
+app = QApplication(sys.argv)
+window = create_main_window(app)
+window.show()
+app.processEvents()
+print("{READY_MARKER}", flush=True)
+print("LAZY_LOADED=" + ",".join(name for name in {LAZY_MODULES!r} if name in sys.modules), flush=True)
+app.quit()
+"""
+
+
+def build_child_env(home_dir: str, offscreen: bool) -> dict[str, str]:
+    """
+    자식 프로세스 환경 변수 구성
+    (설정, 데이터베이스, 디버그 로그가 모두 임시 홈 디렉토리에 기록되도록 함)
+    """
+    env = dict(os.environ)
+    env["HOME"] = home_dir
+    env["USERPROFILE"] = home_dir
+    env[DATA_DIR_ENV] = os.path.join(home_dir, "data")
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [PROJECT_ROOT, env.get("PYTHONPATH")]))
+    if offscreen:
+        env["QT_QPA_PLATFORM"] = "offscreen"
+    return env
+
+
+def run_child(env: dict[str, str], importtime: bool) -> tuple[float, str, str]:
+    """
+    자식 프로세스로 앱을 시작하여 메인 윈도우가 표시될 때까지 걸린 시간을 측정합니다.
+
+    Args:
+        env: 자식 프로세스 환경 변수
+        importtime: True면 -X importtime으로 실행 (측정값에 오버헤드 포함)
+
+    Returns:
+        (소요 시간(초), 표준 출력, 표준 에러)
+    """
+    command = [sys.executable]
+    if importtime:
+        command += ["-X", "importtime"]
+    command += ["-c", CHILD_CODE]
+
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        command, cwd=PROJECT_ROOT, env=env, text=True, encoding="utf-8",
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE
+    )
+    elapsed = None
+    stdout_lines = []
+    for line in process.stdout:
+        if elapsed is None and line.strip() == READY_MARKER:
+            elapsed = time.perf_counter() - start
+        stdout_lines.append(line)
+    stderr = process.stderr.read()
+    process.wait()
+
+    if elapsed is None or process.returncode != 0:
+        raise RuntimeError(f"앱 시작 실패 (종료 코드 {process.returncode}):\n{stderr[-2000:]}")
+    return elapsed, "".join(stdout_lines), stderr
+
+
+def parse_importtime(stderr: str) -> list[tuple[str, int, int]]:
+    """
+    -X importtime 출력에서 (모듈 이름, self(us), cumulative(us)) 목록을 추출합니다.
+    모듈 이름 앞의 공백(중첩 깊이)은 유지합니다.
+    """
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|", 2)
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # 헤더 행
+        entries.append((parts[2].rstrip()[1:], int(parts[0]), int(parts[1])))
+    return entries
+
+
+def print_import_report(entries: list[tuple[str, int, int]], top: int) -> None:
+    """임포트 시간 합계와 누적 시간 상위 모듈 출력"""
+    total_ms = sum(self_us for _, self_us, _ in entries) / 1000
+    print(f"임포트 모듈 {len(entries)}개, 합계 {total_ms:.1f}ms")
+
+    print(f"[최상위 임포트 누적 시간 상위 {top}개]")
+    top_level = [entry for entry in entries if not entry[0].startswith(" ")]
+    for name, _, cumulative_us in sorted(top_level, key=lambda entry: entry[2], reverse=True)[:top]:
+        print(f"  {cumulative_us / 1000:8.1f}ms  {name}")
+
+    print(f"[pacekeeper 모듈 누적 시간 상위 {top}개]")
+    own: dict[str, int] = {}
+    for name, _, cumulative_us in entries:
+        name = name.strip()
+        if name.startswith("pacekeeper"):
+            own[name] = max(own.get(name, 0), cumulative_us)
+    for name, cumulative_us in sorted(own.items(), key=lambda item: item[1], reverse=True)[:top]:
+        print(f"  {cumulative_us / 1000:8.1f}ms  {name}")
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="앱 시작 시간(첫 윈도우 표시까지) 벤치마크")
+    parser.add_argument("--repeat", type=int, default=10, help="시작 시간 측정 횟수 (기본값: 10)")
+    parser.add_argument("--top", type=int, default=15, help="출력할 임포트 상위 모듈 수 (기본값: 15)")
+    parser.add_argument("--show", action="store_true", help="offscreen 대신 실제 화면에 윈도우 표시")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as home_dir:
+        # main.py의 디버그 로그 경로(~/Desktop) 생성
+        os.makedirs(os.path.join(home_dir, "Desktop"), exist_ok=True)
+        env = build_child_env(home_dir, offscreen=not args.show)
+
+        # 첫 실행은 .pyc 생성, 데이터베이스 마이그레이션 등이 포함되므로 측정에서 제외
+        run_child(env, importtime=False)
+
+        timings = [run_child(env, importtime=False)[0] for _ in range(args.repeat)]
+        print(f"시작 시간 {args.repeat}회 측정 (프로세스 시작 → 메인 윈도우 표시)")
+        summarize("startup", timings)
+
+        _, stdout, stderr = run_child(env, importtime=True)
+        print_import_report(parse_importtime(stderr), args.top)
+
+        lazy_line = next((line for line in stdout.splitlines() if line.startswith("LAZY_LOADED=")), "")
+        eager = [name for name in lazy_line.partition("=")[2].split(",") if name]
+        if eager:
+            print(f"경고: 처음 사용할 때 임포트되어야 할 모듈이 시작 시 임포트됨: {', '.join(eager)}")
+        else:
+            print("지연 임포트 대상 모듈이 시작 시 임포트되지 않음: " + ", ".join(LAZY_MODULES))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# benchmarks/bench_stats_dashboard.py
+# 통계 대시보드(최근 1년 히트맵, 태그/카테고리별 합계, 연속 기록) 계산 시간 벤치마크
+#
+# daily_stats 컬럼 배열 기반 집계와, 기간 내 로그 ORM 객체를 모두 읽어 파이썬에서 합산하는
+# 기존 방식을 같은 데이터로 비교합니다.
+#
+# 사용 예:
+#   python benchmarks/bench_stats_dashboard.py --logs 100000
+
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+
+# 직접 실행 시 패키지 경로 설정
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir)))
+
+from icecream import ic
+
+from benchmarks._report import summarize
+from benchmarks.bench_logger_overhead import configure_logger
+
+# 대시보드 계산 목표 시간(ms)
+TARGET_MS = 100
+
+
+def orm_dashboard(log_repo, tag_repo, start_day: date, end_day: date) -> dict:
+    """
+    기존 방식: 기간 내 로그를 모두 ORM 객체로 읽고 태그 JSON을 파싱하여 합산
+    """
+    categories = {tag.id: tag.category_id for tag in tag_repo.get_tags()}
+    daily_seconds: dict[date, int] = defaultdict(int)
+    tag_seconds: dict[int, int] = defaultdict(int)
+    category_seconds: dict[int, int] = defaultdict(int)
+    for log in log_repo.get_logs_by_period(start_day.isoformat(), end_day.isoformat()):
+        seconds = int((log.ended_at - log.started_at).total_seconds()) if log.ended_at else 0
+        daily_seconds[log.started_at.date()] += seconds
+        tag_ids = set(json.loads(log.tags)) if log.tags else set()
+        for tag_id in tag_ids:
+            tag_seconds[tag_id] += seconds
+        for category_id in {categories.get(tag_id, 0) for tag_id in tag_ids} - {0}:
+            category_seconds[category_id] += seconds
+    return {"daily": daily_seconds, "tags": tag_seconds, "categories": category_seconds}
+
+
+def measure(call, repeat: int) -> list[float]:
+    """call을 한 번 예열 호출한 뒤 repeat회 실행한 소요 시간(초) 목록"""
+    call()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="통계 대시보드 계산 시간 벤치마크")
+    parser.add_argument("--logs", type=int, default=100000, help="생성할 로그 수 (기본값: 100000)")
+    parser.add_argument("--repeat", type=int, default=20, help="측정 횟수 (기본값: 20)")
+    parser.add_argument("--baseline-repeat", type=int, default=3, help="기존 방식 측정 횟수 (기본값: 3)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # 사용자 로그 파일과 디버그 출력에 벤치마크 기록이 남지 않도록 비활성화
+        configure_logger(logging.getLogger("PaceKeeper"), "disabled", os.path.join(tmp_dir, "bench.log"))
+        ic.disable()
+
+        from benchmarks.dataset import generate_dataset
+        from pacekeeper.database import DatabaseSessionManager
+        from pacekeeper.repository.log_repository import LogRepository
+        from pacekeeper.repository.stats_repository import StatsRepository
+        from pacekeeper.repository.tag_repository import TagRepository
+        from pacekeeper.services.stats_aggregation import aggregate_dashboard
+        from pacekeeper.services.stats_service import DASHBOARD_DAYS, StatsService
+
+        session_manager = DatabaseSessionManager(f"sqlite:///{os.path.join(tmp_dir, 'bench.db')}")
+        row_counts = generate_dataset(session_manager, args.logs)
+        print(f"데이터 생성 완료: {row_counts}")
+
+        stats_repo = StatsRepository(session_manager)
+        stats_service = StatsService(stats_repo)
+        log_repo = LogRepository(session_manager)
+        tag_repo = TagRepository(session_manager)
+
+        end_day = datetime.now().date()
+        start_day = end_day - timedelta(days=DASHBOARD_DAYS - 1)
+        columns = stats_repo.get_daily_columns(start_day, end_day)
+        dashboard = stats_service.get_dashboard(start_day, end_day)
+        print(
+            f"기간 {start_day} ~ {end_day}: daily_stats {len(columns)}행, 세션 {dashboard.sessions}, "
+            f"태그 {len(dashboard.tag_totals)}, 카테고리 {len(dashboard.category_totals)}, "
+            f"연속 기록 {dashboard.current_streak}/{dashboard.longest_streak}일"
+        )
+
+        full_timings = measure(lambda: stats_service.get_dashboard(start_day, end_day), args.repeat)
+        summarize("dashboard", full_timings)
+        summarize("fetch", measure(lambda: stats_repo.get_daily_columns(start_day, end_day), args.repeat))
+        summarize("aggregate", measure(lambda: aggregate_dashboard(columns, start_day, end_day), args.repeat))
+        orm_timings = measure(lambda: orm_dashboard(log_repo, tag_repo, start_day, end_day), args.baseline_repeat)
+        summarize("orm", orm_timings)
+
+        # 두 방식의 집중 시간 합계가 같은지 확인
+        baseline = orm_dashboard(log_repo, tag_repo, start_day, end_day)
+        if sum(baseline["daily"].values()) != dashboard.focus_seconds:
+            print("경고: 기존 방식과 대시보드의 집중 시간 합계가 다릅니다.")
+
+        median_ms = sorted(full_timings)[len(full_timings) // 2] * 1000
+        verdict = "통과" if median_ms < TARGET_MS else "초과"
+        print(f"대시보드 median {median_ms:.1f}ms (목표 {TARGET_MS}ms 미만): {verdict}")
+
+        session_manager.engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
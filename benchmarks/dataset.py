@@ -0,0 +1,134 @@
+# benchmarks/dataset.py
+# 벤치마크용 대량 합성 데이터 생성기
+
+import json
+import random
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert
+
+from create_dummy_data import ACTIVITIES, CATEGORIES, LOG_MESSAGE_TEMPLATES, TAG_WORDS
+from pacekeeper.database import DatabaseSessionManager
+from pacekeeper.repository.column_types import format_log_datetime
+from pacekeeper.repository.entities import Category, Log, Tag, log_tags
+from pacekeeper.repository.stats_repository import StatsRepository
+
+# 한 번의 executemany로 넣을 행 수
+INSERT_CHUNK_SIZE = 10000
+
+# 로그당 태그 수 분포 (태그 수: 비율)
+TAG_COUNT_WEIGHTS = {0: 15, 1: 45, 2: 30, 3: 10}
+
+# 태그 인기도는 Zipf 분포를 따름 (소수의 태그가 대부분의 로그에 사용됨)
+TAG_ZIPF_EXPONENT = 1.1
+
+# 로그 사이 평균 간격(분)과 전체 데이터가 걸치는 최대 기간(일)
+# 데이터가 많으면 간격을 줄여 모든 로그가 최대 기간 안에 들어가도록 함
+MEAN_LOG_GAP_MINUTES = 120
+MAX_SPAN_DAYS = 365 * 40
+
+
+def _build_tag_vocabulary() -> list[tuple[str, int]]:
+    """
+    (태그 이름, 카테고리 인덱스) 목록 생성 (여러 카테고리에 있는 단어는 처음 카테고리에 속함)
+    """
+    vocabulary: dict[str, int] = {}
+    for category_index, category in enumerate(CATEGORIES):
+        for word in TAG_WORDS[category["name"]]:
+            vocabulary.setdefault(word, category_index)
+    return list(vocabulary.items())
+
+
+def generate_dataset(session_manager: DatabaseSessionManager, num_logs: int, seed: int = 42) -> dict[str, int]:
+    """
+    빈 데이터베이스에 카테고리, 태그, 로그를 대량으로 생성합니다.
+
+    ORM 객체를 거치지 않고 INSERT_CHUNK_SIZE 행씩 executemany로 넣으며,
+    log_tags 연결 테이블과 호환용 문자열 컬럼도 함께 채웁니다.
+    로그는 ID 순서대로 시간이 흐르며, 가장 최근 로그가 현재 시각에 가깝습니다.
+
+    Args:
+        session_manager: 대상 데이터베이스의 세션 매니저
+        num_logs: 생성할 로그 수
+        seed: 난수 시드 (같은 시드면 같은 데이터 생성)
+
+    Returns:
+        테이블별 생성 행 수
+    """
+    rng = random.Random(seed)
+    vocabulary = _build_tag_vocabulary()
+    tag_weights = [1 / (rank ** TAG_ZIPF_EXPONENT) for rank in range(1, len(vocabulary) + 1)]
+    tag_counts = list(TAG_COUNT_WEIGHTS)
+    tag_count_weights = list(TAG_COUNT_WEIGHTS.values())
+
+    gap_minutes = min(MEAN_LOG_GAP_MINUTES, MAX_SPAN_DAYS * 24 * 60 / max(num_logs, 1))
+    current = datetime.now().replace(microsecond=0) - timedelta(minutes=gap_minutes * num_logs)
+
+    with session_manager.session_scope() as session:
+        session.execute(
+            insert(Category.__table__),
+            [{"id": index + 1, "state": 1, **category} for index, category in enumerate(CATEGORIES)]
+        )
+        session.execute(
+            insert(Tag.__table__),
+            [
+                {"id": index + 1, "name": name, "description": "", "category_id": category_index + 1, "state": 1}
+                for index, (name, category_index) in enumerate(vocabulary)
+            ]
+        )
+
+    log_tag_count = 0
+    for chunk_start in range(0, num_logs, INSERT_CHUNK_SIZE):
+        log_rows = []
+        link_rows = []
+        for log_id in range(chunk_start + 1, min(chunk_start + INSERT_CHUNK_SIZE, num_logs) + 1):
+            tag_count = rng.choices(tag_counts, tag_count_weights)[0]
+            tag_indexes = list(dict.fromkeys(rng.choices(range(len(vocabulary)), tag_weights, k=tag_count)))
+
+            # 메시지 문구는 첫 번째 태그의 카테고리에 맞춤
+            category_index = vocabulary[tag_indexes[0]][1] if tag_indexes else rng.randrange(len(CATEGORIES))
+            category_name = CATEGORIES[category_index]["name"]
+            tag_words = [f"#{vocabulary[index][0]}" for index in tag_indexes]
+            message = rng.choice(LOG_MESSAGE_TEMPLATES).format(
+                tag1=tag_words[0] if tag_words else vocabulary[rng.randrange(len(vocabulary))][0],
+                tag2=tag_words[1] if len(tag_words) > 1 else "",
+                activity=rng.choice(ACTIVITIES[category_name])
+            )
+            if len(tag_words) > 2:
+                message = f"{message} {' '.join(tag_words[2:])}"
+
+            current += timedelta(minutes=rng.uniform(0.5, 1.5) * gap_minutes)
+            ended_at = current + timedelta(minutes=rng.randint(15, 60))
+            tag_ids = [index + 1 for index in tag_indexes]
+            log_rows.append({
+                "id": log_id,
+                "message": message,
+                "tags": json.dumps(tag_ids),
+                "start_date": format_log_datetime(current),
+                "end_date": format_log_datetime(ended_at),
+                "started_at": int(current.timestamp()),
+                "ended_at": int(ended_at.timestamp()),
+                "state": 1,
+            })
+            link_rows.extend({"log_id": log_id, "tag_id": tag_id} for tag_id in tag_ids)
+
+        with session_manager.session_scope() as session:
+            session.execute(insert(Log.__table__), log_rows)
+            if link_rows:
+                session.execute(insert(log_tags), link_rows)
+        log_tag_count += len(link_rows)
+
+    # 대량 삽입은 LogService를 거치지 않으므로 일별 통계를 한 번에 재계산
+    daily_stat_count = StatsRepository(session_manager).rebuild()
+
+    # 대량 삽입 후 쿼리 플래너 통계 갱신
+    with session_manager.engine.begin() as conn:
+        conn.exec_driver_sql("ANALYZE")
+
+    return {
+        "categories": len(CATEGORIES),
+        "tags": len(vocabulary),
+        "pace_logs": num_logs,
+        "log_tags": log_tag_count,
+        "daily_stats": daily_stat_count,
+    }
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+# benchmarks/run_benchmarks.py
+# Repository / Service 메서드 벤치마크 실행기
+#
+# 데이터 크기별로 별도 프로세스에서 임시 DB를 만들고(DatabaseSessionManager가 싱글톤이므로),
+# 합성 데이터를 넣은 뒤 각 메서드의 호출 시간을 측정하여 JSON으로 저장합니다.
+#
+# 사용 예:
+#   python benchmarks/run_benchmarks.py --sizes 10000,100000 --output bench.json
+#   python benchmarks/run_benchmarks.py --sizes 10000 --compare bench.json
+
+import argparse
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import date, datetime, timedelta
+from itertools import count
+from typing import Any
+
+# 직접 실행 시 패키지 경로 설정
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir)))
+
+DEFAULT_SIZES = "10000,100000,1000000"
+# 이 비율 이상 느려진 항목을 회귀로 표시
+REGRESSION_RATIO = 1.2
+
+# (벤치마크 이름, 호출 함수, 호출 횟수 배율) - 배율은 전체 조회처럼 느린 작업의 반복 수를 줄이는 용도
+BenchmarkCase = tuple[str, Callable[[], Any], float]
+
+
+def time_calls(call: Callable[[], Any], repeat: int) -> dict[str, float]:
+    """
+    call을 한 번 예열 호출한 뒤 repeat회 실행하여 소요 시간 통계(ms)를 반환합니다.
+    """
+    call()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        call()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    ordered = sorted(timings)
+    return {
+        "repeat": repeat,
+        "min_ms": ordered[0],
+        "median_ms": statistics.median(ordered),
+        "mean_ms": statistics.mean(ordered),
+        "p95_ms": ordered[max(int(len(ordered) * 0.95) - 1, 0)],
+    }
+
+
+def build_cases(session_manager) -> list[BenchmarkCase]:
+    """
+    데이터가 채워진 DB를 대상으로 측정할 작업 목록을 만듭니다.
+    쓰기 작업은 데이터셋 크기가 거의 변하지 않도록 벤치마크가 만든 행만 수정/삭제합니다.
+    """
+    from pacekeeper.database import UnitOfWork
+    from pacekeeper.repository.category_repository import CategoryRepository
+    from pacekeeper.repository.entities import Log
+    from pacekeeper.repository.log_filters import LogFilters
+    from pacekeeper.repository.log_repository import LogRepository
+    from pacekeeper.repository.stats_repository import StatsRepository
+    from pacekeeper.repository.tag_repository import TagRepository
+    from pacekeeper.services.log_service import LogService
+    from pacekeeper.services.stats_service import StatsService
+    from pacekeeper.services.tag_service import TagService
+
+    log_repo = LogRepository(session_manager)
+    tag_repo = TagRepository(session_manager)
+    category_repo = CategoryRepository(session_manager)
+    stats_repo = StatsRepository(session_manager)
+    log_service = LogService(log_repo, tag_repo, stats_repo)
+    tag_service = TagService(tag_repo)
+    stats_service = StatsService(stats_repo)
+
+    today = date.today()
+    period = ((today - timedelta(days=90)).strftime("%Y-%m-%d"), today.strftime("%Y-%m-%d"))
+    popular_tag = tag_repo.get_tag(1).name
+    tag_ids = [tag.id for tag in tag_repo.get_tags()]
+    recent_tags = [log.tags for log in log_repo.get_recent_logs(100)]
+    sequence = count()
+
+    def new_log() -> Log:
+        now = datetime.now()
+        return Log(message=f"벤치마크 저장 #{popular_tag}", tags="[1]", started_at=now, ended_at=now)
+
+    def ensure_tags() -> None:
+        with UnitOfWork(session_manager) as uow:
+            tag_repo.ensure_tags([popular_tag, f"bench{next(sequence)}"], uow.session)
+
+    def latest_log_id() -> int:
+        return log_repo.get_logs_page(None, None, 1)[0].id
+
+    def newest_tag_id() -> int:
+        return tag_repo.get_tags()[0].id
+
+    return [
+        # ILogRepository
+        ("LogRepository.initialize_database", log_repo.initialize_database, 1),
+        ("LogRepository.save_log", lambda: log_repo.save_log(new_log()), 1),
+        ("LogRepository.get_all_logs", log_repo.get_all_logs, 0.1),
+        ("LogRepository.get_logs_by_period", lambda: log_repo.get_logs_by_period(*period), 1),
+        ("LogRepository.get_logs_by_tag", lambda: log_repo.get_logs_by_tag(popular_tag), 0.1),
+        ("LogRepository.get_logs_page", lambda: log_repo.get_logs_page(None, None, 100), 1),
+        ("LogRepository.get_logs_page[filtered]",
+         lambda: log_repo.get_logs_page(LogFilters(*period, tag_keyword=popular_tag), None, 100), 1),
+        ("LogRepository.search_logs[fts]", lambda: log_repo.search_logs("프로그래밍", limit=100), 1),
+        ("LogRepository.search_logs[like]", lambda: log_repo.search_logs("공부", limit=100), 1),
+        ("LogRepository.get_recent_logs", lambda: log_repo.get_recent_logs(20), 1),
+        ("LogRepository.soft_delete_logs", lambda: log_repo.soft_delete_logs([latest_log_id()]), 1),
+        # ITagRepository
+        ("TagRepository.init_db", tag_repo.init_db, 1),
+        ("TagRepository.add_tag", lambda: tag_repo.add_tag(popular_tag), 1),
+        ("TagRepository.ensure_tags", ensure_tags, 1),
+        ("TagRepository.get_tag", lambda: tag_repo.get_tag(1), 1),
+        ("TagRepository.get_tags_by_ids", lambda: tag_repo.get_tags_by_ids(tag_ids), 1),
+        ("TagRepository.get_tags", tag_repo.get_tags, 1),
+        ("TagRepository.update_tag", lambda: tag_repo.update_tag(1, description=f"bench {next(sequence)}"), 1),
+        ("TagRepository.delete_tag", lambda: tag_repo.delete_tag(newest_tag_id()), 1),
+        # ICategoryRepository
+        ("CategoryRepository.init_db", category_repo.init_db, 1),
+        ("CategoryRepository.create_category", lambda: category_repo.create_category(f"bench{next(sequence)}"), 1),
+        ("CategoryRepository.get_category", lambda: category_repo.get_category(1), 1),
+        ("CategoryRepository.get_categories", category_repo.get_categories, 1),
+        ("CategoryRepository.update_category",
+         lambda: category_repo.update_category(1, description=f"bench {next(sequence)}"), 1),
+        ("CategoryRepository.delete_category",
+         lambda: category_repo.delete_category(category_repo.get_categories()[-1].id), 1),
+        # LogService
+        ("LogService.create_study_log", lambda: log_service.create_study_log(f"벤치마크 #{popular_tag} #bench"), 1),
+        ("LogService.retrieve_all_logs", log_service.retrieve_all_logs, 0.1),
+        ("LogService.retrieve_logs_by_period", lambda: log_service.retrieve_logs_by_period(*period), 1),
+        ("LogService.retrieve_logs_by_tag", lambda: log_service.retrieve_logs_by_tag(popular_tag), 0.1),
+        ("LogService.retrieve_logs_page", lambda: log_service.retrieve_logs_page(None, None, 100), 1),
+        ("LogService.search_logs", lambda: log_service.search_logs("프로그래밍", period, 100), 1),
+        ("LogService.retrieve_recent_logs", log_service.retrieve_recent_logs, 1),
+        ("LogService.remove_logs_by_ids", lambda: log_service.remove_logs_by_ids([latest_log_id()]), 1),
+        # TagService
+        ("TagService.get_tag_text", lambda: tag_service.get_tag_text(recent_tags[0]), 1),
+        ("TagService.get_tag_texts", lambda: tag_service.get_tag_texts(recent_tags), 1),
+        ("TagService.get_tag", lambda: tag_service.get_tag(1), 1),
+        ("TagService.get_tags", tag_service.get_tags, 1),
+        ("TagService.create_tag", lambda: tag_service.create_tag(f"bench{next(sequence)}"), 1),
+        ("TagService.update_tag", lambda: tag_service.update_tag(1, description=f"bench {next(sequence)}"), 1),
+        ("TagService.delete_tag", lambda: tag_service.delete_tag(newest_tag_id()), 1),
+        # StatsService
+        ("StatsService.get_day_totals", stats_service.get_day_totals, 1),
+        ("StatsService.get_week_totals", stats_service.get_week_totals, 1),
+        ("StatsService.get_month_totals", stats_service.get_month_totals, 1),
+        ("StatsService.get_year_totals", stats_service.get_year_totals, 1),
+        ("StatsService.rebuild_stats", stats_service.rebuild_stats, 0.1),
+    ]
+
+
+def run_single_size(size: int, repeat: int, seed: int, name_filter: str | None) -> dict[str, Any]:
+    """
+    현재 프로세스에서 한 가지 데이터 크기에 대해 데이터 생성과 측정을 수행합니다.
+    """
+    import logging
+
+    from icecream import ic
+
+    from benchmarks.bench_logger_overhead import configure_logger
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # 사용자 로그 파일과 디버그 출력에 벤치마크 기록이 남지 않도록 비활성화
+        configure_logger(logging.getLogger("PaceKeeper"), "disabled", os.path.join(tmp_dir, "bench.log"))
+        ic.disable()
+
+        from benchmarks.dataset import generate_dataset
+        from pacekeeper.database import DatabaseSessionManager
+
+        session_manager = DatabaseSessionManager(f"sqlite:///{os.path.join(tmp_dir, 'bench.db')}")
+
+        start = time.perf_counter()
+        row_counts = generate_dataset(session_manager, size, seed)
+        generation_seconds = time.perf_counter() - start
+        print(f"[{size}] 데이터 생성 {generation_seconds:.1f}s: {row_counts}", file=sys.stderr)
+
+        results: dict[str, dict[str, float]] = {}
+        for name, call, repeat_scale in build_cases(session_manager):
+            if name_filter and name_filter not in name:
+                continue
+            results[name] = time_calls(call, max(int(repeat * repeat_scale), 1))
+            print(f"[{size}] {name:<45} median={results[name]['median_ms']:9.3f}ms", file=sys.stderr)
+
+        session_manager.engine.dispose()
+
+    return {"rows": row_counts, "generation_seconds": generation_seconds, "benchmarks": results}
+
+
+def compare_results(current: dict[str, Any], baseline: dict[str, Any]) -> None:
+    """
+    이전 결과 파일과 중앙값을 비교하여 출력합니다. REGRESSION_RATIO 이상 느려진 항목은 표시합니다.
+    """
+    for size, size_result in current["sizes"].items():
+        baseline_size = baseline.get("sizes", {}).get(size)
+        if not baseline_size:
+            continue
+        print(f"\n== {size} rows: 이전 결과 대비 중앙값 ==")
+        for name, stats in size_result["benchmarks"].items():
+            previous = baseline_size["benchmarks"].get(name)
+            if not previous or previous["median_ms"] <= 0:
+                continue
+            ratio = stats["median_ms"] / previous["median_ms"]
+            marker = "  <-- 회귀" if ratio >= REGRESSION_RATIO else ""
+            print(f"{name:<45} {previous['median_ms']:9.3f}ms -> {stats['median_ms']:9.3f}ms (x{ratio:.2f}){marker}")
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="PaceKeeper Repository/Service 벤치마크")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help=f"쉼표로 구분한 로그 수 목록 (기본값: {DEFAULT_SIZES})")
+    parser.add_argument("--repeat", type=int, default=20, help="작업별 호출 횟수 (기본값: 20)")
+    parser.add_argument("--seed", type=int, default=42, help="데이터 생성 난수 시드 (기본값: 42)")
+    parser.add_argument("--filter", dest="name_filter", help="이름에 이 문자열이 포함된 벤치마크만 실행")
+    parser.add_argument("--output", help="결과 JSON 파일 경로 (기본값: 표준 출력)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 파일 경로")
+    parser.add_argument("--single-size", type=int, help=argparse.SUPPRESS)  # 크기별 하위 프로세스용
+    args = parser.parse_args()
+
+    if args.single_size is not None:
+        result = run_single_size(args.single_size, args.repeat, args.seed, args.name_filter)
+        json.dump(result, sys.stdout, ensure_ascii=False)
+        return
+
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    report: dict[str, Any] = {
+        "meta": {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+            "seed": args.seed,
+        },
+        "sizes": {},
+    }
+
+    for size in sizes:
+        command = [sys.executable, os.path.abspath(__file__), "--single-size", str(size),
+                   "--repeat", str(args.repeat), "--seed", str(args.seed)]
+        if args.name_filter:
+            command += ["--filter", args.name_filter]
+        completed = subprocess.run(command, check=True, stdout=subprocess.PIPE, text=True)
+        report["sizes"][str(size)] = json.loads(completed.stdout)
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output)
+        print(f"결과 저장: {args.output}")
+    else:
+        print(output)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare_results(report, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
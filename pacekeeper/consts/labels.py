@@ -1,32 +1,40 @@
 import json
 import os
 import sys
+import threading
+from collections.abc import Mapping
 from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
+
+ALLOWED_LANGUAGES = ('en', 'ko')
+DEFAULT_LANGUAGE = "ko"
 
 
 @dataclass(frozen=True)
 class LanguageResource:
-    base_labels: dict[str, str]
-    title_labels: dict[str, str]
-    button_labels: dict[str, str]
-    menu_labels: dict[str, str]
-    tab_labels: dict[str, str]
-    group_labels: dict[str, str]
-    setting_labels: dict[str, str]
-    messages: dict[str, str]
-    error_messages: dict[str, str]
+    """언어별 레이블 묶음 (각 레이블 그룹은 읽기 전용 매핑)"""
+    base_labels: Mapping[str, str]
+    title_labels: Mapping[str, str]
+    button_labels: Mapping[str, str]
+    menu_labels: Mapping[str, str]
+    tab_labels: Mapping[str, str]
+    group_labels: Mapping[str, str]
+    setting_labels: Mapping[str, str]
+    messages: Mapping[str, str]
+    error_messages: Mapping[str, str]
 
-def load_language_resource(language: str = "ko") -> LanguageResource:
-    """
-    주어진 언어 코드('en' 또는 'ko')에 따른 리소스 파일을 로드하여 LanguageResource 객체를 반환합니다.
-    만약 지원되지 않는 언어 코드가 전달되면 기본값 'ko'를 사용합니다.
-    """
-    allowed_languages = ['en', 'ko']
-    if language not in allowed_languages:
+
+def _normalize_language(language: str) -> str:
+    """지원되지 않는 언어 코드면 기본값 'ko'로 대체"""
+    if language not in ALLOWED_LANGUAGES:
         print(f"지원되지 않는 언어 코드 '{language}' 입니다. 기본값 'ko'로 설정합니다.")
-        language = "ko"
+        return DEFAULT_LANGUAGE
+    return language
+
 
+def _read_language_file(language: str) -> LanguageResource:
+    """언어 리소스 파일을 읽어 LanguageResource 객체 생성"""
     # PyInstaller로 빌드된 경우 리소스 경로 처리
     if getattr(sys, 'frozen', False):
         # 빌드된 실행파일에서는 _MEIPASS 경로 사용
@@ -41,14 +49,108 @@ def load_language_resource(language: str = "ko") -> LanguageResource:
     except Exception as e:
         raise RuntimeError(f"언어 리소스 로드 실패: {e}") from e
 
+    def section(name: str) -> Mapping[str, str]:
+        return MappingProxyType(dict(data.get(name, {})))
+
     return LanguageResource(
-        base_labels=data.get("BASE_LABELS", {}),
-        title_labels=data.get("TITLE_LABELS", {}),
-        button_labels=data.get("BUTTON_LABELS", {}),
-        menu_labels=data.get("MENU_LABELS", {}),
-        tab_labels=data.get("TAB_LABELS", {}),
-        group_labels=data.get("GROUP_LABELS", {}),
-        setting_labels=data.get("SETTING_LABELS", {}),
-        messages=data.get("MESSAGES", {}),
-        error_messages=data.get("ERROR_MESSAGES", {})
+        base_labels=section("BASE_LABELS"),
+        title_labels=section("TITLE_LABELS"),
+        button_labels=section("BUTTON_LABELS"),
+        menu_labels=section("MENU_LABELS"),
+        tab_labels=section("TAB_LABELS"),
+        group_labels=section("GROUP_LABELS"),
+        setting_labels=section("SETTING_LABELS"),
+        messages=section("MESSAGES"),
+        error_messages=section("ERROR_MESSAGES")
     )
+
+
+class LanguageRegistry:
+    """
+    프로세스 전역 언어 리소스 레지스트리
+
+    언어별 리소스 파일은 처음 요청될 때 한 번만 읽어 보관하며,
+    활성 언어를 바꿔도 파일을 다시 읽지 않습니다.
+    """
+
+    def __init__(self) -> None:
+        self._resources: dict[str, LanguageResource] = {}
+        self._active_language = DEFAULT_LANGUAGE
+        self._lock = threading.Lock()
+
+    def get(self, language: str = DEFAULT_LANGUAGE) -> LanguageResource:
+        """
+        언어 리소스 반환 (처음 요청된 언어만 파일에서 읽음)
+
+        Args:
+            language: 언어 코드 ('en' 또는 'ko', 그 외는 'ko'로 대체)
+
+        Returns:
+            LanguageResource 객체 (같은 언어면 항상 같은 객체)
+        """
+        language = _normalize_language(language)
+        resource = self._resources.get(language)
+        if resource is None:
+            with self._lock:
+                resource = self._resources.get(language)
+                if resource is None:
+                    resource = _read_language_file(language)
+                    self._resources[language] = resource
+        return resource
+
+    @property
+    def active_language(self) -> str:
+        """현재 활성 언어 코드"""
+        return self._active_language
+
+    @property
+    def active(self) -> LanguageResource:
+        """현재 활성 언어의 리소스"""
+        return self.get(self._active_language)
+
+    def set_active(self, language: str) -> bool:
+        """
+        활성 언어 변경
+
+        Args:
+            language: 새 언어 코드
+
+        Returns:
+            활성 언어가 실제로 바뀌었는지 여부
+        """
+        language = _normalize_language(language)
+        self.get(language)  # 전환 전에 리소스 로드 (실패 시 기존 언어 유지)
+        if language == self._active_language:
+            return False
+        self._active_language = language
+        return True
+
+
+class ActiveLanguageResource:
+    """
+    활성 언어 리소스를 가리키는 참조
+
+    속성 접근을 레지스트리의 활성 리소스로 위임하므로, 모듈 수준에 보관해도
+    언어가 전환되면 자동으로 새 언어의 레이블을 반환합니다.
+    """
+
+    def __init__(self, registry: LanguageRegistry) -> None:
+        self._registry = registry
+
+    def __getattr__(self, name: str) -> Mapping[str, str]:
+        return getattr(self._registry.active, name)
+
+
+language_registry = LanguageRegistry()
+
+# 활성 언어를 따르는 리소스 (모듈 수준 lang_res로 사용)
+lang_res = ActiveLanguageResource(language_registry)
+
+
+def load_language_resource(language: str = "ko") -> LanguageResource:
+    """
+    주어진 언어 코드('en' 또는 'ko')에 따른 리소스 파일을 로드하여 LanguageResource 객체를 반환합니다.
+    만약 지원되지 않는 언어 코드가 전달되면 기본값 'ko'를 사용합니다.
+    리소스 파일은 언어별로 한 번만 읽으며, 이후 호출은 같은 객체를 반환합니다.
+    """
+    return language_registry.get(language)
@@ -12,6 +12,7 @@ SHORT_BREAK_SOUND = 'short_brk.wav'
 
 # File paths and names
 CONFIG_FILE = 'config.json'
+SESSION_CHECKPOINT_FILE = 'session.json'
 LOG_FILE = 'pace_log.txt'
 DB_FILE = 'pace_log.db'
 ASSETS_DIR = 'assets'
@@ -62,6 +63,11 @@ SET_BREAK_COLOR = 'break_color'
 SET_LANGUAGE = 'language'
 SET_MAIN_DLG_WIDTH = 'main_dlg_width'
 SET_MAIN_DLG_HEIGHT = 'main_dlg_height'
+SET_DB_JOURNAL_MODE = 'db_journal_mode'
+SET_DB_SYNCHRONOUS = 'db_synchronous'
+SET_DB_TEMP_STORE = 'db_temp_store'
+SET_DB_MMAP_SIZE = 'db_mmap_size'
+SET_DB_CACHE_SIZE = 'db_cache_size'
 
 # Default settings
 DEFAULT_SETTINGS = {
@@ -76,7 +82,12 @@ DEFAULT_SETTINGS = {
     SET_BREAK_COLOR: '#FDFFB6',
     SET_LANGUAGE: 'ko',
     SET_MAIN_DLG_WIDTH: 800,
-    SET_MAIN_DLG_HEIGHT: 550
+    SET_MAIN_DLG_HEIGHT: 550,
+    SET_DB_JOURNAL_MODE: 'WAL',
+    SET_DB_SYNCHRONOUS: 'NORMAL',
+    SET_DB_TEMP_STORE: 'MEMORY',
+    SET_DB_MMAP_SIZE: 256 * 1024 * 1024,  # 256MB
+    SET_DB_CACHE_SIZE: -16000,  # 음수는 KiB 단위 (약 16MB)
 }
 
 # 사용 가능한 언어 설정
@@ -1,6 +1,6 @@
 # container/__init__.py
 
-from .di_container import DIContainer
+from .di_container import CircularDependencyError, DIContainer, LazySingleton
 from .service_registration import ServiceRegistry
 
-__all__ = ["DIContainer", "ServiceRegistry"]
+__all__ = ["CircularDependencyError", "DIContainer", "LazySingleton", "ServiceRegistry"]
@@ -1,33 +1,122 @@
 # container/di_container.py
 
 import inspect
+import threading
 from collections.abc import Callable
+from dataclasses import dataclass
 from typing import Any, TypeVar
 
 T = TypeVar('T')
 
 
+class CircularDependencyError(ValueError):
+    """서비스 해결 중 순환 의존성이 발견된 경우"""
+
+    def __init__(self, chain: list[type]) -> None:
+        self.chain = chain
+        super().__init__("Circular dependency: " + " -> ".join(_type_name(t) for t in chain))
+
+
+def _type_name(interface: Any) -> str:
+    return getattr(interface, "__name__", repr(interface))
+
+
+@dataclass(frozen=True)
+class _Registration:
+    """서비스 등록 정보"""
+    lifecycle: str
+    implementation: type | Callable[[], Any]
+    lazy: bool = False
+
+
+@dataclass(frozen=True)
+class _ResolutionPlan:
+    """
+    구현체 하나의 생성 계획 (생성자 시그니처를 한 번만 분석하여 캐시)
+
+    Attributes:
+        factory: 호출할 클래스 또는 팩토리 함수
+        dependencies: (매개변수 이름, 해결할 인터페이스) 목록
+    """
+    factory: Callable[..., Any]
+    dependencies: tuple[tuple[str, Any], ...]
+
+
+class LazySingleton:
+    """
+    지연 싱글톤 프록시
+
+    처음 속성에 접근할 때 컨테이너에서 실제 인스턴스를 생성하고, 이후 모든 속성 접근을 전달합니다.
+    구현 클래스가 등록된 경우 isinstance 검사는 생성 없이 구현 클래스로 통과합니다.
+    속성 접근 외의 연산(비교, 반복 등)은 전달하지 않습니다.
+    """
+
+    __slots__ = ("_container", "_interface", "_target_class", "_instance")
+
+    def __init__(self, container: "DIContainer", interface: type, target_class: type | None) -> None:
+        object.__setattr__(self, "_container", container)
+        object.__setattr__(self, "_interface", interface)
+        object.__setattr__(self, "_target_class", target_class)
+        object.__setattr__(self, "_instance", None)
+
+    def _get_instance(self) -> Any:
+        instance = object.__getattribute__(self, "_instance")
+        if instance is None:
+            container = object.__getattribute__(self, "_container")
+            instance = container._create_singleton(object.__getattribute__(self, "_interface"))
+            object.__setattr__(self, "_instance", instance)
+        return instance
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._get_instance(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._get_instance(), name, value)
+
+    @property
+    def __class__(self) -> type:
+        return object.__getattribute__(self, "_target_class") or LazySingleton
+
+    def __repr__(self) -> str:
+        instance = object.__getattribute__(self, "_instance")
+        if instance is not None:
+            return repr(instance)
+        return f"<LazySingleton {_type_name(object.__getattribute__(self, '_interface'))} (not created)>"
+
+
 class DIContainer:
     """
     의존성 주입 컨테이너
 
     서비스들의 등록, 해결, 생명주기 관리를 담당합니다.
     싱글톤과 트랜지언트(일회성) 라이프사이클을 지원합니다.
+
+    구현 클래스의 생성자 시그니처는 처음 해결할 때 한 번만 분석하여 생성 계획으로 캐시하며,
+    해결 중 순환 의존성이 있으면 CircularDependencyError를 발생시킵니다.
+    lazy로 등록한 싱글톤은 처음 속성에 접근할 때 생성되는 프록시로 해결됩니다.
+    작업 스레드에서 지연 싱글톤이 생성될 수 있으므로 해결은 잠금으로 직렬화합니다.
     """
 
     def __init__(self) -> None:
-        self._services: dict[type, tuple] = {}
+        self._services: dict[type, _Registration] = {}
         self._singletons: dict[type, Any] = {}
-
-    def register_singleton(self, interface: type[T], implementation: type[T] | Callable[[], T]) -> None:
+        self._proxies: dict[type, LazySingleton] = {}
+        self._plans: dict[Any, _ResolutionPlan] = {}
+        self._resolving: list[type] = []
+        self._lock = threading.RLock()
+
+    def register_singleton(
+        self, interface: type[T], implementation: type[T] | Callable[[], T], lazy: bool = False
+    ) -> None:
         """
         싱글톤으로 서비스 등록
 
         Args:
             interface: 인터페이스 또는 추상 클래스
             implementation: 구현 클래스 또는 팩토리 함수
+            lazy: True면 처음 속성에 접근할 때까지 생성을 미루는 프록시로 해결
         """
-        self._services[interface] = ('singleton', implementation)
+        self._register(interface, _Registration('singleton', implementation, lazy))
 
     def register_transient(self, interface: type[T], implementation: type[T] | Callable[[], T]) -> None:
         """
@@ -37,7 +126,7 @@ class DIContainer:
             interface: 인터페이스 또는 추상 클래스
             implementation: 구현 클래스 또는 팩토리 함수
         """
-        self._services[interface] = ('transient', implementation)
+        self._register(interface, _Registration('transient', implementation))
 
     def register_instance(self, interface: type[T], instance: T) -> None:
         """
@@ -47,9 +136,17 @@ class DIContainer:
             interface: 인터페이스 또는 추상 클래스
             instance: 등록할 인스턴스
         """
-        self._services[interface] = ('singleton', lambda: instance)
+        self._register(interface, _Registration('singleton', lambda: instance))
         self._singletons[interface] = instance
 
+    def _register(self, interface: type, registration: _Registration) -> None:
+        with self._lock:
+            self._services[interface] = registration
+            self._singletons.pop(interface, None)
+            self._proxies.pop(interface, None)
+            # 생성 계획은 등록 여부에 따라 달라지므로 다시 만듦
+            self._plans.clear()
+
     def resolve(self, interface: type[T]) -> T:
         """
         등록된 서비스를 해결하여 인스턴스 반환
@@ -58,65 +155,107 @@ class DIContainer:
             interface: 해결할 인터페이스
 
         Returns:
-            해결된 서비스 인스턴스
+            해결된 서비스 인스턴스 (아직 생성되지 않은 지연 싱글톤은 프록시)
 
         Raises:
             ValueError: 등록되지 않은 서비스인 경우
+            CircularDependencyError: 순환 의존성이 있는 경우
         """
-        if interface not in self._services:
-            raise ValueError(f"Service not registered: {interface}")
-
-        lifecycle, implementation = self._services[interface]
-
-        if lifecycle == 'singleton':
+        with self._lock:
+            if interface in self._singletons:
+                return self._singletons[interface]
+
+            registration = self._services.get(interface)
+            if registration is None:
+                raise ValueError(f"Service not registered: {interface}")
+
+            if registration.lifecycle == 'singleton':
+                if registration.lazy:
+                    proxy = self._proxies.get(interface)
+                    if proxy is None:
+                        target_class = registration.implementation if inspect.isclass(registration.implementation) else None
+                        proxy = self._proxies[interface] = LazySingleton(self, interface, target_class)
+                    return proxy
+                return self._create_singleton(interface)
+
+            # transient
+            return self._build(interface, registration.implementation)
+
+    def _create_singleton(self, interface: type) -> Any:
+        """싱글톤 인스턴스 생성 및 저장 (이미 생성되었으면 기존 인스턴스 반환)"""
+        with self._lock:
             if interface not in self._singletons:
-                self._singletons[interface] = self._create_instance(implementation)
+                self._singletons[interface] = self._build(interface, self._services[interface].implementation)
             return self._singletons[interface]
-        else:  # transient
-            return self._create_instance(implementation)
 
-    def _create_instance(self, implementation: type | Callable) -> Any:
+    def _build(self, interface: type, implementation: type | Callable) -> Any:
         """
-        구현체로부터 인스턴스 생성
+        생성 계획에 따라 의존성을 해결하여 인스턴스 생성 (순환 의존성 검사)
 
         Args:
+            interface: 생성 중인 인터페이스
             implementation: 구현 클래스 또는 팩토리 함수
 
         Returns:
             생성된 인스턴스
         """
-        if callable(implementation) and not inspect.isclass(implementation):
-            # 팩토리 함수인 경우
-            return implementation()
+        if interface in self._resolving:
+            chain = self._resolving[self._resolving.index(interface):] + [interface]
+            raise CircularDependencyError(chain)
+
+        plan = self._plans.get(implementation)
+        if plan is None:
+            plan = self._plans[implementation] = self._compile_plan(implementation)
 
-        # 클래스인 경우 생성자 의존성 자동 주입
-        return self._create_with_dependencies(implementation)
+        self._resolving.append(interface)
+        try:
+            return plan.factory(**{name: self.resolve(dependency) for name, dependency in plan.dependencies})
+        finally:
+            self._resolving.pop()
 
-    def _create_with_dependencies(self, cls: type) -> Any:
+    def _compile_plan(self, implementation: type | Callable) -> _ResolutionPlan:
         """
-        생성자 의존성을 자동으로 주입하여 인스턴스 생성
+        구현체의 생성 계획 작성
+
+        팩토리 함수는 인자 없이 호출합니다. 클래스는 생성자의 타입 어노테이션 중 등록된
+        인터페이스를 의존성으로 주입하며, 등록되지 않은 타입의 매개변수는 기본값을 사용합니다.
 
         Args:
-            cls: 생성할 클래스
+            implementation: 구현 클래스 또는 팩토리 함수
 
         Returns:
-            의존성이 주입된 인스턴스
+            생성 계획
+
+        Raises:
+            ValueError: 기본값이 없는 매개변수의 의존성을 해결할 수 없는 경우
         """
-        # 생성자 시그니처 분석
-        signature = inspect.signature(cls.__init__)
-        dependencies = {}
+        if callable(implementation) and not inspect.isclass(implementation):
+            # 팩토리 함수인 경우
+            return _ResolutionPlan(implementation, ())
+
+        # 클래스인 경우 생성자 시그니처 분석
+        signature = inspect.signature(implementation.__init__)
+        dependencies = []
 
         for param_name, param in signature.parameters.items():
-            if param_name == 'self':
+            if param_name == 'self' or param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
                 continue
 
-            # 타입 어노테이션이 있는 경우 해당 타입으로 의존성 해결
-            if param.annotation != inspect.Parameter.empty:
-                dependencies[param_name] = self.resolve(param.annotation)
-            elif param.default == inspect.Parameter.empty:
-                raise ValueError(f"Cannot resolve dependency: {param_name} in {cls}")
-
-        return cls(**dependencies)
+            has_default = param.default is not inspect.Parameter.empty
+            # 타입 어노테이션이 등록된 인터페이스면 의존성으로 해결
+            if param.annotation is not inspect.Parameter.empty and (
+                param.annotation in self._services or not has_default
+            ):
+                if param.annotation not in self._services:
+                    raise ValueError(
+                        f"Cannot resolve dependency: {param_name}: {_type_name(param.annotation)} "
+                        f"in {_type_name(implementation)} (not registered)"
+                    )
+                dependencies.append((param_name, param.annotation))
+            elif not has_default:
+                raise ValueError(f"Cannot resolve dependency: {param_name} in {implementation}")
+
+        return _ResolutionPlan(implementation, tuple(dependencies))
 
     def is_registered(self, interface: type) -> bool:
         """
@@ -134,5 +273,8 @@ class DIContainer:
         """
         모든 등록된 서비스와 싱글톤 인스턴스 제거
         """
-        self._services.clear()
-        self._singletons.clear()
+        with self._lock:
+            self._services.clear()
+            self._singletons.clear()
+            self._proxies.clear()
+            self._plans.clear()
@@ -38,35 +38,42 @@ class ServiceRegistry:
         """Repository 레이어 서비스 등록"""
         from pacekeeper.interfaces.repositories.i_category_repository import ICategoryRepository
         from pacekeeper.interfaces.repositories.i_log_repository import ILogRepository
+        from pacekeeper.interfaces.repositories.i_stats_repository import IStatsRepository
         from pacekeeper.interfaces.repositories.i_tag_repository import ITagRepository
         from pacekeeper.repository.category_repository import CategoryRepository
         from pacekeeper.repository.log_repository import LogRepository
+        from pacekeeper.repository.stats_repository import StatsRepository
         from pacekeeper.repository.tag_repository import TagRepository
 
-        # Repository 인터페이스와 구현체 등록
-        container.register_singleton(ILogRepository, LogRepository)
-        container.register_singleton(ITagRepository, TagRepository)
-        container.register_singleton(ICategoryRepository, CategoryRepository)
+        # Repository 인터페이스와 구현체 등록 (처음 사용할 때 생성되도록 지연 등록)
+        container.register_singleton(ILogRepository, LogRepository, lazy=True)
+        container.register_singleton(ITagRepository, TagRepository, lazy=True)
+        container.register_singleton(ICategoryRepository, CategoryRepository, lazy=True)
+        container.register_singleton(IStatsRepository, StatsRepository, lazy=True)
 
     @staticmethod
     def _register_services(container: "DIContainer") -> None:
         """Service 레이어 서비스 등록"""
         from pacekeeper.interfaces.services.i_category_service import ICategoryService
         from pacekeeper.interfaces.services.i_log_service import ILogService
+        from pacekeeper.interfaces.services.i_stats_service import IStatsService
         from pacekeeper.interfaces.services.i_tag_service import ITagService
         from pacekeeper.services.category_service import CategoryService
         from pacekeeper.services.log_service import LogService
+        from pacekeeper.services.stats_service import StatsService
         from pacekeeper.services.tag_service import TagService
 
         # Service 인터페이스와 구현체 등록
         container.register_singleton(ILogService, LogService)
         container.register_singleton(ITagService, TagService)
         container.register_singleton(ICategoryService, CategoryService)
+        container.register_singleton(IStatsService, StatsService)
 
     @staticmethod
     def _register_controllers(container: "DIContainer") -> None:
         """Controller 레이어 서비스 등록"""
         from pacekeeper.controllers.config_controller import ConfigController
+        from pacekeeper.controllers.db_worker import DbWorker
         from pacekeeper.controllers.main_controller import MainController
         from pacekeeper.controllers.sound_manager import SoundManager
         from pacekeeper.controllers.timer_controller import TimerService
@@ -75,10 +82,14 @@ class ServiceRegistry:
         container.register_singleton(ConfigController, lambda: ConfigController())
 
         # 다른 Controller들
-        container.register_singleton(SoundManager, SoundManager)
+        # SoundManager는 첫 알림음 재생 시 생성
+        container.register_singleton(SoundManager, SoundManager, lazy=True)
         container.register_singleton(TimerService, TimerService)
         container.register_transient(MainController, MainController)
 
+        # 데이터베이스 작업 스레드 풀 (QObject이므로 QApplication 생성 후 해결)
+        container.register_singleton(DbWorker, lambda: DbWorker())
+
     @staticmethod
     def _register_infrastructure(container: "DIContainer") -> None:
         """인프라스트럭처 서비스 등록"""
@@ -1,13 +1,14 @@
 # controllers/config_controller.py
 
+from collections.abc import Iterable
+from datetime import datetime
 from typing import Any
 
-from pacekeeper.consts.labels import load_language_resource
 from pacekeeper.services.app_state_manager import AppStateManager, AppStatus
-from pacekeeper.services.settings_manager import SettingsManager
+from pacekeeper.services.session_checkpoint import SessionCheckpoint
+from pacekeeper.services.settings_schema import Settings
+from pacekeeper.services.settings_manager import SettingsManager, SettingsObserver
 
-# 언어 리소스 로드
-lang_res = load_language_resource()
 
 class ConfigController:
     """
@@ -57,6 +58,16 @@ class ConfigController:
         self.__initialized = True
 
     # --- 설정 관련 메서드 (SettingsManager에 위임) ---
+    @property
+    def settings(self) -> Settings:
+        """
+        현재 설정 값 (타이머 등 자주 읽는 곳에서 속성으로 직접 읽을 때 사용)
+
+        Returns:
+            Settings 인스턴스 (설정 파일을 다시 로드하면 새 인스턴스로 바뀌므로 보관하지 말 것)
+        """
+        return self.settings_manager.settings
+
     def get_setting(self, key: str, default: Any = None) -> Any:
         """
         설정 값 반환
@@ -82,16 +93,25 @@ class ConfigController:
 
     def save_settings(self) -> bool:
         """
-        현재 설정을 파일에 저장
+        현재 설정을 파일에 즉시 저장
 
         Returns:
             저장 성공 여부
         """
         return self.settings_manager.save_settings()
 
+    def flush_settings(self) -> bool:
+        """
+        예약된 설정 저장이 있으면 즉시 저장 (앱 종료 시 호출)
+
+        Returns:
+            저장 성공 여부
+        """
+        return self.settings_manager.flush()
+
     def update_settings(self, new_settings: dict[str, Any]) -> dict[str, str]:
         """
-        여러 설정 값 업데이트 및 저장
+        여러 설정 값 업데이트 및 저장 예약
 
         Args:
             new_settings: 업데이트할 설정 딕셔너리
@@ -119,6 +139,25 @@ class ConfigController:
         """
         self.settings_manager.set_language(lang)
 
+    def add_settings_observer(self, observer: SettingsObserver, keys: Iterable[str] | None = None) -> None:
+        """
+        설정 변경을 관찰할 옵저버 추가
+
+        Args:
+            observer: 설정 변경을 관찰할 SettingsObserver 인스턴스
+            keys: 관찰할 설정 키 (None이면 모든 설정)
+        """
+        self.settings_manager.add_observer(observer, keys)
+
+    def remove_settings_observer(self, observer: SettingsObserver) -> None:
+        """
+        등록된 설정 옵저버 제거
+
+        Args:
+            observer: 제거할 SettingsObserver 인스턴스
+        """
+        self.settings_manager.remove_observer(observer)
+
     # --- 상태 관련 메서드 (AppStateManager에 위임) ---
     def get_status(self) -> AppStatus:
         """
@@ -173,3 +212,41 @@ class ConfigController:
             현재 사이클 수
         """
         return self.app_state_manager.get_cycle()
+
+    # --- 세션 체크포인트 관련 메서드 (AppStateManager에 위임) ---
+    def save_checkpoint(self, started_at: datetime, remaining_seconds: int, message: str) -> bool:
+        """
+        진행 중인 학습 세션의 체크포인트 저장
+
+        Args:
+            started_at: 세션 시작 시간
+            remaining_seconds: 남은 시간(초)
+            message: 입력 중인 로그 메시지
+
+        Returns:
+            저장 성공 여부
+        """
+        return self.app_state_manager.save_checkpoint(started_at, remaining_seconds, message)
+
+    def load_checkpoint(self) -> SessionCheckpoint | None:
+        """
+        이전 실행에서 남은 세션 체크포인트 반환
+
+        Returns:
+            체크포인트 (없으면 None)
+        """
+        return self.app_state_manager.load_checkpoint()
+
+    def clear_checkpoint(self) -> None:
+        """세션 체크포인트 삭제"""
+        self.app_state_manager.clear_checkpoint()
+
+    def restore_checkpoint(self, checkpoint: SessionCheckpoint, resume: bool) -> None:
+        """
+        체크포인트의 사이클과 상태를 복원
+
+        Args:
+            checkpoint: 복원할 체크포인트
+            resume: True면 세션 상태까지 복원, False면 사이클만 복원
+        """
+        self.app_state_manager.restore_checkpoint(checkpoint, resume)
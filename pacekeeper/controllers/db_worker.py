@@ -0,0 +1,184 @@
+# controllers/db_worker.py
+
+import itertools
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from PyQt5 import sip
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from pacekeeper.database.query_stats import query_action
+from pacekeeper.utils.desktop_logger import DesktopLogger
+
+# 데이터베이스 작업 스레드 수
+# (SQLite는 쓰기를 직렬화하므로 쓰기 작업 중에도 조회가 진행될 수 있을 정도만 둠)
+DB_WORKER_THREADS = 2
+
+# 종료 시 진행 중인 작업을 기다리는 최대 시간(ms)
+DB_WORKER_SHUTDOWN_TIMEOUT_MS = 5000
+
+# 결과 콜백 (작업 반환값) / 오류 콜백 (발생한 예외)
+ResultCallback = Callable[[Any], None]
+ErrorCallback = Callable[[Exception], None]
+
+
+@dataclass
+class _PendingTask:
+    """GUI 스레드에서 결과를 전달할 때 필요한 작업 정보"""
+    key: str | None
+    generation: int
+    on_result: ResultCallback | None
+    on_error: ErrorCallback | None
+    owner: QObject | None
+
+
+class _DbTask(QRunnable):
+    """스레드 풀에서 함수 하나를 실행하고 결과를 DbWorker 시그널로 보내는 작업"""
+
+    def __init__(
+        self, worker: "DbWorker", task_id: int, fn: Callable[..., Any], args: tuple, kwargs: dict, action: str
+    ):
+        super().__init__()
+        self.worker = worker
+        self.task_id = task_id
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.action = action
+
+    def run(self):
+        try:
+            # 쿼리 통계에서 이 작업이 실행한 문장을 작업 이름으로 묶음
+            with query_action(self.action):
+                result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            self.worker.logger.log_error(f"데이터베이스 작업 실패: {getattr(self.fn, '__qualname__', self.fn)}", exc_info=True)
+            self._emit(False, e)
+        else:
+            self._emit(True, result)
+
+    def _emit(self, succeeded: bool, value: Any) -> None:
+        try:
+            self.worker.task_done.emit(self.task_id, succeeded, value)
+        except RuntimeError:
+            # 인터프리터 종료 중 DbWorker가 먼저 삭제된 경우 (결과를 받을 곳이 없으므로 버림)
+            pass
+
+
+class DbWorker(QObject):
+    """
+    데이터베이스 작업을 GUI 스레드 밖에서 실행하는 작업자
+
+    서비스 호출을 전용 QThreadPool에서 실행하고, 결과는 시그널을 통해 GUI 스레드로 돌아와
+    콜백으로 전달됩니다. 조회가 오래 걸려도 GUI 스레드의 QTimer(타이머 표시)가 멈추지 않습니다.
+
+    같은 key로 새 작업을 제출하면 이전 작업의 결과는 버려지므로, 검색을 연달아 실행해도
+    마지막 검색 결과만 화면에 반영됩니다. 콜백이 QObject(다이얼로그 등)의 메서드이고
+    결과가 도착하기 전에 그 객체가 삭제되었다면 콜백을 호출하지 않습니다.
+
+    Attributes:
+        task_done: (작업 ID, 성공 여부, 결과 또는 예외) 작업 스레드에서 발생하는 내부 시그널
+    """
+
+    task_done = pyqtSignal(int, bool, object)
+
+    def __init__(self, max_threads: int = DB_WORKER_THREADS, parent: QObject | None = None) -> None:
+        """
+        Args:
+            max_threads: 동시에 실행할 최대 작업 수
+            parent: 부모 QObject
+        """
+        super().__init__(parent)
+        self.logger = DesktopLogger("PaceKeeper")
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max_threads)
+
+        self._task_ids = itertools.count(1)
+        self._pending: dict[int, _PendingTask] = {}
+        self._generations: dict[str, int] = {}
+
+        # 작업 스레드에서 발생한 시그널은 이 객체가 속한 GUI 스레드에서 처리됨
+        self.task_done.connect(self._on_task_done)
+
+    def submit(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        on_result: ResultCallback | None = None,
+        on_error: ErrorCallback | None = None,
+        key: str | None = None,
+        **kwargs: Any
+    ) -> int:
+        """
+        함수를 작업 스레드에서 실행하도록 제출합니다. (GUI 스레드에서 호출)
+
+        Args:
+            fn: 실행할 함수 (서비스 메서드 등)
+            *args: fn에 전달할 위치 인자
+            on_result: 성공 시 GUI 스레드에서 반환값으로 호출할 콜백
+            on_error: 예외 발생 시 GUI 스레드에서 예외로 호출할 콜백
+            key: 작업 종류 (같은 key의 새 작업이 제출되면 이전 작업의 결과는 전달하지 않음)
+            **kwargs: fn에 전달할 키워드 인자
+
+        Returns:
+            작업 ID
+        """
+        generation = 0
+        if key is not None:
+            generation = self._generations.get(key, 0) + 1
+            self._generations[key] = generation
+
+        callback_owner = getattr(on_result or on_error, "__self__", None)
+        task_id = next(self._task_ids)
+        self._pending[task_id] = _PendingTask(
+            key=key,
+            generation=generation,
+            on_result=on_result,
+            on_error=on_error,
+            owner=callback_owner if isinstance(callback_owner, QObject) else None,
+        )
+        action = key or getattr(fn, "__qualname__", repr(fn))
+        self.pool.start(_DbTask(self, task_id, fn, args, kwargs, action))
+        return task_id
+
+    def cancel(self, key: str) -> None:
+        """
+        해당 key로 제출된 작업의 결과를 버립니다. (이미 실행 중인 작업은 끝까지 실행됨)
+
+        Args:
+            key: 작업 종류
+        """
+        if key in self._generations:
+            self._generations[key] += 1
+
+    def wait_for_done(self, timeout_ms: int = DB_WORKER_SHUTDOWN_TIMEOUT_MS) -> bool:
+        """
+        대기 중이거나 실행 중인 작업이 끝날 때까지 기다립니다. (앱 종료 시 DB 연결 정리 전에 호출)
+
+        Args:
+            timeout_ms: 최대 대기 시간(ms)
+
+        Returns:
+            제한 시간 안에 모든 작업이 끝났는지 여부
+        """
+        done = self.pool.waitForDone(timeout_ms)
+        if not done:
+            self.logger.log_error(f"데이터베이스 작업이 {timeout_ms}ms 안에 끝나지 않았습니다.")
+        return done
+
+    def _on_task_done(self, task_id: int, succeeded: bool, value: Any) -> None:
+        """작업 결과를 GUI 스레드에서 콜백으로 전달"""
+        task = self._pending.pop(task_id, None)
+        if task is None:
+            return
+        # 같은 key의 더 새로운 작업이 있거나 취소된 경우
+        if task.key is not None and self._generations.get(task.key) != task.generation:
+            return
+        # 콜백을 가진 다이얼로그 등이 이미 삭제된 경우
+        if task.owner is not None and sip.isdeleted(task.owner):
+            return
+
+        callback = task.on_result if succeeded else task.on_error
+        if callback is not None:
+            callback(value)
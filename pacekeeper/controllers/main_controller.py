@@ -11,21 +11,28 @@ from PyQt5.QtWidgets import QMessageBox
 if TYPE_CHECKING:
     from pacekeeper.views.main_window import MainWindow
 
-from pacekeeper.consts.labels import load_language_resource
+from pacekeeper.consts.labels import lang_res
 from pacekeeper.controllers.config_controller import AppStatus, ConfigController
+from pacekeeper.controllers.db_worker import DbWorker
 from pacekeeper.controllers.sound_manager import SoundManager
 from pacekeeper.controllers.timer_controller import TimerService
 from pacekeeper.interfaces.services.i_category_service import ICategoryService
 from pacekeeper.interfaces.services.i_log_service import ILogService
+from pacekeeper.interfaces.services.i_stats_service import IStatsService
 from pacekeeper.interfaces.services.i_tag_service import ITagService
 from pacekeeper.repository.entities import Log
+from pacekeeper.services.session_checkpoint import SessionCheckpoint
 
 logger: logging.Logger = logging.getLogger(__name__)
 
-lang_res: dict[str, str] = load_language_resource(ConfigController().get_language())
 
 MINUTE_TO_SECOND: int = 60  # 테스트용으로 분당 5초로 설정. 실제로는 60초로 변경 필요
 
+# 이전 세션 체크포인트 처리 방법 (이어서 진행 / 로그로 저장 / 버리기)
+RECOVER_RESUME: str = "resume"
+RECOVER_SAVE: str = "save"
+RECOVER_DISCARD: str = "discard"
+
 
 class MainController:
     """
@@ -41,7 +48,9 @@ class MainController:
         tag_service: ITagService,
         log_service: ILogService,
         sound_manager: SoundManager,
-        timer_service: TimerService
+        timer_service: TimerService,
+        stats_service: IStatsService,
+        db_worker: DbWorker
     ) -> None:
         self.main_window = main_window
         self.config_ctrl = config_ctrl
@@ -51,15 +60,25 @@ class MainController:
         self.log_service: ILogService = log_service
         self.sound_manager: SoundManager = sound_manager
         self.timer_service: TimerService = timer_service
+        self.stats_service: IStatsService = stats_service
+        # 로그 저장/조회는 작업 스레드에서 실행하여 타이머 표시가 멈추지 않도록 함
+        self.db_worker: DbWorker = db_worker
         self.paused: bool = False
+        # 세션 시작 시 입력되어 있던 로그 메시지 (체크포인트에 기록)
+        self.session_message: str = ""
+        # 학습 세션 진행 여부 (휴식 타이머의 일시정지는 체크포인트에 기록하지 않음)
+        self.study_active: bool = False
 
         # 앱 시작 시, 최근 로그를 UI에 업데이트합니다.
         self.refresh_recent_logs()
 
+        # 이전 실행에서 끝나지 않은 세션이 있으면 윈도우 표시 후 복구 여부를 묻습니다.
+        QTimer.singleShot(0, self.recover_session)
+
     def start_study_session(self):
         """학습 세션 시작 메소드 (기존 start_study() 대체)"""
         self.study_start_time = datetime.datetime.now()
-        study_minutes = self.config_ctrl.get_setting("study_time", 25)
+        study_minutes = self.config_ctrl.settings.study_time
         total_seconds = study_minutes * MINUTE_TO_SECOND
 
         # 학습 세션 상태 설정 및 타이머 종료 시 수행할 콜백 할당
@@ -69,32 +88,43 @@ class MainController:
         # 타이머 시작 (내부적으로 기존 타이머 종료 후 새 타이머 스레드 시작)
         self.timer_service.start(total_seconds)
 
+        # 미니 모드에서는 입력창이 숨겨지므로 시작 시점의 메시지를 체크포인트에 기록
+        self.session_message = self.main_window.log_input_panel.get_value().strip()
+        self.study_active = True
+        self.save_session_checkpoint()
+
+    def save_session_checkpoint(self) -> None:
+        """진행 중인 학습 세션의 체크포인트 저장 (세션 시작, 일시정지, 재개 시)"""
+        if not self.study_active:
+            return
+        self.config_ctrl.save_checkpoint(
+            self.study_start_time, self.timer_service.remaining_seconds, self.session_message
+        )
+
     def on_study_session_finished(self):
         """학습 세션 종료 후 실행될 로직 및 휴식 세션 전환"""
         self.timer_service.stop()
+        self.study_active = False
+        self.config_ctrl.clear_checkpoint()
 
-        # 학습 종료 시 로그 저장 (사용자 입력값)
+        # 학습 종료 시 로그 저장 (사용자 입력값, 작업 스레드에서 저장 후 최신 로그 목록을 UI에 업데이트)
         user_input = self.main_window.log_input_panel.get_value().strip()
         if user_input:
-            try:
-                # 저장된 study_start_time을 create_study_log에 전달
-                self.log_service.create_study_log(
-                    user_input, study_start_time=self.study_start_time
-                )
-            except Exception as e:
-                QMessageBox.critical(self.main_window, "Error", f"로그 저장 실패: {str(e)}")
-
-        # 로그 추가 후 최신 로그 목록을 UI에 업데이트합니다.
-        self.refresh_recent_logs()
+            # 저장된 study_start_time을 create_study_log에 전달
+            self.db_worker.submit(
+                self.log_service.create_study_log, user_input, study_start_time=self.study_start_time,
+                on_result=self._on_study_log_saved, on_error=self._on_study_log_failed
+            )
 
         # 사이클 증가 및 휴식 시간 결정
         cycle = self.config_ctrl.increment_cycle()
-        if cycle % self.config_ctrl.get_setting("cycles", 4) == 0:
-            break_min = self.config_ctrl.get_setting("long_break", 15)
+        settings = self.config_ctrl.settings
+        if cycle % settings.pomodoro_cycles == 0:
+            break_min = settings.long_break_time
             self.config_ctrl.set_status(AppStatus.LONG_BREAK)
             self.sound_manager.play_sound("pacekeeper/assets/sounds/long_brk.wav")
         else:
-            break_min = self.config_ctrl.get_setting("short_break", 5)
+            break_min = settings.short_break_time
             self.config_ctrl.set_status(AppStatus.SHORT_BREAK)
             self.sound_manager.play_sound("pacekeeper/assets/sounds/short_brk.wav")
 
@@ -158,15 +188,116 @@ class MainController:
         else:
             self.timer_service.pause()
             self.paused = True
+        self.save_session_checkpoint()
+
+    def _on_study_log_saved(self, _log) -> None:
+        """로그 저장 완료 후 최신 로그 목록을 UI에 업데이트 (태그 버튼은 최근 로그 갱신 시 함께 갱신됨)"""
+        self.refresh_recent_logs()
+
+    def _on_study_log_failed(self, error: Exception) -> None:
+        QMessageBox.critical(self.main_window, "Error", f"로그 저장 실패: {str(error)}")
 
     def stop_study_timer(self):
         """공부 타이머 중단 메서드"""
         self.timer_service.stop()
+        self.study_active = False
+        self.config_ctrl.clear_checkpoint()
         # 추가로 UI 갱신이나 상태 초기화 작업이 필요하면 이곳에 구현합니다.
 
+    def recover_session(self, now: datetime.datetime | None = None) -> None:
+        """
+        이전 실행에서 비정상 종료된 학습 세션 복구
+
+        체크포인트가 남아 있으면 세션을 이어서 진행할지(남은 시간이 있는 경우),
+        지금까지의 시간을 로그로 저장할지(메시지가 있는 경우), 버릴지 선택하게 합니다.
+
+        Args:
+            now: 기준 시간 (None이면 현재 시간)
+        """
+        checkpoint = self.config_ctrl.load_checkpoint()
+        if checkpoint is None:
+            return
+        if self.timer_service.is_running():
+            # 이미 새 세션이 시작된 경우
+            return
+
+        now = now or datetime.datetime.now()
+        remaining = checkpoint.remaining_at(now)
+        ic("이전 세션 체크포인트 발견", checkpoint, remaining)
+
+        choice = self._ask_recovery_choice(checkpoint, remaining)
+        if choice == RECOVER_RESUME and remaining > 0:
+            self._resume_session(checkpoint, remaining)
+            return
+
+        self.config_ctrl.clear_checkpoint()
+        self.config_ctrl.restore_checkpoint(checkpoint, resume=False)
+        if choice == RECOVER_SAVE and checkpoint.message:
+            self.db_worker.submit(
+                self.log_service.create_study_log, checkpoint.message,
+                study_start_time=checkpoint.started_at, ended_at=checkpoint.focus_ended_at(now),
+                on_result=self._on_study_log_saved, on_error=self._on_study_log_failed
+            )
+
+    def _ask_recovery_choice(self, checkpoint: SessionCheckpoint, remaining_seconds: int) -> str:
+        """
+        체크포인트 처리 방법을 사용자에게 묻는 대화상자 표시
+
+        Args:
+            checkpoint: 이전 실행의 체크포인트
+            remaining_seconds: 현재 기준 남은 시간(초)
+
+        Returns:
+            RECOVER_RESUME, RECOVER_SAVE, RECOVER_DISCARD 중 하나
+        """
+        box = QMessageBox(self.main_window)
+        box.setIcon(QMessageBox.Question)
+        box.setWindowTitle(lang_res.messages['RECOVER_SESSION_TITLE'])
+        box.setText(lang_res.messages['RECOVER_SESSION'].format(
+            checkpoint.message,
+            checkpoint.started_at.strftime("%Y-%m-%d %H:%M"),
+            f"{remaining_seconds // 60:02d}:{remaining_seconds % 60:02d}",
+        ))
+        buttons = {}
+        if remaining_seconds > 0:
+            buttons[RECOVER_RESUME] = box.addButton(lang_res.button_labels['RESUME'], QMessageBox.AcceptRole)
+        if checkpoint.message:
+            buttons[RECOVER_SAVE] = box.addButton(lang_res.button_labels['SAVE_LOG'], QMessageBox.ActionRole)
+        buttons[RECOVER_DISCARD] = box.addButton(lang_res.button_labels['DISCARD'], QMessageBox.RejectRole)
+        box.setDefaultButton(next(iter(buttons.values())))
+        box.exec_()
+
+        clicked = box.clickedButton()
+        return next((choice for choice, button in buttons.items() if button is clicked), RECOVER_DISCARD)
+
+    def _resume_session(self, checkpoint: SessionCheckpoint, remaining_seconds: int) -> None:
+        """체크포인트의 학습 세션을 남은 시간으로 다시 시작"""
+        self.config_ctrl.restore_checkpoint(checkpoint, resume=True)
+        self.study_start_time = checkpoint.started_at
+        self.session_message = checkpoint.message
+        # 세션 종료 시 입력창의 메시지로 로그를 저장하므로 복원
+        self.main_window.log_input_panel.set_value(checkpoint.message)
+
+        self.timer_service.on_finish = self.on_study_session_finished
+        self.timer_service.start(remaining_seconds)
+        self.study_active = True
+        self.main_window.toggle_buttons(AppStatus.STUDY)
+        # 체크포인트 파일은 그대로 유효하므로 다시 저장하지 않음
+        if checkpoint.is_paused:
+            self.timer_service.pause()
+            self.paused = True
+            self.main_window.toggle_buttons(AppStatus.PAUSED)
+
     def refresh_recent_logs(self):
         """
-        MainWindow의 recent_logs 컨트롤 및 TagButtonsPanel을 업데이트하여 최신 로그 목록과 태그 버튼을 반영하는 메서드.
+        MainWindow의 recent_logs 컨트롤을 업데이트하여 최신 로그 목록을 반영하는 메서드.
+        조회는 작업 스레드에서 실행하고, 결과가 도착하면 GUI 스레드에서 컨트롤을 갱신합니다.
+        """
+        self.db_worker.submit(self._load_recent_logs, on_result=self._show_recent_logs, key="recent_logs")
+
+    def _load_recent_logs(self) -> list[Log]:
+        """
+        최근 로그를 조회하여 표시할 로그 목록을 만듭니다. (작업 스레드에서 실행)
         중복된 메시지는 하나만 보여주고, 최대 10개의 로그만 표시합니다.
         """
         logs: list[Log] = self.log_service.retrieve_recent_logs()
@@ -178,17 +309,20 @@ class MainController:
             if message in seen_messages:
                 continue
 
-            tag_text = self.tag_service.get_tag_text(log.tags)
-            tag_list = ", ".join(tag_text) if tag_text else ""
-            log.tag_text = tag_list
-
             unique_logs.append(log)
             seen_messages.add(message)
             if len(unique_logs) >= 10:
                 break
 
-        # 최근 로그 UI 컨트롤 업데이트
-        self.main_window.recent_logs.update_logs(logs=unique_logs)
+        # 표시할 로그의 태그 이름을 한 번에 조회
+        tag_texts = self.tag_service.get_tag_texts([log.tags for log in unique_logs])
+        for log, tag_text in zip(unique_logs, tag_texts, strict=True):
+            log.tag_text = ", ".join(tag_text) if tag_text else ""
+        return unique_logs
+
+    def _show_recent_logs(self, logs: list[Log]) -> None:
+        """최근 로그 UI 컨트롤 업데이트"""
+        self.main_window.recent_logs.update_logs(logs=logs)
 
     def get_all_logs(self):
         """
@@ -2,14 +2,12 @@ import logging
 import os
 import sys
 
-from PyQt5.QtMultimedia import QSound
 from PyQt5.QtWidgets import QMessageBox
 
-from pacekeeper.consts.labels import load_language_resource
+from pacekeeper.consts.labels import lang_res
 from pacekeeper.controllers.config_controller import ConfigController
 from pacekeeper.utils.resource_path import resource_path
 
-lang_res = load_language_resource()
 logger = logging.getLogger(__name__)
 
 class SoundManager:
@@ -35,6 +33,9 @@ class SoundManager:
                 self.current_sound.stop()
 
             # QSound 사용 (볼륨 조절은 불가능하지만 안정적)
+            # QtMultimedia는 첫 알람 재생 시점에 임포트 (시작 시간 단축)
+            from PyQt5.QtMultimedia import QSound
+
             self.current_sound = QSound(sound_file)
             self.current_sound.play()
             logger.info("Sound played successfully using QSound")
@@ -1,194 +1,256 @@
-# controllers/timer_controller.py
-
-from collections.abc import Callable
-
-from PyQt5.QtCore import QObject, QTimer, pyqtSignal
-
-from pacekeeper.controllers.config_controller import ConfigController
-from pacekeeper.services.app_state_manager import AppStatus
-
-
-class TimerService(QObject):
-    """
-    타이머 서비스 클래스
-
-    애플리케이션의 타이머 기능(시작, 일시정지, 재개, 종료)을 제공합니다.
-    PyQt5의 QTimer를 사용하여 GUI 스레드에서 안전하게 타이머를 실행합니다.
-
-    Attributes:
-        timer_finished: 타이머 완료 시 발생하는 시그널
-    """
-
-    # 시그널 정의
-    timer_finished = pyqtSignal()
-
-    def __init__(
-        self,
-        config_ctrl: ConfigController,
-        update_callback: Callable[[str], None],
-        on_finish: Callable[[], None] | None = None,
-        pauseable: bool = True
-    ) -> None:
-        """
-        TimerService 초기화
-
-        Args:
-            config_ctrl: 설정 컨트롤러 인스턴스
-            update_callback: 남은 시간을 UI에 업데이트하는 콜백 함수
-            on_finish: 타이머 종료 시 호출되는 콜백 함수 (선택적)
-            pauseable: 타이머 일시정지 가능 여부 (기본값: True)
-        """
-        super().__init__()
-
-        self.config_ctrl = config_ctrl
-        self.update_callback = update_callback
-        self.on_finish = on_finish
-        self.pauseable = pauseable
-
-        # QTimer 초기화
-        self.timer = QTimer()
-        self.timer.timeout.connect(self._timer_tick)
-
-        # 타이머 상태 변수
-        self.remaining_seconds: int = 0
-        self.paused: bool = False
-        self._is_running: bool = False
-
-    def start(self, total_seconds: int) -> None:
-        """
-        타이머 시작
-
-        기존에 실행 중인 타이머가 있으면 먼저 중지하고 새 타이머를 시작합니다.
-
-        Args:
-            total_seconds: 타이머 실행 시간 (초)
-        """
-        self.stop()  # 이전 타이머 중지
-
-        # 앱 상태 업데이트
-        self.config_ctrl.set_status(AppStatus.STUDY)
-        self.config_ctrl.is_running = True
-
-        # 타이머 종료 시 호출할 내부 콜백 연결
-        self.timer_finished.connect(self._on_timer_finished)
-
-        # 타이머 초기화 및 시작
-        self.remaining_seconds = total_seconds
-        self._is_running = True
-        self.paused = False
-
-        self._update_display()  # 초기 표시 업데이트
-        self.timer.start(1000)  # 1초마다 tick
-
-    def stop(self) -> None:
-        """
-        타이머 중지 및 앱 상태 초기화
-
-        실행 중인 타이머를 중지하고 모든 상태를 초기화합니다.
-        """
-        if self._is_running:
-            self.timer.stop()
-            self._is_running = False
-            self.paused = False
-            self.remaining_seconds = 0
-
-            # 시그널 연결 해제
-            try:
-                self.timer_finished.disconnect()
-            except TypeError:
-                # 연결된 슬롯이 없는 경우 예외 처리
-                pass
-
-        self.config_ctrl.is_running = False
-        self.config_ctrl.set_status(AppStatus.WAIT)
-
-    def pause(self) -> None:
-        """
-        타이머 일시정지
-
-        타이머가 실행 중이고 일시정지 가능한 경우에만 일시정지합니다.
-        """
-        if self._is_running and self.pauseable and not self.paused:
-            self.timer.stop()
-            self.paused = True
-            self.config_ctrl.set_status(AppStatus.PAUSED)
-
-    def resume(self) -> None:
-        """
-        타이머 재개
-
-        타이머가 일시정지 상태이고 일시정지 가능한 경우에만 재개합니다.
-        """
-        if self._is_running and self.pauseable and self.paused:
-            self.paused = False
-            self.timer.start(1000)
-
-            # 이전 상태로 복원 (학습 또는 휴식)
-            current_status = self.config_ctrl.get_status()
-            if current_status == AppStatus.PAUSED:
-                self.config_ctrl.set_status(AppStatus.STUDY)  # 기본값으로 학습 상태 설정
-
-    def is_paused(self) -> bool:
-        """
-        타이머 일시정지 상태 여부 확인
-
-        Returns:
-            타이머가 일시정지 상태이면 True, 아니면 False
-        """
-        return self.paused
-
-    def is_running(self) -> bool:
-        """
-        타이머 실행 중 여부 확인
-
-        Returns:
-            타이머가 실행 중이면 True, 아니면 False
-        """
-        return self._is_running
-
-    def get_remaining_time(self) -> tuple[int, int]:
-        """
-        현재 남은 시간을 분:초 형식으로 반환
-
-        Returns:
-            (분, 초) 튜플
-        """
-        minutes = self.remaining_seconds // 60
-        seconds = self.remaining_seconds % 60
-        return (minutes, seconds)
-
-    def _timer_tick(self) -> None:
-        """
-        타이머 틱 처리 - 1초마다 호출됨
-
-        남은 시간을 감소시키고 UI를 업데이트합니다.
-        타이머가 종료되면 완료 시그널을 발생시킵니다.
-        """
-        if self.remaining_seconds > 0:
-            self.remaining_seconds -= 1
-            self._update_display()
-        else:
-            self.timer.stop()
-            self._is_running = False
-            self.timer_finished.emit()
-
-    def _update_display(self) -> None:
-        """
-        남은 시간을 UI에 표시
-
-        현재 남은 시간을 MM:SS 형식으로 변환하여 update_callback 함수를 통해 UI에 전달합니다.
-        """
-        minutes, seconds = self.get_remaining_time()
-        time_str = f"{minutes:02}:{seconds:02}"
-
-        if self.update_callback:
-            self.update_callback(time_str)
-
-    def _on_timer_finished(self) -> None:
-        """
-        타이머 종료 시 호출되는 내부 처리
-
-        타이머 종료 시 외부에서 전달받은 on_finish 콜백 함수를 호출합니다.
-        """
-        if self.on_finish:
-            self.on_finish()
+# controllers/timer_controller.py
+
+import math
+import time
+from collections.abc import Callable
+
+from PyQt5.QtCore import QObject, Qt, QTimer, pyqtSignal
+
+from pacekeeper.controllers.config_controller import ConfigController
+from pacekeeper.services.app_state_manager import AppStatus
+
+# 표시되는 초가 바뀐 직후에 틱이 오도록 더하는 여유 시간(ms)
+TIMER_TICK_SLACK_MS = 5
+
+
+class TimerService(QObject):
+    """
+    타이머 서비스 클래스
+
+    애플리케이션의 타이머 기능(시작, 일시정지, 재개, 종료)을 제공합니다.
+    PyQt5의 QTimer를 사용하여 GUI 스레드에서 안전하게 타이머를 실행합니다.
+
+    남은 시간은 틱 횟수가 아니라 monotonic 시계 기준의 종료 시각(deadline)으로 계산하므로,
+    이벤트 루프가 멈춰 틱이 늦거나 빠져도 종료 시각이 밀리지 않습니다.
+    틱은 표시되는 초가 바뀌는 시점에 맞춰 한 번씩만 예약되고(단발 CoarseTimer),
+    표시 문자열이 바뀔 때만 update_callback을 호출합니다.
+
+    Attributes:
+        timer_finished: 타이머 완료 시 발생하는 시그널
+    """
+
+    # 시그널 정의
+    timer_finished = pyqtSignal()
+
+    def __init__(
+        self,
+        config_ctrl: ConfigController,
+        update_callback: Callable[[str], None],
+        on_finish: Callable[[], None] | None = None,
+        pauseable: bool = True,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """
+        TimerService 초기화
+
+        Args:
+            config_ctrl: 설정 컨트롤러 인스턴스
+            update_callback: 남은 시간을 UI에 업데이트하는 콜백 함수
+            on_finish: 타이머 종료 시 호출되는 콜백 함수 (선택적)
+            pauseable: 타이머 일시정지 가능 여부 (기본값: True)
+            clock: 초 단위 monotonic 시계 (기본값: time.monotonic)
+        """
+        super().__init__()
+
+        self.config_ctrl = config_ctrl
+        self._is_running: bool = False
+        self._displayed_text: str | None = None  # 마지막으로 표시한 문자열
+        self.update_callback = update_callback
+        self.on_finish = on_finish
+        self.pauseable = pauseable
+        self.clock = clock
+
+        # QTimer 초기화 (다음 초 변경 시점마다 다시 예약하는 단발 타이머)
+        self.timer = QTimer()
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.CoarseTimer)
+        self.timer.timeout.connect(self._timer_tick)
+
+        # 타이머 상태 변수
+        self.paused: bool = False
+        self._deadline: float = 0.0            # 종료 시각 (clock 기준)
+        self._paused_remaining: float = 0.0    # 일시정지 시점의 남은 시간(초)
+
+    def start(self, total_seconds: int) -> None:
+        """
+        타이머 시작
+
+        기존에 실행 중인 타이머가 있으면 먼저 중지하고 새 타이머를 시작합니다.
+
+        Args:
+            total_seconds: 타이머 실행 시간 (초)
+        """
+        self.stop()  # 이전 타이머 중지
+
+        # 앱 상태 업데이트
+        self.config_ctrl.set_status(AppStatus.STUDY)
+        self.config_ctrl.is_running = True
+
+        # 타이머 종료 시 호출할 내부 콜백 연결
+        self.timer_finished.connect(self._on_timer_finished)
+
+        # 타이머 초기화 및 시작
+        self._deadline = self.clock() + total_seconds
+        self._is_running = True
+        self.paused = False
+        self._displayed_text = None
+
+        self._timer_tick()  # 초기 표시 업데이트 및 다음 틱 예약
+
+    def stop(self) -> None:
+        """
+        타이머 중지 및 앱 상태 초기화
+
+        실행 중인 타이머를 중지하고 모든 상태를 초기화합니다.
+        """
+        if self._is_running:
+            self.timer.stop()
+            self._is_running = False
+            self.paused = False
+            self._deadline = 0.0
+            self._paused_remaining = 0.0
+
+            # 시그널 연결 해제
+            try:
+                self.timer_finished.disconnect()
+            except TypeError:
+                # 연결된 슬롯이 없는 경우 예외 처리
+                pass
+
+        self.config_ctrl.is_running = False
+        self.config_ctrl.set_status(AppStatus.WAIT)
+
+    def pause(self) -> None:
+        """
+        타이머 일시정지
+
+        타이머가 실행 중이고 일시정지 가능한 경우에만 일시정지합니다.
+        """
+        if self._is_running and self.pauseable and not self.paused:
+            self.timer.stop()
+            # 남은 시간을 고정해 두고 재개 시 종료 시각을 다시 계산
+            self._paused_remaining = max(self._deadline - self.clock(), 0.0)
+            self.paused = True
+            self.config_ctrl.set_status(AppStatus.PAUSED)
+
+    def resume(self) -> None:
+        """
+        타이머 재개
+
+        타이머가 일시정지 상태이고 일시정지 가능한 경우에만 재개합니다.
+        """
+        if self._is_running and self.pauseable and self.paused:
+            self.paused = False
+            self._deadline = self.clock() + self._paused_remaining
+            self._timer_tick()
+
+            # 이전 상태로 복원 (학습 또는 휴식)
+            current_status = self.config_ctrl.get_status()
+            if current_status == AppStatus.PAUSED:
+                self.config_ctrl.set_status(AppStatus.STUDY)  # 기본값으로 학습 상태 설정
+
+    def is_paused(self) -> bool:
+        """
+        타이머 일시정지 상태 여부 확인
+
+        Returns:
+            타이머가 일시정지 상태이면 True, 아니면 False
+        """
+        return self.paused
+
+    def is_running(self) -> bool:
+        """
+        타이머 실행 중 여부 확인
+
+        Returns:
+            타이머가 실행 중이면 True, 아니면 False
+        """
+        return self._is_running
+
+    @property
+    def update_callback(self) -> Callable[[str], None]:
+        """남은 시간을 UI에 업데이트하는 콜백 함수"""
+        return self._update_callback
+
+    @update_callback.setter
+    def update_callback(self, callback: Callable[[str], None]) -> None:
+        # 표시 대상이 바뀌면(휴식 다이얼로그 등) 다음 초를 기다리지 않고 현재 남은 시간을 바로 표시
+        self._update_callback = callback
+        self._displayed_text = None
+        if self._is_running:
+            self._update_display()
+
+    @property
+    def remaining_seconds(self) -> int:
+        """
+        표시용 남은 시간(초) - 남은 시간의 올림이므로 시작 직후에는 전체 시간이 표시됩니다.
+        """
+        if not self._is_running:
+            return 0
+        return math.ceil(self._remaining())
+
+    def _remaining(self) -> float:
+        """남은 시간(초, 소수 포함) - 일시정지 중에는 멈춘 값"""
+        if self.paused:
+            return self._paused_remaining
+        return max(self._deadline - self.clock(), 0.0)
+
+    def get_remaining_time(self) -> tuple[int, int]:
+        """
+        현재 남은 시간을 분:초 형식으로 반환
+
+        Returns:
+            (분, 초) 튜플
+        """
+        minutes = self.remaining_seconds // 60
+        seconds = self.remaining_seconds % 60
+        return (minutes, seconds)
+
+    def _timer_tick(self) -> None:
+        """
+        타이머 틱 처리 - 표시되는 초가 바뀔 때마다 호출됨
+
+        종료 시각 기준으로 남은 시간을 계산하여 UI를 업데이트하고 다음 틱을 예약합니다.
+        틱이 늦게 오더라도 남은 시간은 시계로 계산하므로 누적 오차가 생기지 않으며,
+        종료 시각이 지났으면 바로 완료 시그널을 발생시킵니다.
+        """
+        if not self._is_running or self.paused:
+            return
+
+        remaining = self._remaining()
+        if remaining <= 0:
+            self.timer.stop()
+            self._is_running = False
+            self._update_display()
+            self.timer_finished.emit()
+            return
+
+        self._update_display()
+        # 표시되는 초(남은 시간의 올림)가 다음으로 바뀌는 시점까지 대기
+        until_next_second = remaining - (math.ceil(remaining) - 1)
+        self.timer.start(int(until_next_second * 1000) + TIMER_TICK_SLACK_MS)
+
+    def _update_display(self) -> None:
+        """
+        남은 시간을 UI에 표시
+
+        현재 남은 시간을 MM:SS 형식으로 변환하여, 표시 중인 문자열과 다를 때만
+        update_callback 함수를 통해 UI에 전달합니다.
+        """
+        minutes, seconds = self.get_remaining_time()
+        time_str = f"{minutes:02}:{seconds:02}"
+        if time_str == self._displayed_text:
+            return
+        self._displayed_text = time_str
+
+        if self.update_callback:
+            self.update_callback(time_str)
+
+    def _on_timer_finished(self) -> None:
+        """
+        타이머 종료 시 호출되는 내부 처리
+
+        타이머 종료 시 외부에서 전달받은 on_finish 콜백 함수를 호출합니다.
+        """
+        if self.on_finish:
+            self.on_finish()
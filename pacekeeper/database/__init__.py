@@ -1,6 +1,16 @@
 # database/__init__.py
 
+from .query_stats import StatementBudget, StatementBudgetExceeded, StatementRecorder, query_action
+from .schema_migration import SchemaMigration
 from .session_manager import DatabaseSessionManager
 from .unit_of_work import UnitOfWork
 
-__all__ = ["DatabaseSessionManager", "UnitOfWork"]
+__all__ = [
+    "DatabaseSessionManager",
+    "SchemaMigration",
+    "StatementBudget",
+    "StatementBudgetExceeded",
+    "StatementRecorder",
+    "UnitOfWork",
+    "query_action",
+]
@@ -0,0 +1,252 @@
+# database/query_stats.py
+
+import os
+import sys
+import threading
+import time
+from collections.abc import Generator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# 이 환경 변수가 설정되어 있으면(0 제외) 쿼리 통계를 수집하고 앱 종료 시 보고서를 로그에 기록
+QUERY_STATS_ENV = "PACEKEEPER_QUERY_STATS"
+
+# 작업 이름이 지정되지 않은 곳에서 실행된 문장
+NO_ACTION = "(작업 없음)"
+
+# pacekeeper 코드 밖에서 실행된 문장 (스키마 생성, PRAGMA 등)
+UNKNOWN_CALLER = "(알 수 없음)"
+
+_REPOSITORY_MODULE_PREFIX = "pacekeeper.repository."
+_PACKAGE_PREFIX = "pacekeeper."
+_SKIPPED_MODULE_PREFIXES = ("pacekeeper.database.", "pacekeeper.container.")
+
+_current = threading.local()
+
+
+def query_stats_enabled() -> bool:
+    """QUERY_STATS_ENV 환경 변수로 쿼리 통계가 켜져 있는지 확인"""
+    return os.environ.get(QUERY_STATS_ENV, "") not in ("", "0")
+
+
+def current_action() -> str:
+    """현재 스레드에서 실행 중인 작업 이름"""
+    return getattr(_current, "action", NO_ACTION)
+
+
+@contextmanager
+def query_action(name: str) -> Generator[None, None, None]:
+    """
+    블록 안에서 실행되는 문장을 작업 이름으로 묶음 (현재 스레드에만 적용, 중첩 시 안쪽 이름 사용)
+
+    Args:
+        name: 작업 이름 (DbWorker 작업 key, UI 동작 이름 등)
+    """
+    previous = getattr(_current, "action", NO_ACTION)
+    _current.action = name
+    try:
+        yield
+    finally:
+        _current.action = previous
+
+
+def find_caller() -> str:
+    """
+    문장을 실행한 저장소 메서드 이름 (예: LogRepository.get_recent_logs)
+    저장소를 거치지 않았으면 database, container 패키지 밖의 가장 가까운 pacekeeper 함수를 "모듈:함수"로 반환합니다.
+    """
+    fallback = None
+    frame = sys._getframe(1)
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module.startswith(_REPOSITORY_MODULE_PREFIX):
+            return frame.f_code.co_qualname
+        if fallback is None and module.startswith(_PACKAGE_PREFIX) and not module.startswith(_SKIPPED_MODULE_PREFIXES):
+            fallback = f"{module}:{frame.f_code.co_qualname}"
+        frame = frame.f_back
+    return fallback or UNKNOWN_CALLER
+
+
+@dataclass
+class StatementStats:
+    """문장 수와 실행 시간 합계"""
+    count: int = 0
+    total_seconds: float = 0.0
+
+    def add(self, elapsed: float) -> None:
+        self.count += 1
+        self.total_seconds += elapsed
+
+
+class StatementRecorder:
+    """
+    엔진에서 실행되는 SQL 문장 수와 시간을 작업별, 저장소 메서드별로 기록
+
+    SQLAlchemy의 before_cursor_execute / after_cursor_execute 이벤트를 사용하므로
+    ORM, Core, exec_driver_sql로 실행한 문장이 모두 기록됩니다. 기록 중에는 문장마다
+    호출 스택을 거슬러 올라가 저장소 메서드를 찾으므로, 필요할 때만 시작합니다.
+    여러 스레드(DbWorker 작업 스레드 포함)에서 실행된 문장을 함께 기록합니다.
+    """
+
+    def __init__(self, engine: Engine) -> None:
+        """
+        Args:
+            engine: 기록할 SQLAlchemy 엔진
+        """
+        self.engine = engine
+        self.actions: dict[str, dict[str, StatementStats]] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._listening = False
+
+    def start(self) -> None:
+        """기록 시작 (이미 기록 중이면 무시)"""
+        if self._listening:
+            return
+        event.listen(self.engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(self.engine, "after_cursor_execute", self._after_cursor_execute)
+        self._listening = True
+
+    def stop(self) -> None:
+        """기록 중지 (기록한 통계는 유지)"""
+        if not self._listening:
+            return
+        event.remove(self.engine, "before_cursor_execute", self._before_cursor_execute)
+        event.remove(self.engine, "after_cursor_execute", self._after_cursor_execute)
+        self._listening = False
+
+    def reset(self) -> None:
+        """기록한 통계 초기화"""
+        with self._lock:
+            self.actions.clear()
+
+    def __enter__(self) -> "StatementRecorder":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    @property
+    def statement_count(self) -> int:
+        """기록한 전체 문장 수"""
+        with self._lock:
+            return sum(stats.count for callers in self.actions.values() for stats in callers.values())
+
+    @property
+    def total_seconds(self) -> float:
+        """기록한 전체 문장 실행 시간(초)"""
+        with self._lock:
+            return sum(stats.total_seconds for callers in self.actions.values() for stats in callers.values())
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        # 커서 실행 전후 이벤트는 같은 스레드에서 연달아 발생함
+        self._local.started = time.perf_counter()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        elapsed = time.perf_counter() - getattr(self._local, "started", time.perf_counter())
+        self.record(current_action(), find_caller(), statement, elapsed)
+
+    def record(self, action: str, caller: str, statement: str, elapsed: float) -> None:
+        """
+        실행된 문장 하나 기록
+
+        Args:
+            action: 작업 이름
+            caller: 문장을 실행한 저장소 메서드
+            statement: SQL 문장
+            elapsed: 실행 시간(초)
+        """
+        with self._lock:
+            self.actions.setdefault(action, {}).setdefault(caller, StatementStats()).add(elapsed)
+
+    def report(self, title: str = "쿼리 통계") -> str:
+        """
+        작업별 보고서 (작업과 저장소 메서드는 문장 수가 많은 순서)
+
+        Args:
+            title: 보고서 제목
+
+        Returns:
+            여러 줄 보고서 문자열
+        """
+        with self._lock:
+            actions = {action: dict(callers) for action, callers in self.actions.items()}
+
+        def totals(callers: dict[str, StatementStats]) -> tuple[int, float]:
+            return sum(s.count for s in callers.values()), sum(s.total_seconds for s in callers.values())
+
+        count = sum(totals(callers)[0] for callers in actions.values())
+        seconds = sum(totals(callers)[1] for callers in actions.values())
+        lines = [f"[{title}] 문장 {count}개, 합계 {seconds * 1000:.1f}ms"]
+        for action, callers in sorted(actions.items(), key=lambda item: -totals(item[1])[0]):
+            action_count, action_seconds = totals(callers)
+            lines.append(f"  {action}: 문장 {action_count}개, {action_seconds * 1000:.1f}ms")
+            for caller, stats in sorted(callers.items(), key=lambda item: -item[1].count):
+                lines.append(f"    {caller:<48} {stats.count:6d}개 {stats.total_seconds * 1000:9.1f}ms")
+        return "\n".join(lines)
+
+
+class StatementBudgetExceeded(AssertionError):
+    """블록 안에서 실행된 SQL 문장 수가 허용 개수를 넘은 경우"""
+
+
+class StatementBudget(StatementRecorder):
+    """
+    블록 안에서 실행되는 SQL 문장 수가 허용 개수 이하인지 확인하는 컨텍스트 매니저
+
+    블록이 끝날 때 허용 개수를 넘었으면 실행된 문장 목록과 함께 StatementBudgetExceeded를 발생시킵니다.
+    DbWorker로 제출한 작업의 문장까지 세려면 블록 안에서 db_worker.wait_for_done()으로 작업이 끝나기를 기다리고,
+    결과 콜백이 이어서 제출하는 작업이 있으면 이벤트를 처리한 뒤 다시 기다려야 합니다.
+
+    사용 예:
+        with StatementBudget(session_manager.engine, 3, "LogDialog 열기"):
+            dialog = LogDialog(...)
+            db_worker.wait_for_done()
+    """
+
+    def __init__(self, engine: Engine, max_statements: int, label: str = "") -> None:
+        """
+        Args:
+            engine: 기록할 SQLAlchemy 엔진
+            max_statements: 허용하는 최대 문장 수
+            label: 오류 메시지에 표시할 동작 이름
+        """
+        super().__init__(engine)
+        self.max_statements = max_statements
+        self.label = label
+        self.statements: list[tuple[str, str]] = []
+
+    def record(self, action: str, caller: str, statement: str, elapsed: float) -> None:
+        super().record(action, caller, statement, elapsed)
+        with self._lock:
+            self.statements.append((caller, " ".join(statement.split())))
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+        if exc_type is None and self.statement_count > self.max_statements:
+            listed = "\n".join(f"  {caller}: {statement}" for caller, statement in self.statements)
+            raise StatementBudgetExceeded(
+                f"{self.label or 'SQL 문장'}: {self.statement_count}개 실행 "
+                f"(허용 {self.max_statements}개)\n{listed}"
+            )
+
+
+def attach_query_stats(engine: Engine) -> StatementRecorder | None:
+    """
+    QUERY_STATS_ENV 환경 변수가 켜져 있으면 엔진에 쿼리 통계 기록을 시작
+
+    Args:
+        engine: 기록할 SQLAlchemy 엔진
+
+    Returns:
+        기록 중인 StatementRecorder (환경 변수가 꺼져 있으면 None)
+    """
+    if not query_stats_enabled():
+        return None
+    recorder = StatementRecorder(engine)
+    recorder.start()
+    return recorder
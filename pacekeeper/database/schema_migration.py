@@ -0,0 +1,248 @@
+# database/schema_migration.py
+
+from collections.abc import Callable
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+
+from pacekeeper.utils.desktop_logger import DesktopLogger
+from pacekeeper.utils.functions import parse_tag_ids
+
+# 백필 시 한 번에 읽어 들일 pace_logs 행 수
+BACKFILL_CHUNK_SIZE = 1000
+
+# pace_logs.message 전문 검색용 FTS5 가상 테이블
+LOG_FTS_TABLE = "pace_logs_fts"
+
+# 외부 콘텐츠(pace_logs) FTS 테이블과 동기화 트리거
+# 한글은 공백 단위 토큰화로는 조사가 붙은 단어를 찾을 수 없으므로 trigram 토크나이저로 부분 문자열을 색인합니다.
+LOG_FTS_DDL = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {LOG_FTS_TABLE} USING fts5("
+    "message, content='pace_logs', content_rowid='id', tokenize='trigram')",
+    f"CREATE TRIGGER IF NOT EXISTS pace_logs_fts_ai AFTER INSERT ON pace_logs BEGIN "
+    f"INSERT INTO {LOG_FTS_TABLE}(rowid, message) VALUES (new.id, new.message); END",
+    f"CREATE TRIGGER IF NOT EXISTS pace_logs_fts_ad AFTER DELETE ON pace_logs BEGIN "
+    f"INSERT INTO {LOG_FTS_TABLE}({LOG_FTS_TABLE}, rowid, message) VALUES ('delete', old.id, old.message); END",
+    f"CREATE TRIGGER IF NOT EXISTS pace_logs_fts_au AFTER UPDATE OF message ON pace_logs BEGIN "
+    f"INSERT INTO {LOG_FTS_TABLE}({LOG_FTS_TABLE}, rowid, message) VALUES ('delete', old.id, old.message); "
+    f"INSERT INTO {LOG_FTS_TABLE}(rowid, message) VALUES (new.id, new.message); END",
+)
+
+
+# 로그 시작 시각의 로컬 날짜와 지속 시간(초) SQL 식 (StatsRepository의 증분 집계와 같은 기준)
+_LOG_DAY_SQL = "date(l.started_at, 'unixepoch', 'localtime')"
+_LOG_SECONDS_SQL = "MAX(COALESCE(l.ended_at, l.started_at) - l.started_at, 0)"
+
+_DAILY_STATS_INSERT_SQL = "INSERT INTO daily_stats (day, tag_id, category_id, sessions, focus_seconds) "
+
+
+def _daily_stats_selects(log_condition: str = "") -> tuple[str, str, str]:
+    """
+    활성 로그를 일별 집계 행으로 묶는 SELECT 문 (전체 합계 → 태그별 → 카테고리별 행)
+
+    Args:
+        log_condition: pace_logs(l)에 추가로 적용할 조건 (" AND ..." 형태)
+    """
+    log_filter = f"l.state >= 1 AND l.started_at IS NOT NULL{log_condition}"
+    return (
+        f"SELECT {_LOG_DAY_SQL}, 0, 0, COUNT(*), SUM({_LOG_SECONDS_SQL}) "
+        f"FROM pace_logs l WHERE {log_filter} GROUP BY 1",
+        f"SELECT {_LOG_DAY_SQL}, t.id, t.category_id, COUNT(*), SUM({_LOG_SECONDS_SQL}) "
+        "FROM pace_logs l JOIN log_tags lt ON lt.log_id = l.id JOIN tags t ON t.id = lt.tag_id "
+        f"WHERE {log_filter} GROUP BY 1, 2, 3",
+        # 바깥 SELECT의 WHERE는 뒤에 ON CONFLICT가 올 때 구문 모호성을 피하기 위한 것
+        "SELECT day, 0, category_id, COUNT(*), SUM(seconds) FROM ("
+        f"SELECT DISTINCT l.id, {_LOG_DAY_SQL} AS day, t.category_id AS category_id, {_LOG_SECONDS_SQL} AS seconds "
+        "FROM pace_logs l JOIN log_tags lt ON lt.log_id = l.id JOIN tags t ON t.id = lt.tag_id "
+        f"WHERE {log_filter} AND t.category_id > 0"
+        ") WHERE 1 GROUP BY day, category_id",
+    )
+
+
+# daily_stats 롤업 테이블을 활성 로그에서 다시 계산하는 SQL (전체 합계 → 태그별 → 카테고리별 행)
+DAILY_STATS_REBUILD_SQL = (
+    "DELETE FROM daily_stats",
+    *(_DAILY_STATS_INSERT_SQL + select for select in _daily_stats_selects()),
+)
+
+# ID 범위(:first_id ~ :last_id)의 로그를 daily_stats에 더하는 SQL (일괄 가져오기용)
+DAILY_STATS_ADD_RANGE_SQL = tuple(
+    _DAILY_STATS_INSERT_SQL + select
+    + " ON CONFLICT (day, tag_id, category_id) DO UPDATE SET "
+    "sessions = sessions + excluded.sessions, focus_seconds = focus_seconds + excluded.focus_seconds"
+    for select in _daily_stats_selects(" AND l.id BETWEEN :first_id AND :last_id")
+)
+
+
+class SchemaMigration:
+    """
+    기존 데이터베이스를 현재 엔티티 정의에 맞게 갱신하는 클래스
+
+    적용된 단계는 SQLite의 PRAGMA user_version에 기록되므로,
+    각 마이그레이션 단계는 데이터베이스마다 한 번만 실행됩니다.
+    """
+
+    def __init__(self, engine: Engine) -> None:
+        self.engine = engine
+        self.logger = DesktopLogger("PaceKeeper")
+
+        # (버전, 마이그레이션 함수) 목록 - 버전 오름차순으로 적용
+        self._steps: list[tuple[int, Callable[[], None]]] = [
+            (1, self._backfill_log_tags),
+            (2, self._add_log_epoch_columns),
+            (3, self._create_log_fts),
+            (4, self._add_unique_active_tag_names),
+            (5, self._build_daily_stats),
+            (6, self._use_partial_log_indexes),
+        ]
+
+    def get_version(self) -> int:
+        """
+        현재 데이터베이스의 스키마 버전 반환
+
+        Returns:
+            PRAGMA user_version 값
+        """
+        with self.engine.connect() as conn:
+            return conn.exec_driver_sql("PRAGMA user_version").scalar() or 0
+
+    def run(self) -> None:
+        """
+        아직 적용되지 않은 마이그레이션 단계를 순서대로 실행
+        """
+        current_version = self.get_version()
+        for version, step in self._steps:
+            if version <= current_version:
+                continue
+
+            step()
+            with self.engine.begin() as conn:
+                conn.exec_driver_sql(f"PRAGMA user_version = {int(version)}")
+            self.logger.log_system_event(f"스키마 마이그레이션 v{version} 적용 완료")
+
+    def _backfill_log_tags(self) -> None:
+        """
+        pace_logs.tags JSON 컬럼을 파싱하여 log_tags 연결 테이블을 채웁니다.
+
+        id 기준으로 BACKFILL_CHUNK_SIZE 행씩 읽고 청크마다 커밋합니다.
+        INSERT OR IGNORE를 사용하므로 중간에 중단되어도 다시 실행하면 이어서 채워집니다.
+        """
+        last_id = 0
+        inserted = 0
+        while True:
+            with self.engine.begin() as conn:
+                rows = conn.execute(
+                    text("SELECT id, tags FROM pace_logs WHERE id > :last_id ORDER BY id LIMIT :limit"),
+                    {"last_id": last_id, "limit": BACKFILL_CHUNK_SIZE}
+                ).fetchall()
+                if not rows:
+                    break
+
+                pairs = [
+                    {"log_id": log_id, "tag_id": tag_id}
+                    for log_id, tags_json in rows
+                    for tag_id in parse_tag_ids(tags_json)
+                ]
+                if pairs:
+                    conn.execute(
+                        text("INSERT OR IGNORE INTO log_tags (log_id, tag_id) VALUES (:log_id, :tag_id)"),
+                        pairs
+                    )
+                inserted += len(pairs)
+                last_id = rows[-1][0]
+
+        self.logger.log_system_event(f"log_tags 백필 완료: {inserted}개 연결")
+
+    def _add_log_epoch_columns(self) -> None:
+        """
+        pace_logs에 epoch 초 정수 컬럼(started_at, ended_at)을 추가하고 문자열 컬럼에서 값을 채웁니다.
+
+        문자열은 로컬 시간으로 저장되어 있으므로 SQLite의 'utc' 수정자로 UTC epoch 초로 변환합니다.
+        기존 문자열 기반 기간 인덱스는 새 정수 컬럼 인덱스로 대체되므로 제거합니다.
+        """
+        with self.engine.begin() as conn:
+            columns = {row[1] for row in conn.exec_driver_sql("PRAGMA table_info(pace_logs)")}
+            if "started_at" not in columns:
+                conn.exec_driver_sql("ALTER TABLE pace_logs ADD COLUMN started_at INTEGER")
+            if "ended_at" not in columns:
+                conn.exec_driver_sql("ALTER TABLE pace_logs ADD COLUMN ended_at INTEGER")
+            conn.exec_driver_sql("DROP INDEX IF EXISTS ix_pace_logs_state_start_date")
+            max_id = conn.exec_driver_sql("SELECT MAX(id) FROM pace_logs").scalar() or 0
+
+        for low_id in range(0, max_id, BACKFILL_CHUNK_SIZE):
+            with self.engine.begin() as conn:
+                conn.execute(
+                    text(
+                        "UPDATE pace_logs SET "
+                        "started_at = COALESCE(started_at, CAST(strftime('%s', start_date, 'utc') AS INTEGER)), "
+                        "ended_at = COALESCE(ended_at, CAST(strftime('%s', end_date, 'utc') AS INTEGER)) "
+                        "WHERE id > :low_id AND id <= :high_id"
+                    ),
+                    {"low_id": low_id, "high_id": low_id + BACKFILL_CHUNK_SIZE}
+                )
+
+        self.logger.log_system_event(f"pace_logs epoch 컬럼 백필 완료: 최대 ID {max_id}")
+
+    def _create_log_fts(self) -> None:
+        """
+        pace_logs.message를 색인하는 FTS5 테이블과 동기화 트리거를 만들고 기존 메시지로 색인을 채웁니다.
+
+        SQLite가 FTS5 또는 trigram 토크나이저(3.34 이상)를 지원하지 않으면 건너뛰며,
+        이 경우 LogRepository.search_logs는 LIKE 검색으로 동작합니다.
+        """
+        try:
+            with self.engine.begin() as conn:
+                for statement in LOG_FTS_DDL:
+                    conn.exec_driver_sql(statement)
+                conn.exec_driver_sql(f"INSERT INTO {LOG_FTS_TABLE}({LOG_FTS_TABLE}) VALUES ('rebuild')")
+        except OperationalError as e:
+            self.logger.log_error(f"전문 검색 테이블 생성 실패 (LIKE 검색 사용): {e}")
+            return
+
+        self.logger.log_system_event(f"{LOG_FTS_TABLE} 전문 검색 색인 생성 완료")
+
+    def _add_unique_active_tag_names(self) -> None:
+        """
+        활성 태그 이름에 부분 유니크 인덱스(uq_tags_name_active)를 추가합니다.
+
+        이미 같은 이름의 활성 태그가 여러 개 있으면 가장 먼저 만들어진 태그만 남기고
+        나머지는 soft delete 합니다. 삭제된 태그도 ID로 조회되므로 과거 로그의 태그 표시는 유지됩니다.
+        """
+        with self.engine.begin() as conn:
+            deduplicated = conn.exec_driver_sql(
+                "UPDATE tags SET state = 0 WHERE state >= 1 AND id NOT IN ("
+                "SELECT MIN(id) FROM tags WHERE state >= 1 GROUP BY name)"
+            ).rowcount
+            conn.exec_driver_sql(
+                "CREATE UNIQUE INDEX IF NOT EXISTS uq_tags_name_active ON tags (name) WHERE state >= 1"
+            )
+
+        self.logger.log_system_event(f"활성 태그 이름 유니크 인덱스 생성 완료: 중복 태그 {deduplicated}개 정리")
+
+    def _build_daily_stats(self) -> None:
+        """
+        기존 활성 로그로 daily_stats 롤업 테이블을 채웁니다.
+        (테이블은 create_all로 이미 생성되어 있으며, 이후에는 LogService가 증분으로 갱신)
+        """
+        with self.engine.begin() as conn:
+            for statement in DAILY_STATS_REBUILD_SQL:
+                conn.exec_driver_sql(statement)
+            row_count = conn.exec_driver_sql("SELECT COUNT(*) FROM daily_stats").scalar()
+
+        self.logger.log_system_event(f"daily_stats 집계 테이블 생성 완료: {row_count}행")
+
+    def _use_partial_log_indexes(self) -> None:
+        """
+        (state, ...) 복합 인덱스였던 pace_logs 인덱스를 제거합니다.
+
+        같은 이름의 활성 로그 부분 인덱스(WHERE state >= 1)는 마이그레이션 후
+        DatabaseSessionManager가 누락된 인덱스로 다시 생성합니다.
+        선두 컬럼이 범위 조건인 복합 인덱스는 ANALYZE 통계가 있어야 skip-scan으로 사용되고,
+        최신순 조회에서는 정렬을 위한 임시 B-tree가 필요했습니다.
+        """
+        with self.engine.begin() as conn:
+            conn.exec_driver_sql("DROP INDEX IF EXISTS ix_pace_logs_state_started_at")
+            conn.exec_driver_sql("DROP INDEX IF EXISTS ix_pace_logs_state_id")
+
+        self.logger.log_system_event("pace_logs 복합 인덱스 제거 완료 (부분 인덱스로 다시 생성)")
@@ -1,59 +1,125 @@
 # database/session_manager.py
 
+import threading
 from collections.abc import Generator
 from contextlib import contextmanager
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session, sessionmaker
 
+from pacekeeper.database.query_stats import attach_query_stats, query_action
+from pacekeeper.database.schema_migration import SchemaMigration
+from pacekeeper.database.sqlite_pragmas import apply_sqlite_pragmas, get_sqlite_pragmas
 from pacekeeper.repository.db_config import DATABASE_URI
 from pacekeeper.repository.entities import Base
 from pacekeeper.utils.desktop_logger import DesktopLogger
 
+# 다른 연결이 쓰기 잠금을 가진 경우 기다리는 최대 시간(초)
+# (DbWorker 작업 스레드와 GUI 스레드가 동시에 쓰기를 시도해도 "database is locked" 대신 대기)
+SQLITE_BUSY_TIMEOUT_SECONDS = 10
+
 
 class DatabaseSessionManager:
     """
     데이터베이스 세션 관리를 중앙화하는 클래스
 
     모든 Repository가 공통으로 사용할 세션 관리 기능을 제공합니다.
+
+    여러 스레드에서 사용할 수 있습니다. 싱글톤 생성과 초기화는 잠금으로 보호되고,
+    세션은 호출마다 새로 만들어 한 스레드 안에서만 사용하며, 연결은 엔진의 연결 풀이 스레드별로 빌려줍니다.
     """
 
     _instance = None
     _initialized = False
+    _instance_lock = threading.Lock()
 
-    def __new__(cls):
+    def __new__(cls, database_uri=None):
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls)
         return cls._instance
 
-    def __init__(self) -> None:
-        if not self._initialized:
+    def __init__(self, database_uri=None) -> None:
+        """
+        Args:
+            database_uri: 데이터베이스 URI (None이면 앱 데이터 경로의 DB 사용, 벤치마크 등에서 임시 DB 지정용)
+                          싱글톤이므로 최초 생성 시에만 적용됩니다.
+        """
+        if self._initialized:
+            return
+        with self._instance_lock:
+            if self._initialized:
+                return
             self.logger = DesktopLogger("PaceKeeper")
             self.engine = create_engine(
-                DATABASE_URI,
+                database_uri or DATABASE_URI,
                 echo=False,
-                connect_args={"check_same_thread": False}
+                connect_args={"check_same_thread": False, "timeout": SQLITE_BUSY_TIMEOUT_SECONDS}
             )
+            # 새 연결마다 WAL 모드 등 성능 관련 PRAGMA 적용
+            self.pragmas = get_sqlite_pragmas()
+            event.listen(self.engine, "connect", self._on_connect)
             self.SessionLocal = sessionmaker(bind=self.engine)
-            self._initialize_database()
+            # PACEKEEPER_QUERY_STATS 환경 변수가 켜져 있으면 실행된 SQL 문장을 작업별로 기록
+            self.query_stats = attach_query_stats(self.engine)
+            with query_action("데이터베이스 초기화"):
+                self._initialize_database()
             DatabaseSessionManager._initialized = True
             self.logger.log_system_event("DatabaseSessionManager 초기화됨.")
 
+    def _on_connect(self, dbapi_connection, connection_record) -> None:
+        """
+        엔진이 새 DBAPI 연결을 열 때 호출되어 설정된 PRAGMA를 적용
+        """
+        apply_sqlite_pragmas(dbapi_connection, self.pragmas)
+
     def _initialize_database(self) -> None:
         """
         데이터베이스 및 테이블 초기화
+
+        테이블 생성 후 기존 데이터베이스에 스키마 마이그레이션과 누락된 인덱스를 적용합니다.
+        인덱스가 새로 추가된 컬럼을 참조할 수 있으므로 마이그레이션을 먼저 실행합니다.
         """
         try:
             Base.metadata.create_all(self.engine)
+            SchemaMigration(self.engine).run()
+            self._create_missing_indexes()
             self.logger.log_system_event("데이터베이스 초기화 완료")
         except SQLAlchemyError as e:
             self.logger.log_error("데이터베이스 초기화 실패", exc_info=True)
             raise Exception("데이터베이스 초기화 실패") from e
 
+    def _create_missing_indexes(self) -> None:
+        """
+        엔티티에 선언된 인덱스 중 데이터베이스에 없는 것을 생성
+
+        create_all은 이미 존재하는 테이블에 인덱스를 추가하지 않으므로,
+        이전 버전에서 만들어진 데이터베이스를 위해 인덱스별로 확인 후 생성합니다.
+        인덱스를 새로 만든 경우 ANALYZE로 통계를 갱신하여, 선두 컬럼이 범위 조건(state >= 1)인
+        복합 인덱스도 쿼리 플래너가 skip-scan으로 사용할 수 있게 합니다.
+        인스펙터는 표현식 인덱스를 반환하지 않으므로 기존 인덱스 이름은 sqlite_master에서 조회합니다.
+        """
+        with self.engine.connect() as conn:
+            existing = {
+                name for (name,) in conn.exec_driver_sql("SELECT name FROM sqlite_master WHERE type = 'index'")
+            }
+        created = 0
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                if index.name not in existing:
+                    index.create(bind=self.engine)
+                    created += 1
+
+        if created:
+            with self.engine.begin() as conn:
+                conn.exec_driver_sql("ANALYZE")
+            self.logger.log_system_event(f"누락된 인덱스 {created}개 생성 완료")
+
     def get_session(self) -> Session:
         """
-        새로운 데이터베이스 세션 생성
+        새로운 데이터베이스 세션 생성 (세션은 스레드 간에 공유하지 말 것)
 
         Returns:
             SQLAlchemy 세션 객체
@@ -101,6 +167,12 @@ class DatabaseSessionManager:
         모든 세션 정리 및 엔진 종료
         """
         try:
+            if self.query_stats is not None:
+                self.query_stats.stop()
+                self.logger.log_system_event(self.query_stats.report())
+            # 세션 동안 수집된 쿼리 패턴을 바탕으로 필요한 테이블의 통계를 갱신
+            with self.engine.begin() as conn:
+                conn.exec_driver_sql("PRAGMA optimize")
             self.engine.dispose()
             self.logger.log_system_event("모든 데이터베이스 세션 종료됨")
         except Exception as e:
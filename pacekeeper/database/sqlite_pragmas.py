@@ -0,0 +1,88 @@
+# database/sqlite_pragmas.py
+
+from typing import Any
+
+from pacekeeper.consts.settings import (
+    DEFAULT_SETTINGS,
+    SET_DB_CACHE_SIZE,
+    SET_DB_JOURNAL_MODE,
+    SET_DB_MMAP_SIZE,
+    SET_DB_SYNCHRONOUS,
+    SET_DB_TEMP_STORE,
+)
+
+# 설정 키 → PRAGMA 이름
+PRAGMA_SETTING_KEYS: dict[str, str] = {
+    SET_DB_JOURNAL_MODE: "journal_mode",
+    SET_DB_SYNCHRONOUS: "synchronous",
+    SET_DB_TEMP_STORE: "temp_store",
+    SET_DB_MMAP_SIZE: "mmap_size",
+    SET_DB_CACHE_SIZE: "cache_size",
+}
+
+# 문자열 PRAGMA의 허용 값 (설정 파일 값이 SQL에 그대로 들어가지 않도록 제한)
+ALLOWED_PRAGMA_VALUES: dict[str, set[str]] = {
+    "journal_mode": {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"},
+    "synchronous": {"OFF", "NORMAL", "FULL", "EXTRA"},
+    "temp_store": {"DEFAULT", "FILE", "MEMORY"},
+}
+
+DEFAULT_PRAGMAS: dict[str, Any] = {
+    pragma: DEFAULT_SETTINGS[key] for key, pragma in PRAGMA_SETTING_KEYS.items()
+}
+
+
+def get_sqlite_pragmas() -> dict[str, Any]:
+    """
+    사용자 설정에서 SQLite PRAGMA 값을 읽어 반환
+    설정에 없는 항목은 기본값을 사용합니다.
+
+    Returns:
+        PRAGMA 이름 → 값 딕셔너리
+    """
+    from pacekeeper.controllers.config_controller import ConfigController
+
+    config = ConfigController()
+    return {
+        pragma: config.get_setting(key, DEFAULT_SETTINGS[key])
+        for key, pragma in PRAGMA_SETTING_KEYS.items()
+    }
+
+
+def normalize_pragma_value(pragma: str, value: Any) -> str:
+    """
+    PRAGMA 값을 검증하여 SQL에 사용할 문자열로 변환
+    잘못된 값이면 기본값을 사용합니다.
+
+    Args:
+        pragma: PRAGMA 이름
+        value: 설정 값
+
+    Returns:
+        검증된 PRAGMA 값 문자열
+    """
+    allowed = ALLOWED_PRAGMA_VALUES.get(pragma)
+    if allowed is not None:
+        text_value = str(value).upper()
+        return text_value if text_value in allowed else str(DEFAULT_PRAGMAS[pragma])
+
+    try:
+        return str(int(value))
+    except (TypeError, ValueError):
+        return str(DEFAULT_PRAGMAS[pragma])
+
+
+def apply_sqlite_pragmas(dbapi_connection: Any, pragmas: dict[str, Any]) -> None:
+    """
+    새로 열린 DBAPI 연결에 PRAGMA 적용 (SQLAlchemy "connect" 이벤트에서 호출)
+
+    Args:
+        dbapi_connection: sqlite3 연결 객체
+        pragmas: PRAGMA 이름 → 값 딕셔너리
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma, value in pragmas.items():
+            cursor.execute(f"PRAGMA {pragma}={normalize_pragma_value(pragma, value)}")
+    finally:
+        cursor.close()
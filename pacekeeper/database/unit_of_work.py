@@ -93,7 +93,7 @@ class UnitOfWork:
         if self._session:
             try:
                 self._session.flush()
-                self.logger.log_debug("UnitOfWork 세션 플러시됨")
+                self.logger.log_system_event("UnitOfWork 세션 플러시됨")
             except SQLAlchemyError as e:
                 self.logger.log_error("UnitOfWork 플러시 실패", exc_info=True)
                 raise e
@@ -2,10 +2,12 @@
 
 from .i_category_repository import ICategoryRepository
 from .i_log_repository import ILogRepository
+from .i_stats_repository import IStatsRepository
 from .i_tag_repository import ITagRepository
 
 __all__ = [
     "ILogRepository",
     "ITagRepository",
     "ICategoryRepository",
+    "IStatsRepository",
 ]
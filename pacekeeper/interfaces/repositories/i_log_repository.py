@@ -1,8 +1,14 @@
 # interfaces/repositories/i_log_repository.py
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from datetime import datetime
+
+from sqlalchemy.orm import Session
 
 from pacekeeper.repository.entities import Log
+from pacekeeper.repository.log_export_row import LogExportRow
+from pacekeeper.repository.log_filters import LogFilters
 
 
 class ILogRepository(ABC):
@@ -22,18 +28,48 @@ class ILogRepository(ABC):
     # save_category 메서드 제거됨 - LogRepository에서 카테고리 로직 분리
 
     @abstractmethod
-    def save_log(self, log: Log) -> Log:
+    def save_log(self, log: Log, session: Session | None = None) -> Log:
         """
         로그 저장/갱신
 
         Args:
             log: 저장할 로그 객체
+            session: 호출자의 트랜잭션 세션 (None이면 새 트랜잭션에서 저장 후 커밋)
 
         Returns:
             저장된 로그 객체
         """
         pass
 
+    @abstractmethod
+    def bulk_insert_logs(self, logs: list[tuple[str, list[int], datetime, datetime | None]], session: Session) -> list[int]:
+        """
+        여러 로그를 한 번에 저장 (호출자의 트랜잭션 안에서 실행, 커밋하지 않음)
+
+        Args:
+            logs: (메시지, 태그 ID 목록, 시작 시간, 종료 시간) 목록
+            session: 호출자의 세션
+
+        Returns:
+            입력 순서대로의 새 로그 ID 목록
+        """
+        pass
+
+    @abstractmethod
+    def find_existing_log_keys(self, session: Session, start: datetime, end: datetime) -> set[tuple[datetime, str]]:
+        """
+        기간 내 활성 로그의 (시작 시간, 메시지) 조회
+
+        Args:
+            session: 사용할 세션
+            start: 시작 시간 (포함)
+            end: 종료 시간 (포함)
+
+        Returns:
+            (시작 시간, 메시지) 집합
+        """
+        pass
+
     @abstractmethod
     def get_all_logs(self) -> list[Log]:
         """
@@ -45,13 +81,13 @@ class ILogRepository(ABC):
         pass
 
     @abstractmethod
-    def get_logs_by_period(self, start_date: str, end_date: str) -> list[Log]:
+    def get_logs_by_period(self, start_date: str | datetime, end_date: str | datetime) -> list[Log]:
         """
         기간 내의 활성 로그 조회
 
         Args:
-            start_date: 시작 날짜/시간
-            end_date: 종료 날짜/시간
+            start_date: 시작 날짜/시간 (datetime 또는 문자열)
+            end_date: 종료 날짜/시간 (datetime 또는 문자열)
 
         Returns:
             기간 내의 활성 로그 목록
@@ -71,6 +107,75 @@ class ILogRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_logs_page(
+        self,
+        filters: LogFilters | None = None,
+        after_id: int | None = None,
+        page_size: int = 100
+    ) -> list[Log]:
+        """
+        조건에 맞는 활성 로그를 ID 내림차순으로 한 페이지 조회 (keyset 페이지네이션)
+
+        Args:
+            filters: 조회 조건 (None이면 전체)
+            after_id: 직전 페이지의 마지막 로그 ID (None이면 첫 페이지)
+            page_size: 페이지당 최대 로그 수
+
+        Returns:
+            ID 내림차순 로그 목록 (page_size보다 적으면 마지막 페이지)
+        """
+        pass
+
+    @abstractmethod
+    def count_logs(self, filters: LogFilters | None = None) -> int:
+        """
+        조건에 맞는 활성 로그 수 조회
+
+        Args:
+            filters: 조회 조건 (None이면 전체)
+
+        Returns:
+            로그 수
+        """
+        pass
+
+    @abstractmethod
+    def iter_export_rows(self, filters: LogFilters | None = None, batch_size: int = 1000) -> Iterator[LogExportRow]:
+        """
+        조건에 맞는 활성 로그를 ID 오름차순으로 스트리밍 조회 (전체 결과를 메모리에 올리지 않음)
+
+        Args:
+            filters: 조회 조건 (None이면 전체)
+            batch_size: 한 번에 가져오는 행 수
+
+        Yields:
+            태그/카테고리 이름이 해석된 로그 행
+        """
+        pass
+
+    @abstractmethod
+    def search_logs(
+        self,
+        query: str,
+        period: tuple[str | datetime | None, str | datetime | None] | None = None,
+        limit: int = 100,
+        tag_keyword: str | None = None
+    ) -> list[Log]:
+        """
+        메시지 전문 검색으로 활성 로그 조회
+
+        Args:
+            query: 공백으로 구분된 검색어 (모든 단어 포함)
+            period: (시작, 종료) 날짜/시간 범위 (None이면 전체 기간)
+            limit: 최대 결과 수
+            tag_keyword: 태그 이름 조건 (None이면 적용하지 않음)
+
+        Returns:
+            관련도 순 검색 결과 로그 목록
+        """
+        pass
+
     @abstractmethod
     def get_recent_logs(self, limit: int = 20) -> list[Log]:
         """
@@ -85,12 +190,13 @@ class ILogRepository(ABC):
         pass
 
     @abstractmethod
-    def soft_delete_logs(self, log_ids: list[int]) -> int:
+    def soft_delete_logs(self, log_ids: list[int], session: Session | None = None) -> int:
         """
         로그들을 soft delete 처리
 
         Args:
             log_ids: 삭제할 로그 ID 목록
+            session: 호출자의 트랜잭션 세션 (None이면 새 트랜잭션에서 삭제 후 커밋)
 
         Returns:
             삭제된 로그 수
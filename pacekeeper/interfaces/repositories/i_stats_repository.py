@@ -0,0 +1,88 @@
+# interfaces/repositories/i_stats_repository.py
+
+from abc import ABC, abstractmethod
+from datetime import date
+
+from sqlalchemy.orm import Session
+
+from pacekeeper.repository.stats_totals import DailyStatColumns, StatsTotals
+
+
+class IStatsRepository(ABC):
+    """
+    통계 Repository 인터페이스
+
+    daily_stats 롤업 테이블 접근을 위한 추상 인터페이스를 정의합니다.
+    """
+
+    @abstractmethod
+    def add_logs(self, log_ids: list[int], session: Session) -> None:
+        """
+        활성 로그들을 일별 집계에 더합니다. (호출자의 트랜잭션 안에서 실행, 커밋하지 않음)
+
+        Args:
+            log_ids: 저장이 끝난(flush된) 로그 ID 목록
+            session: 호출자의 세션
+        """
+        pass
+
+    @abstractmethod
+    def add_log_range(self, first_id: int, last_id: int, session: Session) -> None:
+        """
+        연속 ID 범위의 활성 로그들을 일별 집계에 더합니다. (커밋하지 않음)
+
+        Args:
+            first_id: 첫 로그 ID (포함)
+            last_id: 마지막 로그 ID (포함)
+            session: 호출자의 세션
+        """
+        pass
+
+    @abstractmethod
+    def remove_logs(self, log_ids: list[int], session: Session) -> None:
+        """
+        활성 로그들을 일별 집계에서 뺍니다. (soft delete 전에 호출, 커밋하지 않음)
+
+        Args:
+            log_ids: 삭제할 로그 ID 목록
+            session: 호출자의 세션
+        """
+        pass
+
+    @abstractmethod
+    def get_period_totals(self, start_day: date, end_day: date) -> StatsTotals:
+        """
+        기간 내 전체/태그별/카테고리별 합계 조회
+
+        Args:
+            start_day: 시작 날짜 (포함)
+            end_day: 종료 날짜 (포함)
+
+        Returns:
+            기간 집계 결과
+        """
+        pass
+
+    @abstractmethod
+    def get_daily_columns(self, start_day: date, end_day: date) -> DailyStatColumns:
+        """
+        기간 내 일별 집계 행을 컬럼별 배열로 조회
+
+        Args:
+            start_day: 시작 날짜 (포함)
+            end_day: 종료 날짜 (포함)
+
+        Returns:
+            날짜순으로 정렬된 컬럼 배열
+        """
+        pass
+
+    @abstractmethod
+    def rebuild(self) -> int:
+        """
+        활성 로그 전체로 일별 집계를 다시 계산
+
+        Returns:
+            생성된 집계 행 수
+        """
+        pass
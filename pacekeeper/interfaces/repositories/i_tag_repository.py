@@ -2,6 +2,8 @@
 
 from abc import ABC, abstractmethod
 
+from sqlalchemy.orm import Session
+
 from pacekeeper.repository.entities import Tag
 
 
@@ -31,6 +33,22 @@ class ITagRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def ensure_tags(self, names: list[str], session: Session) -> list[int]:
+        """
+        태그 이름 목록을 활성 태그 ID 목록으로 변환 (없는 태그는 일괄 생성)
+
+        호출자의 트랜잭션 안에서 실행되며 커밋하지 않습니다.
+
+        Args:
+            names: 태그 이름 목록
+            session: 호출자의 세션
+
+        Returns:
+            중복을 제거한 이름 순서대로의 태그 ID 목록
+        """
+        pass
+
     @abstractmethod
     def get_tag(self, tag_id: int) -> Tag | None:
         """
@@ -44,6 +62,19 @@ class ITagRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_tags_by_ids(self, tag_ids: list[int]) -> list[Tag]:
+        """
+        태그 ID 목록으로 태그들을 일괄 조회 (삭제된 태그 포함)
+
+        Args:
+            tag_ids: 조회할 태그 ID 목록
+
+        Returns:
+            찾은 태그 목록 (순서 보장 없음)
+        """
+        pass
+
     @abstractmethod
     def get_tags(self) -> list[Tag]:
         """
@@ -2,10 +2,12 @@
 
 from .i_category_service import ICategoryService
 from .i_log_service import ILogService
+from .i_stats_service import IStatsService
 from .i_tag_service import ITagService
 
 __all__ = [
     "ILogService",
     "ITagService",
     "ICategoryService",
+    "IStatsService",
 ]
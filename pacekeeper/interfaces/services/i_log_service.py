@@ -4,6 +4,9 @@ from abc import ABC, abstractmethod
 from datetime import datetime
 
 from pacekeeper.repository.entities import Log
+from pacekeeper.repository.log_filters import LogFilters
+from pacekeeper.services.log_export import ProgressCallback
+from pacekeeper.services.log_import import LogImportResult
 
 
 class ILogService(ABC):
@@ -14,13 +17,16 @@ class ILogService(ABC):
     """
 
     @abstractmethod
-    def create_study_log(self, message: str, study_start_time: datetime | None = None) -> None:
+    def create_study_log(
+        self, message: str, study_start_time: datetime | None = None, ended_at: datetime | None = None
+    ) -> None:
         """
         학습 로그를 생성합니다.
 
         Args:
             message: 로그 메시지
             study_start_time: 학습 시작 시간 (선택사항)
+            ended_at: 학습 종료 시간 (선택사항, 없으면 현재 시간)
         """
         pass
 
@@ -35,13 +41,13 @@ class ILogService(ABC):
         pass
 
     @abstractmethod
-    def retrieve_logs_by_period(self, start_date: str, end_date: str) -> list[Log]:
+    def retrieve_logs_by_period(self, start_date: str | datetime, end_date: str | datetime) -> list[Log]:
         """
         지정한 기간 동안의 활성 로그를 조회합니다.
 
         Args:
-            start_date: 시작 날짜
-            end_date: 종료 날짜
+            start_date: 시작 날짜 (datetime 또는 문자열)
+            end_date: 종료 날짜 (datetime 또는 문자열)
 
         Returns:
             기간 내의 활성 로그 목록
@@ -61,6 +67,48 @@ class ILogService(ABC):
         """
         pass
 
+    @abstractmethod
+    def retrieve_logs_page(
+        self,
+        filters: LogFilters | None = None,
+        after_id: int | None = None,
+        page_size: int = 100
+    ) -> list[Log]:
+        """
+        조건에 맞는 활성 로그를 최신순으로 한 페이지씩 조회합니다.
+
+        Args:
+            filters: 조회 조건 (None이면 전체)
+            after_id: 직전 페이지의 마지막 로그 ID (None이면 첫 페이지)
+            page_size: 페이지당 최대 로그 수
+
+        Returns:
+            ID 내림차순 로그 목록 (page_size보다 적으면 마지막 페이지)
+        """
+        pass
+
+    @abstractmethod
+    def search_logs(
+        self,
+        query: str,
+        period: tuple[str | datetime | None, str | datetime | None] | None = None,
+        limit: int = 100,
+        tag_keyword: str | None = None
+    ) -> list[Log]:
+        """
+        메시지에 검색어가 포함된 활성 로그를 관련도 순으로 조회합니다.
+
+        Args:
+            query: 공백으로 구분된 검색어 (모든 단어 포함)
+            period: (시작, 종료) 날짜/시간 범위 (None이면 전체 기간)
+            limit: 최대 결과 수
+            tag_keyword: 태그 이름 조건 (None이면 적용하지 않음)
+
+        Returns:
+            검색 결과 로그 목록
+        """
+        pass
+
     @abstractmethod
     def retrieve_recent_logs(self, limit: int = 20) -> list[Log]:
         """
@@ -83,3 +131,45 @@ class ILogService(ABC):
             log_ids: 삭제할 로그 ID 목록
         """
         pass
+
+    @abstractmethod
+    def export_logs(
+        self,
+        path: str,
+        export_format: str,
+        filters: LogFilters | None = None,
+        progress_callback: ProgressCallback | None = None
+    ) -> int:
+        """
+        조건에 맞는 활성 로그를 CSV 또는 JSONL 파일로 스트리밍하여 내보냅니다.
+
+        Args:
+            path: 저장할 파일 경로
+            export_format: "csv" 또는 "jsonl"
+            filters: 조회 조건 (None이면 전체)
+            progress_callback: (내보낸 행 수, 전체 행 수) 진행 상황 콜백
+
+        Returns:
+            내보낸 로그 수 (실패 또는 취소 시 -1)
+        """
+        pass
+
+    @abstractmethod
+    def import_logs(
+        self,
+        path: str,
+        import_format: str | None = None,
+        progress_callback: ProgressCallback | None = None
+    ) -> LogImportResult:
+        """
+        CSV 또는 JSONL 파일의 로그를 청크 단위 트랜잭션으로 일괄 저장합니다.
+
+        Args:
+            path: 가져올 파일 경로
+            import_format: "csv" 또는 "jsonl" (None이면 확장자로 판단)
+            progress_callback: (읽은 행 수, 예상 전체 행 수) 진행 상황 콜백
+
+        Returns:
+            가져오기 결과
+        """
+        pass
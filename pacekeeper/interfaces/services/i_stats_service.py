@@ -0,0 +1,104 @@
+# interfaces/services/i_stats_service.py
+
+from abc import ABC, abstractmethod
+from datetime import date
+
+from pacekeeper.repository.stats_totals import StatsDashboard, StatsTotals
+
+
+class IStatsService(ABC):
+    """
+    통계 Service 인터페이스
+
+    daily_stats 롤업 테이블 기반의 기간별 집계 조회를 위한 추상 인터페이스를 정의합니다.
+    """
+
+    @abstractmethod
+    def get_day_totals(self, day: date | None = None) -> StatsTotals:
+        """
+        하루 합계를 조회합니다.
+
+        Args:
+            day: 조회할 날짜 (None이면 오늘)
+
+        Returns:
+            해당 날짜의 집계 결과
+        """
+        pass
+
+    @abstractmethod
+    def get_week_totals(self, day: date | None = None) -> StatsTotals:
+        """
+        주어진 날짜가 속한 주(월요일~일요일)의 합계를 조회합니다.
+
+        Args:
+            day: 기준 날짜 (None이면 오늘)
+
+        Returns:
+            해당 주의 집계 결과
+        """
+        pass
+
+    @abstractmethod
+    def get_month_totals(self, day: date | None = None) -> StatsTotals:
+        """
+        주어진 날짜가 속한 달의 합계를 조회합니다.
+
+        Args:
+            day: 기준 날짜 (None이면 오늘)
+
+        Returns:
+            해당 달의 집계 결과
+        """
+        pass
+
+    @abstractmethod
+    def get_year_totals(self, day: date | None = None) -> StatsTotals:
+        """
+        주어진 날짜가 속한 해의 합계를 조회합니다.
+
+        Args:
+            day: 기준 날짜 (None이면 오늘)
+
+        Returns:
+            해당 해의 집계 결과
+        """
+        pass
+
+    @abstractmethod
+    def get_period_totals(self, start_day: date, end_day: date) -> StatsTotals:
+        """
+        임의 기간의 합계를 조회합니다.
+
+        Args:
+            start_day: 시작 날짜 (포함)
+            end_day: 종료 날짜 (포함)
+
+        Returns:
+            기간 집계 결과
+        """
+        pass
+
+    @abstractmethod
+    def get_dashboard(self, start_day: date | None = None, end_day: date | None = None) -> StatsDashboard:
+        """
+        통계 대시보드 데이터를 계산합니다.
+
+        Args:
+            start_day: 시작 날짜 (None이면 end_day 기준 최근 1년)
+            end_day: 종료 날짜 (None이면 오늘)
+
+        Returns:
+            날짜별 합계, 태그/카테고리별 합계, 연속 기록 일수
+        """
+        pass
+
+    @abstractmethod
+    def rebuild_stats(self) -> int:
+        """
+        활성 로그 전체로 일별 집계를 다시 계산합니다.
+
+        Returns:
+            생성된 집계 행 수 (실패 시 -1)
+        """
+        pass
@@ -25,6 +25,18 @@ class ITagService(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_tag_texts(self, tag_id_lists: list[list[int] | str]) -> list[list[str]]:
+        """
+        여러 로그의 태그 ID 목록을 한 번에 태그 이름 목록으로 변환합니다.
+
+        Args:
+            tag_id_lists: 로그별 태그 ID 목록 (정수 리스트 또는 JSON 문자열)의 리스트
+
+        Returns:
+            입력 순서와 동일한 로그별 태그 이름 목록
+        """
+        pass
 
     @abstractmethod
     def create_tag(self, name: str, description: str = "") -> Tag:
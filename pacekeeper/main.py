@@ -54,6 +54,112 @@ except Exception as e:
     sys.exit(1)
 
 
+def create_main_window(app: QApplication) -> MainWindow:
+    """
+    데이터 마이그레이션, DI 컨테이너 구성 후 메인 윈도우와 메인 컨트롤러를 생성합니다.
+
+    Args:
+        app: 실행 중인 QApplication (종료 시 정리 작업 연결용)
+
+    Returns:
+        MainController가 연결된 메인 윈도우 (아직 표시되지 않음)
+    """
+    # 데이터 마이그레이션 체크 및 수행
+    logger.info("데이터 마이그레이션 체크...")
+    from pacekeeper.utils.app_paths import ensure_data_directory
+    from pacekeeper.utils.migration import DataMigration
+
+    # 데이터 디렉토리 확인 및 생성
+    if not ensure_data_directory():
+        logger.error("데이터 디렉토리 생성 실패")
+
+    # 마이그레이션 필요 여부 확인
+    migration = DataMigration()
+    if migration.check_migration_needed():
+        logger.info("데이터 마이그레이션이 필요합니다.")
+        migration_results = migration.perform_migration()
+
+        if migration_results['overall']:
+            logger.info("데이터 마이그레이션이 완료되었습니다.")
+            if migration_results['database']:
+                logger.info("데이터베이스 마이그레이션 성공")
+            if migration_results['config']:
+                logger.info("설정 파일 마이그레이션 성공")
+        else:
+            logger.warning("데이터 마이그레이션에 실패했습니다. 기본 설정으로 시작합니다.")
+    else:
+        logger.info("마이그레이션이 필요하지 않습니다.")
+
+    # DI 컨테이너 설정
+    logger.info("DI 컨테이너 초기화...")
+    container = DIContainer()
+    ServiceRegistry.register_all_services(container)
+
+    # 앱 종료 시 진행 중인 데이터베이스 작업을 기다린 뒤 통계 갱신 및 연결 정리
+    from pacekeeper.controllers.db_worker import DbWorker
+    from pacekeeper.database import DatabaseSessionManager
+
+    db_worker = container.resolve(DbWorker)
+    app.aboutToQuit.connect(db_worker.wait_for_done)
+    app.aboutToQuit.connect(container.resolve(DatabaseSessionManager).close_all_sessions)
+
+    # 설정 컨트롤러 생성
+    logger.info("ConfigController 생성...")
+    config_ctrl = container.resolve(ConfigController)
+    # 앱 종료 시 예약된 설정 저장을 바로 실행
+    app.aboutToQuit.connect(config_ctrl.flush_settings)
+
+    # 메인 윈도우 생성 (임시로 None 컨트롤러)
+    logger.info("MainWindow 생성...")
+    main_window = MainWindow(None, config_ctrl)
+
+    # 메인 컨트롤러 생성 (DI 컨테이너를 통해)
+    logger.info("MainController 생성...")
+    # MainController는 MainWindow를 생성자 매개변수로 받으므로 수동으로 생성
+    from pacekeeper.controllers.sound_manager import SoundManager
+    from pacekeeper.controllers.timer_controller import TimerService
+    from pacekeeper.interfaces.services.i_category_service import ICategoryService
+    from pacekeeper.interfaces.services.i_log_service import ILogService
+    from pacekeeper.interfaces.services.i_stats_service import IStatsService
+    from pacekeeper.interfaces.services.i_tag_service import ITagService
+
+    category_service = container.resolve(ICategoryService)
+    log_service = container.resolve(ILogService)
+    tag_service = container.resolve(ITagService)
+    stats_service = container.resolve(IStatsService)
+    sound_manager = container.resolve(SoundManager)  # 첫 알림음 재생 시 생성되는 지연 싱글톤
+
+    # TimerService는 콜백 함수가 필요하므로 수동 생성
+    timer_service = TimerService(
+        config_ctrl,
+        update_callback=main_window.update_timer_label,
+        on_finish=None  # 나중에 MainController에서 설정
+    )
+
+    main_ctrl = MainController(
+        main_window,
+        config_ctrl,
+        category_service,
+        tag_service,
+        log_service,
+        sound_manager,
+        timer_service,
+        stats_service,
+        db_worker
+    )
+
+    # MainWindow에 MainController 설정 (의존성 주입 완료)
+    main_window.set_main_controller(main_ctrl)
+
+    # 앱 종료 시 대기 중인 로그를 파일에 기록
+    # 슬롯은 연결한 순서대로 호출되므로, 데이터베이스 종료와 설정 저장 로그까지 포함되도록 가장 마지막에 연결
+    from pacekeeper.utils.desktop_logger import DesktopLogger
+
+    app.aboutToQuit.connect(DesktopLogger("PaceKeeper").shutdown)
+
+    return main_window
+
+
 def main() -> NoReturn:
     """애플리케이션 메인 함수"""
     try:
@@ -89,78 +195,7 @@ def main() -> NoReturn:
                     logger.info(f"대체 아이콘 설정 완료: {fallback_path}")
                     break
 
-        # 데이터 마이그레이션 체크 및 수행
-        logger.info("데이터 마이그레이션 체크...")
-        from pacekeeper.utils.app_paths import ensure_data_directory
-        from pacekeeper.utils.migration import DataMigration
-
-        # 데이터 디렉토리 확인 및 생성
-        if not ensure_data_directory():
-            logger.error("데이터 디렉토리 생성 실패")
-
-        # 마이그레이션 필요 여부 확인
-        migration = DataMigration()
-        if migration.check_migration_needed():
-            logger.info("데이터 마이그레이션이 필요합니다.")
-            migration_results = migration.perform_migration()
-
-            if migration_results['overall']:
-                logger.info("데이터 마이그레이션이 완료되었습니다.")
-                if migration_results['database']:
-                    logger.info("데이터베이스 마이그레이션 성공")
-                if migration_results['config']:
-                    logger.info("설정 파일 마이그레이션 성공")
-            else:
-                logger.warning("데이터 마이그레이션에 실패했습니다. 기본 설정으로 시작합니다.")
-        else:
-            logger.info("마이그레이션이 필요하지 않습니다.")
-
-        # DI 컨테이너 설정
-        logger.info("DI 컨테이너 초기화...")
-        container = DIContainer()
-        ServiceRegistry.register_all_services(container)
-
-        # 설정 컨트롤러 생성
-        logger.info("ConfigController 생성...")
-        config_ctrl = container.resolve(ConfigController)
-
-        # 메인 윈도우 생성 (임시로 None 컨트롤러)
-        logger.info("MainWindow 생성...")
-        main_window = MainWindow(None, config_ctrl)
-
-        # 메인 컨트롤러 생성 (DI 컨테이너를 통해)
-        logger.info("MainController 생성...")
-        # MainController는 MainWindow를 생성자 매개변수로 받으므로 수동으로 생성
-        from pacekeeper.controllers.sound_manager import SoundManager
-        from pacekeeper.controllers.timer_controller import TimerService
-        from pacekeeper.interfaces.services.i_category_service import ICategoryService
-        from pacekeeper.interfaces.services.i_log_service import ILogService
-        from pacekeeper.interfaces.services.i_tag_service import ITagService
-
-        category_service = container.resolve(ICategoryService)
-        log_service = container.resolve(ILogService)
-        tag_service = container.resolve(ITagService)
-        sound_manager = SoundManager(config_ctrl)  # SoundManager는 수동 생성
-
-        # TimerService는 콜백 함수가 필요하므로 수동 생성
-        timer_service = TimerService(
-            config_ctrl,
-            update_callback=main_window.update_timer_label,
-            on_finish=None  # 나중에 MainController에서 설정
-        )
-
-        main_ctrl = MainController(
-            main_window,
-            config_ctrl,
-            category_service,
-            tag_service,
-            log_service,
-            sound_manager,
-            timer_service
-        )
-
-        # MainWindow에 MainController 설정 (의존성 주입 완료)
-        main_window.set_main_controller(main_ctrl)
+        main_window = create_main_window(app)
 
         # 메인 윈도우 표시
         logger.info("메인 윈도우 표시...")
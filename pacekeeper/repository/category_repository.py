@@ -21,7 +21,7 @@ class CategoryRepository(ICategoryRepository):
         """
         새로운 카테고리를 추가하거나 이미 존재하는 카테고리를 반환합니다.
         """
-        session: SessionType = Session()
+        session = self.session_manager.get_session()
         try:
             category = session.query(Category).filter(
                 Category.name == name,
@@ -76,7 +76,7 @@ class CategoryRepository(ICategoryRepository):
         """
         지정된 ID의 카테고리를 조회합니다.
         """
-        session: SessionType = Session()
+        session = self.session_manager.get_session()
         try:
             category = session.query(Category).filter(Category.id == category_id, Category.state >= 1).first()
             if category:
@@ -111,7 +111,7 @@ class CategoryRepository(ICategoryRepository):
         """
         모든 활성 카테고리를 조회합니다.
         """
-        session: SessionType = Session()
+        session = self.session_manager.get_session()
         try:
             categories = session.query(Category).filter(Category.state >= 1).order_by(Category.id).all()
             self.desktop_logger.log_system_event("전체 카테고리 조회 성공")
@@ -139,7 +139,7 @@ class CategoryRepository(ICategoryRepository):
         """
         카테고리 업데이트 (이름, 설명, 색상)
         """
-        session: SessionType = Session()
+        session = self.session_manager.get_session()
         try:
             category = session.query(Category).filter(Category.id == category_id, Category.state >= 1).first()
             if category:
@@ -163,7 +163,7 @@ class CategoryRepository(ICategoryRepository):
         """
         카테고리 삭제 (soft delete: state를 0으로 업데이트)
         """
-        session: SessionType = Session()
+        session = self.session_manager.get_session()
         try:
             category = session.query(Category).filter(Category.id == category_id).first()
             if category:
@@ -0,0 +1,59 @@
+# repository/column_types.py
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import Integer
+from sqlalchemy.types import TypeDecorator
+
+# 호환용 문자열 컬럼(start_date, end_date)에 저장되는 날짜/시간 형식
+LOG_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def parse_log_datetime(value: str | None) -> datetime | None:
+    """
+    "YYYY-MM-DD HH:MM:SS" 또는 "YYYY-MM-DD" 형식의 문자열을 datetime으로 변환
+    형식이 맞지 않으면 None을 반환합니다.
+    """
+    if not value:
+        return None
+    for fmt in (LOG_DATETIME_FORMAT, "%Y-%m-%d"):
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def format_log_datetime(value: datetime) -> str:
+    """
+    datetime을 호환용 문자열 컬럼 형식으로 변환
+    """
+    return value.strftime(LOG_DATETIME_FORMAT)
+
+
+class EpochDateTime(TypeDecorator):
+    """
+    UTC 기준 epoch 초(INTEGER)로 저장하고 datetime으로 노출하는 컬럼 타입
+
+    시간대 정보가 없는 datetime은 앱의 다른 부분과 마찬가지로 로컬 시간으로 간주하며,
+    조회 결과도 로컬 시간의 naive datetime으로 반환합니다.
+    """
+    impl = Integer
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, dialect: Any) -> int | None:
+        if value is None:
+            return None
+        if isinstance(value, str):
+            value = parse_log_datetime(value)
+            if value is None:
+                return None
+        if isinstance(value, datetime):
+            return int(value.timestamp())
+        return int(value)
+
+    def process_result_value(self, value: Any, dialect: Any) -> datetime | None:
+        if value is None:
+            return None
+        return datetime.fromtimestamp(value)
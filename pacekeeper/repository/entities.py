@@ -2,11 +2,43 @@
 
 from typing import Any
 
-from sqlalchemy import Column, Integer, SmallInteger, String, Text
+from sqlalchemy import (
+    Column,
+    ForeignKey,
+    Index,
+    Integer,
+    PrimaryKeyConstraint,
+    SmallInteger,
+    String,
+    Table,
+    Text,
+    event,
+    func,
+    text,
+    type_coerce,
+)
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import relationship
+
+from pacekeeper.repository.column_types import (
+    EpochDateTime,
+    format_log_datetime,
+    parse_log_datetime,
+)
 
 Base = declarative_base()
 
+# 로그-태그 연결 테이블 (pace_logs.tags JSON 컬럼의 정규화된 형태)
+# 기본 키 (log_id, tag_id)는 로그 기준 조회, 보조 인덱스 (tag_id, log_id)는 태그 기준 검색에 사용됩니다.
+log_tags = Table(
+    'log_tags',
+    Base.metadata,
+    Column('log_id', Integer, ForeignKey('pace_logs.id'), primary_key=True),
+    Column('tag_id', Integer, ForeignKey('tags.id'), primary_key=True),
+    Index('ix_log_tags_tag_id_log_id', 'tag_id', 'log_id'),
+)
+
 class Category(Base):
     """
     카테고리 엔티티 클래스
@@ -54,6 +86,13 @@ class Tag(Base):
     각 태그는 카테고리에 속할 수 있습니다.
     """
     __tablename__ = 'tags'
+    __table_args__ = (
+        # add_tag의 "name == ? AND state >= 1" 조회용
+        Index('ix_tags_name_state', 'name', 'state'),
+        # 활성 태그 이름 중복 방지 (삭제된 태그는 같은 이름으로 다시 만들 수 있음)
+        # 태그 일괄 생성 시 INSERT ... ON CONFLICT DO NOTHING의 충돌 대상
+        Index('uq_tags_name_active', 'name', unique=True, sqlite_where=text('state >= 1')),
+    )
 
     id = Column(Integer, primary_key=True)
     name = Column(String(16), nullable=False)
@@ -86,22 +125,41 @@ class Tag(Base):
         return f"<Tag(id={self.id}, name={repr(self.name)}, category_id={self.category_id})>"
 
 
+# 태그 이름 검색(LogRepository._tagged_log_ids)의 "lower(name) == ?" 조회용 표현식 인덱스
+Index('ix_tags_lower_name', func.lower(Tag.name))
+
+
 class Log(Base):
     """
     로그 엔티티 클래스
 
     사용자의 작업 로그 정보를 저장합니다.
     각 로그는 메시지, 태그 목록, 시작/종료 시간 등을 포함합니다.
+
+    시작/종료 시간은 epoch 초 정수 컬럼(started_at, ended_at)이 기준이며,
+    문자열 컬럼(start_date, end_date)은 기존 코드와의 호환을 위해 저장 시 자동으로 채워집니다.
     """
     __tablename__ = 'pace_logs'
+    __table_args__ = (
+        # 활성 로그만 담는 부분 인덱스 (state >= 1 조건이 선두 컬럼 범위가 아니므로 통계 없이도 사용됨)
+        # 기간 조회 (state >= 1 AND started_at BETWEEN ...)용
+        Index('ix_pace_logs_state_started_at', 'started_at', sqlite_where=text('state >= 1')),
+        # 활성 로그 최신순 조회 (state >= 1 ORDER BY id DESC)용
+        Index('ix_pace_logs_state_id', 'id', sqlite_where=text('state >= 1')),
+    )
 
     id = Column(Integer, primary_key=True)
     message = Column(Text, nullable=False, default="")
     tags = Column(Text, nullable=False, default="")  # JSON 형식으로 저장된 태그 ID 리스트
-    start_date = Column(String, nullable=False)
-    end_date = Column(String, nullable=True)
+    start_date = Column(String, nullable=False)  # started_at에서 파생된 호환용 문자열
+    end_date = Column(String, nullable=True)  # ended_at에서 파생된 호환용 문자열
+    started_at = Column(EpochDateTime, nullable=True)
+    ended_at = Column(EpochDateTime, nullable=True)
     state = Column(SmallInteger, default=1)
 
+    # log_tags 연결 테이블을 통한 태그 목록 (읽기 전용, 쓰기는 LogRepository가 tags 컬럼과 동기화)
+    tag_entities = relationship(Tag, secondary=log_tags, viewonly=True)
+
     def to_dict(self) -> dict[str, Any]:
         """
         로그 객체를 딕셔너리로 변환
@@ -115,9 +173,28 @@ class Log(Base):
             "tags": self.tags,
             "start_date": self.start_date,
             "end_date": self.end_date,
+            "started_at": self.started_at,
+            "ended_at": self.ended_at,
             "state": self.state
         }
 
+    @hybrid_property
+    def duration_seconds(self) -> int | None:
+        """
+        로그의 지속 시간(초). SQL 식으로도 사용할 수 있습니다.
+
+        Returns:
+            종료 시간 - 시작 시간 (초), 둘 중 하나라도 없으면 None
+        """
+        if self.started_at is None or self.ended_at is None:
+            return None
+        return int((self.ended_at - self.started_at).total_seconds())
+
+    @duration_seconds.expression
+    def duration_seconds(cls):
+        # 저장된 정수 값으로 직접 계산하도록 EpochDateTime 변환을 우회
+        return type_coerce(cls.ended_at, Integer) - type_coerce(cls.started_at, Integer)
+
     def __repr__(self) -> str:
         """
         로그 객체의 문자열 표현
@@ -126,3 +203,72 @@ class Log(Base):
             로그 정보를 담은 문자열
         """
         return f"<Log(message={repr(self.message)}, start_date={repr(self.start_date)}, end_date={repr(self.end_date)})>"
+
+
+class DailyStat(Base):
+    """
+    일별 집계 엔티티 클래스
+
+    활성 로그를 로컬 날짜(started_at 기준)별로 미리 집계한 롤업 테이블입니다.
+    한 날짜에 세 종류의 행이 있습니다.
+    - tag_id = 0, category_id = 0: 그날의 전체 합계
+    - tag_id > 0: 태그별 합계 (category_id는 태그의 카테고리)
+    - tag_id = 0, category_id > 0: 카테고리별 합계 (같은 카테고리 태그가 여러 개인 로그도 한 번만 집계)
+    """
+    __tablename__ = 'daily_stats'
+    __table_args__ = (
+        PrimaryKeyConstraint('day', 'tag_id', 'category_id'),
+    )
+
+    day = Column(String(10), nullable=False)  # 로컬 날짜 'YYYY-MM-DD'
+    tag_id = Column(Integer, nullable=False, default=0)
+    category_id = Column(Integer, nullable=False, default=0)
+    sessions = Column(Integer, nullable=False, default=0)
+    focus_seconds = Column(Integer, nullable=False, default=0)
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        집계 객체를 딕셔너리로 변환
+
+        Returns:
+            집계 정보를 담은 딕셔너리
+        """
+        return {
+            "day": self.day,
+            "tag_id": self.tag_id,
+            "category_id": self.category_id,
+            "sessions": self.sessions,
+            "focus_seconds": self.focus_seconds
+        }
+
+    def __repr__(self) -> str:
+        """
+        집계 객체의 문자열 표현
+
+        Returns:
+            집계 정보를 담은 문자열
+        """
+        return (
+            f"<DailyStat(day={repr(self.day)}, tag_id={self.tag_id}, category_id={self.category_id}, "
+            f"sessions={self.sessions}, focus_seconds={self.focus_seconds})>"
+        )
+
+
+@event.listens_for(Log, "before_insert")
+@event.listens_for(Log, "before_update")
+def _sync_log_datetimes(mapper, connection, target: Log) -> None:
+    """
+    저장 직전에 datetime 컬럼과 호환용 문자열 컬럼을 동기화
+
+    datetime 컬럼을 기준으로 문자열을 채우며,
+    문자열만 지정된 경우(기존 코드 경로)에는 문자열에서 datetime을 채웁니다.
+    """
+    if target.started_at is None:
+        target.started_at = parse_log_datetime(target.start_date)
+    if target.ended_at is None:
+        target.ended_at = parse_log_datetime(target.end_date)
+
+    if target.started_at is not None:
+        target.start_date = format_log_datetime(target.started_at)
+    if target.ended_at is not None:
+        target.end_date = format_log_datetime(target.ended_at)
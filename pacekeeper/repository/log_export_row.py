@@ -0,0 +1,32 @@
+# repository/log_export_row.py
+
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class LogExportRow:
+    """
+    내보내기용 로그 한 행 (태그/카테고리 이름이 해석된 상태)
+
+    Attributes:
+        id: 로그 ID
+        started_at: 시작 시간 (로컬 시간)
+        ended_at: 종료 시간 (없으면 None)
+        message: 로그 메시지
+        tags: 태그 이름 목록
+        categories: 태그들이 속한 카테고리 이름 목록 (중복 제거)
+    """
+    id: int
+    started_at: datetime | None
+    ended_at: datetime | None
+    message: str
+    tags: tuple[str, ...] = ()
+    categories: tuple[str, ...] = ()
+
+    @property
+    def duration_seconds(self) -> int:
+        """집중 시간(초), 시작/종료 시간이 없으면 0"""
+        if self.started_at is None or self.ended_at is None:
+            return 0
+        return max(int((self.ended_at - self.started_at).total_seconds()), 0)
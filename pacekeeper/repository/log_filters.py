@@ -0,0 +1,21 @@
+# repository/log_filters.py
+
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class LogFilters:
+    """
+    로그 조회 조건
+
+    지정하지 않은(None) 조건은 적용하지 않습니다.
+
+    Attributes:
+        start_date: 시작 날짜/시간 (datetime 또는 YYYY-MM-DD / YYYY-MM-DD HH:MM:SS 형식 문자열)
+        end_date: 종료 날짜/시간 (날짜만 주어지면 해당 날짜 전체 포함)
+        tag_keyword: 태그 이름 (대소문자 무시, 정확히 일치)
+    """
+    start_date: str | datetime | None = None
+    end_date: str | datetime | None = None
+    tag_keyword: str | None = None
@@ -1,16 +1,51 @@
 # repository/log_repository.py
 
 
-from sqlalchemy import and_, desc, or_
+import json
+from collections import defaultdict
+from collections.abc import Iterator
+from datetime import datetime, time
+
+from sqlalchemy import and_, column, delete, desc, func, insert, inspect, select, table
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import ColumnElement, Select
 
-from pacekeeper.consts.labels import load_language_resource
 from pacekeeper.database import DatabaseSessionManager
+from pacekeeper.database.schema_migration import LOG_FTS_TABLE
 from pacekeeper.interfaces.repositories.i_log_repository import ILogRepository
-from pacekeeper.repository.entities import Category, Log
+from pacekeeper.repository.column_types import format_log_datetime, parse_log_datetime
+from pacekeeper.repository.entities import Category, Log, Tag, log_tags
+from pacekeeper.repository.log_export_row import LogExportRow
+from pacekeeper.repository.log_filters import LogFilters
 from pacekeeper.utils.desktop_logger import DesktopLogger
-
-lang_res = load_language_resource()
+from pacekeeper.utils.functions import parse_tag_ids
+
+# 전문 검색 테이블 (schema_migration에서 생성, 읽기 전용으로만 사용)
+log_fts = table(LOG_FTS_TABLE, column("rowid"), column("message"), column("rank"))
+
+# 내보내기 시 한 번에 DB에서 가져오는 로그 수 (yield_per 배치 크기)
+EXPORT_BATCH_SIZE = 1000
+
+# 일괄 저장할 로그 값 (메시지, 태그 ID 목록, 시작 시간, 종료 시간)
+NewLogValues = tuple[str, list[int], datetime, datetime | None]
+
+# 일괄 저장용 연결별 임시 테이블
+# executemany로 pace_logs에 바로 넣으면 행마다 별도 문장이 되어 FTS 트리거가 행마다 색인을 기록하므로,
+# 임시 테이블에 모은 뒤 INSERT ... SELECT 한 문장으로 옮겨 FTS 색인 기록을 한 번에 처리합니다.
+# 행이 많으므로 ORM/Core 파라미터 처리를 거치지 않고 DBAPI executemany로 직접 넣습니다.
+LOG_IMPORT_STAGE_SQL = (
+    "CREATE TEMP TABLE IF NOT EXISTS log_import_stage ("
+    "message TEXT NOT NULL, tags TEXT NOT NULL, start_date TEXT NOT NULL, end_date TEXT, "
+    "started_at INTEGER NOT NULL, ended_at INTEGER)"
+)
+LOG_IMPORT_STAGE_INSERT_SQL = "INSERT INTO temp.log_import_stage VALUES (?, ?, ?, ?, ?, ?)"
+LOG_IMPORT_MOVE_SQL = (
+    "INSERT INTO pace_logs (message, tags, start_date, end_date, started_at, ended_at, state) "
+    "SELECT message, tags, start_date, end_date, started_at, ended_at, 1 FROM temp.log_import_stage ORDER BY rowid"
+)
+LOG_IMPORT_STAGE_CLEAR_SQL = "DELETE FROM temp.log_import_stage"
+LOG_TAGS_INSERT_SQL = "INSERT INTO log_tags (log_id, tag_id) VALUES (?, ?)"
 
 
 class LogRepository(ILogRepository):
@@ -26,6 +61,9 @@ class LogRepository(ILogRepository):
         self.desktop_logger = DesktopLogger("PaceKeeper")
         self.desktop_logger.log_system_event("LogRepository 초기화됨.")
 
+        # 전문 검색 테이블 존재 여부 (첫 검색 시 확인)
+        self._fts_available: bool | None = None
+
         # DB 및 테이블 초기화: 기본적으로 엔티티에 의해 생성
         self.initialize_database()
 
@@ -77,12 +115,13 @@ class LogRepository(ILogRepository):
             session.refresh(category)
             return category
 
-    def save_log(self, log: Log) -> Log:
+    def save_log(self, log: Log, session: Session | None = None) -> Log:
         """
         로그 저장/갱신
 
         Args:
             log: 저장할 로그 객체
+            session: 호출자의 트랜잭션 세션 (None이면 새 트랜잭션에서 저장 후 커밋)
 
         Returns:
             저장된 로그 객체
@@ -90,11 +129,132 @@ class LogRepository(ILogRepository):
         Raises:
             SQLAlchemyError: 저장 실패 시
         """
+        if session is not None:
+            return self._save_log(session, log)
+
         with self.session_manager.session_scope() as session:
-            session.add(log)
-            session.flush()  # ID 생성을 위해
-            session.refresh(log)
-            return log
+            return self._save_log(session, log)
+
+    def _save_log(self, session: Session, log: Log) -> Log:
+        """
+        주어진 세션에 로그를 추가하고 log_tags를 동기화 (커밋하지 않음)
+
+        Args:
+            session: 사용할 세션
+            log: 저장할 로그 객체
+
+        Returns:
+            ID가 할당된 로그 객체
+        """
+        session.add(log)
+        session.flush()  # ID 생성을 위해
+        self._sync_log_tags(session, log)
+        return log
+
+    def bulk_insert_logs(self, logs: list[NewLogValues], session: Session) -> list[int]:
+        """
+        여러 로그를 ORM 객체 없이 executemany로 저장합니다. (호출자의 트랜잭션 안에서 실행, 커밋하지 않음)
+
+        임시 테이블(log_import_stage)에 DBAPI executemany로 모은 뒤 INSERT ... SELECT 한 문장으로 옮기므로
+        전문 검색 색인은 INSERT 트리거가 한 문장 안에서 갱신합니다.
+        호환용 문자열 컬럼과 log_tags 연결 행도 함께 채웁니다.
+
+        Args:
+            logs: (메시지, 태그 ID 목록, 시작 시간, 종료 시간) 목록
+            session: 호출자의 세션
+
+        Returns:
+            입력 순서대로의 새 로그 ID 목록
+        """
+        if not logs:
+            return []
+
+        connection = session.connection()
+        connection.exec_driver_sql(LOG_IMPORT_STAGE_SQL)
+        connection.exec_driver_sql(
+            LOG_IMPORT_STAGE_INSERT_SQL,
+            [
+                (
+                    message,
+                    json.dumps(tag_ids),
+                    format_log_datetime(started_at),
+                    format_log_datetime(ended_at) if ended_at else None,
+                    int(started_at.timestamp()),
+                    int(ended_at.timestamp()) if ended_at else None,
+                )
+                for message, tag_ids, started_at, ended_at in logs
+            ]
+        )
+        connection.exec_driver_sql(LOG_IMPORT_MOVE_SQL)
+        connection.exec_driver_sql(LOG_IMPORT_STAGE_CLEAR_SQL)
+
+        # 한 문장으로 삽입하는 동안 쓰기 잠금을 잡고 있으므로 새 rowid는 입력 순서대로 연속 할당됨
+        # (INSERT 트리거 안의 삽입은 last_insert_rowid에 영향을 주지 않음)
+        last_id = connection.exec_driver_sql("SELECT last_insert_rowid()").scalar()
+        log_ids = list(range(last_id - len(logs) + 1, last_id + 1))
+
+        link_rows = [
+            (log_id, tag_id)
+            for log_id, (_, tag_ids, _, _) in zip(log_ids, logs, strict=True)
+            for tag_id in dict.fromkeys(tag_ids)
+        ]
+        if link_rows:
+            connection.exec_driver_sql(LOG_TAGS_INSERT_SQL, link_rows)
+        return log_ids
+
+    def find_existing_log_keys(self, session: Session, start: datetime, end: datetime) -> set[tuple[datetime, str]]:
+        """
+        기간 내 활성 로그의 (시작 시간, 메시지) 조회 (가져오기 시 중복 확인용)
+
+        Args:
+            session: 사용할 세션
+            start: 시작 시간 (포함)
+            end: 종료 시간 (포함)
+
+        Returns:
+            (시작 시간, 메시지) 집합
+        """
+        return {
+            (started_at, message)
+            for started_at, message in session.execute(
+                select(Log.started_at, Log.message)
+                .where(Log.started_at >= start, Log.started_at <= end, Log.state >= 1)
+            )
+        }
+
+    def _sync_log_tags(self, session: Session, log: Log) -> None:
+        """
+        로그의 tags JSON 컬럼 내용을 log_tags 연결 테이블에 반영
+
+        Args:
+            session: 현재 트랜잭션의 세션
+            log: ID가 할당된 로그 객체
+        """
+        session.execute(delete(log_tags).where(log_tags.c.log_id == log.id))
+        tag_ids = parse_tag_ids(log.tags)
+        if tag_ids:
+            session.execute(
+                insert(log_tags),
+                [{"log_id": log.id, "tag_id": tag_id} for tag_id in tag_ids]
+            )
+
+    def _detach_logs(self, session: Session, logs: list[Log]) -> list[Log]:
+        """
+        조회한 로그 객체를 세션에서 분리
+
+        읽기 전용 세션은 커밋하지 않으므로 로드된 컬럼 값이 만료되지 않습니다.
+        따라서 별도 복사본을 만들지 않고 객체를 그대로 분리하여 반환합니다.
+
+        Args:
+            session: 로그를 조회한 세션
+            logs: 세션에 연결된 로그 객체 목록
+
+        Returns:
+            세션과 분리된 로그 객체 목록
+        """
+        for log in logs:
+            session.expunge(log)
+        return logs
 
     def get_all_logs(self) -> list[Log]:
         """
@@ -107,18 +267,8 @@ class LogRepository(ILogRepository):
             try:
                 logs = session.query(Log).filter(Log.state >= 1).order_by(desc(Log.id)).all()
 
-                # 세션이 닫히기 전에 모든 로그 객체의 속성을 미리 로드하여 세션과 분리된 객체 목록 생성
-                detached_logs = []
-                for log in logs:
-                    detached_log = Log(
-                        id=log.id,
-                        start_date=log.start_date,
-                        end_date=log.end_date,
-                        message=log.message,
-                        tags=log.tags,
-                        state=log.state
-                    )
-                    detached_logs.append(detached_log)
+                # 세션이 닫힌 뒤에도 사용할 수 있도록 세션과 분리된 객체 목록 생성
+                detached_logs = self._detach_logs(session, logs)
 
                 self.desktop_logger.log_system_event("전체 로그 조회 성공")
                 return detached_logs
@@ -126,57 +276,318 @@ class LogRepository(ILogRepository):
                 self.desktop_logger.log_error(f"전체 로그 조회 실패: {e}", exc_info=True)
                 return []
 
-    def get_logs_by_period(self, start_date: str, end_date: str) -> list[Log]:
+    def get_logs_by_period(self, start_date: str | datetime, end_date: str | datetime) -> list[Log]:
         """
         기간 내의 활성 로그 조회 (state가 1 이상)
 
         Args:
-            start_date: 시작 날짜/시간 (YYYY-MM-DD 또는 YYYY-MM-DD HH:MM:SS 형식)
-            end_date: 종료 날짜/시간 (YYYY-MM-DD 또는 YYYY-MM-DD HH:MM:SS 형식)
+            start_date: 시작 날짜/시간 (datetime 또는 YYYY-MM-DD / YYYY-MM-DD HH:MM:SS 형식 문자열)
+            end_date: 종료 날짜/시간 (datetime 또는 YYYY-MM-DD / YYYY-MM-DD HH:MM:SS 형식 문자열)
+                날짜만 주어지면 해당 날짜 전체를 포함합니다.
 
         Returns:
             기간 내의 활성 로그 목록
         """
         with self.session_manager.readonly_session_scope() as session:
             try:
-                # 날짜 형식이 YYYY-MM-DD인 경우 시간 정보 추가
-                if len(start_date) == 10:  # YYYY-MM-DD 형식
-                    start_date = f"{start_date} 00:00:00"
-                if len(end_date) == 10:  # YYYY-MM-DD 형식
-                    end_date = f"{end_date} 23:59:59"
+                start_dt, end_dt = self._to_period_bounds(start_date, end_date)
 
                 logs = session.query(Log).filter(
                     and_(
-                        Log.start_date >= start_date,
-                        Log.start_date <= end_date,
+                        Log.started_at >= start_dt,
+                        Log.started_at <= end_dt,
                         Log.state >= 1
                     )
                 ).order_by(desc(Log.id)).all()
 
-                # 세션이 닫히기 전에 모든 로그 객체의 속성을 미리 로드하여 세션과 분리된 객체 목록 생성
-                detached_logs = []
-                for log in logs:
-                    detached_log = Log(
-                        id=log.id,
-                        start_date=log.start_date,
-                        end_date=log.end_date,
-                        message=log.message,
-                        tags=log.tags,
-                        state=log.state
-                    )
-                    detached_logs.append(detached_log)
+                detached_logs = self._detach_logs(session, logs)
 
                 self.desktop_logger.log_system_event(f"기간({start_date} ~ {end_date}) 로그 조회 성공")
                 return detached_logs
-            except SQLAlchemyError as e:
+            except (SQLAlchemyError, ValueError) as e:
                 self.desktop_logger.log_error(f"기간 로그 조회 실패: {e}", exc_info=True)
                 return []
 
+    @staticmethod
+    def _to_period_bounds(
+        start_date: str | datetime | None,
+        end_date: str | datetime | None
+    ) -> tuple[datetime | None, datetime | None]:
+        """
+        기간 조회 인자를 datetime 범위로 변환
+
+        Args:
+            start_date: 시작 날짜/시간 (None이면 하한 없음)
+            end_date: 종료 날짜/시간 (날짜만 주어지면 그 날의 마지막 초까지 포함, None이면 상한 없음)
+
+        Returns:
+            (시작 datetime, 종료 datetime) - 주어지지 않은 경계는 None
+
+        Raises:
+            ValueError: 문자열 형식이 올바르지 않은 경우
+        """
+        if isinstance(start_date, str):
+            parsed_start = parse_log_datetime(start_date)
+            if parsed_start is None:
+                raise ValueError(f"잘못된 시작 날짜 형식: {start_date}")
+            start_date = parsed_start
+
+        if isinstance(end_date, str):
+            parsed_end = parse_log_datetime(end_date)
+            if parsed_end is None:
+                raise ValueError(f"잘못된 종료 날짜 형식: {end_date}")
+            if len(end_date) == 10:  # YYYY-MM-DD 형식은 하루 전체 포함
+                parsed_end = datetime.combine(parsed_end.date(), time.max)
+            end_date = parsed_end
+
+        return start_date, end_date
+
+    @staticmethod
+    def _tagged_log_ids(tag_keyword: str) -> Select:
+        """
+        태그 이름이 키워드와 정확히 일치하는(대소문자 무시) 태그의 로그 ID 서브쿼리 생성
+
+        태그 이름 조회는 lower(name) 표현식 인덱스(ix_tags_lower_name)를 사용합니다.
+
+        Args:
+            tag_keyword: 태그 이름 (대소문자 무시)
+
+        Returns:
+            log_tags.log_id를 선택하는 SELECT 문
+        """
+        return (
+            select(log_tags.c.log_id)
+            .join(Tag, Tag.id == log_tags.c.tag_id)
+            .where(func.lower(Tag.name) == tag_keyword.lower())
+        )
+
+    def _filter_conditions(self, filters: LogFilters | None) -> list[ColumnElement[bool]]:
+        """
+        조회 조건을 활성 로그 WHERE 조건 목록으로 변환
+
+        Args:
+            filters: 조회 조건 (None이면 활성 로그 전체)
+
+        Returns:
+            AND로 결합할 조건 목록
+
+        Raises:
+            ValueError: 날짜 형식이 잘못된 경우
+        """
+        conditions: list[ColumnElement[bool]] = [Log.state >= 1]
+        if filters is None:
+            return conditions
+
+        start_dt, end_dt = self._to_period_bounds(filters.start_date, filters.end_date)
+        if start_dt is not None:
+            conditions.append(Log.started_at >= start_dt)
+        if end_dt is not None:
+            conditions.append(Log.started_at <= end_dt)
+        if filters.tag_keyword:
+            conditions.append(Log.id.in_(self._tagged_log_ids(filters.tag_keyword)))
+        return conditions
+
+    def get_logs_page(
+        self,
+        filters: LogFilters | None = None,
+        after_id: int | None = None,
+        page_size: int = 100
+    ) -> list[Log]:
+        """
+        조건에 맞는 활성 로그를 ID 내림차순으로 한 페이지 조회 (keyset 페이지네이션)
+
+        OFFSET 대신 직전 페이지의 마지막 ID 이후부터 조회하므로,
+        전체 이력의 크기와 관계없이 페이지당 비용이 일정합니다.
+
+        Args:
+            filters: 조회 조건 (None이면 전체)
+            after_id: 직전 페이지의 마지막 로그 ID (None이면 첫 페이지)
+            page_size: 페이지당 최대 로그 수
+
+        Returns:
+            ID 내림차순 로그 목록 (page_size보다 적으면 마지막 페이지)
+        """
+        with self.session_manager.readonly_session_scope() as session:
+            try:
+                query = session.query(Log).filter(*self._filter_conditions(filters))
+
+                if after_id is not None:
+                    query = query.filter(Log.id < after_id)
+
+                logs = query.order_by(desc(Log.id)).limit(page_size).all()
+                return self._detach_logs(session, logs)
+            except (SQLAlchemyError, ValueError) as e:
+                self.desktop_logger.log_error(f"로그 페이지 조회 실패: {e}", exc_info=True)
+                return []
+
+    def count_logs(self, filters: LogFilters | None = None) -> int:
+        """
+        조건에 맞는 활성 로그 수 조회
+
+        Args:
+            filters: 조회 조건 (None이면 전체)
+
+        Returns:
+            로그 수 (조회 실패 시 0)
+        """
+        with self.session_manager.readonly_session_scope() as session:
+            try:
+                return session.scalar(
+                    select(func.count()).select_from(Log).where(*self._filter_conditions(filters))
+                ) or 0
+            except (SQLAlchemyError, ValueError) as e:
+                self.desktop_logger.log_error(f"로그 수 조회 실패: {e}", exc_info=True)
+                return 0
+
+    def iter_export_rows(
+        self,
+        filters: LogFilters | None = None,
+        batch_size: int = EXPORT_BATCH_SIZE
+    ) -> Iterator[LogExportRow]:
+        """
+        조건에 맞는 활성 로그를 ID 오름차순으로 한 행씩 스트리밍 조회
+
+        yield_per로 batch_size 행씩 커서에서 가져오고, 배치마다 log_tags를 한 번 조회하여
+        태그/카테고리 이름을 붙입니다. ORM 객체를 만들지 않으며 메모리에는 한 배치만 유지됩니다.
+        반복이 끝나거나 중단(close)되면 세션을 닫습니다.
+
+        Args:
+            filters: 조회 조건 (None이면 전체)
+            batch_size: 한 번에 가져오는 행 수
+
+        Yields:
+            태그/카테고리 이름이 해석된 로그 행
+
+        Raises:
+            SQLAlchemyError: 조회 실패 시
+            ValueError: 날짜 형식이 잘못된 경우
+        """
+        with self.session_manager.readonly_session_scope() as session:
+            result = session.execute(
+                select(Log.id, Log.started_at, Log.ended_at, Log.message)
+                .where(*self._filter_conditions(filters))
+                .order_by(Log.id)
+                .execution_options(yield_per=batch_size)
+            )
+            for batch in result.partitions():
+                tags_by_log: dict[int, list[str]] = defaultdict(list)
+                categories_by_log: dict[int, dict[str, None]] = defaultdict(dict)
+                for log_id, tag_name, category_name in session.execute(
+                    select(log_tags.c.log_id, Tag.name, Category.name)
+                    .join(Tag, Tag.id == log_tags.c.tag_id)
+                    .outerjoin(Category, Category.id == Tag.category_id)
+                    .where(log_tags.c.log_id.in_([row.id for row in batch]))
+                    .order_by(log_tags.c.log_id, log_tags.c.tag_id)
+                ):
+                    tags_by_log[log_id].append(tag_name)
+                    if category_name:
+                        categories_by_log[log_id][category_name] = None
+
+                for log_id, started_at, ended_at, message in batch:
+                    yield LogExportRow(
+                        id=log_id,
+                        started_at=started_at,
+                        ended_at=ended_at,
+                        message=message,
+                        tags=tuple(tags_by_log.get(log_id, ())),
+                        categories=tuple(categories_by_log.get(log_id, ())),
+                    )
+
+    @staticmethod
+    def _split_search_terms(query: str) -> tuple[str | None, list[str]]:
+        """
+        검색어를 FTS MATCH 식과 LIKE로 찾을 짧은 단어로 분리
+
+        trigram 토크나이저는 3글자 이상의 부분 문자열만 색인하므로,
+        그보다 짧은 단어(예: 두 글자 한글 단어)는 LIKE 조건으로 찾습니다.
+
+        Args:
+            query: 공백으로 구분된 검색어
+
+        Returns:
+            (모든 긴 단어를 AND로 묶은 MATCH 식 또는 None, 짧은 단어 목록)
+        """
+        terms = list(dict.fromkeys(query.split()))
+        fts_terms = [term for term in terms if len(term) >= 3]
+        short_terms = [term for term in terms if len(term) < 3]
+        # 각 단어를 구문(phrase)으로 감싸 FTS 쿼리 문법 문자를 그대로 검색
+        match_query = " AND ".join('"' + term.replace('"', '""') + '"' for term in fts_terms)
+        return match_query or None, short_terms
+
+    def _has_fts_table(self, session: Session) -> bool:
+        """전문 검색 테이블이 생성되어 있는지 확인 (결과를 캐시)"""
+        if self._fts_available is None:
+            self._fts_available = inspect(session.get_bind()).has_table(LOG_FTS_TABLE)
+        return self._fts_available
+
+    def search_logs(
+        self,
+        query: str,
+        period: tuple[str | datetime | None, str | datetime | None] | None = None,
+        limit: int = 100,
+        tag_keyword: str | None = None
+    ) -> list[Log]:
+        """
+        메시지 전문 검색으로 활성 로그 조회
+
+        공백으로 구분된 모든 단어를 포함하는 로그를 찾으며(부분 문자열 일치, 대소문자 무시),
+        3글자 이상 단어가 있으면 FTS5 bm25 점수 순으로, 없으면 최신순으로 정렬합니다.
+
+        Args:
+            query: 검색어
+            period: (시작, 종료) 날짜/시간 범위 (None이면 전체 기간)
+            limit: 최대 결과 수
+            tag_keyword: 태그 이름 조건 (None이면 적용하지 않음)
+
+        Returns:
+            검색 결과 로그 목록
+        """
+        match_query, short_terms = self._split_search_terms(query)
+        if match_query is None and not short_terms:
+            return []
+
+        with self.session_manager.readonly_session_scope() as session:
+            try:
+                log_query = session.query(Log).filter(Log.state >= 1)
+
+                if period is not None:
+                    start_dt, end_dt = self._to_period_bounds(*period)
+                    if start_dt is not None:
+                        log_query = log_query.filter(Log.started_at >= start_dt)
+                    if end_dt is not None:
+                        log_query = log_query.filter(Log.started_at <= end_dt)
+                if tag_keyword:
+                    log_query = log_query.filter(Log.id.in_(self._tagged_log_ids(tag_keyword)))
+
+                if match_query is not None and self._has_fts_table(session):
+                    log_query = (
+                        log_query.join(log_fts, log_fts.c.rowid == Log.id)
+                        .filter(log_fts.c.message.match(match_query))
+                        .order_by(log_fts.c.rank, desc(Log.id))
+                    )
+                else:
+                    # FTS를 사용할 수 없으면 모든 단어를 LIKE로 검색
+                    short_terms = list(dict.fromkeys(query.split()))
+                    log_query = log_query.order_by(desc(Log.id))
+
+                for term in short_terms:
+                    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                    log_query = log_query.filter(Log.message.ilike(f"%{escaped}%", escape="\\"))
+
+                logs = log_query.limit(limit).all()
+                self.desktop_logger.log_system_event(f"로그 검색('{query}') 성공: {len(logs)}건")
+                return self._detach_logs(session, logs)
+            except (SQLAlchemyError, ValueError) as e:
+                self.desktop_logger.log_error(f"로그 검색 실패: {e}", exc_info=True)
+                return []
+
     def get_logs_by_tag(self, tag_keyword: str) -> list[Log]:
         """
         지정된 태그를 포함하는 활성 로그 조회 (state가 1 이상)
 
-        태그 키워드는 메시지 내용(#태그명)과 태그 ID 모두에서 검색됩니다.
+        태그 이름이 키워드와 정확히 일치(대소문자 무시)하는 태그가 연결된 로그를
+        log_tags 연결 테이블의 (tag_id, log_id) 인덱스를 통해 검색합니다.
+        키워드를 포함하는 다른 태그 이름(부분 일치)은 검색하지 않습니다.
 
         Args:
             tag_keyword: 검색할 태그 키워드
@@ -186,32 +597,15 @@ class LogRepository(ILogRepository):
         """
         with self.session_manager.readonly_session_scope() as session:
             try:
-                # 메시지 내용에서 태그 검색 (예: #test)
-                message_filter = Log.message.like(f"%#{tag_keyword}%")
-
-                # 태그 ID에서 검색 (태그 이름이 저장된 태그 ID 검색)
-                tag_filter = Log.tags.like(f"%{tag_keyword}%")
-
-                # 두 조건 중 하나라도 만족하는 로그 검색
                 logs = session.query(Log).filter(
                     and_(
-                        or_(message_filter, tag_filter),
+                        Log.id.in_(self._tagged_log_ids(tag_keyword)),
                         Log.state >= 1
                     )
                 ).order_by(desc(Log.id)).all()
 
-                # 세션이 닫히기 전에 모든 로그 객체의 속성을 미리 로드하여 세션과 분리된 객체 목록 생성
-                detached_logs = []
-                for log in logs:
-                    detached_log = Log(
-                        id=log.id,
-                        start_date=log.start_date,
-                        end_date=log.end_date,
-                        message=log.message,
-                        tags=log.tags,
-                        state=log.state
-                    )
-                    detached_logs.append(detached_log)
+                # 세션이 닫힌 뒤에도 사용할 수 있도록 세션과 분리된 객체 목록 생성
+                detached_logs = self._detach_logs(session, logs)
 
                 self.desktop_logger.log_system_event(f"태그({tag_keyword}) 로그 조회 성공")
                 return detached_logs
@@ -233,18 +627,8 @@ class LogRepository(ILogRepository):
             try:
                 logs = session.query(Log).filter(Log.state >= 1).order_by(desc(Log.id)).limit(limit).all()
 
-                # 세션이 닫히기 전에 모든 로그 객체의 속성을 미리 로드하여 세션과 분리된 객체 목록 생성
-                detached_logs = []
-                for log in logs:
-                    detached_log = Log(
-                        id=log.id,
-                        start_date=log.start_date,
-                        end_date=log.end_date,
-                        message=log.message,
-                        tags=log.tags,
-                        state=log.state
-                    )
-                    detached_logs.append(detached_log)
+                # 세션이 닫힌 뒤에도 사용할 수 있도록 세션과 분리된 객체 목록 생성
+                detached_logs = self._detach_logs(session, logs)
 
                 self.desktop_logger.log_system_event(f"최근 {limit}개의 로그 조회 성공")
                 return detached_logs
@@ -252,12 +636,13 @@ class LogRepository(ILogRepository):
                 self.desktop_logger.log_error(f"최근 로그 조회 실패: {e}", exc_info=True)
                 return []
 
-    def soft_delete_logs(self, log_ids: list[int]) -> int:
+    def soft_delete_logs(self, log_ids: list[int], session: Session | None = None) -> int:
         """
         주어진 로그 ID 리스트에 해당하는 로그들의 state를 0으로 업데이트 (soft delete)
 
         Args:
             log_ids: 삭제할 로그 ID 목록
+            session: 호출자의 트랜잭션 세션 (None이면 새 트랜잭션에서 삭제 후 커밋)
 
         Returns:
             삭제된 로그 수
@@ -268,11 +653,27 @@ class LogRepository(ILogRepository):
         if not log_ids:
             return 0
 
+        if session is not None:
+            return self._soft_delete_logs(session, log_ids)
+
         with self.session_manager.session_scope() as session:
-            logs = session.query(Log).filter(Log.id.in_(log_ids)).all()
-            deleted_count = 0
-            for log in logs:
-                log.state = 0
-                deleted_count += 1
-            self.desktop_logger.log_system_event(f"로그 삭제 (IDs: {log_ids}) 성공")
-            return deleted_count
+            return self._soft_delete_logs(session, log_ids)
+
+    def _soft_delete_logs(self, session: Session, log_ids: list[int]) -> int:
+        """
+        주어진 세션에서 로그들을 soft delete (커밋하지 않음)
+
+        Args:
+            session: 사용할 세션
+            log_ids: 삭제할 로그 ID 목록
+
+        Returns:
+            삭제된 로그 수
+        """
+        logs = session.query(Log).filter(Log.id.in_(log_ids)).all()
+        deleted_count = 0
+        for log in logs:
+            log.state = 0
+            deleted_count += 1
+        self.desktop_logger.log_system_event(f"로그 삭제 (IDs: {log_ids}) 성공")
+        return deleted_count
@@ -0,0 +1,267 @@
+# repository/stats_repository.py
+
+from collections import defaultdict
+from datetime import date, datetime
+
+from sqlalchemy import Integer, delete, func, select, type_coerce
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from pacekeeper.database import DatabaseSessionManager
+from pacekeeper.database.schema_migration import DAILY_STATS_ADD_RANGE_SQL, DAILY_STATS_REBUILD_SQL
+from pacekeeper.interfaces.repositories.i_stats_repository import IStatsRepository
+from pacekeeper.repository.entities import DailyStat, Log, Tag, log_tags
+from pacekeeper.repository.stats_totals import DailyStatColumns, StatsTotals
+from pacekeeper.utils.desktop_logger import DesktopLogger
+
+# IN 절에 한 번에 바인딩할 최대 로그 ID 수
+LOG_ID_CHUNK_SIZE = 500
+
+# (날짜, 태그 ID, 카테고리 ID) → [세션 수 증감, 집중 시간 증감]
+StatsDeltas = dict[tuple[str, int, int], list[int]]
+
+
+class StatsRepository(IStatsRepository):
+    """
+    daily_stats 롤업 테이블 Repository
+
+    로그 저장/삭제 시 해당 로그의 날짜·태그·카테고리 행만 증감하므로
+    통계 조회 비용은 전체 로그 수가 아니라 조회 기간의 날짜 수에 비례합니다.
+    """
+
+    def __init__(self, session_manager: DatabaseSessionManager):
+        self.session_manager = session_manager
+        self.desktop_logger = DesktopLogger("PaceKeeper")
+        self.desktop_logger.log_system_event("StatsRepository 초기화됨.")
+
+    def add_logs(self, log_ids: list[int], session: Session) -> None:
+        """
+        활성 로그들을 일별 집계에 더합니다. (호출자의 트랜잭션 안에서 실행, 커밋하지 않음)
+
+        Args:
+            log_ids: 저장이 끝난(flush된) 로그 ID 목록
+            session: 호출자의 세션
+        """
+        self._apply_deltas(session, self._collect_deltas(session, log_ids, 1))
+
+    def add_log_range(self, first_id: int, last_id: int, session: Session) -> None:
+        """
+        ID 범위의 활성 로그들을 SQL 집계로 일별 집계에 더합니다. (일괄 가져오기용, 커밋하지 않음)
+
+        로그를 파이썬으로 읽지 않고 재계산과 같은 GROUP BY 집계를 upsert하므로
+        방금 일괄 저장한 연속 ID 범위에만 사용해야 합니다.
+
+        Args:
+            first_id: 첫 로그 ID (포함)
+            last_id: 마지막 로그 ID (포함)
+            session: 호출자의 세션
+        """
+        connection = session.connection()
+        for statement in DAILY_STATS_ADD_RANGE_SQL:
+            connection.exec_driver_sql(statement, {"first_id": first_id, "last_id": last_id})
+
+    def remove_logs(self, log_ids: list[int], session: Session) -> None:
+        """
+        활성 로그들을 일별 집계에서 뺍니다. (soft delete 전에 호출, 커밋하지 않음)
+        이미 삭제된 로그는 집계에 없으므로 건너뜁니다.
+
+        Args:
+            log_ids: 삭제할 로그 ID 목록
+            session: 호출자의 세션
+        """
+        deltas = self._collect_deltas(session, log_ids, -1)
+        self._apply_deltas(session, deltas)
+
+        # 세션 수가 0이 된 행 정리
+        days = sorted({day for day, _, _ in deltas})
+        if days:
+            session.execute(delete(DailyStat).where(DailyStat.day.in_(days), DailyStat.sessions <= 0))
+
+    def _collect_deltas(self, session: Session, log_ids: list[int], sign: int) -> StatsDeltas:
+        """
+        활성 로그들의 날짜·태그·카테고리별 증감량 계산
+
+        날짜는 started_at의 로컬 날짜이며, 재계산 SQL(DAILY_STATS_REBUILD_SQL)과 같은 기준을 사용합니다.
+
+        Args:
+            session: 사용할 세션
+            log_ids: 로그 ID 목록
+            sign: 1이면 더하기, -1이면 빼기
+
+        Returns:
+            집계 행 키 → [세션 수 증감, 집중 시간 증감]
+        """
+        started_at = type_coerce(Log.started_at, Integer)
+        ended_at = type_coerce(Log.ended_at, Integer)
+        deltas: StatsDeltas = defaultdict(lambda: [0, 0])
+
+        unique_ids = list(dict.fromkeys(log_ids))
+        for i in range(0, len(unique_ids), LOG_ID_CHUNK_SIZE):
+            chunk = unique_ids[i:i + LOG_ID_CHUNK_SIZE]
+            logs = session.execute(
+                select(Log.id, started_at, ended_at)
+                .where(Log.id.in_(chunk), Log.state >= 1, started_at.isnot(None))
+            ).all()
+            if not logs:
+                continue
+
+            tags_by_log: dict[int, list[tuple[int, int]]] = defaultdict(list)
+            for log_id, tag_id, category_id in session.execute(
+                select(log_tags.c.log_id, Tag.id, Tag.category_id)
+                .join(Tag, Tag.id == log_tags.c.tag_id)
+                .where(log_tags.c.log_id.in_([log_id for log_id, _, _ in logs]))
+            ):
+                tags_by_log[log_id].append((tag_id, category_id or 0))
+
+            for log_id, start, end in logs:
+                day = datetime.fromtimestamp(start).strftime("%Y-%m-%d")
+                seconds = max((end if end is not None else start) - start, 0)
+
+                # 같은 카테고리의 태그가 여러 개여도 카테고리 행은 한 번만 집계
+                keys = {(day, 0, 0)}
+                for tag_id, category_id in tags_by_log[log_id]:
+                    keys.add((day, tag_id, category_id))
+                    if category_id > 0:
+                        keys.add((day, 0, category_id))
+
+                for key in keys:
+                    deltas[key][0] += sign
+                    deltas[key][1] += sign * seconds
+
+        return deltas
+
+    def _apply_deltas(self, session: Session, deltas: StatsDeltas) -> None:
+        """
+        증감량을 INSERT ... ON CONFLICT DO UPDATE로 daily_stats에 반영
+
+        한 행짜리 upsert 문을 executemany로 실행하므로 SQL 컴파일은 캐시되고,
+        행 수와 관계없이 같은 문장을 재사용합니다.
+
+        Args:
+            session: 사용할 세션
+            deltas: 집계 행 키 → [세션 수 증감, 집중 시간 증감]
+        """
+        if not deltas:
+            return
+
+        table = DailyStat.__table__
+        statement = sqlite_insert(table)
+        statement = statement.on_conflict_do_update(
+            index_elements=[table.c.day, table.c.tag_id, table.c.category_id],
+            set_={
+                "sessions": table.c.sessions + statement.excluded.sessions,
+                "focus_seconds": table.c.focus_seconds + statement.excluded.focus_seconds,
+            }
+        )
+        session.execute(
+            statement,
+            [
+                {"day": day, "tag_id": tag_id, "category_id": category_id, "sessions": sessions, "focus_seconds": seconds}
+                for (day, tag_id, category_id), (sessions, seconds) in deltas.items()
+            ]
+        )
+
+    def get_period_totals(self, start_day: date, end_day: date) -> StatsTotals:
+        """
+        기간 내 전체/태그별/카테고리별 합계 조회
+
+        daily_stats의 기본 키(day, ...) 범위만 읽으므로 전체 로그 수와 무관합니다.
+
+        Args:
+            start_day: 시작 날짜 (포함)
+            end_day: 종료 날짜 (포함)
+
+        Returns:
+            기간 집계 결과 (조회 실패 시 빈 결과)
+        """
+        with self.session_manager.readonly_session_scope() as session:
+            try:
+                rows = session.execute(
+                    select(
+                        DailyStat.tag_id,
+                        DailyStat.category_id,
+                        func.sum(DailyStat.sessions),
+                        func.sum(DailyStat.focus_seconds)
+                    )
+                    .where(DailyStat.day.between(start_day.isoformat(), end_day.isoformat()))
+                    .group_by(DailyStat.tag_id, DailyStat.category_id)
+                ).all()
+            except SQLAlchemyError as e:
+                self.desktop_logger.log_error(f"기간 통계 조회 실패: {e}", exc_info=True)
+                return StatsTotals(start_day, end_day)
+
+        sessions = 0
+        focus_seconds = 0
+        by_tag: dict[int, tuple[int, int]] = {}
+        by_category: dict[int, tuple[int, int]] = {}
+        for tag_id, category_id, row_sessions, row_seconds in rows:
+            if tag_id > 0:
+                # 태그의 카테고리가 기간 중 바뀌었으면 (tag_id, category_id) 행이 여러 개일 수 있음
+                previous_sessions, previous_seconds = by_tag.get(tag_id, (0, 0))
+                by_tag[tag_id] = (previous_sessions + row_sessions, previous_seconds + row_seconds)
+            elif category_id > 0:
+                by_category[category_id] = (row_sessions, row_seconds)
+            else:
+                sessions, focus_seconds = row_sessions, row_seconds
+
+        return StatsTotals(start_day, end_day, sessions, focus_seconds, by_tag, by_category)
+
+    def get_daily_columns(self, start_day: date, end_day: date) -> DailyStatColumns:
+        """
+        기간 내 daily_stats 행을 컬럼별 배열로 조회
+
+        Args:
+            start_day: 시작 날짜 (포함)
+            end_day: 종료 날짜 (포함)
+
+        Returns:
+            날짜순으로 정렬된 컬럼 배열 (조회 실패 시 빈 배열)
+        """
+        columns = DailyStatColumns()
+        with self.session_manager.readonly_session_scope() as session:
+            try:
+                result = session.execute(
+                    select(
+                        DailyStat.day,
+                        DailyStat.tag_id,
+                        DailyStat.category_id,
+                        DailyStat.sessions,
+                        DailyStat.focus_seconds
+                    )
+                    .where(DailyStat.day.between(start_day.isoformat(), end_day.isoformat()))
+                    .order_by(DailyStat.day)
+                )
+                # 날짜 문자열은 같은 날의 행끼리 한 번만 변환
+                last_day, last_ordinal = None, 0
+                for day, tag_id, category_id, sessions, focus_seconds in result:
+                    if day != last_day:
+                        last_day, last_ordinal = day, date.fromisoformat(day).toordinal()
+                    columns.days.append(last_ordinal)
+                    columns.tag_ids.append(tag_id)
+                    columns.category_ids.append(category_id)
+                    columns.sessions.append(sessions)
+                    columns.focus_seconds.append(focus_seconds)
+            except SQLAlchemyError as e:
+                self.desktop_logger.log_error(f"일별 통계 컬럼 조회 실패: {e}", exc_info=True)
+                return DailyStatColumns()
+
+        return columns
+
+    def rebuild(self) -> int:
+        """
+        활성 로그 전체로 일별 집계를 다시 계산
+
+        Returns:
+            생성된 집계 행 수
+
+        Raises:
+            SQLAlchemyError: 재계산 실패 시
+        """
+        with self.session_manager.session_scope() as session:
+            for statement in DAILY_STATS_REBUILD_SQL:
+                session.connection().exec_driver_sql(statement)
+            row_count = session.scalar(select(func.count()).select_from(DailyStat))
+
+        self.desktop_logger.log_system_event(f"daily_stats 재계산 완료: {row_count}행")
+        return row_count
@@ -0,0 +1,85 @@
+# repository/stats_totals.py
+
+from array import array
+from dataclasses import dataclass, field
+from datetime import date
+
+
+@dataclass(frozen=True)
+class StatsTotals:
+    """
+    기간별 집중 시간 집계 결과 (daily_stats 롤업 테이블에서 계산)
+
+    Attributes:
+        start_day: 기간 시작 날짜 (포함)
+        end_day: 기간 종료 날짜 (포함)
+        sessions: 기간 내 로그(세션) 수
+        focus_seconds: 기간 내 총 집중 시간(초)
+        by_tag: 태그 ID → (세션 수, 집중 시간(초))
+        by_category: 카테고리 ID → (세션 수, 집중 시간(초))
+    """
+    start_day: date
+    end_day: date
+    sessions: int = 0
+    focus_seconds: int = 0
+    by_tag: dict[int, tuple[int, int]] = field(default_factory=dict)
+    by_category: dict[int, tuple[int, int]] = field(default_factory=dict)
+
+
+@dataclass
+class DailyStatColumns:
+    """
+    daily_stats 행을 컬럼별 배열로 담은 묶음 (ORM 객체 없이 대량 집계할 때 사용)
+
+    같은 인덱스의 값들이 한 행을 이룹니다.
+
+    Attributes:
+        days: 날짜 서수 (date.toordinal())
+        tag_ids: 태그 ID (0이면 전체 또는 카테고리 합계 행)
+        category_ids: 카테고리 ID
+        sessions: 세션 수
+        focus_seconds: 집중 시간(초)
+    """
+    days: array = field(default_factory=lambda: array("l"))
+    tag_ids: array = field(default_factory=lambda: array("q"))
+    category_ids: array = field(default_factory=lambda: array("q"))
+    sessions: array = field(default_factory=lambda: array("q"))
+    focus_seconds: array = field(default_factory=lambda: array("q"))
+
+    def __len__(self) -> int:
+        return len(self.days)
+
+
+@dataclass(frozen=True)
+class StatsDashboard:
+    """
+    통계 대시보드 표시용 집계 결과
+
+    Attributes:
+        start_day: 기간 시작 날짜 (포함)
+        end_day: 기간 종료 날짜 (포함)
+        daily_sessions: 날짜별 세션 수 (인덱스 0이 start_day)
+        daily_focus_seconds: 날짜별 집중 시간(초)
+        tag_totals: (태그 ID, 세션 수, 집중 시간(초)) 목록, 집중 시간 내림차순
+        category_totals: (카테고리 ID, 세션 수, 집중 시간(초)) 목록, 집중 시간 내림차순
+        current_streak: 기간 마지막 날(기록이 없으면 전날)부터 거슬러 올라간 연속 기록 일수
+        longest_streak: 기간 내 최장 연속 기록 일수
+    """
+    start_day: date
+    end_day: date
+    daily_sessions: array
+    daily_focus_seconds: array
+    tag_totals: list[tuple[int, int, int]] = field(default_factory=list)
+    category_totals: list[tuple[int, int, int]] = field(default_factory=list)
+    current_streak: int = 0
+    longest_streak: int = 0
+
+    @property
+    def sessions(self) -> int:
+        """기간 내 전체 세션 수"""
+        return sum(self.daily_sessions)
+
+    @property
+    def focus_seconds(self) -> int:
+        """기간 내 전체 집중 시간(초)"""
+        return sum(self.daily_focus_seconds)
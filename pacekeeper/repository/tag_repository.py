@@ -1,12 +1,17 @@
 
 
-from sqlalchemy import desc
+from sqlalchemy import desc, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
 
 from pacekeeper.database import DatabaseSessionManager
 from pacekeeper.interfaces.repositories.i_tag_repository import ITagRepository
 from pacekeeper.repository.entities import Tag
 from pacekeeper.utils.desktop_logger import DesktopLogger
 
+# IN 절에 한 번에 바인딩할 최대 태그 ID/이름 수
+TAG_ID_CHUNK_SIZE = 500
+
 
 class TagRepository(ITagRepository):
     def __init__(self, session_manager: DatabaseSessionManager):
@@ -38,8 +43,62 @@ class TagRepository(ITagRepository):
             else:
                 self.desktop_logger.log_system_event(f"태그 이미 존재함: {name}")
 
+            # 커밋 시 속성이 만료되지 않도록 세션에서 분리하여 반환
+            session.expunge(tag)
             return tag
 
+    def ensure_tags(self, names: list[str], session: Session) -> list[int]:
+        """
+        태그 이름 목록을 활성 태그 ID 목록으로 변환하고, 없는 태그는 한 번에 생성합니다.
+
+        호출자의 트랜잭션(session) 안에서 실행되며 커밋하지 않습니다.
+        기존 태그는 한 번의 IN 쿼리로 찾고, 없는 태그는 다중 행
+        INSERT ... ON CONFLICT DO NOTHING으로 생성한 뒤 다시 조회합니다.
+
+        Args:
+            names: 태그 이름 목록 (중복 허용)
+            session: 호출자의 세션
+
+        Returns:
+            중복을 제거한 이름 순서대로의 태그 ID 목록
+        """
+        unique_names = list(dict.fromkeys(names))
+        if not unique_names:
+            return []
+
+        name_to_id = self._find_active_tag_ids(session, unique_names)
+        missing = [name for name in unique_names if name not in name_to_id]
+        if missing:
+            session.execute(
+                sqlite_insert(Tag)
+                .values([{"name": name, "description": "", "category_id": 0, "state": 1} for name in missing])
+                .on_conflict_do_nothing()
+            )
+            name_to_id.update(self._find_active_tag_ids(session, missing))
+            self.desktop_logger.log_system_event(f"태그 일괄 추가 완료: {missing}")
+
+        return [name_to_id[name] for name in unique_names]
+
+    def _find_active_tag_ids(self, session: Session, names: list[str]) -> dict[str, int]:
+        """
+        이름이 일치하는 활성 태그의 이름 → ID 매핑 조회
+
+        Args:
+            session: 사용할 세션
+            names: 태그 이름 목록
+
+        Returns:
+            태그 이름 → 태그 ID 딕셔너리
+        """
+        name_to_id: dict[str, int] = {}
+        for i in range(0, len(names), TAG_ID_CHUNK_SIZE):
+            chunk = names[i:i + TAG_ID_CHUNK_SIZE]
+            rows = session.execute(
+                select(Tag.name, Tag.id).where(Tag.name.in_(chunk), Tag.state >= 1)
+            )
+            name_to_id.update({name: tag_id for name, tag_id in rows})
+        return name_to_id
+
     def get_tag(self, tag_id: int) -> Tag | None:
         """
         태그 ID 목록을 받아 태그 이름을 문자열로 변환합니다.
@@ -52,6 +111,27 @@ class TagRepository(ITagRepository):
                 self.desktop_logger.log_error(f"태그 조회 실패: {e}", exc_info=True)
                 return None
 
+    def get_tags_by_ids(self, tag_ids: list[int]) -> list[Tag]:
+        """
+        태그 ID 목록에 해당하는 태그들을 IN 쿼리로 한 번에 조회합니다.
+        과거 로그의 태그 이름을 표시해야 하므로 삭제된 태그도 포함합니다.
+        """
+        if not tag_ids:
+            return []
+
+        unique_ids = list(dict.fromkeys(tag_ids))
+        with self.session_manager.readonly_session_scope() as session:
+            try:
+                tags: list[Tag] = []
+                # SQLite 바인드 변수 개수 제한을 피하기 위해 청크 단위로 조회
+                for i in range(0, len(unique_ids), TAG_ID_CHUNK_SIZE):
+                    chunk = unique_ids[i:i + TAG_ID_CHUNK_SIZE]
+                    tags.extend(session.query(Tag).filter(Tag.id.in_(chunk)).all())
+                return tags
+            except Exception as e:
+                self.desktop_logger.log_error(f"태그 일괄 조회 실패: {e}", exc_info=True)
+                return []
+
     def get_tags(self) -> list[Tag]:
         """
         모든 활성 태그를 조회합니다.
@@ -1,12 +1,14 @@
 # services/app_state_manager.py
 
 from dataclasses import dataclass
+from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from pacekeeper.consts.labels import load_language_resource
+from pacekeeper.consts.labels import lang_res
+from pacekeeper.services.session_checkpoint import SessionCheckpoint, SessionCheckpointStore
+from pacekeeper.utils.event_bus import ANY_TOPIC, ChangeCallback, EventBus, Scheduler, call_soon
 
-lang_res = load_language_resource()
 
 @dataclass
 class StatusInfo:
@@ -20,6 +22,7 @@ class AppStatus(Enum):
     애플리케이션 상태를 나타내는 열거형
 
     각 상태는 표시 레이블과 정수 값을 포함한 StatusInfo 객체를 가집니다.
+    StatusInfo의 레이블은 모듈 로드 시점의 언어이며, label 속성은 현재 활성 언어의 레이블을 반환합니다.
     """
     WAIT = StatusInfo(label=lang_res.base_labels['WAIT'], value=0)
     STUDY = StatusInfo(label=lang_res.base_labels['STUDY'], value=1)
@@ -29,8 +32,8 @@ class AppStatus(Enum):
 
     @property
     def label(self) -> str:
-        """상태의 레이블 반환"""
-        return self.value.label
+        """현재 활성 언어 기준 상태의 레이블 반환"""
+        return lang_res.base_labels.get(self.name, self.value.label)
 
     @property
     def value_int(self) -> int:
@@ -45,13 +48,14 @@ class AppStatus(Enum):
 
 class Observer:
     """상태 변경을 관찰하는 옵저버 인터페이스"""
-    def update(self, event_type: str, **kwargs: Any) -> None:
+    def update(self, event_type: str, old: Any, new: Any) -> None:
         """
         상태 변경 알림을 받는 메서드
 
         Args:
             event_type: 이벤트 타입 (예: "status_changed", "cycle_changed")
-            **kwargs: 이벤트 관련 추가 정보
+            old: 이전 값
+            new: 새 값
         """
         pass
 
@@ -61,23 +65,34 @@ class AppStateManager:
     애플리케이션 상태 관리 클래스
 
     상태(AppStatus)와 사이클 카운트를 관리하고, 상태 변경 시 등록된 옵저버에게 알림을 보냅니다.
+    옵저버는 이벤트 타입별로 구독할 수 있고, 같은 이벤트 루프 차례의 변경은 모아서 알립니다.
+    진행 중인 학습 세션은 체크포인트로 기록하여, 앱이 비정상 종료된 뒤 다음 실행에서 복구할 수 있습니다.
     """
-    def __init__(self) -> None:
-        """AppStateManager 초기화"""
+    def __init__(
+        self, checkpoint_store: SessionCheckpointStore | None = None, scheduler: Scheduler | None = call_soon
+    ) -> None:
+        """
+        AppStateManager 초기화
+
+        Args:
+            checkpoint_store: 세션 체크포인트 저장소 (None이면 앱 데이터 디렉토리의 기본 저장소)
+            scheduler: 변경 알림 전달을 예약하는 함수 (None이면 변경 즉시 알림)
+        """
         self._status: AppStatus = AppStatus.WAIT
         self._is_running: bool = False
         self._current_cycle: int = 1
-        self._observers: list[Observer] = []
+        # 이벤트 타입별 변경 알림 버스 (옵저버는 약한 참조로 보관)
+        self._events = EventBus(scheduler)
+        self._checkpoint_store: SessionCheckpointStore = checkpoint_store or SessionCheckpointStore()
 
     def add_observer(self, observer: Observer) -> None:
         """
-        상태 변경을 관찰할 옵저버 추가
+        모든 상태 변경을 관찰할 옵저버 추가 (옵저버가 사라지면 자동으로 제거됨)
 
         Args:
             observer: 상태 변경을 관찰할 Observer 인스턴스
         """
-        if observer not in self._observers:
-            self._observers.append(observer)
+        self._events.subscribe(ANY_TOPIC, observer.update)
 
     def remove_observer(self, observer: Observer) -> None:
         """
@@ -86,19 +101,38 @@ class AppStateManager:
         Args:
             observer: 제거할 Observer 인스턴스
         """
-        if observer in self._observers:
-            self._observers.remove(observer)
+        self._events.unsubscribe_all(observer.update)
+
+    def subscribe(self, event_type: str, callback: ChangeCallback) -> None:
+        """
+        특정 이벤트 타입의 변경만 구독
+
+        Args:
+            event_type: 이벤트 타입 ("status_changed", "cycle_changed", "running_changed")
+            callback: (이벤트 타입, 이전 값, 새 값)으로 호출할 함수
+        """
+        self._events.subscribe(event_type, callback)
 
-    def _notify_observers(self, event_type: str, **kwargs: Any) -> None:
+    def unsubscribe(self, event_type: str, callback: ChangeCallback) -> None:
         """
-        등록된 모든 옵저버에게 알림
+        이벤트 타입 구독 해제
 
         Args:
             event_type: 이벤트 타입
-            **kwargs: 이벤트 관련 추가 정보
+            callback: 구독한 함수
         """
-        for observer in self._observers:
-            observer.update(event_type, **kwargs)
+        self._events.unsubscribe(event_type, callback)
+
+    def _notify_observers(self, event_type: str, old: Any, new: Any) -> None:
+        """
+        이벤트 타입을 구독한 옵저버에게 알림
+
+        Args:
+            event_type: 이벤트 타입
+            old: 이전 값
+            new: 새 값
+        """
+        self._events.publish(event_type, old, new)
 
     def get_status(self) -> AppStatus:
         """현재 애플리케이션 상태 반환"""
@@ -167,3 +201,54 @@ class AppStateManager:
         self.set_running(False)
         self.set_status(AppStatus.WAIT)
         self.set_cycle(1)
+
+    # --- 세션 체크포인트 ---
+    def save_checkpoint(self, started_at: datetime, remaining_seconds: int, message: str) -> bool:
+        """
+        진행 중인 학습 세션의 체크포인트 저장 (상태와 사이클은 현재 값 사용)
+
+        세션 시작, 일시정지, 재개처럼 세션 상태가 바뀔 때만 호출합니다.
+        실행 중에는 예상 종료 시간이 기록되므로 매 초 저장할 필요가 없습니다.
+
+        Args:
+            started_at: 세션 시작 시간
+            remaining_seconds: 남은 시간(초)
+            message: 입력 중인 로그 메시지
+
+        Returns:
+            저장 성공 여부
+        """
+        checkpoint = SessionCheckpoint.create(
+            status=self._status.name,
+            started_at=started_at,
+            remaining_seconds=remaining_seconds,
+            paused=self._status == AppStatus.PAUSED,
+            cycle=self._current_cycle,
+            message=message,
+        )
+        return self._checkpoint_store.save(checkpoint)
+
+    def load_checkpoint(self) -> SessionCheckpoint | None:
+        """
+        이전 실행에서 남은 세션 체크포인트 반환
+
+        Returns:
+            체크포인트 (없거나 읽을 수 없으면 None)
+        """
+        return self._checkpoint_store.load()
+
+    def clear_checkpoint(self) -> None:
+        """세션 체크포인트 삭제 (세션이 끝났거나 중단된 경우)"""
+        self._checkpoint_store.clear()
+
+    def restore_checkpoint(self, checkpoint: SessionCheckpoint, resume: bool) -> None:
+        """
+        체크포인트의 사이클과 상태를 복원
+
+        Args:
+            checkpoint: 복원할 체크포인트
+            resume: True면 세션 상태(학습/일시정지)까지 복원, False면 사이클만 복원
+        """
+        self.set_cycle(checkpoint.cycle)
+        if resume:
+            self.set_status(AppStatus[checkpoint.status])
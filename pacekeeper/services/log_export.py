@@ -0,0 +1,104 @@
+# services/log_export.py
+
+import csv
+import json
+from collections.abc import Callable, Iterable
+from typing import TextIO
+
+from pacekeeper.repository.column_types import format_log_datetime
+from pacekeeper.repository.log_export_row import LogExportRow
+
+# 지원하는 내보내기 형식
+EXPORT_FORMAT_CSV = "csv"
+EXPORT_FORMAT_JSONL = "jsonl"
+EXPORT_FORMATS = (EXPORT_FORMAT_CSV, EXPORT_FORMAT_JSONL)
+
+# 내보내기 파일의 컬럼 순서
+EXPORT_FIELDS = ("id", "started_at", "ended_at", "duration_seconds", "message", "tags", "categories")
+
+# CSV에서 태그/카테고리 이름 목록을 한 칸에 넣을 때의 구분자
+CSV_LIST_SEPARATOR = " "
+
+# 진행 상황 콜백 (내보낸 행 수, 전체 행 수)
+ProgressCallback = Callable[[int, int], None]
+
+
+class ExportCancelled(Exception):
+    """진행 상황 콜백에서 발생시켜 내보내기를 중단"""
+
+
+def export_format_from_path(path: str) -> str | None:
+    """
+    파일 확장자로 내보내기 형식 추정
+
+    Returns:
+        EXPORT_FORMATS 중 하나 또는 None (알 수 없는 확장자)
+    """
+    extension = path.rsplit(".", 1)[-1].lower() if "." in path else ""
+    return extension if extension in EXPORT_FORMATS else None
+
+
+def _row_values(row: LogExportRow) -> dict[str, object]:
+    """로그 행을 컬럼 이름 → 값 딕셔너리로 변환 (날짜는 호환용 문자열 형식)"""
+    return {
+        "id": row.id,
+        "started_at": format_log_datetime(row.started_at) if row.started_at else None,
+        "ended_at": format_log_datetime(row.ended_at) if row.ended_at else None,
+        "duration_seconds": row.duration_seconds,
+        "message": row.message,
+        "tags": list(row.tags),
+        "categories": list(row.categories),
+    }
+
+
+def write_rows(
+    rows: Iterable[LogExportRow],
+    file: TextIO,
+    export_format: str,
+    total: int = 0,
+    progress_callback: ProgressCallback | None = None,
+    progress_interval: int = 1000
+) -> int:
+    """
+    로그 행을 한 행씩 파일에 기록합니다. (행 목록을 메모리에 모으지 않음)
+
+    Args:
+        rows: 로그 행 이터러블
+        file: 쓰기용 텍스트 파일 (CSV는 newline="" 으로 열어야 함)
+        export_format: EXPORT_FORMATS 중 하나
+        total: 전체 행 수 (진행 상황 표시용)
+        progress_callback: progress_interval 행마다와 마지막에 호출되는 콜백
+        progress_interval: 진행 상황 콜백 호출 간격(행)
+
+    Returns:
+        기록한 행 수
+
+    Raises:
+        ValueError: 지원하지 않는 형식인 경우
+        ExportCancelled: 진행 상황 콜백이 중단을 요청한 경우
+    """
+    if export_format == EXPORT_FORMAT_CSV:
+        writer = csv.DictWriter(file, fieldnames=EXPORT_FIELDS)
+        writer.writeheader()
+
+        def write(values: dict[str, object]) -> None:
+            values["tags"] = CSV_LIST_SEPARATOR.join(values["tags"])
+            values["categories"] = CSV_LIST_SEPARATOR.join(values["categories"])
+            writer.writerow(values)
+    elif export_format == EXPORT_FORMAT_JSONL:
+        def write(values: dict[str, object]) -> None:
+            file.write(json.dumps(values, ensure_ascii=False))
+            file.write("\n")
+    else:
+        raise ValueError(f"지원하지 않는 내보내기 형식: {export_format}")
+
+    written = 0
+    for row in rows:
+        write(_row_values(row))
+        written += 1
+        if progress_callback and written % progress_interval == 0:
+            progress_callback(written, max(total, written))
+
+    if progress_callback:
+        progress_callback(written, max(total, written))
+    return written
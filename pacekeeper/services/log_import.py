@@ -0,0 +1,241 @@
+# services/log_import.py
+
+import csv
+import json
+import re
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, TextIO
+
+from pacekeeper.services.log_export import EXPORT_FORMAT_CSV, EXPORT_FORMAT_JSONL, EXPORT_FORMATS
+from pacekeeper.utils.functions import extract_tags
+
+# 가져오기 지원 형식 (내보내기 형식과 동일)
+IMPORT_FORMATS = EXPORT_FORMATS
+
+# 다른 앱의 내보내기 파일에서 메시지로 사용할 컬럼 (정규화된 이름, 우선순위 순)
+MESSAGE_FIELDS = ("message", "description", "task", "title", "note", "notes", "name")
+
+# 날짜/시간 문자열 형식 (ISO 8601은 datetime.fromisoformat으로 먼저 처리)
+DATETIME_FORMATS = (
+    "%Y/%m/%d %H:%M:%S",
+    "%Y/%m/%d %H:%M",
+    "%Y.%m.%d %H:%M:%S",
+    "%Y.%m.%d %H:%M",
+    "%m/%d/%Y %H:%M:%S",
+    "%m/%d/%Y %H:%M",
+)
+
+# 태그 컬럼 값의 구분자 (쉼표, 세미콜론, 공백)
+TAG_SEPARATOR_PATTERN = re.compile(r"[,;\s]+")
+
+
+class ImportCancelled(Exception):
+    """진행 상황 콜백에서 발생시켜 가져오기를 중단"""
+
+
+@dataclass(frozen=True)
+class ImportedLog:
+    """
+    파일에서 읽은 로그 한 행
+
+    Attributes:
+        message: 태그 컬럼의 태그가 해시태그로 포함된 메시지
+        started_at: 시작 시간 (로컬 시간, 초 단위)
+        ended_at: 종료 시간 (없으면 None)
+    """
+    message: str
+    started_at: datetime
+    ended_at: datetime | None
+
+
+@dataclass(frozen=True)
+class LogImportResult:
+    """
+    가져오기 결과
+
+    Attributes:
+        imported: 저장한 로그 수
+        skipped: 시작 시간이나 메시지가 없어 건너뛴 행 수
+        duplicates: 같은 시작 시간과 메시지의 로그가 이미 있어 건너뛴 행 수
+        completed: 파일 끝까지 처리했는지 여부 (실패 또는 취소 시 False, 그 전 청크는 저장됨)
+    """
+    imported: int = 0
+    skipped: int = 0
+    duplicates: int = 0
+    completed: bool = True
+
+
+def import_format_from_path(path: str) -> str | None:
+    """
+    파일 확장자로 가져오기 형식 추정
+
+    Returns:
+        IMPORT_FORMATS 중 하나 또는 None (알 수 없는 확장자)
+    """
+    extension = path.rsplit(".", 1)[-1].lower() if "." in path else ""
+    if extension == "json":
+        return EXPORT_FORMAT_JSONL
+    return extension if extension in IMPORT_FORMATS else None
+
+
+def count_lines(path: str) -> int:
+    """파일의 줄 수를 블록 단위로 셉니다. (진행률 계산용, 파일 전체를 메모리에 올리지 않음)"""
+    lines = 0
+    with open(path, "rb") as file:
+        while block := file.read(1 << 20):
+            lines += block.count(b"\n")
+    return lines
+
+
+@lru_cache(maxsize=256)
+def _normalize_key(key: str) -> str:
+    """컬럼 이름을 소문자 + 밑줄 형태로 정규화 (예: 'Start Date' → 'start_date', 행마다 같은 머리글이므로 캐시)"""
+    return re.sub(r"[\s\-]+", "_", key.strip().lower())
+
+
+def parse_datetime(value: Any) -> datetime | None:
+    """
+    날짜/시간 값을 로컬 시간의 naive datetime으로 변환 (초 미만 버림)
+    시간대가 있는 값은 로컬 시간으로 변환하며, 형식이 맞지 않으면 None을 반환합니다.
+    """
+    if not isinstance(value, str) or not value.strip():
+        return None
+    text = value.strip()
+    try:
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        parsed = None
+        for fmt in DATETIME_FORMATS:
+            try:
+                parsed = datetime.strptime(text, fmt)
+                break
+            except ValueError:
+                continue
+        if parsed is None:
+            return None
+
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed.replace(microsecond=0)
+
+
+def parse_duration(value: Any) -> timedelta | None:
+    """
+    기간 값을 timedelta로 변환
+    숫자는 초, 'H:MM:SS' / 'MM:SS' 형식은 시:분:초로 해석합니다.
+    """
+    if isinstance(value, int | float):
+        return timedelta(seconds=value) if value >= 0 else None
+    if not isinstance(value, str) or not value.strip():
+        return None
+    text = value.strip()
+    try:
+        if ":" in text:
+            seconds = 0
+            for part in text.split(":"):
+                seconds = seconds * 60 + int(part)
+            return timedelta(seconds=seconds)
+        return timedelta(seconds=float(text))
+    except ValueError:
+        return None
+
+
+def _record_datetime(record: dict[str, Any], prefix: str) -> datetime | None:
+    """
+    'start' / 'end' 관련 컬럼에서 날짜/시간 추출
+    (started_at, start, start_datetime, 또는 start_date + start_time 조합)
+    """
+    for key in (f"{prefix}ed_at", prefix, f"{prefix}_datetime", f"{prefix}_date"):
+        value = record.get(key)
+        if not value:
+            continue
+        time_value = record.get(f"{prefix}_time")
+        if key == f"{prefix}_date" and isinstance(value, str) and isinstance(time_value, str) and time_value.strip():
+            value = f"{value.strip()} {time_value.strip()}"
+        parsed = parse_datetime(value)
+        if parsed is not None:
+            return parsed
+    return None
+
+
+def _record_tags(value: Any) -> list[str]:
+    """태그 컬럼 값(목록 또는 구분자로 나눈 문자열)을 태그 이름 목록으로 변환"""
+    if isinstance(value, list):
+        names = [str(name) for name in value]
+    elif isinstance(value, str):
+        names = TAG_SEPARATOR_PATTERN.split(value)
+    else:
+        return []
+    # 해시태그로 추출될 수 있도록 단어 문자가 아닌 문자는 밑줄로 바꿈
+    tags = (re.sub(r"\W+", "_", name.strip().lstrip("#")).strip("_") for name in names)
+    return [tag for tag in tags if tag]
+
+
+def record_to_log(record: dict[str, Any]) -> ImportedLog | None:
+    """
+    한 행(컬럼 이름 → 값)을 ImportedLog로 변환
+
+    이 앱의 내보내기 파일과 다른 시간 기록 앱의 일반적인 컬럼 이름(Description, Start date/Start time,
+    Duration, Tags 등)을 인식합니다. 태그 컬럼의 태그 중 메시지에 없는 것은 해시태그로 덧붙입니다.
+
+    Returns:
+        변환된 로그 (시작 시간 또는 메시지/태그가 없으면 None)
+    """
+    record = {_normalize_key(key): value for key, value in record.items() if isinstance(key, str)}
+
+    started_at = _record_datetime(record, "start")
+    if started_at is None:
+        return None
+
+    message = next(
+        (str(record[key]).strip() for key in MESSAGE_FIELDS if record.get(key) not in (None, "")), ""
+    )
+    existing_tags = set(extract_tags(message))
+    extra_tags = [name for name in dict.fromkeys(_record_tags(record.get("tags"))) if name not in existing_tags]
+    if extra_tags:
+        message = " ".join([message, *(f"#{name}" for name in extra_tags)]).strip()
+    if not message:
+        return None
+
+    ended_at = _record_datetime(record, "end")
+    if ended_at is None:
+        duration = parse_duration(record.get("duration_seconds", record.get("duration")))
+        if duration is not None:
+            ended_at = started_at + duration
+    if ended_at is not None and ended_at < started_at:
+        ended_at = None
+
+    return ImportedLog(message=message, started_at=started_at, ended_at=ended_at)
+
+
+def iter_records(file: TextIO, import_format: str) -> Iterator[dict[str, Any] | None]:
+    """
+    파일에서 한 행씩 읽어 컬럼 이름 → 값 딕셔너리로 반환 (파일 전체를 메모리에 올리지 않음)
+
+    Args:
+        file: 읽기용 텍스트 파일 (CSV는 newline="" 으로 열어야 함)
+        import_format: IMPORT_FORMATS 중 하나
+
+    Yields:
+        행 딕셔너리 (JSONL의 잘못된 줄은 None)
+
+    Raises:
+        ValueError: 지원하지 않는 형식인 경우
+    """
+    if import_format == EXPORT_FORMAT_CSV:
+        yield from csv.DictReader(file)
+    elif import_format == EXPORT_FORMAT_JSONL:
+        for line in file:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                yield None
+                continue
+            yield record if isinstance(record, dict) else None
+    else:
+        raise ValueError(f"지원하지 않는 가져오기 형식: {import_format}")
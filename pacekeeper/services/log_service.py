@@ -1,58 +1,83 @@
 import json
+import os
+import tempfile
 from datetime import datetime
+from itertools import islice
 
 from icecream import ic
 
+from pacekeeper.database import UnitOfWork
 from pacekeeper.interfaces.repositories.i_log_repository import ILogRepository
+from pacekeeper.interfaces.repositories.i_stats_repository import IStatsRepository
 from pacekeeper.interfaces.repositories.i_tag_repository import ITagRepository
 from pacekeeper.interfaces.services.i_log_service import ILogService
 from pacekeeper.repository.entities import Log
+from pacekeeper.repository.log_filters import LogFilters
+from pacekeeper.services.log_export import (
+    EXPORT_FORMAT_CSV,
+    EXPORT_FORMATS,
+    ExportCancelled,
+    ProgressCallback,
+    write_rows,
+)
+from pacekeeper.services.log_import import (
+    ImportCancelled,
+    ImportedLog,
+    LogImportResult,
+    count_lines,
+    import_format_from_path,
+    iter_records,
+    record_to_log,
+)
 from pacekeeper.utils.desktop_logger import DesktopLogger
 from pacekeeper.utils.functions import extract_tags
 
 
+# 가져오기 시 한 트랜잭션에서 저장하는 최대 행 수
+IMPORT_CHUNK_SIZE = 5000
+
+
 class LogService(ILogService):
-    def __init__(self, log_repository: ILogRepository, tag_repository: ITagRepository) -> None:
+    def __init__(
+        self,
+        log_repository: ILogRepository,
+        tag_repository: ITagRepository,
+        stats_repository: IStatsRepository
+    ) -> None:
         self.logger: DesktopLogger = DesktopLogger("PaceKeeper")
         self.repository: ILogRepository = log_repository
         self.tag_repo: ITagRepository = tag_repository
+        self.stats_repo: IStatsRepository = stats_repository
         self.logger.log_system_event("LogService 초기화됨.")
 
-    def create_study_log(self, message: str, study_start_time: datetime | None = None) -> None:
+    def create_study_log(
+        self, message: str, study_start_time: datetime | None = None, ended_at: datetime | None = None
+    ) -> None:
         """
         메시지와 선택적 study_start_time을 이용해 학습 로그를 생성합니다.
         study_start_time이 제공되면 이를 시작 시간으로 사용하고, 그렇지 않으면 현재 시간을 사용합니다.
+        ended_at이 제공되면 종료 시간으로 사용합니다. (복구한 부분 세션 저장 등)
         """
         self.logger.log_user_action(f"학습 로그 생성 요청: {message}")
 
-        now = datetime.now()
-        if study_start_time:
-            start_date = study_start_time.strftime("%Y-%m-%d %H:%M:%S")
-        else:
-            start_date = now.strftime("%Y-%m-%d %H:%M:%S")
-        end_date = now.strftime("%Y-%m-%d %H:%M:%S")
-
-        # 메시지에서 태그 추출 및 태그 테이블에 추가하여 태그 ID 수집
-        tag_ids: list[int] = []
+        ended_at = ended_at or datetime.now()
+        started_at = study_start_time or ended_at
         tags_list: list[str] = extract_tags(message)
-        if tags_list:
-            for tag in tags_list:
-                try:
-                    tag_entity = self.tag_repo.add_tag(tag)
-                    ic("tag_entity", tag_entity)
-                    tag_ids.append(tag_entity.id)
-                    ic("tag_ids", tag_ids)
-                except Exception:
-                    self.logger.log_error("태그 추가 실패", exc_info=True)
 
-        # 태그 ID 리스트를 JSON 형식으로 변환하여 저장
-        tags_json = json.dumps(tag_ids, ensure_ascii=False)
+        # 태그 생성, 로그 저장, 일별 통계 갱신을 하나의 트랜잭션으로 처리 (실패 시 모두 롤백)
+        try:
+            with UnitOfWork() as uow:
+                # 메시지의 태그를 한 번에 조회/생성하여 태그 ID 수집
+                tag_ids = self.tag_repo.ensure_tags(tags_list, uow.session)
+                ic("tag_ids", tag_ids)
 
-        ic(tags_json)
+                # 태그 ID 리스트를 JSON 형식으로 변환하여 저장
+                tags_json = json.dumps(tag_ids, ensure_ascii=False)
 
-        new_log = Log(start_date=start_date, end_date=end_date, message=message, tags=tags_json)
-        try:
-            self.repository.save_log(new_log)
+                # 호환용 문자열 컬럼(start_date, end_date)은 저장 시 started_at/ended_at에서 채워짐
+                new_log = Log(started_at=started_at, ended_at=ended_at, message=message, tags=tags_json)
+                self.repository.save_log(new_log, uow.session)
+                self.stats_repo.add_logs([new_log.id], uow.session)
             self.logger.log_system_event("학습 로그 저장 성공")
         except Exception:
             self.logger.log_error("학습 로그 저장 실패", exc_info=True)
@@ -69,7 +94,7 @@ class LogService(ILogService):
             self.logger.log_error("전체 로그 조회 실패", exc_info=True)
             return []
 
-    def retrieve_logs_by_period(self, start_date: str, end_date: str) -> list[Log]:
+    def retrieve_logs_by_period(self, start_date: str | datetime, end_date: str | datetime) -> list[Log]:
         """
         지정한 기간 동안의 활성 로그를 조회합니다.
         """
@@ -93,6 +118,37 @@ class LogService(ILogService):
             self.logger.log_error("태그 로그 조회 실패", exc_info=True)
             return []
 
+    def retrieve_logs_page(
+        self,
+        filters: LogFilters | None = None,
+        after_id: int | None = None,
+        page_size: int = 100
+    ) -> list[Log]:
+        """
+        조건에 맞는 활성 로그를 최신순으로 한 페이지씩 조회합니다.
+        """
+        try:
+            return self.repository.get_logs_page(filters, after_id, page_size)
+        except Exception:
+            self.logger.log_error("로그 페이지 조회 실패", exc_info=True)
+            return []
+
+    def search_logs(
+        self,
+        query: str,
+        period: tuple[str | datetime | None, str | datetime | None] | None = None,
+        limit: int = 100,
+        tag_keyword: str | None = None
+    ) -> list[Log]:
+        """
+        메시지에 검색어가 포함된 활성 로그를 관련도 순으로 조회합니다.
+        """
+        try:
+            return self.repository.search_logs(query, period, limit, tag_keyword)
+        except Exception:
+            self.logger.log_error("로그 검색 실패", exc_info=True)
+            return []
+
     def retrieve_recent_logs(self, limit: int = 20) -> list[Log]:
         """
         최근 활성 로그들을 조회합니다.
@@ -110,11 +166,169 @@ class LogService(ILogService):
     def remove_logs_by_ids(self, log_ids: list[int]) -> None:
         """
         지정한 로그 ID 리스트에 해당하는 로그들을 soft delete 처리합니다.
+        일별 통계에서 빼는 작업과 삭제를 하나의 트랜잭션으로 처리합니다.
         """
         if not log_ids:
             return
         try:
-            self.repository.soft_delete_logs(log_ids)
+            with UnitOfWork() as uow:
+                self.stats_repo.remove_logs(log_ids, uow.session)
+                self.repository.soft_delete_logs(log_ids, uow.session)
             self.logger.log_system_event(f"로그 삭제 (IDs: {log_ids}) 성공")
         except Exception:
             self.logger.log_error("로그 삭제 실패", exc_info=True)
+
+    def export_logs(
+        self,
+        path: str,
+        export_format: str,
+        filters: LogFilters | None = None,
+        progress_callback: ProgressCallback | None = None
+    ) -> int:
+        """
+        조건에 맞는 활성 로그를 태그/카테고리 이름과 함께 CSV 또는 JSONL 파일로 내보냅니다.
+
+        로그는 배치 단위로 스트리밍하여 한 행씩 기록하므로 전체 결과를 메모리에 올리지 않습니다.
+        같은 디렉토리의 임시 파일에 기록한 뒤 교체하므로, 실패하거나 취소되면 기존 파일이 유지됩니다.
+
+        Args:
+            path: 저장할 파일 경로
+            export_format: "csv" 또는 "jsonl"
+            filters: 조회 조건 (None이면 전체)
+            progress_callback: (내보낸 행 수, 전체 행 수) 진행 상황 콜백, ExportCancelled를 발생시키면 중단
+
+        Returns:
+            내보낸 로그 수 (실패 또는 취소 시 -1)
+        """
+        if export_format not in EXPORT_FORMATS:
+            self.logger.log_error(f"지원하지 않는 내보내기 형식: {export_format}")
+            return -1
+
+        self.logger.log_user_action(f"로그 내보내기 요청: {path} ({export_format})")
+        temp_path = None
+        try:
+            total = self.repository.count_logs(filters)
+            # CSV는 스프레드시트 프로그램이 UTF-8로 인식하도록 BOM 포함
+            encoding = "utf-8-sig" if export_format == EXPORT_FORMAT_CSV else "utf-8"
+            with tempfile.NamedTemporaryFile(
+                "w", encoding=encoding, newline="", dir=os.path.dirname(os.path.abspath(path)),
+                prefix=".export-", suffix=".tmp", delete=False
+            ) as file:
+                temp_path = file.name
+                rows = self.repository.iter_export_rows(filters)
+                try:
+                    written = write_rows(rows, file, export_format, total, progress_callback)
+                finally:
+                    rows.close()
+            os.replace(temp_path, path)
+            temp_path = None
+            self.logger.log_system_event(f"로그 내보내기 성공: {written}개 → {path}")
+            return written
+        except ExportCancelled:
+            self.logger.log_user_action("로그 내보내기 취소")
+            return -1
+        except Exception:
+            self.logger.log_error("로그 내보내기 실패", exc_info=True)
+            return -1
+        finally:
+            if temp_path is not None and os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def import_logs(
+        self,
+        path: str,
+        import_format: str | None = None,
+        progress_callback: ProgressCallback | None = None
+    ) -> LogImportResult:
+        """
+        CSV 또는 JSONL 파일의 로그를 일괄 저장합니다.
+
+        파일을 한 행씩 읽어 IMPORT_CHUNK_SIZE 행마다 하나의 트랜잭션으로 처리합니다.
+        청크마다 메시지의 해시태그를 한 번에 조회/생성하고, 로그와 log_tags를 executemany로 저장한 뒤
+        일별 통계를 갱신합니다. 같은 시작 시간과 메시지의 로그가 이미 있으면 건너뛰므로
+        같은 파일을 다시 가져와도 중복되지 않습니다.
+
+        Args:
+            path: 가져올 파일 경로
+            import_format: "csv" 또는 "jsonl" (None이면 확장자로 판단)
+            progress_callback: (읽은 행 수, 예상 전체 행 수) 진행 상황 콜백, ImportCancelled를 발생시키면 중단
+
+        Returns:
+            가져오기 결과 (실패 또는 취소 시 completed=False, 그 전 청크는 저장된 상태)
+        """
+        import_format = import_format or import_format_from_path(path)
+        if import_format is None:
+            self.logger.log_error(f"가져오기 형식을 알 수 없음: {path}")
+            return LogImportResult(completed=False)
+
+        self.logger.log_user_action(f"로그 가져오기 요청: {path} ({import_format})")
+        imported = skipped = duplicates = read = 0
+        try:
+            # CSV는 머리글 행 제외 (따옴표 안 줄바꿈이 있으면 실제보다 크게 추정됨)
+            total = max(count_lines(path) - (1 if import_format == EXPORT_FORMAT_CSV else 0), 0)
+            with open(path, encoding="utf-8-sig", newline="") as file:
+                records = iter_records(file, import_format)
+                while chunk := list(islice(records, IMPORT_CHUNK_SIZE)):
+                    read += len(chunk)
+                    logs = [record_to_log(record) for record in chunk if record is not None]
+                    valid_logs = [log for log in logs if log is not None]
+                    skipped += len(chunk) - len(valid_logs)
+
+                    saved = self._import_chunk(valid_logs)
+                    imported += saved
+                    duplicates += len(valid_logs) - saved
+
+                    if progress_callback:
+                        progress_callback(read, max(total, read))
+        except ImportCancelled:
+            self.logger.log_user_action(f"로그 가져오기 취소: {imported}개 저장됨")
+            return LogImportResult(imported, skipped, duplicates, completed=False)
+        except Exception:
+            self.logger.log_error(f"로그 가져오기 실패: {imported}개 저장됨", exc_info=True)
+            return LogImportResult(imported, skipped, duplicates, completed=False)
+
+        self.logger.log_system_event(
+            f"로그 가져오기 성공: {imported}개 저장, {skipped}개 건너뜀, {duplicates}개 중복"
+        )
+        return LogImportResult(imported, skipped, duplicates)
+
+    def _import_chunk(self, logs: list[ImportedLog]) -> int:
+        """
+        가져온 로그 한 청크를 하나의 트랜잭션으로 저장
+
+        Args:
+            logs: 가져온 로그 목록
+
+        Returns:
+            저장한 로그 수 (이미 있는 로그와 청크 내 중복 제외)
+        """
+        if not logs:
+            return 0
+
+        with UnitOfWork() as uow:
+            seen = self.repository.find_existing_log_keys(
+                uow.session, min(log.started_at for log in logs), max(log.started_at for log in logs)
+            )
+            new_logs: list[tuple[ImportedLog, list[str]]] = []
+            for log in logs:
+                key = (log.started_at, log.message)
+                if key in seen:
+                    continue
+                seen.add(key)
+                new_logs.append((log, extract_tags(log.message)))
+            if not new_logs:
+                return 0
+
+            # 청크의 모든 태그를 한 번에 조회/생성
+            names = [name for _, tag_names in new_logs for name in tag_names]
+            tag_id_by_name = dict(zip(dict.fromkeys(names), self.tag_repo.ensure_tags(names, uow.session), strict=True))
+
+            log_ids = self.repository.bulk_insert_logs(
+                [
+                    (log.message, [tag_id_by_name[name] for name in dict.fromkeys(tag_names)], log.started_at, log.ended_at)
+                    for log, tag_names in new_logs
+                ],
+                uow.session
+            )
+            self.stats_repo.add_log_range(log_ids[0], log_ids[-1], uow.session)
+        return len(log_ids)
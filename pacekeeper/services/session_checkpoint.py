@@ -0,0 +1,161 @@
+# services/session_checkpoint.py
+
+import json
+import os
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+from pacekeeper.utils.app_paths import get_session_checkpoint_path
+from pacekeeper.utils.desktop_logger import DesktopLogger
+from pacekeeper.utils.functions import write_json_atomic
+
+# 체크포인트 파일 형식 버전 (필드가 바뀌면 올려서 이전 파일을 무시)
+CHECKPOINT_VERSION = 1
+
+
+@dataclass(frozen=True)
+class SessionCheckpoint:
+    """
+    진행 중인 학습 세션의 체크포인트
+
+    Attributes:
+        status: AppStatus 이름 ("STUDY" 또는 "PAUSED")
+        started_at: 세션 시작 시간
+        ends_at: 예상 종료 시간 (일시정지 중이면 None)
+        remaining_seconds: 저장 시점의 남은 시간(초)
+        cycle: 현재 사이클 수
+        message: 입력 중인 로그 메시지
+        saved_at: 저장 시간
+    """
+    status: str
+    started_at: datetime
+    ends_at: datetime | None
+    remaining_seconds: int
+    cycle: int
+    message: str
+    saved_at: datetime
+
+    @property
+    def is_paused(self) -> bool:
+        return self.ends_at is None
+
+    def remaining_at(self, now: datetime) -> int:
+        """
+        주어진 시간 기준 남은 시간(초) - 일시정지 중이었다면 저장 시점의 남은 시간
+
+        Args:
+            now: 기준 시간 (보통 현재 시간)
+        """
+        if self.ends_at is None:
+            return self.remaining_seconds
+        return max(int((self.ends_at - now).total_seconds()), 0)
+
+    def focus_ended_at(self, now: datetime) -> datetime:
+        """
+        부분 세션을 로그로 남길 때의 종료 시간
+        (실행 중이었으면 현재 시간과 예상 종료 시간 중 이른 쪽, 일시정지 중이었으면 저장 시간)
+        """
+        if self.ends_at is None:
+            return self.saved_at
+        return min(now, self.ends_at)
+
+    def to_dict(self) -> dict[str, Any]:
+        values = asdict(self)
+        for key in ("started_at", "ends_at", "saved_at"):
+            values[key] = values[key].isoformat() if values[key] else None
+        return {"version": CHECKPOINT_VERSION, **values}
+
+    @classmethod
+    def from_dict(cls, values: dict[str, Any]) -> "SessionCheckpoint":
+        """
+        Raises:
+            ValueError: 형식 버전이 다르거나 필드 값이 잘못된 경우
+        """
+        if not isinstance(values, dict):
+            raise ValueError(f"잘못된 체크포인트 형식: {type(values).__name__}")
+        if values.get("version") != CHECKPOINT_VERSION:
+            raise ValueError(f"지원하지 않는 체크포인트 버전: {values.get('version')}")
+        try:
+            ends_at = values.get("ends_at")
+            return cls(
+                status=str(values["status"]),
+                started_at=datetime.fromisoformat(values["started_at"]),
+                ends_at=datetime.fromisoformat(ends_at) if ends_at else None,
+                remaining_seconds=int(values["remaining_seconds"]),
+                cycle=int(values["cycle"]),
+                message=str(values.get("message", "")),
+                saved_at=datetime.fromisoformat(values["saved_at"]),
+            )
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"잘못된 체크포인트: {e}") from e
+
+    @classmethod
+    def create(
+        cls, status: str, started_at: datetime, remaining_seconds: int, paused: bool, cycle: int, message: str
+    ) -> "SessionCheckpoint":
+        """현재 시간 기준으로 체크포인트 생성 (실행 중이면 남은 시간으로 예상 종료 시간 계산)"""
+        now = datetime.now().replace(microsecond=0)
+        return cls(
+            status=status,
+            started_at=started_at,
+            ends_at=None if paused else now + timedelta(seconds=remaining_seconds),
+            remaining_seconds=remaining_seconds,
+            cycle=cycle,
+            message=message,
+            saved_at=now,
+        )
+
+
+class SessionCheckpointStore:
+    """
+    세션 체크포인트 파일 저장소
+
+    config.json과 분리된 작은 JSON 파일 하나에 체크포인트를 원자적으로 기록합니다.
+    데이터베이스 잠금과 무관하게 바로 기록되므로 일괄 가져오기 등 긴 쓰기 트랜잭션 중에도 GUI 스레드를 막지 않습니다.
+    """
+
+    def __init__(self, path: str | None = None) -> None:
+        """
+        Args:
+            path: 체크포인트 파일 경로 (None이면 앱 데이터 디렉토리의 session.json)
+        """
+        self.path = path or get_session_checkpoint_path()
+        self.logger = DesktopLogger("PaceKeeper")
+
+    def save(self, checkpoint: SessionCheckpoint) -> bool:
+        """
+        체크포인트 저장
+
+        Returns:
+            저장 성공 여부
+        """
+        try:
+            write_json_atomic(self.path, checkpoint.to_dict(), ensure_ascii=False)
+            return True
+        except OSError:
+            self.logger.log_error("세션 체크포인트 저장 실패", exc_info=True)
+            return False
+
+    def load(self) -> SessionCheckpoint | None:
+        """
+        체크포인트 로드 (파일이 없거나 읽을 수 없으면 None, 잘못된 파일은 삭제)
+        """
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                return SessionCheckpoint.from_dict(json.load(file))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            self.logger.log_error("세션 체크포인트 로드 실패 (파일 삭제)", exc_info=True)
+            self.clear()
+            return None
+
+    def clear(self) -> None:
+        """체크포인트 삭제 (세션이 정상적으로 끝나거나 중단된 경우)"""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+        except OSError:
+            self.logger.log_error("세션 체크포인트 삭제 실패", exc_info=True)
@@ -2,14 +2,28 @@
 
 import json
 import os
+import threading
+import time
+from collections.abc import Iterable
 from typing import Any
 
-from pacekeeper.consts.labels import load_language_resource
-from pacekeeper.consts.settings import CONFIG_FILE, DEFAULT_SETTINGS, SET_LANGUAGE
+from pacekeeper.consts.labels import lang_res, language_registry
+from pacekeeper.consts.settings import CONFIG_FILE, SET_LANGUAGE
+from pacekeeper.services.settings_schema import (
+    SETTING_ERROR_MESSAGES,
+    Settings,
+    resolve_setting_key,
+    validate_setting,
+)
 from pacekeeper.utils.app_paths import get_config_path
+from pacekeeper.utils.event_bus import ANY_TOPIC, EventBus, Scheduler, call_soon
+from pacekeeper.utils.functions import write_json_atomic
 
-# 언어 리소스 로드
-lang_res = load_language_resource()
+# 설정 변경 후 파일에 저장하기까지 기다리는 시간(초) - 이 시간 안에 이어진 변경은 한 번의 저장으로 합쳐짐
+SETTINGS_SAVE_DELAY_SECONDS = 0.5
+
+# 변경이 계속 이어져도 첫 변경 후 이 시간(초)이 지나면 저장
+SETTINGS_SAVE_MAX_DELAY_SECONDS = 5.0
 
 
 class SettingsObserver:
@@ -32,36 +46,59 @@ class SettingsManager:
 
     설정 파일 로드, 저장 및 설정 값 접근 기능을 제공합니다.
     설정 변경 시 등록된 옵저버에게 알림을 보냅니다.
+
+    설정 값은 Settings 데이터 클래스에 보관되며, 값을 바꿀 때 키별 검증 함수로 검사합니다.
+    옵저버는 관심 있는 설정 키에만 등록할 수 있고, 같은 이벤트 루프 차례의 변경은 모아서 알립니다.
+
+    설정 값을 바꾸면 메모리에 바로 반영하고, 파일 저장은 저장 스레드에서 지연 실행합니다.
+    save_delay 안에 이어진 변경은 한 번의 저장으로 합쳐지며, 파일은 임시 파일을 거쳐 원자적으로 교체됩니다.
+    앱 종료 시 flush()로 대기 중인 변경을 저장합니다.
     """
-    def __init__(self, config_file: str = CONFIG_FILE) -> None:
+    def __init__(
+        self,
+        config_file: str = CONFIG_FILE,
+        save_delay: float = SETTINGS_SAVE_DELAY_SECONDS,
+        scheduler: Scheduler | None = call_soon
+    ) -> None:
         """
         SettingsManager 초기화
 
         Args:
             config_file: 설정 파일 이름 (기본값: CONFIG_FILE 상수 사용) - 현재는 사용되지 않음
+            save_delay: 마지막 변경 후 파일에 저장하기까지 기다리는 시간(초)
+            scheduler: 변경 알림 전달을 예약하는 함수 (None이면 변경 즉시 알림)
         """
         # 통합 경로 시스템 사용
         self.config_file: str = get_config_path()
         self.config_dir: str = os.path.dirname(self.config_file)
 
-        self.default_settings: dict[str, Any] = dict(DEFAULT_SETTINGS)
-        self.settings: dict[str, Any] = dict(self.default_settings)
+        self.settings: Settings = Settings()
+
+        # 설정 키별 변경 알림 버스 (옵저버는 약한 참조로 보관)
+        self._events = EventBus(scheduler)
 
-        # 옵저버 목록 초기화
-        self._observers: list[SettingsObserver] = []
+        # 지연 저장 상태 (settings 변경과 스냅샷은 _save_condition, 파일 기록은 _write_lock으로 직렬화)
+        self.save_delay: float = save_delay
+        self.save_count: int = 0
+        self._save_condition = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._dirty_since: float | None = None
+        self._save_due: float = 0.0
+        self._save_thread: threading.Thread | None = None
 
         # 설정 로드
         self.load_settings()
 
-    def add_observer(self, observer: SettingsObserver) -> None:
+    def add_observer(self, observer: SettingsObserver, keys: Iterable[str] | None = None) -> None:
         """
-        설정 변경을 관찰할 옵저버 추가
+        설정 변경을 관찰할 옵저버 추가 (옵저버가 사라지면 자동으로 제거됨)
 
         Args:
             observer: 설정 변경을 관찰할 SettingsObserver 인스턴스
+            keys: 관찰할 설정 키 (None이면 모든 설정)
         """
-        if observer not in self._observers:
-            self._observers.append(observer)
+        for key in (ANY_TOPIC,) if keys is None else keys:
+            self._events.subscribe(resolve_setting_key(key), observer.on_settings_changed)
 
     def remove_observer(self, observer: SettingsObserver) -> None:
         """
@@ -70,52 +107,130 @@ class SettingsManager:
         Args:
             observer: 제거할 SettingsObserver 인스턴스
         """
-        if observer in self._observers:
-            self._observers.remove(observer)
+        self._events.unsubscribe_all(observer.on_settings_changed)
+
+    def flush_notifications(self) -> None:
+        """모아 둔 설정 변경 알림을 바로 전달"""
+        self._events.flush()
 
     def _notify_observers(self, key: str, old_value: Any, new_value: Any) -> None:
         """
-        등록된 모든 옵저버에게 설정 변경 알림
+        설정 키를 관찰하는 옵저버에게 변경 알림
+        언어가 바뀌면 옵저버가 새 레이블을 읽을 수 있도록 알림 전에 활성 언어를 전환합니다.
 
         Args:
             key: 변경된 설정 키
             old_value: 이전 설정 값
             new_value: 새 설정 값
         """
-        for observer in self._observers:
-            observer.on_settings_changed(key, old_value, new_value)
+        if key == SET_LANGUAGE:
+            language_registry.set_active(new_value)
+
+        self._events.publish(key, old_value, new_value)
 
-    def load_settings(self) -> dict[str, Any]:
+    def load_settings(self) -> Settings:
         """
         설정 파일에서 설정 로드
 
         설정 파일이 존재하지 않거나 로드 실패 시 기본 설정을 사용합니다.
+        이전 버전의 키를 옮기거나 잘못된 값을 기본값으로 바꾼 경우 파일을 다시 저장합니다.
 
         Returns:
-            로드된 설정 딕셔너리
+            로드된 설정
         """
         if os.path.exists(self.config_file):
+            changes: list[str] = []
             try:
                 with open(self.config_file, encoding='utf-8') as f:
-                    self.settings = json.load(f)
+                    values = json.load(f)
+                if not isinstance(values, dict):
+                    raise ValueError(f"JSON 객체가 아님: {type(values).__name__}")
+                settings, changes = Settings.from_dict(values)
             except Exception as e:
                 print(lang_res.error_messages['SETTINGS_LOAD'].format(e))
-                self.settings = dict(self.default_settings)
+                settings = Settings()
+            with self._save_condition:
+                self.settings = settings
+            if changes:
+                print(f"설정 파일 마이그레이션: {'; '.join(changes)}")
+                self.schedule_save()
         else:
             self.save_settings()
 
+        language_registry.set_active(self.get_language())
         return self.settings
 
     def save_settings(self) -> bool:
         """
-        현재 설정을 파일에 저장
+        현재 설정을 파일에 즉시 저장 (대기 중인 지연 저장은 취소됨)
 
         Returns:
             저장 성공 여부
         """
+        with self._write_lock:
+            with self._save_condition:
+                settings = self._take_snapshot()
+            return self._write_settings(settings)
+
+    def schedule_save(self) -> None:
+        """
+        설정 저장 예약
+
+        마지막 호출 후 save_delay가 지나면 저장 스레드에서 저장합니다.
+        변경이 계속 이어지더라도 첫 변경 후 SETTINGS_SAVE_MAX_DELAY_SECONDS 안에는 저장됩니다.
+        """
+        with self._save_condition:
+            now = time.monotonic()
+            if self._dirty_since is None:
+                self._dirty_since = now
+            self._save_due = min(now + self.save_delay, self._dirty_since + SETTINGS_SAVE_MAX_DELAY_SECONDS)
+            if self._save_thread is None:
+                self._save_thread = threading.Thread(
+                    target=self._save_loop, name="SettingsSaver", daemon=True
+                )
+                self._save_thread.start()
+            self._save_condition.notify()
+
+    def flush(self) -> bool:
+        """
+        예약된 저장이 있으면 즉시 저장 (앱 종료 시 호출)
+
+        Returns:
+            저장 성공 여부 (저장할 변경이 없으면 True)
+        """
+        with self._write_lock:
+            with self._save_condition:
+                if self._dirty_since is None:
+                    return True
+                settings = self._take_snapshot()
+            return self._write_settings(settings)
+
+    def _save_loop(self) -> None:
+        """저장 스레드: 예약된 저장 시간이 되면 설정 스냅샷을 파일에 기록"""
+        while True:
+            with self._save_condition:
+                while self._dirty_since is None or time.monotonic() < self._save_due:
+                    timeout = None if self._dirty_since is None else self._save_due - time.monotonic()
+                    self._save_condition.wait(timeout)
+
+            with self._write_lock:
+                with self._save_condition:
+                    # 기다리는 동안 flush()나 save_settings()가 이미 저장한 경우
+                    if self._dirty_since is None:
+                        continue
+                    settings = self._take_snapshot()
+                self._write_settings(settings)
+
+    def _take_snapshot(self) -> dict[str, Any]:
+        """저장할 설정 복사본을 만들고 저장 예약을 해제 (_save_condition을 잡은 상태에서 호출)"""
+        self._dirty_since = None
+        return self.settings.to_dict()
+
+    def _write_settings(self, settings: dict[str, Any]) -> bool:
+        """설정 스냅샷을 파일에 원자적으로 기록 (_write_lock을 잡은 상태에서 호출)"""
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.settings, f, indent=4)
+            write_json_atomic(self.config_file, settings, indent=4)
+            self.save_count += 1
             return True
         except Exception as e:
             print(lang_res.error_messages['SETTINGS_SAVE'].format(e))
@@ -123,32 +238,40 @@ class SettingsManager:
 
     def get_setting(self, key: str, default: Any = None) -> Any:
         """
-        설정 값 반환
+        설정 값 반환 (자주 읽는 값은 settings 속성으로 직접 읽는 것이 빠름)
 
         Args:
-            key: 설정 키
-            default: 설정이 존재하지 않을 경우 반환할 기본값
+            key: 설정 키 (이전 버전의 키도 허용)
+            default: 알 수 없는 설정 키일 경우 반환할 기본값
 
         Returns:
             설정 값 또는 기본값
         """
-        return self.settings.get(key, default)
+        return getattr(self.settings, resolve_setting_key(key), default)
 
     def set_setting(self, key: str, value: Any) -> None:
         """
-        설정 값 설정 및 옵저버에 알림
+        설정 값 설정, 옵저버에 알림 및 저장 예약
 
         Args:
-            key: 설정 키
+            key: 설정 키 (이전 버전의 키도 허용)
             value: 설정 값
+
+        Raises:
+            ValueError: 알 수 없는 설정 키이거나 값이 유효하지 않은 경우
         """
-        old_value = self.settings.get(key)
-        self.settings[key] = value
+        key = resolve_setting_key(key)
+        if not validate_setting(key, value):
+            raise ValueError(f"잘못된 설정 값: {key}={value!r}")
+        with self._save_condition:
+            old_value = getattr(self.settings, key)
+            setattr(self.settings, key, value)
         self._notify_observers(key, old_value, value)
+        self.schedule_save()
 
     def update_settings(self, new_settings: dict[str, Any], validate: bool = True) -> dict[str, str]:
         """
-        여러 설정 값 업데이트 및 저장
+        여러 설정 값 업데이트 및 저장 예약
 
         Args:
             new_settings: 업데이트할 설정 딕셔너리
@@ -158,28 +281,31 @@ class SettingsManager:
             유효성 검사 오류 메시지 딕셔너리 (키: 설정 키, 값: 오류 메시지)
             유효성 검사를 통과하면 빈 딕셔너리 반환
         """
-        errors: dict[str, str] = {}
+        new_settings = {resolve_setting_key(key): value for key, value in new_settings.items()}
 
         if validate:
             errors = self._validate_settings(new_settings)
             if errors:
                 return errors
 
-        # 설정 업데이트 및 옵저버에 알림
+        # 설정 업데이트 및 옵저버에 알림 (검사를 건너뛴 경우 알 수 없는 키는 무시)
         for key, value in new_settings.items():
-            old_value = self.settings.get(key)
-            self.settings[key] = value
+            if not hasattr(self.settings, key):
+                continue
+            with self._save_condition:
+                old_value = getattr(self.settings, key)
+                setattr(self.settings, key, value)
             self._notify_observers(key, old_value, value)
 
-        self.save_settings()
+        self.schedule_save()
         return {}
 
     def _validate_settings(self, settings: dict[str, Any]) -> dict[str, str]:
         """
-        설정 유효성 검사
+        설정 유효성 검사 (설정 스키마의 키별 검증 함수 사용)
 
         Args:
-            settings: 검사할 설정 딕셔너리
+            settings: 검사할 설정 딕셔너리 (현재 키)
 
         Returns:
             유효성 검사 오류 메시지 딕셔너리 (키: 설정 키, 값: 오류 메시지)
@@ -187,50 +313,14 @@ class SettingsManager:
         """
         errors: dict[str, str] = {}
 
-        # 학습 시간 검증
-        if "study_time" in settings:
-            study_time = settings["study_time"]
-            if not isinstance(study_time, int) or study_time < 1 or study_time > 120:
-                errors["study_time"] = lang_res.error_messages.get(
-                    'INVALID_STUDY_TIME',
-                    "학습 시간은 1~120 사이의 정수여야 합니다."
-                )
-
-        # 짧은 휴식 시간 검증
-        if "short_break" in settings:
-            short_break = settings["short_break"]
-            if not isinstance(short_break, int) or short_break < 1 or short_break > 30:
-                errors["short_break"] = lang_res.error_messages.get(
-                    'INVALID_SHORT_BREAK',
-                    "짧은 휴식 시간은 1~30 사이의 정수여야 합니다."
-                )
-
-        # 긴 휴식 시간 검증
-        if "long_break" in settings:
-            long_break = settings["long_break"]
-            if not isinstance(long_break, int) or long_break < 5 or long_break > 60:
-                errors["long_break"] = lang_res.error_messages.get(
-                    'INVALID_LONG_BREAK',
-                    "긴 휴식 시간은 5~60 사이의 정수여야 합니다."
-                )
-
-        # 사이클 수 검증
-        if "cycles" in settings:
-            cycles = settings["cycles"]
-            if not isinstance(cycles, int) or cycles < 1 or cycles > 10:
-                errors["cycles"] = lang_res.error_messages.get(
-                    'INVALID_CYCLES',
-                    "사이클 수는 1~10 사이의 정수여야 합니다."
-                )
-
-        # 언어 설정 검증
-        if SET_LANGUAGE in settings:
-            language = settings[SET_LANGUAGE]
-            if language not in ["ko", "en"]:
-                errors[SET_LANGUAGE] = lang_res.error_messages.get(
-                    'INVALID_LANGUAGE',
-                    "지원하지 않는 언어입니다. 지원 언어: ko, en"
-                )
+        for key, value in settings.items():
+            if validate_setting(key, value):
+                continue
+            if key in SETTING_ERROR_MESSAGES:
+                message_key, default_message = SETTING_ERROR_MESSAGES[key]
+                errors[key] = lang_res.error_messages.get(message_key, default_message)
+            else:
+                errors[key] = lang_res.error_messages.get('INVALID_SETTING', "잘못된 설정 값입니다: {}").format(key)
 
         return errors
 
@@ -241,7 +331,7 @@ class SettingsManager:
         Returns:
             언어 코드 (기본값: "ko")
         """
-        return self.settings.get(SET_LANGUAGE, "ko")
+        return self.settings.language
 
     def set_language(self, lang: str) -> None:
         """
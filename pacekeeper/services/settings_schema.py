@@ -0,0 +1,198 @@
+# services/settings_schema.py
+
+import re
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, fields
+from typing import Any
+
+from pacekeeper.consts.settings import (
+    AVAILABLE_LANGS,
+    DEFAULT_SETTINGS,
+    SET_ALARM_VOLUME,
+    SET_BREAK_COLOR,
+    SET_DB_CACHE_SIZE,
+    SET_DB_JOURNAL_MODE,
+    SET_DB_MMAP_SIZE,
+    SET_DB_SYNCHRONOUS,
+    SET_DB_TEMP_STORE,
+    SET_LANGUAGE,
+    SET_LONG_BREAK_TIME,
+    SET_MAIN_DLG_HEIGHT,
+    SET_MAIN_DLG_WIDTH,
+    SET_PADDING_SIZE,
+    SET_POMODORO_CYCLES,
+    SET_SHORT_BREAK_TIME,
+    SET_SOUND_ENABLE,
+    SET_STUDY_TIME,
+    SET_TTS_ENABLE,
+)
+
+# 정수 설정의 허용 범위 (최소값, 최대값) - 설정 다이얼로그의 입력 범위도 이 값을 사용
+SETTING_RANGES: dict[str, tuple[int, int]] = {
+    SET_STUDY_TIME: (1, 120),
+    SET_SHORT_BREAK_TIME: (1, 30),
+    SET_LONG_BREAK_TIME: (5, 60),
+    SET_POMODORO_CYCLES: (1, 10),
+    SET_PADDING_SIZE: (0, 1000),
+    SET_ALARM_VOLUME: (0, 100),
+    SET_MAIN_DLG_WIDTH: (200, 10000),
+    SET_MAIN_DLG_HEIGHT: (150, 10000),
+    SET_DB_MMAP_SIZE: (0, 2 ** 40),
+    SET_DB_CACHE_SIZE: (-(2 ** 31), 2 ** 31),
+}
+
+# 이전 버전에서 사용하던 설정 키 → 현재 키 (로드 시 현재 키로 옮김)
+LEGACY_SETTING_KEYS: dict[str, str] = {
+    "short_break": SET_SHORT_BREAK_TIME,
+    "long_break": SET_LONG_BREAK_TIME,
+    "cycles": SET_POMODORO_CYCLES,
+    "sound_volume": SET_ALARM_VOLUME,
+}
+
+# 유효성 검사 오류 메시지 (ERROR_MESSAGES 키, 언어 리소스에 없을 때 사용할 기본 메시지)
+SETTING_ERROR_MESSAGES: dict[str, tuple[str, str]] = {
+    SET_STUDY_TIME: ('INVALID_STUDY_TIME', "학습 시간은 1~120 사이의 정수여야 합니다."),
+    SET_SHORT_BREAK_TIME: ('INVALID_SHORT_BREAK', "짧은 휴식 시간은 1~30 사이의 정수여야 합니다."),
+    SET_LONG_BREAK_TIME: ('INVALID_LONG_BREAK', "긴 휴식 시간은 5~60 사이의 정수여야 합니다."),
+    SET_POMODORO_CYCLES: ('INVALID_CYCLES', "사이클 수는 1~10 사이의 정수여야 합니다."),
+    SET_LANGUAGE: ('INVALID_LANGUAGE', "지원하지 않는 언어입니다. 지원 언어: ko, en"),
+}
+
+_COLOR_PATTERN = re.compile(r"#[0-9A-Fa-f]{6}")
+
+Validator = Callable[[Any], bool]
+
+
+def _int_in_range(minimum: int, maximum: int) -> Validator:
+    """범위 안의 정수인지 검사하는 검증 함수 생성 (bool은 정수로 보지 않음)"""
+    def validate(value: Any) -> bool:
+        return type(value) is int and minimum <= value <= maximum
+    return validate
+
+
+def _is_bool(value: Any) -> bool:
+    return type(value) is bool
+
+
+def _is_str(value: Any) -> bool:
+    return isinstance(value, str)
+
+
+def _one_of(choices: set[str]) -> Validator:
+    """허용 값 중 하나인지 검사하는 검증 함수 생성"""
+    return lambda value: value in choices
+
+
+def _is_color(value: Any) -> bool:
+    return isinstance(value, str) and _COLOR_PATTERN.fullmatch(value) is not None
+
+
+def _compile_validators() -> dict[str, Validator]:
+    """설정 키별 검증 함수를 한 번만 만들어 둠 (검사 시 키 하나당 함수 호출 한 번)"""
+    validators: dict[str, Validator] = {
+        key: _int_in_range(minimum, maximum) for key, (minimum, maximum) in SETTING_RANGES.items()
+    }
+    validators[SET_SOUND_ENABLE] = _is_bool
+    validators[SET_TTS_ENABLE] = _is_bool
+    validators[SET_BREAK_COLOR] = _is_color
+    validators[SET_LANGUAGE] = _one_of(set(AVAILABLE_LANGS))
+    # 문자열 PRAGMA 값은 연결 시 sqlite_pragmas.normalize_pragma_value에서 허용 값으로 제한됨
+    for key in (SET_DB_JOURNAL_MODE, SET_DB_SYNCHRONOUS, SET_DB_TEMP_STORE):
+        validators[key] = _is_str
+    return validators
+
+
+SETTING_VALIDATORS: dict[str, Validator] = _compile_validators()
+
+
+@dataclass(slots=True)
+class Settings:
+    """
+    애플리케이션 설정 값
+
+    필드 이름은 config.json의 키와 같습니다. 타이머 등 자주 읽는 곳에서는
+    딕셔너리 조회 대신 속성으로 바로 읽습니다. (예: config_ctrl.settings.study_time)
+    """
+    study_time: int = DEFAULT_SETTINGS[SET_STUDY_TIME]
+    short_break_time: int = DEFAULT_SETTINGS[SET_SHORT_BREAK_TIME]
+    long_break_time: int = DEFAULT_SETTINGS[SET_LONG_BREAK_TIME]
+    pomodoro_cycles: int = DEFAULT_SETTINGS[SET_POMODORO_CYCLES]
+    padding_size: int = DEFAULT_SETTINGS[SET_PADDING_SIZE]
+    sound_enable: bool = DEFAULT_SETTINGS[SET_SOUND_ENABLE]
+    tts_enable: bool = DEFAULT_SETTINGS[SET_TTS_ENABLE]
+    alarm_volume: int = DEFAULT_SETTINGS[SET_ALARM_VOLUME]
+    break_color: str = DEFAULT_SETTINGS[SET_BREAK_COLOR]
+    language: str = DEFAULT_SETTINGS[SET_LANGUAGE]
+    main_dlg_width: int = DEFAULT_SETTINGS[SET_MAIN_DLG_WIDTH]
+    main_dlg_height: int = DEFAULT_SETTINGS[SET_MAIN_DLG_HEIGHT]
+    db_journal_mode: str = DEFAULT_SETTINGS[SET_DB_JOURNAL_MODE]
+    db_synchronous: str = DEFAULT_SETTINGS[SET_DB_SYNCHRONOUS]
+    db_temp_store: str = DEFAULT_SETTINGS[SET_DB_TEMP_STORE]
+    db_mmap_size: int = DEFAULT_SETTINGS[SET_DB_MMAP_SIZE]
+    db_cache_size: int = DEFAULT_SETTINGS[SET_DB_CACHE_SIZE]
+
+    def to_dict(self) -> dict[str, Any]:
+        """config.json에 저장할 딕셔너리 반환"""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, values: dict[str, Any]) -> tuple["Settings", list[str]]:
+        """
+        config.json 딕셔너리에서 설정 생성
+
+        이전 버전의 키는 현재 키로 옮기고(현재 키가 함께 있으면 현재 키의 값 사용),
+        알 수 없는 키는 버리며, 잘못된 값은 기본값으로 대체합니다.
+
+        Args:
+            values: 설정 파일에서 읽은 딕셔너리
+
+        Returns:
+            (설정, 옮기거나 버리거나 대체한 항목 설명 목록 - 비어 있지 않으면 파일을 다시 저장해야 함)
+        """
+        settings = cls()
+        changes: list[str] = []
+
+        for key, value in values.items():
+            if key in LEGACY_SETTING_KEYS:
+                new_key = LEGACY_SETTING_KEYS[key]
+                if new_key in values:
+                    changes.append(f"{key}: {new_key} 값 사용")
+                    continue
+                changes.append(f"{key} → {new_key}")
+                key = new_key
+            validate = SETTING_VALIDATORS.get(key)
+            if validate is None:
+                changes.append(f"{key}: 알 수 없는 설정")
+            elif not validate(value):
+                changes.append(f"{key}: 잘못된 값 {value!r} (기본값 사용)")
+            else:
+                setattr(settings, key, value)
+
+        missing = SETTING_KEYS.difference(resolve_setting_key(key) for key in values)
+        if missing:
+            changes.append(f"기본값 추가: {', '.join(sorted(missing))}")
+        return settings, changes
+
+
+# 설정 키 목록 (Settings 필드 이름)
+SETTING_KEYS: frozenset[str] = frozenset(field.name for field in fields(Settings))
+
+
+def resolve_setting_key(key: str) -> str:
+    """이전 버전의 설정 키를 현재 키로 변환"""
+    return LEGACY_SETTING_KEYS.get(key, key)
+
+
+def validate_setting(key: str, value: Any) -> bool:
+    """
+    설정 값 유효성 검사
+
+    Args:
+        key: 설정 키 (현재 키)
+        value: 설정 값
+
+    Returns:
+        알려진 키이고 값이 유효하면 True
+    """
+    validate = SETTING_VALIDATORS.get(key)
+    return validate is not None and validate(value)
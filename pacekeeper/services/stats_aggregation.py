@@ -0,0 +1,116 @@
+# services/stats_aggregation.py
+
+from array import array
+from datetime import date
+
+from pacekeeper.repository.stats_totals import DailyStatColumns, StatsDashboard
+
+
+def _zeros(length: int) -> array:
+    """0으로 채운 64비트 정수 배열 생성"""
+    return array("q", bytes(8 * length))
+
+
+def _group_totals(ids: array, sessions: array, focus_seconds: array) -> list[tuple[int, int, int]]:
+    """
+    ID별 세션 수와 집중 시간을 합산
+
+    Returns:
+        (ID, 세션 수, 집중 시간(초)) 목록, 집중 시간 내림차순
+    """
+    grouped: dict[int, list[int]] = {}
+    for key, row_sessions, row_seconds in zip(ids, sessions, focus_seconds, strict=True):
+        totals = grouped.get(key)
+        if totals is None:
+            grouped[key] = [row_sessions, row_seconds]
+        else:
+            totals[0] += row_sessions
+            totals[1] += row_seconds
+    return sorted(
+        ((key, totals[0], totals[1]) for key, totals in grouped.items()),
+        key=lambda item: (-item[2], -item[1], item[0])
+    )
+
+
+def _streaks(daily_sessions: array) -> tuple[int, int]:
+    """
+    기록이 있는 날의 연속 일수 계산
+
+    Returns:
+        (현재 연속 일수, 최장 연속 일수)
+        현재 연속 일수는 마지막 날부터 세며, 마지막 날에 기록이 없으면 전날부터 셉니다.
+    """
+    longest = run = 0
+    for sessions in daily_sessions:
+        run = run + 1 if sessions > 0 else 0
+        longest = max(longest, run)
+
+    end = len(daily_sessions) - 1
+    if end >= 0 and daily_sessions[end] == 0:
+        end -= 1
+    current = 0
+    while end >= 0 and daily_sessions[end] > 0:
+        current += 1
+        end -= 1
+    return current, longest
+
+
+def aggregate_dashboard(columns: DailyStatColumns, start_day: date, end_day: date) -> StatsDashboard:
+    """
+    일별 집계 컬럼 배열로 대시보드 데이터를 계산합니다.
+
+    행 종류(전체/태그/카테고리 합계)별로 인덱스를 나눈 뒤 배열 단위로 그룹 합산하며,
+    로그 ORM 객체나 태그 JSON은 사용하지 않습니다.
+
+    Args:
+        columns: 기간 내 daily_stats 컬럼 배열
+        start_day: 기간 시작 날짜 (포함)
+        end_day: 기간 종료 날짜 (포함)
+
+    Returns:
+        날짜별 합계, 태그/카테고리별 합계, 연속 기록 일수
+    """
+    day_count = max((end_day - start_day).days + 1, 0)
+    daily_sessions = _zeros(day_count)
+    daily_focus_seconds = _zeros(day_count)
+
+    base = start_day.toordinal()
+    tag_rows = array("l")
+    category_rows = array("l")
+    rows = zip(columns.days, columns.tag_ids, columns.category_ids, strict=True)
+    for index, (day, tag_id, category_id) in enumerate(rows):
+        # 기간 밖의 행은 어떤 합계에도 포함하지 않음
+        offset = day - base
+        if not 0 <= offset < day_count:
+            continue
+        if tag_id > 0:
+            tag_rows.append(index)
+        elif category_id > 0:
+            category_rows.append(index)
+        else:
+            daily_sessions[offset] += columns.sessions[index]
+            daily_focus_seconds[offset] += columns.focus_seconds[index]
+
+    def pick(values: array, rows: array) -> array:
+        return array(values.typecode, [values[row] for row in rows])
+
+    tag_totals = _group_totals(
+        pick(columns.tag_ids, tag_rows), pick(columns.sessions, tag_rows), pick(columns.focus_seconds, tag_rows)
+    )
+    category_totals = _group_totals(
+        pick(columns.category_ids, category_rows),
+        pick(columns.sessions, category_rows),
+        pick(columns.focus_seconds, category_rows)
+    )
+    current_streak, longest_streak = _streaks(daily_sessions)
+
+    return StatsDashboard(
+        start_day=start_day,
+        end_day=end_day,
+        daily_sessions=daily_sessions,
+        daily_focus_seconds=daily_focus_seconds,
+        tag_totals=tag_totals,
+        category_totals=category_totals,
+        current_streak=current_streak,
+        longest_streak=longest_streak,
+    )
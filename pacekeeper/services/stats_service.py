@@ -0,0 +1,84 @@
+import calendar
+from datetime import date, timedelta
+
+from pacekeeper.interfaces.repositories.i_stats_repository import IStatsRepository
+from pacekeeper.interfaces.services.i_stats_service import IStatsService
+from pacekeeper.repository.stats_totals import DailyStatColumns, StatsDashboard, StatsTotals
+from pacekeeper.services.stats_aggregation import aggregate_dashboard
+from pacekeeper.utils.desktop_logger import DesktopLogger
+
+# 대시보드 기본 조회 기간(일)
+DASHBOARD_DAYS = 365
+
+
+class StatsService(IStatsService):
+    def __init__(self, stats_repository: IStatsRepository) -> None:
+        self.logger: DesktopLogger = DesktopLogger("PaceKeeper")
+        self.repository: IStatsRepository = stats_repository
+        self.logger.log_system_event("StatsService 초기화됨.")
+
+    def get_day_totals(self, day: date | None = None) -> StatsTotals:
+        """
+        하루 합계를 조회합니다.
+        """
+        day = day or date.today()
+        return self.get_period_totals(day, day)
+
+    def get_week_totals(self, day: date | None = None) -> StatsTotals:
+        """
+        주어진 날짜가 속한 주(월요일~일요일)의 합계를 조회합니다.
+        """
+        day = day or date.today()
+        monday = day - timedelta(days=day.weekday())
+        return self.get_period_totals(monday, monday + timedelta(days=6))
+
+    def get_month_totals(self, day: date | None = None) -> StatsTotals:
+        """
+        주어진 날짜가 속한 달의 합계를 조회합니다.
+        """
+        day = day or date.today()
+        last_day = calendar.monthrange(day.year, day.month)[1]
+        return self.get_period_totals(day.replace(day=1), day.replace(day=last_day))
+
+    def get_year_totals(self, day: date | None = None) -> StatsTotals:
+        """
+        주어진 날짜가 속한 해의 합계를 조회합니다.
+        """
+        day = day or date.today()
+        return self.get_period_totals(date(day.year, 1, 1), date(day.year, 12, 31))
+
+    def get_period_totals(self, start_day: date, end_day: date) -> StatsTotals:
+        """
+        임의 기간의 합계를 조회합니다.
+        """
+        try:
+            return self.repository.get_period_totals(start_day, end_day)
+        except Exception:
+            self.logger.log_error(f"기간({start_day} ~ {end_day}) 통계 조회 실패", exc_info=True)
+            return StatsTotals(start_day, end_day)
+
+    def get_dashboard(self, start_day: date | None = None, end_day: date | None = None) -> StatsDashboard:
+        """
+        통계 대시보드(날짜별 히트맵, 태그/카테고리별 합계, 연속 기록) 데이터를 계산합니다.
+        기간을 지정하지 않으면 오늘까지 최근 DASHBOARD_DAYS일을 사용합니다.
+        """
+        end_day = end_day or date.today()
+        start_day = start_day or end_day - timedelta(days=DASHBOARD_DAYS - 1)
+        try:
+            columns = self.repository.get_daily_columns(start_day, end_day)
+            return aggregate_dashboard(columns, start_day, end_day)
+        except Exception:
+            self.logger.log_error(f"기간({start_day} ~ {end_day}) 대시보드 계산 실패", exc_info=True)
+            return aggregate_dashboard(DailyStatColumns(), start_day, end_day)
+
+    def rebuild_stats(self) -> int:
+        """
+        활성 로그 전체로 일별 집계를 다시 계산합니다.
+        """
+        try:
+            row_count = self.repository.rebuild()
+            self.logger.log_system_event(f"일별 통계 재계산 성공: {row_count}행")
+            return row_count
+        except Exception:
+            self.logger.log_error("일별 통계 재계산 실패", exc_info=True)
+            return -1
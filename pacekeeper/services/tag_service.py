@@ -1,4 +1,5 @@
 import json
+import threading
 
 from icecream import ic
 
@@ -12,6 +13,12 @@ class TagService(ITagService):
     def __init__(self, tag_repository: ITagRepository) -> None:
         self.logger: DesktopLogger = DesktopLogger("PaceKeeper")
         self.repository: ITagRepository = tag_repository
+
+        # 태그 ID → 태그 이름 캐시 (get_tag_text 호출마다 DB를 조회하지 않도록 유지)
+        self._tag_names: dict[int, str | None] = {}
+        self._cache_loaded: bool = False
+        # 캐시는 GUI 스레드와 DbWorker 작업 스레드에서 함께 사용하므로 잠금으로 보호
+        self._cache_lock = threading.RLock()
         self.logger.log_system_event("TagService 초기화됨.")
 
     def get_tag_text(self, tag_ids: list[int] | str) -> list[str]:
@@ -24,8 +31,50 @@ class TagService(ITagService):
         Returns:
             태그 이름 목록
         """
+        return self.get_tag_texts([tag_ids])[0]
+
+    def get_tag_texts(self, tag_id_lists: list[list[int] | str]) -> list[list[str]]:
+        """
+        여러 로그의 태그 ID 목록을 한 번에 태그 이름 목록으로 변환합니다.
+
+        캐시에 없는 태그 ID는 한 번의 IN 쿼리로 조회하므로,
+        로그 수와 관계없이 DB 왕복 횟수가 일정합니다.
+
+        Args:
+            tag_id_lists: 로그별 태그 ID 목록 (정수 리스트 또는 JSON 문자열)의 리스트
+
+        Returns:
+            입력 순서와 동일한 로그별 태그 이름 목록
+        """
+        parsed_lists = [self._parse_tag_ids(tag_ids) for tag_ids in tag_id_lists]
+
+        all_ids = {tag_id for tag_ids in parsed_lists for tag_id in tag_ids}
+        with self._cache_lock:
+            self._ensure_cached(all_ids)
+
+            result: list[list[str]] = []
+            for tag_ids in parsed_lists:
+                # 명시적으로 str() 변환하여 인코딩 처리 보장
+                names = [str(self._tag_names[tag_id]) for tag_id in tag_ids if self._tag_names.get(tag_id)]
+                result.append(names)
+        return result
+
+    def invalidate_cache(self) -> None:
+        """
+        태그 이름 캐시를 비웁니다. 다음 조회 시 다시 로드됩니다.
+        """
+        with self._cache_lock:
+            self._tag_names.clear()
+            self._cache_loaded = False
+
+    def _parse_tag_ids(self, tag_ids: list[int] | str) -> list[int]:
+        """
+        태그 ID 입력(리스트 또는 JSON 문자열)을 정수 리스트로 정규화합니다.
+        """
         # 입력이 문자열인 경우 JSON 파싱
         if isinstance(tag_ids, str):
+            if not tag_ids:
+                return []
             try:
                 tag_ids = json.loads(tag_ids)
             except json.JSONDecodeError as e:
@@ -37,18 +86,37 @@ class TagService(ITagService):
             ic(f"태그 ID가 리스트가 아닙니다: {type(tag_ids)}")
             return []
 
-        tag_names = []
-        for tag_id in tag_ids:
+        return [tag_id for tag_id in tag_ids if isinstance(tag_id, int)]
+
+    def _ensure_cached(self, tag_ids: set[int]) -> None:
+        """
+        주어진 태그 ID들이 캐시에 존재하도록 보장합니다.
+
+        최초 호출 시 활성 태그 전체를 한 번에 로드하고,
+        이후 캐시에 없는 ID(삭제된 태그, 다른 경로로 추가된 태그)만 일괄 조회합니다.
+        """
+        if not self._cache_loaded:
             try:
-                tag: Tag = self.repository.get_tag(tag_id)
-                if tag and tag.name:
-                    # 직접 태그 이름을 추가하여 불필요한 중간 과정 제거
-                    # 명시적으로 str() 변환하여 인코딩 처리 보장
-                    tag_names.append(str(tag.name))
+                for tag in self.repository.get_tags():
+                    self._tag_names[tag.id] = tag.name
+                self._cache_loaded = True
             except Exception as e:
-                ic(f"태그 조회 오류: {e} - 태그 ID: {tag_id}")
+                self.logger.log_error(f"태그 캐시 로드 실패: {e}", exc_info=True)
+
+        missing_ids = [tag_id for tag_id in tag_ids if tag_id not in self._tag_names]
+        if not missing_ids:
+            return
 
-        return tag_names
+        try:
+            for tag in self.repository.get_tags_by_ids(missing_ids):
+                self._tag_names[tag.id] = tag.name
+        except Exception as e:
+            self.logger.log_error(f"태그 일괄 조회 실패: {e}", exc_info=True)
+            return
+
+        # 존재하지 않는 ID는 반복 조회하지 않도록 None으로 기록
+        for tag_id in missing_ids:
+            self._tag_names.setdefault(tag_id, None)
 
     def get_tag(self, tag_id: int) -> Tag | None:
         """
@@ -102,7 +170,9 @@ class TagService(ITagService):
             생성된 태그 객체
         """
         try:
-            return self.repository.add_tag(name, description)
+            tag = self.repository.add_tag(name, description)
+            self.invalidate_cache()
+            return tag
         except Exception as e:
             self.logger.log_error(f"태그 생성 실패: {e}", exc_info=True)
             raise e
@@ -121,7 +191,9 @@ class TagService(ITagService):
             업데이트된 태그 객체 또는 None
         """
         try:
-            return self.repository.update_tag(tag_id, name, description)
+            tag = self.repository.update_tag(tag_id, name, description)
+            self.invalidate_cache()
+            return tag
         except Exception as e:
             self.logger.log_error(f"태그 업데이트 실패: {e}", exc_info=True)
             return None
@@ -135,6 +207,7 @@ class TagService(ITagService):
         """
         try:
             self.repository.delete_tag(tag_id)
+            self.invalidate_cache()
         except Exception as e:
             self.logger.log_error(f"태그 삭제 실패: {e}", exc_info=True)
             raise e
@@ -4,7 +4,10 @@ import os
 import sys
 from pathlib import Path
 
-from pacekeeper.consts.settings import CONFIG_FILE, DB_FILE
+from pacekeeper.consts.settings import CONFIG_FILE, DB_FILE, SESSION_CHECKPOINT_FILE
+
+# 데이터 디렉토리를 직접 지정하는 환경 변수 (벤치마크 등에서 사용자 데이터와 분리할 때 사용)
+DATA_DIR_ENV = "PACEKEEPER_DATA_DIR"
 
 
 def get_app_data_dir():
@@ -12,11 +15,14 @@ def get_app_data_dir():
     애플리케이션 데이터 디렉토리 반환
     
     개발 환경과 프로덕션 환경에서 통일된 데이터 디렉토리를 제공합니다.
+    PACEKEEPER_DATA_DIR 환경 변수가 설정되어 있으면 그 경로를 사용합니다.
     
     Returns:
         str: 애플리케이션 데이터 디렉토리 경로
     """
-    if getattr(sys, 'frozen', False):
+    if os.environ.get(DATA_DIR_ENV):
+        app_dir = os.environ[DATA_DIR_ENV]
+    elif getattr(sys, 'frozen', False):
         # 프로덕션 환경 (PyInstaller)
         if sys.platform == 'darwin':
             # macOS: Application Support 디렉토리
@@ -48,6 +54,16 @@ def get_config_path():
     return os.path.join(get_app_data_dir(), CONFIG_FILE)
 
 
+def get_session_checkpoint_path():
+    """
+    세션 체크포인트 파일 경로 반환
+    
+    Returns:
+        str: session.json 파일의 전체 경로
+    """
+    return os.path.join(get_app_data_dir(), SESSION_CHECKPOINT_FILE)
+
+
 def get_database_path():
     """
     데이터베이스 파일 경로 반환
@@ -1,7 +1,111 @@
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 import sys
+import threading
+
+# 파일 기록 스레드로 넘기기 전에 보관할 최대 로그 레코드 수
+LOG_QUEUE_SIZE = 10000
+# 큐가 가득 찼을 때 WARNING 이상 레코드가 자리를 기다리는 최대 시간(초)
+LOG_QUEUE_PUT_TIMEOUT = 0.5
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """
+    크기가 제한된 큐에 로그 레코드를 넣는 핸들러
+
+    큐가 가득 차면 INFO 이하 레코드는 즉시 버리고,
+    WARNING 이상 레코드는 LOG_QUEUE_PUT_TIMEOUT 동안 자리를 기다린 뒤 버립니다.
+    버린 레코드 수는 dropped_count에 누적됩니다.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped_count = 0
+        self._dropped_lock = threading.Lock()
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            if record.levelno >= logging.WARNING:
+                self.queue.put(record, timeout=LOG_QUEUE_PUT_TIMEOUT)
+            else:
+                self.queue.put_nowait(record)
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped_count += 1
+
+
+class BlockingSentinelQueueListener(logging.handlers.QueueListener):
+    """
+    종료 신호를 큐에 자리가 날 때까지 기다려 넣는 QueueListener
+
+    기본 구현은 put_nowait를 사용하므로 큐가 가득 찬 상태에서 stop()이 실패합니다.
+    """
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
+
+# "PaceKeeper" 로거의 비동기 기록 상태 (DesktopLogger 인스턴스끼리 공유)
+_queue_handler: DroppingQueueHandler | None = None
+_queue_listener: BlockingSentinelQueueListener | None = None
+_target_handlers: tuple[logging.Handler, ...] = ()
+_queue_lock = threading.Lock()
+
+
+def install_queue_logging(logger: logging.Logger, *handlers: logging.Handler, maxsize: int = LOG_QUEUE_SIZE) -> None:
+    """
+    로거에 큐 핸들러를 연결하고, 실제 핸들러는 백그라운드 스레드에서 실행합니다.
+
+    호출 스레드(GUI 스레드)는 레코드를 큐에 넣기만 하므로 파일 쓰기와 로테이션 검사를 기다리지 않습니다.
+
+    Args:
+        logger: 대상 로거
+        handlers: 백그라운드 스레드에서 레코드를 기록할 핸들러들
+        maxsize: 큐 최대 크기
+    """
+    global _queue_handler, _queue_listener, _target_handlers
+
+    with _queue_lock:
+        log_queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        _queue_handler = DroppingQueueHandler(log_queue)
+        _queue_listener = BlockingSentinelQueueListener(log_queue, *handlers, respect_handler_level=True)
+        _target_handlers = handlers
+        logger.addHandler(_queue_handler)
+        _queue_listener.start()
+
+
+def shutdown_queue_logging(logger: logging.Logger) -> None:
+    """
+    큐에 남은 레코드를 모두 기록하고 백그라운드 스레드를 종료합니다.
+
+    이후의 로그는 실제 핸들러가 호출 스레드에서 직접 기록합니다.
+    여러 번 호출해도 안전합니다.
+
+    Args:
+        logger: install_queue_logging에 전달했던 로거
+    """
+    global _queue_handler, _queue_listener
+
+    with _queue_lock:
+        if _queue_listener is None or _queue_handler is None:
+            return
+
+        logger.removeHandler(_queue_handler)
+        _queue_listener.stop()  # 남은 레코드를 기록한 뒤 스레드 종료
+        for handler in _target_handlers:
+            logger.addHandler(handler)
+
+        dropped_count = _queue_handler.dropped_count
+        _queue_handler = None
+        _queue_listener = None
+
+    if dropped_count:
+        logger.warning(f"로그 큐가 가득 차서 {dropped_count}개의 로그를 기록하지 못했습니다.")
+    for handler in _target_handlers:
+        handler.flush()
 
 
 class DesktopLogger:
@@ -29,10 +133,13 @@ class DesktopLogger:
     def _setup_logger(self):
         logger = logging.getLogger(self.app_name)
         # 이미 핸들러가 등록된 경우 중복 등록 방지
-        if logger.hasHandlers():
+        # (hasHandlers()는 루트 로거의 핸들러까지 확인하므로 이 로거의 핸들러만 확인)
+        if logger.handlers:
             return logger
 
         logger.setLevel(logging.INFO)
+        # 루트 로거 핸들러(콘솔, 디버그 파일)의 동기 기록을 거치지 않도록 전파하지 않음
+        logger.propagate = False
 
         formatter = logging.Formatter(
             '%(asctime)s [%(levelname)s] %(message)s',
@@ -48,10 +155,20 @@ class DesktopLogger:
             encoding='utf-8'
         )
         handler.setFormatter(formatter)
-        logger.addHandler(handler)
+
+        # 파일 기록은 백그라운드 스레드에서 수행하고, 프로세스 종료 시 남은 로그를 기록
+        install_queue_logging(logger, handler)
+        atexit.register(shutdown_queue_logging, logger)
 
         return logger
 
+    def shutdown(self):
+        """
+        대기 중인 로그를 모두 파일에 기록하고 백그라운드 기록 스레드를 종료합니다.
+        앱 종료 시 호출합니다. (호출하지 않아도 인터프리터 종료 시 자동으로 호출됨)
+        """
+        shutdown_queue_logging(self.logger)
+
     def log_error(self, error_msg, exc_info=None):
         """치명적인 오류 로깅"""
         if exc_info:
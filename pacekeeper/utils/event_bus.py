@@ -0,0 +1,168 @@
+# utils/event_bus.py
+
+import threading
+import weakref
+from collections.abc import Callable, Hashable
+from typing import Any
+
+# 모든 주제의 알림을 받는 구독
+ANY_TOPIC = "*"
+
+# 구독 콜백: (주제, 이전 값, 새 값)
+ChangeCallback = Callable[[str, Any, Any], None]
+
+# 알림 전달 예약 함수: 인자로 받은 함수를 나중에(이벤트 루프의 다음 차례에) 호출
+Scheduler = Callable[[Callable[[], None]], None]
+
+# 구독 항목: (대상 객체 약한 참조, 함수) - 바운드 메서드는 함수(대상, ...)로, 그 외에는 함수(...)로 호출
+_Subscription = tuple[weakref.ref | None, Callable[..., None]]
+
+
+def call_soon(fn: Callable[[], None]) -> None:
+    """
+    Qt 이벤트 루프의 다음 차례에 fn 실행
+    QApplication이 없거나 GUI 스레드가 아닌 곳에서 호출되면 바로 실행합니다.
+    """
+    from PyQt5.QtCore import QCoreApplication, QThread, QTimer
+
+    app = QCoreApplication.instance()
+    if app is None or QThread.currentThread() is not app.thread():
+        fn()
+    else:
+        QTimer.singleShot(0, fn)
+
+
+class EventBus:
+    """
+    주제(설정 키, 이벤트 종류 등)별 변경 알림 버스
+
+    구독자는 관심 있는 주제에만 등록하므로 변경 하나에 해당 주제의 구독자만 호출됩니다.
+    바운드 메서드 구독은 약한 참조로 보관하여, 구독 해제 없이 사라진 객체는 자동으로 제거되고
+    호출되지 않습니다. (함수와 람다는 강한 참조로 보관)
+
+    scheduler가 주어지면 같은 차례에 발생한 변경을 모아 두었다가 한 번에 전달하며,
+    같은 주제가 여러 번 바뀌었으면 (처음의 이전 값, 마지막 새 값) 한 번만 전달합니다.
+    결과적으로 값이 그대로라면 전달하지 않습니다.
+
+    여러 스레드에서 사용할 수 있습니다. (DbWorker 작업 스레드에서 상태가 바뀌는 경우 등)
+    구독 목록과 모아 둔 알림은 잠금으로 보호하고, 구독자 호출은 잠금 밖에서 하므로
+    구독자 안에서 구독하거나 다시 publish해도 됩니다. 구독자는 알림을 전달하는 스레드에서 호출됩니다.
+    (scheduler 없이 publish한 스레드, 또는 flush를 실행한 스레드 - call_soon은 GUI 스레드 밖에서 바로 실행)
+    """
+
+    def __init__(self, scheduler: Scheduler | None = None) -> None:
+        """
+        Args:
+            scheduler: 모아 둔 알림의 전달을 예약하는 함수 (None이면 변경 즉시 전달)
+        """
+        self.scheduler = scheduler
+        self._subscribers: dict[str, dict[Hashable, _Subscription]] = {}
+        # 주제별 구독 항목 튜플 (전달 시 복사하지 않도록 구독이 바뀔 때만 다시 만듦)
+        self._snapshots: dict[str, tuple[_Subscription, ...]] = {}
+        self._pending: dict[str, tuple[Any, Any]] = {}
+        # 약한 참조 정리 콜백은 가비지 컬렉션 중 잠금을 잡은 스레드에서도 실행될 수 있으므로 RLock 사용
+        self._lock = threading.RLock()
+
+    def subscribe(self, topic: str, callback: ChangeCallback) -> None:
+        """
+        주제 구독 (이미 구독 중이면 무시)
+
+        Args:
+            topic: 구독할 주제 (ANY_TOPIC이면 모든 주제)
+            callback: 변경 시 (주제, 이전 값, 새 값)으로 호출할 함수
+        """
+        key = self._callback_key(callback)
+        with self._lock:
+            subscribers = self._subscribers.setdefault(topic, {})
+            if key in subscribers:
+                return
+
+            if hasattr(callback, "__self__") and hasattr(callback, "__func__"):
+                def on_dead(_ref: weakref.ref, topic: str = topic, key: Hashable = key) -> None:
+                    self._discard(topic, key)
+                subscribers[key] = (weakref.ref(callback.__self__, on_dead), callback.__func__)
+            else:
+                subscribers[key] = (None, callback)
+            self._snapshots[topic] = tuple(subscribers.values())
+
+    def unsubscribe(self, topic: str, callback: ChangeCallback) -> None:
+        """
+        주제 구독 해제 (구독 중이 아니면 무시)
+
+        Args:
+            topic: 구독한 주제
+            callback: 구독한 함수
+        """
+        self._discard(topic, self._callback_key(callback))
+
+    def unsubscribe_all(self, callback: ChangeCallback) -> None:
+        """모든 주제에서 callback 구독 해제"""
+        key = self._callback_key(callback)
+        with self._lock:
+            for topic in list(self._subscribers):
+                self._discard(topic, key)
+
+    def subscriber_count(self, topic: str) -> int:
+        """주제의 구독자 수 (ANY_TOPIC 구독자는 제외)"""
+        with self._lock:
+            return len(self._subscribers.get(topic, ()))
+
+    def publish(self, topic: str, old_value: Any, new_value: Any) -> None:
+        """
+        변경 알림 (scheduler가 있으면 다음 차례에 모아서 전달)
+
+        Args:
+            topic: 변경된 주제
+            old_value: 이전 값
+            new_value: 새 값
+        """
+        if self.scheduler is None:
+            self._dispatch(topic, old_value, new_value)
+            return
+
+        with self._lock:
+            schedule = not self._pending
+            if topic in self._pending:
+                old_value = self._pending[topic][0]
+            self._pending[topic] = (old_value, new_value)
+        if schedule:
+            self.scheduler(self.flush)
+
+    def flush(self) -> None:
+        """모아 둔 변경 알림을 바로 전달"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for topic, (old_value, new_value) in pending.items():
+            if old_value != new_value:
+                self._dispatch(topic, old_value, new_value)
+
+    def _dispatch(self, topic: str, old_value: Any, new_value: Any) -> None:
+        """주제 구독자와 ANY_TOPIC 구독자 호출 (호출 중 구독이 바뀌어도 안전하도록 튜플 사용)"""
+        with self._lock:
+            snapshots = (self._snapshots.get(topic, ()), self._snapshots.get(ANY_TOPIC, ()))
+        for snapshot in snapshots:
+            for ref, func in snapshot:
+                if ref is None:
+                    func(topic, old_value, new_value)
+                    continue
+                target = ref()
+                if target is not None:
+                    func(target, topic, old_value, new_value)
+
+    def _discard(self, topic: str, key: Hashable) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(topic)
+            if subscribers is None or subscribers.pop(key, None) is None:
+                return
+            if subscribers:
+                self._snapshots[topic] = tuple(subscribers.values())
+            else:
+                del self._subscribers[topic]
+                del self._snapshots[topic]
+
+    @staticmethod
+    def _callback_key(callback: ChangeCallback) -> Hashable:
+        """구독 식별 키 (바운드 메서드는 호출할 때마다 새 객체이므로 (객체 ID, 함수)로 식별)"""
+        if hasattr(callback, "__self__") and hasattr(callback, "__func__"):
+            return (id(callback.__self__), callback.__func__)
+        return callback
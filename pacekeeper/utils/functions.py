@@ -1,5 +1,9 @@
 # utils.py
+import json
+import os
 import re
+import tempfile
+from typing import Any
 
 
 
@@ -10,3 +14,40 @@ def extract_tags(message: str) -> list[str]:
     """
     tags = re.findall(r'#(\w+)', message)
     return tags
+
+
+def parse_tag_ids(tags_json: str | None) -> list[int]:
+    """
+    pace_logs.tags 컬럼의 JSON 문자열을 태그 ID 리스트로 변환
+    잘못된 형식이면 빈 리스트를 반환하고, 중복 ID는 제거합니다.
+    """
+    if not tags_json:
+        return []
+    try:
+        tag_ids = json.loads(tags_json)
+    except (json.JSONDecodeError, TypeError):
+        return []
+    if not isinstance(tag_ids, list):
+        return []
+    return list(dict.fromkeys(tag_id for tag_id in tag_ids if isinstance(tag_id, int)))
+
+
+def write_json_atomic(path: str, data: Any, **dump_kwargs: Any) -> None:
+    """
+    JSON 파일을 원자적으로 기록
+    같은 디렉토리의 임시 파일에 쓴 뒤 os.replace로 교체하므로, 기록 중에 앱이 종료되어도
+    이전 파일 또는 새 파일 중 하나가 온전히 남습니다.
+
+    Raises:
+        OSError: 파일 기록 실패
+    """
+    fd, temp_path = tempfile.mkstemp(
+        prefix=f".{os.path.basename(path)}-", suffix=".tmp", dir=os.path.dirname(path) or "."
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            json.dump(data, file, **dump_kwargs)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
@@ -3,14 +3,13 @@ from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QGuiApplication
 from PyQt5.QtWidgets import QDialog, QHBoxLayout, QLabel, QPushButton, QVBoxLayout
 
-from pacekeeper.consts.labels import load_language_resource
+from pacekeeper.consts.labels import lang_res
 from pacekeeper.consts.settings import SET_BREAK_COLOR, SET_PADDING_SIZE
 from pacekeeper.controllers.config_controller import ConfigController
 from pacekeeper.controllers.main_controller import MainController
 from pacekeeper.utils.theme_manager import theme_manager
 from pacekeeper.views.controls import TimerLabel
 
-lang_res = load_language_resource(ConfigController().get_language())
 
 class BreakDialog(QDialog):
     """
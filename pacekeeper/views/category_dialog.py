@@ -3,11 +3,9 @@ from icecream import ic
 from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import QDialog, QHBoxLayout, QLabel, QPushButton, QVBoxLayout
 
-from pacekeeper.consts.labels import load_language_resource
+from pacekeeper.consts.labels import lang_res
 from pacekeeper.controllers.category_controls import CategoryControlsPanel, TagButtonsPanel
-from pacekeeper.controllers.config_controller import ConfigController
 
-lang_res = load_language_resource(ConfigController().get_language())
 
 class CategoryDialog(QDialog):
     def __init__(self, parent, config_controller, category_service=None, tag_service=None):
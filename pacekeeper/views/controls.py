@@ -9,17 +9,14 @@ from PyQt5.QtWidgets import (
     QLineEdit,
     QPushButton,
     QSizePolicy,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 
-from pacekeeper.consts.labels import load_language_resource
-from pacekeeper.controllers.config_controller import ConfigController
 from pacekeeper.utils.theme_manager import theme_manager
+from pacekeeper.views.log_table_model import FIELD_MESSAGE, FIELD_START_DATE, FIELD_TAGS, LogTableModel
 
-lang_res = load_language_resource(ConfigController().get_language())
 
 class TimerLabel(QLabel):
     """재사용 가능한 타이머 라벨"""
@@ -49,27 +46,30 @@ class RecentLogsControl(QWidget):
         self.layout = QVBoxLayout(self)
         self.layout.setContentsMargins(2, 2, 2, 2)
 
-        # 테이블 위젯 직접 생성 (그룹박스 제거)
-        self.table_widget = QTableWidget(self)
-        self.table_widget.setColumnCount(3)
-        self.table_widget.setHorizontalHeaderLabels(["시간", "메시지", "태그"])
-        self.table_widget.setSelectionBehavior(QAbstractItemView.SelectRows)
-        self.table_widget.setEditTriggers(QAbstractItemView.NoEditTriggers)
-        self.table_widget.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
-        self.table_widget.horizontalHeader().setDefaultSectionSize(150)
+        # 테이블 뷰 직접 생성 (그룹박스 제거)
+        self.log_model = LogTableModel(
+            [(FIELD_START_DATE, "시간"), (FIELD_MESSAGE, "메시지"), (FIELD_TAGS, "태그")],
+            parent=self
+        )
+        self.table_view = QTableView(self)
+        self.table_view.setModel(self.log_model)
+        self.table_view.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table_view.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
+        self.table_view.horizontalHeader().setDefaultSectionSize(150)
 
         # 더블 클릭 이벤트 연결
         if on_double_click:
-            self.table_widget.itemDoubleClicked.connect(lambda item: on_double_click(item.row()))
+            self.table_view.doubleClicked.connect(lambda index: on_double_click(index.row()))
 
-        self.layout.addWidget(self.table_widget)
+        self.layout.addWidget(self.table_view)
 
         # 초기 데이터 로드를 제한된 개수의 로그를 불러옵니다.
         self.update_logs(limit=10)
 
     def update_logs(self, logs=None, limit=50):
         """
-        테이블 위젯의 항목들을 최신 로그로 업데이트합니다.
+        테이블의 항목들을 최신 로그로 업데이트합니다.
 
         파라미터:
             logs: MainController 등에서 전달받은 로그 데이터 (리스트).
@@ -78,9 +78,6 @@ class RecentLogsControl(QWidget):
         ic("RecentLogsControl.update_logs 호출됨")
 
         try:
-            # 테이블 위젯 초기화
-            self.table_widget.clearContents()
-
             # 로그 데이터 검증 및 처리
             if logs is None:
                 ic("로그 데이터가 None입니다. 빈 리스트로 처리합니다.")
@@ -95,12 +92,10 @@ class RecentLogsControl(QWidget):
             logs = logs[:limit] if logs else []
             ic(f"처리할 로그 개수: {len(logs)}")
 
-            # 행 수 설정
-            self.table_widget.setRowCount(len(logs))
-
-            # 로그 데이터가 없으면 콜백 호출 후 종료
+            # 로그 데이터가 없으면 테이블을 비우고 콜백 호출 후 종료
             if not logs:
                 ic("로그 데이터가 없습니다.")
+                self.log_model.set_logs([])
                 # 로그 업데이트가 완료되면 콜백으로 태그 버튼 업데이트 진행
                 if self.on_logs_updated:
                     ic("로그 업데이트 완료, 태그 버튼 업데이트 콜백 호출")
@@ -111,29 +106,14 @@ class RecentLogsControl(QWidget):
                         ic(f"태그 버튼 업데이트 콜백 실행 중 오류 발생: {e}")
                 return
 
-            # 로그 데이터 테이블에 추가
-            for idx, row in enumerate(reversed(logs)):
-                try:
-                    # 필수 속성 확인
-                    if not hasattr(row, 'start_date') or not hasattr(row, 'message') or not hasattr(row, 'tag_text'):
-                        ic(f"로그 항목에 필수 속성이 없습니다: {row}")
-                        continue
-
-                    # 시간 열
-                    time_item = QTableWidgetItem(row.start_date)
-                    self.table_widget.setItem(idx, 0, time_item)
-
-                    # 메시지 열
-                    message_item = QTableWidgetItem(row.message)
-                    self.table_widget.setItem(idx, 1, message_item)
-
-                    # 태그 열
-                    tag_item = QTableWidgetItem(row.tag_text)
-                    self.table_widget.setItem(idx, 2, tag_item)
-
-                    ic(f"로그 항목 추가됨: {row.start_date} - {row.message}")
-                except Exception as e:
-                    ic(f"로그 항목 추가 중 오류 발생: {e}")
+            # 필수 속성이 있는 로그만 오래된 순서로 테이블에 표시
+            rows = []
+            for row in reversed(logs):
+                if not hasattr(row, 'start_date') or not hasattr(row, 'message') or not hasattr(row, 'tag_text'):
+                    ic(f"로그 항목에 필수 속성이 없습니다: {row}")
+                    continue
+                rows.append(row)
+            self.log_model.set_logs(rows, tag_texts=[row.tag_text for row in rows])
 
             # 로그 업데이트가 완료되면 콜백으로 태그 버튼 업데이트 진행
             if self.on_logs_updated:
@@ -150,18 +130,12 @@ class RecentLogsControl(QWidget):
         """특정 행의 메시지를 반환합니다."""
         try:
             # 행 번호 유효성 검사
-            if row < 0 or row >= self.table_widget.rowCount():
-                ic(f"유효하지 않은 행 번호: {row}, 총 행 수: {self.table_widget.rowCount()}")
-                return ""
-
-            # 항목 존재 여부 확인
-            item = self.table_widget.item(row, 1)
-            if item is None:
-                ic(f"행 {row}의 메시지 항목이 없습니다.")
+            if row < 0 or row >= self.log_model.rowCount():
+                ic(f"유효하지 않은 행 번호: {row}, 총 행 수: {self.log_model.rowCount()}")
                 return ""
 
             # 메시지 반환
-            message = item.text()
+            message = self.log_model.message_at(row)
             ic(f"행 {row}에서 메시지 '{message}' 반환")
             return message
         except Exception as e:
@@ -1,10 +1,11 @@
 # views/log_dialog.py
-import json
 from datetime import date, datetime, timedelta
+from functools import partial
 
 from icecream import ic
 from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import (
+    QAbstractItemView,
     QDialog,
     QHBoxLayout,
     QHeaderView,
@@ -13,20 +14,29 @@ from PyQt5.QtWidgets import (
     QMessageBox,
     QPushButton,
     QScrollArea,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
 )
 
-from pacekeeper.consts.labels import load_language_resource
-from pacekeeper.controllers.config_controller import ConfigController
-from pacekeeper.repository.entities import Log
+from pacekeeper.consts.labels import lang_res
+from pacekeeper.repository.log_filters import LogFilters
 from pacekeeper.views.controls import TagButtonsPanel
+from pacekeeper.views.log_table_model import (
+    FIELD_ID,
+    FIELD_MESSAGE,
+    FIELD_START_DATE,
+    FIELD_TAGS,
+    LogTableModel,
+)
+
 
-lang_res = load_language_resource(ConfigController().get_language())
+# 한 번에 조회하는 로그 수
+LOG_PAGE_SIZE = 100
+# 검색어 검색 시 최대 결과 수
+SEARCH_RESULT_LIMIT = 500
 
 class LogDialog(QDialog):
-    def __init__(self, parent, config_controller, log_service=None, tag_service=None):
+    def __init__(self, parent, config_controller, log_service=None, tag_service=None, db_worker=None):
         super().__init__(parent)
         self.setWindowTitle(lang_res.base_labels['LOGS'])
         self.resize(800, 800)
@@ -38,12 +48,18 @@ class LogDialog(QDialog):
         self.log_service = log_service
         self.tag_service = tag_service
 
+        # 조회/삭제를 GUI 스레드 밖에서 실행할 작업자 (None이면 바로 실행)
+        self.db_worker = db_worker
+
         # 종료일 기본값: 오늘
         end_dt = date.today()
         start_dt = end_dt - timedelta(days=90)
         self.selected_start_date = start_dt.strftime("%Y-%m-%d")
         self.selected_end_date = end_dt.strftime("%Y-%m-%d")
 
+        # 현재 조회 조건 (삭제 후 같은 조건으로 다시 조회)
+        self.current_filters: LogFilters | None = None
+
         self.InitUI()
         self.center_on_screen()
 
@@ -93,6 +109,13 @@ class LogDialog(QDialog):
         self.tag_tc.setFixedWidth(100)
         search_layout.addWidget(self.tag_tc)
 
+        # 메시지 검색어 (전문 검색)
+        search_layout.addWidget(QLabel(lang_res.base_labels['KEYWORD']))
+        self.keyword_tc = QLineEdit()
+        self.keyword_tc.setMinimumWidth(120)
+        self.keyword_tc.returnPressed.connect(self.on_search)
+        search_layout.addWidget(self.keyword_tc)
+
         # 검색 버튼
         search_btn = QPushButton(lang_res.button_labels['SEARCH'])
         search_btn.clicked.connect(self.on_search)
@@ -125,26 +148,48 @@ class LogDialog(QDialog):
         self.update_tag_buttons()
 
         # ---------------------------------------------------------------------
-        # (2) TableWidget: 로그를 테이블 형태로 표시
+        # (2) TableView: 로그를 테이블 형태로 표시 (스크롤 시 다음 페이지 조회)
         # ---------------------------------------------------------------------
-        self.table_widget = QTableWidget()
-        self.table_widget.setColumnCount(4)
-        self.table_widget.setHorizontalHeaderLabels(["ID", "Timestamp", "Message", "Tags"])
-        self.table_widget.setColumnHidden(0, True)  # ID 컬럼 숨김
-        self.table_widget.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
-        self.table_widget.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
-        self.table_widget.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeToContents)
-        self.table_widget.setSelectionBehavior(QTableWidget.SelectRows)
-        self.table_widget.setSelectionMode(QTableWidget.ExtendedSelection)
-        main_layout.addWidget(self.table_widget)
+        self.log_model = LogTableModel(
+            [(FIELD_ID, "ID"), (FIELD_START_DATE, "Timestamp"), (FIELD_MESSAGE, "Message"), (FIELD_TAGS, "Tags")],
+            tag_text_resolver=self.resolve_tag_texts,
+            db_worker=self.db_worker,
+            parent=self
+        )
+        self.log_model.loading_changed.connect(self.on_loading_changed)
+        self.table_view = QTableView()
+        self.table_view.setModel(self.log_model)
+        self.table_view.setColumnHidden(0, True)  # ID 컬럼 숨김
+        self.table_view.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
+        self.table_view.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
+        self.table_view.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeToContents)
+        self.table_view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        # 내용에 맞춘 열 너비 계산 시 모든 행 대신 한 페이지 분량의 행만 측정 (검색 결과 표시 시 GUI 스레드 정지 방지)
+        self.table_view.horizontalHeader().setResizeContentsPrecision(LOG_PAGE_SIZE)
+        self.table_view.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table_view.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.table_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        main_layout.addWidget(self.table_view)
+
+        # 데이터가 없을 때 표시할 메시지
+        self.no_data_label = QLabel("데이터가 없습니다")
+        self.no_data_label.setAlignment(Qt.AlignCenter)
+        self.no_data_label.hide()
+        main_layout.addWidget(self.no_data_label)
+
+        # 조회 중일 때 표시할 메시지
+        self.loading_label = QLabel(lang_res.messages['LOADING'])
+        self.loading_label.setAlignment(Qt.AlignCenter)
+        self.loading_label.hide()
+        main_layout.addWidget(self.loading_label)
 
         # ---------------------------------------------------------------------
         # (3) 삭제 버튼: 선택한 로그 항목들을 삭제
         # ---------------------------------------------------------------------
         btn_layout = QHBoxLayout()
-        delete_btn = QPushButton("선택 삭제")
-        delete_btn.clicked.connect(self.on_delete)
-        btn_layout.addWidget(delete_btn)
+        self.delete_btn = QPushButton("선택 삭제")
+        self.delete_btn.clicked.connect(self.on_delete)
+        btn_layout.addWidget(self.delete_btn)
         btn_layout.setAlignment(Qt.AlignCenter)
         main_layout.addLayout(btn_layout)
 
@@ -153,63 +198,42 @@ class LogDialog(QDialog):
 
     def load_all_logs(self):
         """
-        DB에서 전체 로그를 가져와서 TableWidget에 표시
+        DB에서 전체 로그의 첫 페이지를 가져와서 테이블에 표시
         """
-        if not self.log_service:
-            return
-        rows: list[Log] = self.log_service.retrieve_all_logs()
-        self.load_rows(rows)
+        self.load_first_page(None)
 
-    def load_rows(self, rows):
+    def load_first_page(self, filters: LogFilters | None):
         """
-        TableWidget 초기화 후, rows 데이터(ID, start_date, message, tags) 출력
+        테이블을 초기화하고 조건에 맞는 로그의 첫 페이지를 표시
+        이후 페이지는 테이블을 끝까지 스크롤할 때 모델이 이어서 조회합니다.
+
+        Args:
+            filters: 조회 조건 (None이면 전체)
         """
-        self.table_widget.setRowCount(0)
-
-        # 데이터가 없는 경우 메시지 표시
-        if not rows:
-            # 테이블에 "데이터가 없습니다" 메시지를 표시
-            self.table_widget.setRowCount(1)
-            self.table_widget.setColumnCount(4)
-            no_data_item = QTableWidgetItem("데이터가 없습니다")
-            no_data_item.setTextAlignment(Qt.AlignCenter)
-            # 첫 번째 열에 메시지 표시
-            self.table_widget.setItem(0, 1, no_data_item)
-            # 셀 병합
-            self.table_widget.setSpan(0, 1, 1, 3)
-            return
+        self.current_filters = filters
 
-        for row_idx, row in enumerate(rows):
-            self.table_widget.insertRow(row_idx)
-            self.table_widget.setItem(row_idx, 0, QTableWidgetItem(str(row.id)))
-            self.table_widget.setItem(row_idx, 1, QTableWidgetItem(str(row.start_date)))
-            self.table_widget.setItem(row_idx, 2, QTableWidgetItem(str(row.message)))
-
-            # 태그 ID를 태그 이름으로 변환
-            tag_text = ""
-            try:
-                if row.tags and row.tags != "[]":
-                    # JSON 문자열을 리스트로 변환
-                    try:
-                        tag_ids = json.loads(row.tags)
-                    except (json.JSONDecodeError, TypeError) as e:
-                        ic(f"JSON 파싱 오류: {e} - 입력: {row.tags}")
-                        tag_ids = []
-
-                    # 유효한 태그 ID 리스트인 경우 태그 서비스를 통해 이름 가져오기
-                    if isinstance(tag_ids, list) and tag_ids and self.tag_service:
-                        tag_names = self.tag_service.get_tag_text(tag_ids)
-                        # 유효한 태그 이름이 있는 경우 쉼표로 구분하여 연결
-                        if tag_names:
-                            # 문자열 연결 전에 각 항목이 문자열인지 확인하고 인코딩 보장
-                            tag_text = ", ".join(str(name) for name in tag_names if name)
-            except Exception as e:
-                ic(f"태그 변환 오류: {e}")
-                tag_text = ""
-
-            # 태그 텍스트 설정
-            tag_item = QTableWidgetItem(tag_text)
-            self.table_widget.setItem(row_idx, 3, tag_item)
+        page_fetcher = partial(self.log_service.retrieve_logs_page, filters) if self.log_service else None
+        self.log_model.load_pages(page_fetcher, LOG_PAGE_SIZE)
+
+    def on_loading_changed(self, loading: bool):
+        """
+        조회 중에는 '불러오는 중' 메시지를 표시하고, 조회가 끝나면 결과가 없을 때 '데이터가 없습니다'를 표시
+        """
+        self.loading_label.setVisible(loading)
+        self.no_data_label.setVisible(not loading and self.log_model.rowCount() == 0)
+        self.delete_btn.setEnabled(not loading)
+
+    def resolve_tag_texts(self, tags_jsons):
+        """
+        로그들의 태그 ID JSON을 쉼표로 구분된 태그 이름으로 한 번에 변환 (모델이 페이지를 조회할 때 호출)
+        """
+        if not self.tag_service:
+            return [""] * len(tags_jsons)
+        # 유효한 태그 이름이 있는 경우 쉼표로 구분하여 연결
+        return [
+            ", ".join(str(name) for name in names if name)
+            for names in self.tag_service.get_tag_texts(tags_jsons)
+        ]
 
     def on_period_button(self, days):
         """
@@ -233,45 +257,35 @@ class LogDialog(QDialog):
 
     def on_search(self):
         """
-        '검색' 버튼 클릭 시 날짜 범위와 태그 검색을 수행
+        '검색' 버튼 클릭 시 날짜 범위와 태그, 검색어 검색을 수행
         """
         start_date = self.selected_start_date
         end_date = self.selected_end_date
         tag_keyword = self.tag_tc.text().strip().lower()  # 소문자로 변환
-
-        # 서비스가 없으면 빈 결과 반환
-        if not self.log_service:
-            self.load_rows([])
+        keyword = self.keyword_tc.text().strip()
+
+        # 검색어가 있으면 전문 검색 결과를 관련도 순으로 표시
+        if keyword and self.log_service:
+            period = (start_date, end_date) if start_date and end_date else None
+            self.log_model.load_logs(
+                partial(self.log_service.search_logs, keyword, period, SEARCH_RESULT_LIMIT, tag_keyword or None)
+            )
             return
 
-        # 날짜 범위 조건 처리
-        rows_date = self.log_service.retrieve_logs_by_period(start_date, end_date) if start_date and end_date else self.log_service.retrieve_all_logs()
-
-        # 태그 조건 처리
-        if tag_keyword:
-            rows_tag = self.log_service.retrieve_logs_by_tag(tag_keyword)
-
-            # ID 기반으로 교집합 찾기
-            date_ids = {log.id for log in rows_date}
-            tag_ids = {log.id for log in rows_tag}
-            common_ids = date_ids.intersection(tag_ids)
-
-            # 교집합 ID에 해당하는 로그만 필터링
-            result_rows = [log for log in rows_date if log.id in common_ids]
-        else:
-            # 태그 키워드가 없으면 날짜 기준 결과만 사용
-            result_rows = rows_date
-
-        # ID 기준 내림차순 정렬
-        sorted_rows = sorted(result_rows, key=lambda x: x.id, reverse=True)
-        self.load_rows(sorted_rows)
+        # 날짜 범위와 태그 조건을 한 번의 쿼리로 조회 (ID 내림차순, 페이지 단위)
+        filters = LogFilters(
+            start_date=start_date if start_date and end_date else None,
+            end_date=end_date if start_date and end_date else None,
+            tag_keyword=tag_keyword or None
+        )
+        self.load_first_page(filters)
 
     def on_delete(self):
         """
         선택된 로그 항목들을 삭제하는 이벤트 핸들러
         """
         # 선택된 항목 인덱스를 가져옴
-        selected_rows = self.table_widget.selectionModel().selectedRows()
+        selected_rows = self.table_view.selectionModel().selectedRows()
 
         if not selected_rows:
             QMessageBox.information(self, "알림", "삭제할 로그를 선택하세요.")
@@ -284,20 +298,35 @@ class LogDialog(QDialog):
 
         ids_to_delete = []
         for index in selected_rows:
-            row = index.row()
-            id_str = self.table_widget.item(row, 0).text()
-            try:
-                log_id = int(id_str)
+            log_id = self.log_model.log_id_at(index.row())
+            if log_id is not None:
                 ids_to_delete.append(log_id)
-            except ValueError:
-                continue
 
-        if self.log_service:
-            self.log_service.remove_logs_by_ids(ids_to_delete)
-            QMessageBox.information(self, "정보", "선택한 로그가 삭제되었습니다.")
-            self.load_all_logs()
-        else:
+        if not self.log_service:
             QMessageBox.warning(self, "오류", "로그 서비스가 초기화되지 않았습니다.")
+            return
+
+        if self.db_worker is None:
+            self.log_service.remove_logs_by_ids(ids_to_delete)
+            self.on_logs_deleted(None)
+            return
+
+        self.delete_btn.setEnabled(False)
+        self.db_worker.submit(
+            self.log_service.remove_logs_by_ids, ids_to_delete,
+            on_result=self.on_logs_deleted, on_error=self.on_db_error
+        )
+
+    def on_logs_deleted(self, _result):
+        """삭제 완료 후 같은 조건으로 다시 조회"""
+        self.delete_btn.setEnabled(True)
+        QMessageBox.information(self, "정보", "선택한 로그가 삭제되었습니다.")
+        self.load_first_page(self.current_filters)
+
+    def on_db_error(self, error: Exception):
+        """작업 스레드에서 발생한 오류 표시"""
+        self.delete_btn.setEnabled(not self.log_model.is_loading())
+        QMessageBox.critical(self, lang_res.base_labels['ERROR'], lang_res.error_messages['DEFAULT'].format(error))
 
     def center_on_screen(self):
         """화면 중앙에 다이얼로그를 배치합니다."""
@@ -315,14 +344,20 @@ class LogDialog(QDialog):
             if not self.tag_service:
                 ic("태그 서비스가 초기화되지 않았습니다.")
                 return
-            tags = self.tag_service.get_tags()
-            ic("태그 목록 조회 성공", len(tags))
-
-            # 태그 버튼 패널 업데이트
-            self.tag_buttons_panel.update_tags(tags)
+            if self.db_worker is not None:
+                self.db_worker.submit(self.tag_service.get_tags, on_result=self.show_tag_buttons)
+                return
+            self.show_tag_buttons(self.tag_service.get_tags())
         except Exception as e:
             ic("태그 버튼 패널 업데이트 실패", e)
 
+    def show_tag_buttons(self, tags):
+        """
+        조회한 태그 목록으로 태그 버튼 패널을 갱신합니다.
+        """
+        ic("태그 목록 조회 성공", len(tags))
+        self.tag_buttons_panel.update_tags(tags)
+
     def on_tag_button_clicked(self, tag):
         """
         태그 버튼 클릭 시 해당 태그로 검색을 수행합니다.
@@ -0,0 +1,97 @@
+# views/log_export_task.py
+from icecream import ic
+from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtWidgets import QFileDialog, QMessageBox, QProgressDialog, QWidget
+
+from pacekeeper.consts.labels import lang_res
+from pacekeeper.interfaces.services.i_log_service import ILogService
+from pacekeeper.repository.log_filters import LogFilters
+from pacekeeper.services.log_export import EXPORT_FORMAT_CSV, EXPORT_FORMAT_JSONL, ExportCancelled, export_format_from_path
+
+# 파일 대화상자 필터 → 내보내기 형식
+EXPORT_FILE_FILTERS = {
+    "CSV (*.csv)": EXPORT_FORMAT_CSV,
+    "JSON Lines (*.jsonl)": EXPORT_FORMAT_JSONL,
+}
+
+
+class LogExportThread(QThread):
+    """
+    로그 내보내기를 GUI 스레드 밖에서 실행하는 스레드
+
+    진행 상황과 결과는 시그널로 GUI 스레드에 전달됩니다.
+    """
+    progress = pyqtSignal(int, int)  # (내보낸 행 수, 전체 행 수)
+    completed = pyqtSignal(int)      # 내보낸 로그 수 (실패 또는 취소 시 -1)
+
+    def __init__(self, log_service: ILogService, path: str, export_format: str,
+                 filters: LogFilters | None = None, parent=None):
+        super().__init__(parent)
+        self.log_service = log_service
+        self.path = path
+        self.export_format = export_format
+        self.filters = filters
+
+    def run(self):
+        def report(written: int, total: int) -> None:
+            if self.isInterruptionRequested():
+                raise ExportCancelled()
+            self.progress.emit(written, total)
+
+        self.completed.emit(
+            self.log_service.export_logs(self.path, self.export_format, self.filters, report)
+        )
+
+
+def start_log_export(parent: QWidget, log_service: ILogService, filters: LogFilters | None = None) -> LogExportThread | None:
+    """
+    저장할 파일을 선택받아 진행 상황 대화상자와 함께 로그 내보내기를 시작합니다.
+
+    Args:
+        parent: 대화상자 부모 위젯 (스레드가 끝날 때까지 스레드를 소유)
+        log_service: 로그 서비스
+        filters: 조회 조건 (None이면 전체)
+
+    Returns:
+        시작된 내보내기 스레드 (파일 선택을 취소하면 None)
+    """
+    path, selected_filter = QFileDialog.getSaveFileName(
+        parent, lang_res.base_labels['EXPORT'], "pacekeeper_logs.csv", ";;".join(EXPORT_FILE_FILTERS)
+    )
+    if not path:
+        return None
+
+    export_format = export_format_from_path(path)
+    if export_format is None:
+        export_format = EXPORT_FILE_FILTERS.get(selected_filter, EXPORT_FORMAT_CSV)
+        path = f"{path}.{export_format}"
+
+    progress_dialog = QProgressDialog(
+        lang_res.messages['EXPORTING'], lang_res.button_labels['CANCEL'], 0, 0, parent
+    )
+    progress_dialog.setWindowTitle(lang_res.base_labels['EXPORT'])
+    progress_dialog.setMinimumDuration(0)
+
+    thread = LogExportThread(log_service, path, export_format, filters, parent)
+
+    def on_progress(written: int, total: int) -> None:
+        progress_dialog.setMaximum(total)
+        progress_dialog.setValue(written)
+
+    def on_completed(written: int) -> None:
+        canceled = progress_dialog.wasCanceled()
+        progress_dialog.close()
+        if written >= 0:
+            QMessageBox.information(parent, lang_res.base_labels['EXPORT'], lang_res.messages['EXPORT_DONE'].format(written))
+        elif not canceled:
+            QMessageBox.warning(parent, lang_res.base_labels['ERROR'], lang_res.error_messages['EXPORT'])
+        ic(f"로그 내보내기 종료: {written}")
+
+    thread.progress.connect(on_progress)
+    thread.completed.connect(on_completed)
+    thread.finished.connect(thread.deleteLater)
+    progress_dialog.canceled.connect(thread.requestInterruption)
+
+    thread.start()
+    progress_dialog.show()
+    return thread
@@ -0,0 +1,88 @@
+# views/log_import_task.py
+from icecream import ic
+from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtWidgets import QFileDialog, QMessageBox, QProgressDialog, QWidget
+
+from pacekeeper.consts.labels import lang_res
+from pacekeeper.interfaces.services.i_log_service import ILogService
+from pacekeeper.services.log_import import ImportCancelled, LogImportResult
+
+# 파일 대화상자 필터 (형식은 확장자로 판단)
+IMPORT_FILE_FILTER = "CSV / JSON Lines (*.csv *.jsonl *.json)"
+
+
+class LogImportThread(QThread):
+    """
+    로그 가져오기를 GUI 스레드 밖에서 실행하는 스레드
+
+    진행 상황과 결과는 시그널로 GUI 스레드에 전달됩니다.
+    """
+    progress = pyqtSignal(int, int)  # (읽은 행 수, 예상 전체 행 수)
+    completed = pyqtSignal(object)   # LogImportResult
+
+    def __init__(self, log_service: ILogService, path: str, parent=None):
+        super().__init__(parent)
+        self.log_service = log_service
+        self.path = path
+
+    def run(self):
+        def report(read: int, total: int) -> None:
+            if self.isInterruptionRequested():
+                raise ImportCancelled()
+            self.progress.emit(read, total)
+
+        self.completed.emit(self.log_service.import_logs(self.path, progress_callback=report))
+
+
+def start_log_import(parent: QWidget, log_service: ILogService, on_imported=None) -> LogImportThread | None:
+    """
+    가져올 파일을 선택받아 진행 상황 대화상자와 함께 로그 가져오기를 시작합니다.
+
+    Args:
+        parent: 대화상자 부모 위젯 (스레드가 끝날 때까지 스레드를 소유)
+        log_service: 로그 서비스
+        on_imported: 로그가 한 개 이상 저장되면 GUI 스레드에서 호출할 함수 (최근 로그 갱신 등)
+
+    Returns:
+        시작된 가져오기 스레드 (파일 선택을 취소하면 None)
+    """
+    path, _ = QFileDialog.getOpenFileName(parent, lang_res.base_labels['IMPORT'], "", IMPORT_FILE_FILTER)
+    if not path:
+        return None
+
+    progress_dialog = QProgressDialog(
+        lang_res.messages['IMPORTING'], lang_res.button_labels['CANCEL'], 0, 0, parent
+    )
+    progress_dialog.setWindowTitle(lang_res.base_labels['IMPORT'])
+    progress_dialog.setMinimumDuration(0)
+    # 예상 전체 행 수는 줄 수로 추정하므로 도중에 대화상자가 자동으로 닫히지 않게 함
+    progress_dialog.setAutoClose(False)
+    progress_dialog.setAutoReset(False)
+
+    thread = LogImportThread(log_service, path, parent)
+
+    def on_progress(read: int, total: int) -> None:
+        progress_dialog.setMaximum(total)
+        progress_dialog.setValue(read)
+
+    def on_completed(result: LogImportResult) -> None:
+        canceled = progress_dialog.wasCanceled()
+        progress_dialog.close()
+        if result.imported and on_imported:
+            on_imported()
+        message = lang_res.messages['IMPORT_DONE'].format(result.imported, result.skipped, result.duplicates)
+        # 취소한 경우에도 그 전 청크는 저장되었으므로 결과를 알림
+        if result.completed or canceled:
+            QMessageBox.information(parent, lang_res.base_labels['IMPORT'], message)
+        else:
+            QMessageBox.warning(parent, lang_res.base_labels['ERROR'], f"{lang_res.error_messages['IMPORT']}\n{message}")
+        ic(f"로그 가져오기 종료: {result}")
+
+    thread.progress.connect(on_progress)
+    thread.completed.connect(on_completed)
+    thread.finished.connect(thread.deleteLater)
+    progress_dialog.canceled.connect(thread.requestInterruption)
+
+    thread.start()
+    progress_dialog.show()
+    return thread
@@ -0,0 +1,304 @@
+# views/log_table_model.py
+from array import array
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from icecream import ic
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt, pyqtSignal
+
+from pacekeeper.repository.entities import Log
+
+if TYPE_CHECKING:
+    from pacekeeper.controllers.db_worker import DbWorker
+
+# 모델이 표시할 수 있는 로그 필드
+FIELD_ID = "id"
+FIELD_START_DATE = "start_date"
+FIELD_MESSAGE = "message"
+FIELD_TAGS = "tags"
+
+# (after_id, page_size) → 로그 목록
+PageFetcher = Callable[[int | None, int], list[Log]]
+# () → 로그 목록 (페이지 없이 한 번에 조회)
+LogsFetcher = Callable[[], list[Log]]
+# 태그 JSON 문자열 목록 → 같은 순서의 표시용 태그 텍스트 목록 (페이지 단위로 한 번에 변환)
+TagTextResolver = Callable[[list[str]], list[str]]
+
+# 태그 텍스트를 처음 표시할 때 함께 변환할 행 수 (표시 중인 행 근처를 한 번에 변환)
+LAZY_RESOLVE_ROWS = 100
+
+
+class LogTableModel(QAbstractTableModel):
+    """
+    로그 목록을 QTableView에 표시하는 모델
+
+    로그 객체 대신 필드별 배열(ID는 array, 나머지는 문자열 리스트)만 보관하며,
+    셀 텍스트는 data()가 호출될 때(화면에 보이는 행에 한해) 만들어집니다.
+    태그 텍스트는 조회한 페이지 단위로 한 번에 변환하며, 변환 없이 설정된 행은
+    처음 표시될 때 근처 행과 묶어 한 번만 변환하여 보관합니다.
+
+    페이지 조회 함수가 설정되면 canFetchMore/fetchMore를 통해
+    뷰가 끝까지 스크롤될 때 다음 페이지를 이어서 조회합니다.
+
+    DbWorker가 주어지면 조회와 태그 텍스트 변환을 작업 스레드에서 실행하고,
+    결과가 도착하면 GUI 스레드에서 행을 추가합니다. 조회 중에는 loading_changed(True)가 발생합니다.
+
+    Attributes:
+        loading_changed: 조회 시작(True) / 종료(False) 시그널
+    """
+
+    loading_changed = pyqtSignal(bool)
+
+    def __init__(
+        self,
+        columns: list[tuple[str, str]],
+        tag_text_resolver: TagTextResolver | None = None,
+        db_worker: "DbWorker | None" = None,
+        parent=None
+    ):
+        """
+        Args:
+            columns: (필드 이름, 헤더 텍스트) 목록
+            tag_text_resolver: 태그 JSON 목록을 표시용 텍스트 목록으로 변환하는 함수 (None이면 원문 표시)
+            db_worker: 조회를 실행할 작업자 (None이면 GUI 스레드에서 바로 조회)
+            parent: 부모 QObject
+        """
+        super().__init__(parent)
+        self.columns = columns
+        self.tag_text_resolver = tag_text_resolver
+        self.db_worker = db_worker
+
+        self._page_fetcher: PageFetcher | None = None
+        self._page_size = 0
+        self._has_more = False
+        self._loading = False
+        # 새 조회를 시작하면 이전 조회 결과는 버려지도록 모델마다 고유한 작업 key 사용
+        self._load_key = f"log_table_model_{id(self)}"
+        self._clear_store()
+
+    def _clear_store(self) -> None:
+        """행 저장소 초기화"""
+        self._ids = array("q")
+        self._start_dates: list[str] = []
+        self._messages: list[str] = []
+        self._tags: list[str] = []
+        self._tag_texts: list[str | None] = []  # None: 아직 변환하지 않음
+
+    # ------------------------------------------------------------------
+    # QAbstractTableModel 구현
+    # ------------------------------------------------------------------
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._ids)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.columns)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and 0 <= section < len(self.columns):
+            return self.columns[section][1]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.ToolTipRole):
+            return None
+
+        row = index.row()
+        field = self.columns[index.column()][0]
+        if field == FIELD_ID:
+            return str(self._ids[row])
+        if field == FIELD_START_DATE:
+            return self._start_dates[row]
+        if field == FIELD_MESSAGE:
+            return self._messages[row]
+        if field == FIELD_TAGS:
+            return self._tag_text_at(row)
+        return None
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        return (
+            not parent.isValid() and self._has_more and self._page_fetcher is not None and not self._loading
+        )
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        if not self.canFetchMore(parent):
+            return
+
+        after_id = self._ids[-1] if self._ids else None
+        self._set_loading(True)
+        if self.db_worker is None:
+            try:
+                self._on_page_loaded(self._fetch_page(self._page_fetcher, after_id, self._page_size))
+            except Exception as e:
+                self._on_load_failed(e)
+            return
+
+        self.db_worker.submit(
+            self._fetch_page, self._page_fetcher, after_id, self._page_size,
+            on_result=self._on_page_loaded, on_error=self._on_load_failed, key=self._load_key
+        )
+
+    # ------------------------------------------------------------------
+    # 조회 (DbWorker 사용 시 _fetch_* 는 작업 스레드에서 실행)
+    # ------------------------------------------------------------------
+    def _fetch_page(
+        self, page_fetcher: PageFetcher, after_id: int | None, page_size: int
+    ) -> tuple[list[Log], list[str]]:
+        """한 페이지를 조회하고 행별 태그 텍스트까지 한 번에 변환"""
+        logs = page_fetcher(after_id, page_size)
+        return logs, self._resolve_tag_texts([log.tags or "" for log in logs])
+
+    def _fetch_logs(self, fetcher: LogsFetcher) -> tuple[list[Log], list[str]]:
+        """로그 목록 전체를 조회하고 행별 태그 텍스트까지 한 번에 변환"""
+        logs = fetcher()
+        return logs, self._resolve_tag_texts([log.tags or "" for log in logs])
+
+    def _on_page_loaded(self, result: tuple[list[Log], list[str]]) -> None:
+        """조회한 페이지를 모델 끝에 추가"""
+        logs, tag_texts = result
+        self._has_more = len(logs) == self._page_size
+        self._append(logs, tag_texts)
+        self._set_loading(False)
+
+    def _on_logs_loaded(self, result: tuple[list[Log], list[str]]) -> None:
+        """조회한 로그 목록으로 모델 내용을 교체"""
+        logs, tag_texts = result
+        self._replace(logs, tag_texts)
+        self._set_loading(False)
+
+    def _on_load_failed(self, error: Exception) -> None:
+        """조회 실패 시 더 이상 페이지를 조회하지 않음"""
+        ic(f"로그 페이지 조회 오류: {error}")
+        self._has_more = False
+        self._set_loading(False)
+
+    def _set_loading(self, loading: bool) -> None:
+        if self._loading != loading:
+            self._loading = loading
+            self.loading_changed.emit(loading)
+
+    def _cancel_loading(self) -> None:
+        """진행 중인 조회의 결과를 버림"""
+        if self.db_worker is not None:
+            self.db_worker.cancel(self._load_key)
+        self._set_loading(False)
+
+    def is_loading(self) -> bool:
+        """조회 중인지 여부"""
+        return self._loading
+
+    # ------------------------------------------------------------------
+    # 데이터 설정
+    # ------------------------------------------------------------------
+    def load_pages(self, page_fetcher: PageFetcher | None, page_size: int) -> None:
+        """
+        기존 행을 비우고 페이지 조회 함수로 첫 페이지를 불러옵니다.
+        이후 페이지는 뷰가 fetchMore를 호출할 때 조회합니다.
+
+        Args:
+            page_fetcher: (after_id, page_size)를 받아 ID 내림차순 로그 목록을 반환하는 함수
+            page_size: 페이지당 로그 수
+        """
+        self._cancel_loading()
+        self.beginResetModel()
+        self._clear_store()
+        self._page_fetcher = page_fetcher
+        self._page_size = page_size
+        self._has_more = page_fetcher is not None and page_size > 0
+        self.endResetModel()
+        self.fetchMore()
+
+    def load_logs(self, fetcher: LogsFetcher) -> None:
+        """
+        기존 행을 비우고 조회 함수가 반환한 로그 목록 전체를 표시합니다. (페이지 조회 없음)
+
+        Args:
+            fetcher: 표시할 로그 목록을 반환하는 함수 (검색 등)
+        """
+        self.set_logs([])
+        self._set_loading(True)
+        if self.db_worker is None:
+            try:
+                self._on_logs_loaded(self._fetch_logs(fetcher))
+            except Exception as e:
+                self._on_load_failed(e)
+            return
+
+        self.db_worker.submit(
+            self._fetch_logs, fetcher,
+            on_result=self._on_logs_loaded, on_error=self._on_load_failed, key=self._load_key
+        )
+
+    def set_logs(self, logs: list[Log], tag_texts: list[str] | None = None) -> None:
+        """
+        주어진 로그 목록으로 모델 내용을 교체합니다. (페이지 조회 없음, 진행 중인 조회는 취소)
+
+        Args:
+            logs: 표시할 로그 목록
+            tag_texts: 로그별 표시용 태그 텍스트 (None이면 tag_text_resolver로 변환)
+        """
+        self._cancel_loading()
+        self._replace(logs, tag_texts)
+
+    def _replace(self, logs: list[Log], tag_texts: list[str] | None) -> None:
+        """모델 내용을 로그 목록으로 교체"""
+        self.beginResetModel()
+        self._clear_store()
+        self._page_fetcher = None
+        self._has_more = False
+        self._store(logs, tag_texts)
+        self.endResetModel()
+
+    def _append(self, logs: list[Log], tag_texts: list[str] | None = None) -> None:
+        """로그 목록을 모델 끝에 추가"""
+        if not logs:
+            return
+        first_row = len(self._ids)
+        self.beginInsertRows(QModelIndex(), first_row, first_row + len(logs) - 1)
+        self._store(logs, tag_texts)
+        self.endInsertRows()
+
+    def _store(self, logs: list[Log], tag_texts: list[str] | None) -> None:
+        """로그 객체에서 표시에 필요한 필드만 꺼내 저장소에 추가"""
+        for log in logs:
+            self._ids.append(log.id)
+            self._start_dates.append(str(log.start_date))
+            self._messages.append(str(log.message))
+            self._tags.append(log.tags or "")
+        if tag_texts is None:
+            self._tag_texts.extend([None] * len(logs))
+        else:
+            self._tag_texts.extend(tag_texts)
+
+    def _tag_text_at(self, row: int) -> str:
+        """행의 태그 텍스트 반환 (처음 요청될 때 이후 LAZY_RESOLVE_ROWS개 행과 함께 변환)"""
+        tag_text = self._tag_texts[row]
+        if tag_text is None:
+            rows = [
+                r for r in range(row, min(row + LAZY_RESOLVE_ROWS, len(self._tag_texts)))
+                if self._tag_texts[r] is None
+            ]
+            for r, text in zip(rows, self._resolve_tag_texts([self._tags[r] for r in rows]), strict=True):
+                self._tag_texts[r] = text
+            tag_text = self._tag_texts[row]
+        return tag_text
+
+    def _resolve_tag_texts(self, tags_list: list[str]) -> list[str]:
+        """태그 JSON 목록을 표시용 텍스트 목록으로 한 번에 변환 (변환 함수가 없으면 원문)"""
+        if not self.tag_text_resolver or not tags_list:
+            return list(tags_list)
+        try:
+            return self.tag_text_resolver(tags_list)
+        except Exception as e:
+            ic(f"태그 변환 오류: {e}")
+            return [""] * len(tags_list)
+
+    # ------------------------------------------------------------------
+    # 조회 도우미
+    # ------------------------------------------------------------------
+    def log_id_at(self, row: int) -> int | None:
+        """행의 로그 ID 반환 (범위를 벗어나면 None)"""
+        return self._ids[row] if 0 <= row < len(self._ids) else None
+
+    def message_at(self, row: int) -> str:
+        """행의 메시지 반환 (범위를 벗어나면 빈 문자열)"""
+        return self._messages[row] if 0 <= row < len(self._messages) else ""
@@ -13,23 +13,24 @@ from PyQt5.QtWidgets import (
     QWidget,
 )
 
-from pacekeeper.consts.labels import load_language_resource
-from pacekeeper.consts.settings import APP_TITLE, SET_MAIN_DLG_HEIGHT, SET_MAIN_DLG_WIDTH
+from pacekeeper.consts.labels import lang_res
+from pacekeeper.consts.settings import APP_TITLE, SET_LANGUAGE, SET_MAIN_DLG_HEIGHT, SET_MAIN_DLG_WIDTH
 from pacekeeper.controllers.config_controller import ConfigController
+from pacekeeper.database.query_stats import query_action
 from pacekeeper.services.app_state_manager import AppStatus
+from pacekeeper.services.settings_manager import SettingsObserver
 from pacekeeper.utils.theme_manager import theme_manager
 from pacekeeper.views.break_dialog import BreakDialog
-from pacekeeper.views.category_dialog import CategoryDialog
 from pacekeeper.views.controls import RecentLogsControl, TagButtonsPanel, TextInputPanel, TimerLabel
-from pacekeeper.views.log_dialog import LogDialog
-from pacekeeper.views.settings_dialog import SettingsDialog
 
-lang_res = load_language_resource(ConfigController().get_language())
+# 설정/로그/카테고리 다이얼로그는 메뉴에서 처음 열 때 임포트 (시작 시간 단축)
 
-class MainWindow(QMainWindow):
+
+class MainWindow(QMainWindow, SettingsObserver):
     """
     MainWindow: UI View 컴포넌트
     책임: UI 구성, 레이아웃 초기화, 이벤트 바인딩 및 MainController와의 상호작용
+    언어 설정이 바뀌면 SettingsObserver 알림을 받아 재시작 없이 레이블을 갱신합니다.
     """
     def __init__(self, main_controller: Any | None = None, config_ctrl: Any | None = None) -> None:
         if config_ctrl is None:
@@ -43,6 +44,10 @@ class MainWindow(QMainWindow):
         self.config_ctrl = config_ctrl
         self.main_controller = main_controller
 
+        # 실행 중인 로그 내보내기/가져오기 스레드 (없으면 None)
+        self.export_thread = None
+        self.import_thread = None
+
         # 중앙 위젯 설정
         self.central_widget = QWidget(self)
         self.setCentralWidget(self.central_widget)
@@ -56,6 +61,9 @@ class MainWindow(QMainWindow):
         self.original_size = self.size()
         self.study_size = QSize(220, 160)  # 더 자연스러운 직사각형 비율 (2:1)
 
+        # 언어 전환 알림 구독
+        self.config_ctrl.add_settings_observer(self, keys=(SET_LANGUAGE,))
+
     def hide_main_controls(self) -> None:
         """
         학습 타이머 실행 시, recent_logs(리스트 컨트롤), tag_panel(태그 버튼),
@@ -169,27 +177,78 @@ class MainWindow(QMainWindow):
     def init_menu(self) -> None:
         """메뉴바 초기화 및 메뉴 아이템 생성"""
         menu_bar = self.menuBar()
-        file_menu = menu_bar.addMenu(lang_res.base_labels['FILE'])
+        self.file_menu = menu_bar.addMenu(lang_res.base_labels['FILE'])
 
         # 설정 메뉴 아이템
         self.settings_action = QAction(lang_res.base_labels['SETTINGS'], self)
         self.settings_action.setShortcut("Ctrl+S")
-        file_menu.addAction(self.settings_action)
+        self.file_menu.addAction(self.settings_action)
 
         # 로그 메뉴 아이템
         self.track_action = QAction(lang_res.base_labels['LOGS'], self)
         self.track_action.setShortcut("Ctrl+L")
-        file_menu.addAction(self.track_action)
+        self.file_menu.addAction(self.track_action)
 
         # 카테고리 메뉴 아이템
         self.category_action = QAction(lang_res.base_labels['CATEGORY'], self)
         self.category_action.setShortcut("Ctrl+C")
-        file_menu.addAction(self.category_action)
+        self.file_menu.addAction(self.category_action)
+
+        # 통계 메뉴 아이템
+        self.stats_action = QAction(lang_res.base_labels['STATS'], self)
+        self.stats_action.setShortcut("Ctrl+T")
+        self.file_menu.addAction(self.stats_action)
+
+        # 내보내기 메뉴 아이템
+        self.export_action = QAction(lang_res.base_labels['EXPORT'], self)
+        self.export_action.setShortcut("Ctrl+E")
+        self.file_menu.addAction(self.export_action)
+
+        # 가져오기 메뉴 아이템
+        self.import_action = QAction(lang_res.base_labels['IMPORT'], self)
+        self.import_action.setShortcut("Ctrl+I")
+        self.file_menu.addAction(self.import_action)
 
         # 종료 메뉴 아이템
         self.exit_action = QAction(lang_res.base_labels['EXIT'], self)
         self.exit_action.setShortcut("Ctrl+Q")
-        file_menu.addAction(self.exit_action)
+        self.file_menu.addAction(self.exit_action)
+
+    def on_settings_changed(self, key: str, old_value: Any, new_value: Any) -> None:
+        """
+        설정 변경 알림 처리 (언어가 바뀌면 레이블 갱신)
+
+        Args:
+            key: 변경된 설정 키
+            old_value: 이전 설정 값
+            new_value: 새 설정 값
+        """
+        if key == SET_LANGUAGE and old_value != new_value:
+            self.retranslate_ui()
+
+    def retranslate_ui(self) -> None:
+        """현재 활성 언어로 메뉴와 버튼 레이블을 다시 설정"""
+        self.file_menu.setTitle(lang_res.base_labels['FILE'])
+        self.settings_action.setText(lang_res.base_labels['SETTINGS'])
+        self.track_action.setText(lang_res.base_labels['LOGS'])
+        self.category_action.setText(lang_res.base_labels['CATEGORY'])
+        self.stats_action.setText(lang_res.base_labels['STATS'])
+        self.export_action.setText(lang_res.base_labels['EXPORT'])
+        self.import_action.setText(lang_res.base_labels['IMPORT'])
+        self.exit_action.setText(lang_res.base_labels['EXIT'])
+
+        # 버튼 레이블은 현재 상태에 맞게 설정 ("X분 후 휴식" 표시 중이면 시작 버튼 문구는 유지)
+        status = self.config_ctrl.get_status()
+        if "분 후 휴식" not in self.start_button.text():
+            if status == AppStatus.WAIT:
+                self.start_button.setText(lang_res.button_labels.get('START', "START"))
+            elif status in (AppStatus.STUDY, AppStatus.PAUSED):
+                self.start_button.setText(lang_res.button_labels.get('STOP', "STOP"))
+        if status == AppStatus.PAUSED:
+            self.pause_button.setText(lang_res.button_labels.get('RESUME', "RESUME"))
+        else:
+            self.pause_button.setText(lang_res.button_labels.get('PAUSE', "PAUSE"))
+        ic(f"언어 전환 후 레이블 갱신 완료: {status}")
 
     def init_events(self) -> None:
         """이벤트 바인딩"""
@@ -197,6 +256,9 @@ class MainWindow(QMainWindow):
         self.settings_action.triggered.connect(self.on_open_settings)
         self.track_action.triggered.connect(self.on_show_track)
         self.category_action.triggered.connect(self.on_show_category)
+        self.stats_action.triggered.connect(self.on_show_stats)
+        self.export_action.triggered.connect(self.on_export_logs)
+        self.import_action.triggered.connect(self.on_import_logs)
         self.exit_action.triggered.connect(self.on_exit)
 
         # 버튼 이벤트 연결
@@ -220,9 +282,21 @@ class MainWindow(QMainWindow):
                 ic("MainController가 없어서 태그를 가져올 수 없습니다.")
                 return
 
-            # 태그 가져오기 시도
-            tags = self.main_controller.tag_service.get_tags()
+            # 태그는 작업 스레드에서 조회하고 결과가 도착하면 패널 갱신
+            self.main_controller.db_worker.submit(
+                self.main_controller.tag_service.get_tags, on_result=self.show_tag_buttons, key="main_tag_buttons"
+            )
+        except Exception as e:
+            ic(f"태그 조회 요청 중 오류 발생: {e}")
+
+    def show_tag_buttons(self, tags: list[dict] | None) -> None:
+        """
+        조회한 태그 목록으로 태그 패널을 갱신
 
+        Args:
+            tags: 태그 딕셔너리 목록
+        """
+        try:
             # 태그가 None이면 빈 리스트로 처리
             if tags is None:
                 ic("태그 서비스에서 None을 반환했습니다. 빈 리스트로 처리합니다.")
@@ -268,6 +342,8 @@ class MainWindow(QMainWindow):
 
     def on_open_settings(self) -> None:
         """설정 다이얼로그 오픈"""
+        from pacekeeper.views.settings_dialog import SettingsDialog
+
         dlg = SettingsDialog(self, self.config_ctrl)
         dlg.exec_()
 
@@ -275,12 +351,19 @@ class MainWindow(QMainWindow):
         """로그 다이얼로그 오픈"""
         # MainController의 서비스들을 LogDialog에 전달
         if self.main_controller:
-            dlg = LogDialog(
-                self,
-                self.config_ctrl,
-                self.main_controller.log_service,
-                self.main_controller.tag_service
-            )
+            from pacekeeper.views.log_dialog import LogDialog
+
+            # 쿼리 통계에서 다이얼로그 생성 중 GUI 스레드에서 실행한 문장만 묶음
+            # (다이얼로그의 조회는 DbWorker 스레드에서 실행되어 작업 key 또는 함수 이름으로 기록되고,
+            #  exec_()는 모달 대기 시간이므로 묶지 않음)
+            with query_action("LogDialog"):
+                dlg = LogDialog(
+                    self,
+                    self.config_ctrl,
+                    self.main_controller.log_service,
+                    self.main_controller.tag_service,
+                    self.main_controller.db_worker
+                )
             dlg.exec_()
         else:
             ic("MainController가 없어서 로그 다이얼로그를 열 수 없습니다.")
@@ -289,16 +372,80 @@ class MainWindow(QMainWindow):
         """카테고리 다이얼로그 오픈"""
         # MainController의 서비스들을 CategoryDialog에 전달
         if self.main_controller:
-            dlg = CategoryDialog(
-                self,
-                self.config_ctrl,
-                self.main_controller.category_service,
-                self.main_controller.tag_service
-            )
+            from pacekeeper.views.category_dialog import CategoryDialog
+
+            with query_action("CategoryDialog"):
+                dlg = CategoryDialog(
+                    self,
+                    self.config_ctrl,
+                    self.main_controller.category_service,
+                    self.main_controller.tag_service
+                )
             dlg.exec_()
         else:
             ic("MainController가 없어서 카테고리 다이얼로그를 열 수 없습니다.")
 
+    def on_show_stats(self) -> None:
+        """통계 다이얼로그 오픈"""
+        # MainController의 서비스들을 StatsDialog에 전달
+        if self.main_controller:
+            from pacekeeper.views.stats_dialog import StatsDialog
+
+            with query_action("StatsDialog"):
+                dlg = StatsDialog(
+                    self,
+                    self.config_ctrl,
+                    self.main_controller.stats_service,
+                    self.main_controller.tag_service,
+                    self.main_controller.category_service,
+                    self.main_controller.db_worker
+                )
+            dlg.exec_()
+        else:
+            ic("MainController가 없어서 통계 다이얼로그를 열 수 없습니다.")
+
+    def on_export_logs(self) -> None:
+        """로그 내보내기 (파일 선택 후 백그라운드 스레드에서 실행)"""
+        if not self.main_controller:
+            ic("MainController가 없어서 로그를 내보낼 수 없습니다.")
+            return
+        if self.export_thread is not None:
+            ic("이미 로그 내보내기가 진행 중입니다.")
+            return
+
+        from pacekeeper.views.log_export_task import start_log_export
+
+        self.export_thread = start_log_export(self, self.main_controller.log_service)
+        if self.export_thread is not None:
+            self.export_thread.finished.connect(self._on_export_finished)
+
+    def _on_export_finished(self) -> None:
+        """내보내기 스레드 종료 시 참조 해제"""
+        self.export_thread = None
+
+    def on_import_logs(self) -> None:
+        """로그 가져오기 (파일 선택 후 백그라운드 스레드에서 실행, 완료 후 최근 로그와 태그 버튼 갱신)"""
+        if not self.main_controller:
+            ic("MainController가 없어서 로그를 가져올 수 없습니다.")
+            return
+        if self.import_thread is not None:
+            ic("이미 로그 가져오기가 진행 중입니다.")
+            return
+
+        from pacekeeper.views.log_import_task import start_log_import
+
+        self.import_thread = start_log_import(self, self.main_controller.log_service, self._on_logs_imported)
+        if self.import_thread is not None:
+            self.import_thread.finished.connect(self._on_import_finished)
+
+    def _on_logs_imported(self) -> None:
+        """가져온 로그를 최근 로그 목록과 태그 버튼에 반영 (태그 버튼은 최근 로그 갱신 시 함께 갱신됨)"""
+        self.main_controller.refresh_recent_logs()
+
+    def _on_import_finished(self) -> None:
+        """가져오기 스레드 종료 시 참조 해제"""
+        self.import_thread = None
+
     def on_exit(self) -> None:
         """앱 종료 처리"""
         self.close()
@@ -521,6 +668,21 @@ class MainWindow(QMainWindow):
         try:
             ic("애플리케이션 종료 요청")
 
+            # 설정 옵저버 해제
+            self.config_ctrl.remove_settings_observer(self)
+
+            # 진행 중인 로그 내보내기 중단 (임시 파일은 서비스에서 정리)
+            if self.export_thread is not None:
+                ic("로그 내보내기 중단")
+                self.export_thread.requestInterruption()
+                self.export_thread.wait()
+
+            # 진행 중인 로그 가져오기 중단 (처리 중인 청크까지만 저장됨)
+            if self.import_thread is not None:
+                ic("로그 가져오기 중단")
+                self.import_thread.requestInterruption()
+                self.import_thread.wait()
+
             # 타이머 서비스 정리
             if hasattr(self, "main_controller") and hasattr(self.main_controller, "timer_service"):
                 ic("타이머 서비스 정리")
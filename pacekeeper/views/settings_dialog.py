@@ -34,6 +34,7 @@ from pacekeeper.consts.settings import (
     SET_TTS_ENABLE,
 )
 from pacekeeper.controllers.config_controller import ConfigController
+from pacekeeper.services.settings_schema import SETTING_RANGES
 from pacekeeper.utils.theme_manager import theme_manager
 
 
@@ -68,22 +69,22 @@ class SettingsDialog(QDialog):
 
         # 공부 시간 스핀박스
         self.study_time_spin = QSpinBox(timer_group)
-        self.study_time_spin.setRange(1, 120)
+        self.study_time_spin.setRange(*SETTING_RANGES[SET_STUDY_TIME])
         timer_form.addRow(self.lang_res.setting_labels['STUDY_TIME'], self.study_time_spin)
 
         # 짧은 휴식 시간 스핀박스
         self.short_break_spin = QSpinBox(timer_group)
-        self.short_break_spin.setRange(1, 30)
+        self.short_break_spin.setRange(*SETTING_RANGES[SET_SHORT_BREAK_TIME])
         timer_form.addRow(self.lang_res.setting_labels['SHORT_BREAK'], self.short_break_spin)
 
         # 긴 휴식 시간 스핀박스
         self.long_break_spin = QSpinBox(timer_group)
-        self.long_break_spin.setRange(1, 60)
+        self.long_break_spin.setRange(*SETTING_RANGES[SET_LONG_BREAK_TIME])
         timer_form.addRow(self.lang_res.setting_labels['LONG_BREAK'], self.long_break_spin)
 
         # 뽀모도로 사이클 스핀박스
         self.cycles_spin = QSpinBox(timer_group)
-        self.cycles_spin.setRange(1, 10)
+        self.cycles_spin.setRange(*SETTING_RANGES[SET_POMODORO_CYCLES])
         timer_form.addRow(self.lang_res.setting_labels['CYCLES'], self.cycles_spin)
 
         timer_layout.addWidget(timer_group)
@@ -110,7 +111,7 @@ class SettingsDialog(QDialog):
         volume_layout.setContentsMargins(0, 0, 0, 0)
 
         self.volume_slider = QSlider(Qt.Horizontal, volume_widget)
-        self.volume_slider.setRange(0, 100)
+        self.volume_slider.setRange(*SETTING_RANGES[SET_ALARM_VOLUME])
         self.volume_slider.setTickPosition(QSlider.TicksBelow)
         self.volume_slider.setTickInterval(10)
 
@@ -245,8 +246,7 @@ class SettingsDialog(QDialog):
         selected_lang = AVAILABLE_LANGS[self.lang_combo.currentIndex()]
         self.config_ctrl.set_setting(SET_LANGUAGE, selected_lang)
 
-        # 설정 저장
-        self.config_ctrl.save_settings()
+        # 파일 저장은 set_setting이 예약하며, 위 변경들은 한 번의 저장으로 합쳐짐
 
         # 다이얼로그 닫기
         self.accept()
@@ -0,0 +1,291 @@
+# views/stats_dialog.py
+from icecream import ic
+from PyQt5.QtCore import QRect, QSize, Qt
+from PyQt5.QtGui import QColor, QPainter
+from PyQt5.QtWidgets import (
+    QDialog,
+    QGridLayout,
+    QHBoxLayout,
+    QLabel,
+    QMessageBox,
+    QProgressBar,
+    QPushButton,
+    QScrollArea,
+    QVBoxLayout,
+    QWidget,
+)
+
+from pacekeeper.consts.labels import lang_res
+from pacekeeper.repository.stats_totals import StatsDashboard
+
+# 히트맵 칸 크기와 간격(px)
+HEATMAP_CELL_SIZE = 11
+HEATMAP_CELL_GAP = 2
+# 기록이 없는 날 / 가장 많이 집중한 날의 색상
+HEATMAP_EMPTY_COLOR = QColor("#EBEDF0")
+HEATMAP_FULL_COLOR = QColor("#216E39")
+# 막대 그래프로 표시할 최대 항목 수
+MAX_BAR_ITEMS = 10
+
+# 막대 항목 (이름, 세션 수, 집중 시간(초), 색상)
+BarItem = tuple[str, int, int, str | None]
+
+
+def format_duration(seconds: int) -> str:
+    """초를 'H:MM' 형식 문자열로 변환"""
+    hours, remainder = divmod(max(seconds, 0), 3600)
+    return f"{hours}:{remainder // 60:02d}"
+
+
+class HeatmapWidget(QWidget):
+    """
+    일별 집중 시간 히트맵 (열: 주, 행: 요일)
+
+    대시보드의 일별 배열만 읽어 그리므로 로그 수와 관계없이 그리기 비용이 일정합니다.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.dashboard: StatsDashboard | None = None
+        self.max_seconds = 0
+        self.setMinimumSize(self.sizeHint())
+
+    def set_dashboard(self, dashboard: StatsDashboard) -> None:
+        self.dashboard = dashboard
+        self.max_seconds = max(dashboard.daily_focus_seconds, default=0)
+        self.setMinimumSize(self.sizeHint())
+        self.update()
+
+    def _week_count(self) -> int:
+        if self.dashboard is None:
+            return 53
+        days = len(self.dashboard.daily_focus_seconds) + self.dashboard.start_day.weekday()
+        return max((days + 6) // 7, 1)
+
+    def sizeHint(self) -> QSize:
+        step = HEATMAP_CELL_SIZE + HEATMAP_CELL_GAP
+        return QSize(self._week_count() * step, 7 * step)
+
+    def _cell_color(self, seconds: int) -> QColor:
+        if seconds <= 0 or self.max_seconds <= 0:
+            return HEATMAP_EMPTY_COLOR
+        # 집중 시간 비율에 따라 빈 칸 색상과 최대 색상 사이를 보간
+        ratio = 0.25 + 0.75 * seconds / self.max_seconds
+        return QColor(
+            round(HEATMAP_EMPTY_COLOR.red() + (HEATMAP_FULL_COLOR.red() - HEATMAP_EMPTY_COLOR.red()) * ratio),
+            round(HEATMAP_EMPTY_COLOR.green() + (HEATMAP_FULL_COLOR.green() - HEATMAP_EMPTY_COLOR.green()) * ratio),
+            round(HEATMAP_EMPTY_COLOR.blue() + (HEATMAP_FULL_COLOR.blue() - HEATMAP_EMPTY_COLOR.blue()) * ratio),
+        )
+
+    def paintEvent(self, event):
+        if self.dashboard is None:
+            return
+        painter = QPainter(self)
+        painter.setPen(Qt.NoPen)
+        step = HEATMAP_CELL_SIZE + HEATMAP_CELL_GAP
+        # 첫 열은 시작 날짜가 속한 주의 월요일부터 시작
+        first_weekday = self.dashboard.start_day.weekday()
+        for offset, seconds in enumerate(self.dashboard.daily_focus_seconds):
+            week, weekday = divmod(offset + first_weekday, 7)
+            painter.setBrush(self._cell_color(seconds))
+            painter.drawRect(QRect(week * step, weekday * step, HEATMAP_CELL_SIZE, HEATMAP_CELL_SIZE))
+        painter.end()
+
+
+class TotalsBarPanel(QWidget):
+    """
+    태그/카테고리별 집중 시간 막대 그래프
+    """
+
+    def __init__(self, title: str, parent=None):
+        super().__init__(parent)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        self.title_label = QLabel(title)
+        font = self.title_label.font()
+        font.setBold(True)
+        self.title_label.setFont(font)
+        layout.addWidget(self.title_label)
+
+        self.grid = QGridLayout()
+        layout.addLayout(self.grid)
+        layout.addStretch()
+
+    def set_items(self, items: list[BarItem]) -> None:
+        """
+        막대 항목 설정
+
+        Args:
+            items: (이름, 세션 수, 집중 시간(초), 막대 색상 또는 None) 목록, 집중 시간 내림차순
+        """
+        while self.grid.count():
+            widget = self.grid.takeAt(0).widget()
+            if widget is not None:
+                widget.deleteLater()
+
+        max_seconds = max((seconds for _, _, seconds, _ in items), default=0)
+        for row, (name, sessions, seconds, color) in enumerate(items[:MAX_BAR_ITEMS]):
+            bar = QProgressBar()
+            bar.setTextVisible(False)
+            bar.setMaximum(max(max_seconds, 1))
+            bar.setValue(seconds)
+            bar.setFixedHeight(12)
+            if color:
+                bar.setStyleSheet(f"QProgressBar::chunk {{ background-color: {color}; }}")
+
+            self.grid.addWidget(QLabel(name), row, 0)
+            self.grid.addWidget(bar, row, 1)
+            self.grid.addWidget(QLabel(f"{format_duration(seconds)} ({sessions})"), row, 2)
+        self.grid.setColumnStretch(1, 1)
+
+
+class StatsDialog(QDialog):
+    def __init__(self, parent, config_controller, stats_service=None, tag_service=None, category_service=None,
+                 db_worker=None):
+        super().__init__(parent)
+        self.setWindowTitle(lang_res.base_labels['STATS'])
+        self.resize(800, 600)
+        self.setWindowFlags(self.windowFlags() | Qt.WindowStaysOnTopHint)
+
+        self.config = config_controller
+
+        # 서비스들이 전달되지 않으면 None으로 설정 (에러 방지)
+        self.stats_service = stats_service
+        self.tag_service = tag_service
+        self.category_service = category_service
+
+        # 대시보드 조회를 GUI 스레드 밖에서 실행할 작업자 (None이면 바로 조회)
+        self.db_worker = db_worker
+
+        self.InitUI()
+        self.load_dashboard()
+
+    def InitUI(self):
+        main_layout = QVBoxLayout(self)
+
+        # 레이블
+        title_label = QLabel(lang_res.base_labels['STATS'])
+        font = title_label.font()
+        font.setBold(True)
+        title_label.setFont(font)
+        title_label.setAlignment(Qt.AlignCenter)
+        main_layout.addWidget(title_label)
+
+        # 합계 / 연속 기록
+        summary_layout = QHBoxLayout()
+        self.total_focus_label = QLabel()
+        self.sessions_label = QLabel()
+        self.current_streak_label = QLabel()
+        self.longest_streak_label = QLabel()
+        for label in (self.total_focus_label, self.sessions_label, self.current_streak_label, self.longest_streak_label):
+            summary_layout.addWidget(label)
+        main_layout.addLayout(summary_layout)
+
+        # 일별 히트맵
+        main_layout.addWidget(QLabel(lang_res.base_labels['DAILY_HEATMAP']))
+        self.heatmap = HeatmapWidget()
+        self.heatmap_scroll = QScrollArea()
+        self.heatmap_scroll.setWidget(self.heatmap)
+        self.heatmap_scroll.setWidgetResizable(False)
+        self.heatmap_scroll.setFixedHeight(7 * (HEATMAP_CELL_SIZE + HEATMAP_CELL_GAP) + 24)
+        main_layout.addWidget(self.heatmap_scroll)
+
+        # 태그 / 카테고리별 막대 그래프
+        bars_layout = QHBoxLayout()
+        self.tag_panel = TotalsBarPanel(lang_res.base_labels['BY_TAG'])
+        self.category_panel = TotalsBarPanel(lang_res.base_labels['BY_CATEGORY'])
+        bars_layout.addWidget(self.tag_panel)
+        bars_layout.addWidget(self.category_panel)
+        main_layout.addLayout(bars_layout, 1)
+
+        # 닫기 버튼
+        close_button = QPushButton(lang_res.button_labels['CLOSE'])
+        close_button.clicked.connect(self.close)
+        main_layout.addWidget(close_button, alignment=Qt.AlignRight)
+
+    def load_dashboard(self):
+        """최근 1년 대시보드 데이터를 조회하여 화면에 표시 (작업자가 있으면 조회 중 메시지를 먼저 표시)"""
+        if not self.stats_service:
+            ic("StatsService가 없어서 통계를 조회할 수 없습니다.")
+            return
+
+        if self.db_worker is None:
+            self.show_dashboard(*self.fetch_dashboard())
+            return
+
+        self.total_focus_label.setText(lang_res.messages['LOADING'])
+        self.db_worker.submit(
+            self.fetch_dashboard,
+            on_result=self.on_dashboard_loaded, on_error=self.on_dashboard_failed, key="stats_dashboard"
+        )
+
+    def fetch_dashboard(self) -> tuple[StatsDashboard, list[BarItem], list[BarItem]]:
+        """대시보드와 막대 항목(태그/카테고리 이름 포함)을 조회 (작업자 사용 시 작업 스레드에서 실행)"""
+        dashboard = self.stats_service.get_dashboard()
+        return dashboard, self._tag_items(dashboard), self._category_items(dashboard)
+
+    def on_dashboard_loaded(self, result: tuple[StatsDashboard, list[BarItem], list[BarItem]]):
+        self.show_dashboard(*result)
+
+    def on_dashboard_failed(self, error: Exception):
+        self.total_focus_label.clear()
+        QMessageBox.critical(self, lang_res.base_labels['ERROR'], lang_res.error_messages['LOAD'].format(error))
+
+    def show_dashboard(self, dashboard: StatsDashboard, tag_items: list[BarItem], category_items: list[BarItem]):
+        """대시보드 데이터를 위젯에 반영"""
+        labels = lang_res.base_labels
+        days_format = labels['DAYS']
+        self.total_focus_label.setText(labels['TOTAL_FOCUS'] + format_duration(dashboard.focus_seconds))
+        self.sessions_label.setText(labels['SESSIONS'] + str(dashboard.sessions))
+        self.current_streak_label.setText(labels['CURRENT_STREAK'] + days_format.format(dashboard.current_streak))
+        self.longest_streak_label.setText(labels['LONGEST_STREAK'] + days_format.format(dashboard.longest_streak))
+
+        self.heatmap.set_dashboard(dashboard)
+        self.heatmap.setToolTip(f"{dashboard.start_day} ~ {dashboard.end_day}")
+
+        self.tag_panel.set_items(tag_items)
+        self.category_panel.set_items(category_items)
+
+        # 히트맵 크기가 정해진 뒤 최근 날짜(오른쪽 끝)가 보이도록 스크롤
+        self._scroll_heatmap_to_end()
+
+    def _tag_items(self, dashboard: StatsDashboard) -> list[BarItem]:
+        """상위 태그들의 이름을 한 번에 조회하여 막대 항목 생성"""
+        top_tags = dashboard.tag_totals[:MAX_BAR_ITEMS]
+        names: list[str] = []
+        if self.tag_service and top_tags:
+            try:
+                names = self.tag_service.get_tag_text([tag_id for tag_id, _, _ in top_tags])
+            except Exception as e:
+                ic(f"태그 이름 조회 중 오류 발생: {e}")
+        if len(names) != len(top_tags):
+            names = [f"#{tag_id}" for tag_id, _, _ in top_tags]
+        return [(name, sessions, seconds, None) for name, (_, sessions, seconds) in zip(names, top_tags)]
+
+    def _category_items(self, dashboard: StatsDashboard) -> list[BarItem]:
+        """카테고리 이름과 색상으로 막대 항목 생성"""
+        categories = {}
+        if self.category_service:
+            try:
+                categories = {category.id: category for category in self.category_service.get_categories()}
+            except Exception as e:
+                ic(f"카테고리 조회 중 오류 발생: {e}")
+
+        items = []
+        for category_id, sessions, seconds in dashboard.category_totals[:MAX_BAR_ITEMS]:
+            category = categories.get(category_id)
+            if category is None:
+                items.append((f"#{category_id}", sessions, seconds, None))
+            else:
+                items.append((category.name, sessions, seconds, category.color))
+        return items
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        # 히트맵은 최근 날짜(오른쪽 끝)가 보이도록 스크롤
+        self._scroll_heatmap_to_end()
+
+    def _scroll_heatmap_to_end(self):
+        scroll_bar = self.heatmap_scroll.horizontalScrollBar()
+        scroll_bar.setValue(scroll_bar.maximum())
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+# rebuild_stats.py
+# 활성 로그 전체로 daily_stats 일별 통계 테이블을 다시 계산하는 스크립트
+
+import os
+import sys
+
+# 직접 실행 시 패키지 경로 설정
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+from pacekeeper.database import DatabaseSessionManager
+from pacekeeper.repository.stats_repository import StatsRepository
+from pacekeeper.services.stats_service import StatsService
+
+
+def main():
+    """메인 함수"""
+    print("일별 통계(daily_stats) 재계산 시작...")
+
+    stats_service = StatsService(StatsRepository(DatabaseSessionManager()))
+    row_count = stats_service.rebuild_stats()
+    if row_count < 0:
+        print("일별 통계 재계산에 실패했습니다. 로그 파일을 확인하세요.")
+        sys.exit(1)
+
+    print(f"일별 통계 재계산 완료: {row_count}행")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# tests/conftest.py
+# 공통 테스트 픽스처
+#
+# 데이터베이스 경로와 설정 파일 경로는 pacekeeper 모듈 임포트 시 정해지므로,
+# 테스트 모듈이 pacekeeper를 임포트하기 전에 데이터 디렉토리를 임시 디렉토리로 지정합니다.
+
+import os
+import shutil
+import tempfile
+
+from pacekeeper.utils.app_paths import DATA_DIR_ENV
+
+_DATA_DIR = tempfile.mkdtemp(prefix="pacekeeper-tests-")
+os.environ[DATA_DIR_ENV] = _DATA_DIR
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest  # noqa: E402
+from icecream import ic  # noqa: E402
+
+from pacekeeper.database import DatabaseSessionManager, StatementBudget  # noqa: E402
+
+ic.disable()
+
+
+def pytest_unconfigure(config):
+    """테스트 종료 후 임시 데이터 디렉토리 삭제"""
+    shutil.rmtree(_DATA_DIR, ignore_errors=True)
+
+
+def reset_session_manager() -> None:
+    """DatabaseSessionManager 싱글톤을 비워 다음 생성 시 새 데이터베이스로 초기화되게 함"""
+    DatabaseSessionManager._instance = None
+    DatabaseSessionManager._initialized = False
+
+
+@pytest.fixture
+def session_manager(tmp_path):
+    """테스트마다 새 임시 파일 데이터베이스를 사용하는 DatabaseSessionManager"""
+    reset_session_manager()
+    manager = DatabaseSessionManager(database_uri=f"sqlite:///{tmp_path / 'test.db'}")
+    yield manager
+    manager.close_all_sessions()
+    reset_session_manager()
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """오프스크린 QApplication (프로세스당 하나만 생성 가능)"""
+    from PyQt5.QtWidgets import QApplication
+
+    app = QApplication.instance() or QApplication([])
+    yield app
+
+
+@pytest.fixture
+def log_service(session_manager):
+    """테스트 데이터베이스를 사용하는 LogService"""
+    from pacekeeper.repository.log_repository import LogRepository
+    from pacekeeper.repository.stats_repository import StatsRepository
+    from pacekeeper.repository.tag_repository import TagRepository
+    from pacekeeper.services.log_service import LogService
+
+    return LogService(LogRepository(session_manager), TagRepository(session_manager), StatsRepository(session_manager))
+
+
+@pytest.fixture
+def statement_budget(session_manager):
+    """
+    테스트 데이터베이스에서 블록 안의 SQL 문장 수를 제한하는 StatementBudget 생성 함수
+
+    사용 예:
+        with statement_budget(2, "LogDialog 열기"):
+            ...
+    """
+    def make(max_statements: int, label: str = "") -> StatementBudget:
+        return StatementBudget(session_manager.engine, max_statements, label)
+
+    return make
@@ -0,0 +1,103 @@
+# tests/test_daily_stats.py
+# daily_stats 증분 갱신(저장, 삭제, 일괄 가져오기) 결과가 전체 재계산 결과와 같은지 확인
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from pacekeeper.database import UnitOfWork
+from pacekeeper.repository.tag_repository import TagRepository
+
+# (태그 이름, 카테고리 ID) - "work"와 "meeting"은 같은 카테고리
+TAG_CATEGORIES = [("work", 1), ("meeting", 1), ("study", 2), ("misc", 0)]
+
+# (메시지, 시작 시각, 지속 시간(분))
+STUDY_LOGS = [
+    ("#work 보고서", datetime(2024, 6, 1, 9, 0), 25),
+    ("#work #meeting 같은 카테고리 태그 두 개", datetime(2024, 6, 1, 10, 0), 50),
+    ("#study #misc 여러 카테고리", datetime(2024, 6, 1, 23, 50), 25),
+    ("태그 없음", datetime(2024, 6, 2, 8, 0), 25),
+    ("#study 종료 시각이 시작보다 이름", datetime(2024, 6, 2, 9, 0), -5),
+    ("#work #work 중복 태그", datetime(2024, 6, 3, 9, 0), 30),
+]
+
+
+def daily_stats_rows(session_manager) -> list[tuple]:
+    """daily_stats 전체 행 (정렬)"""
+    with session_manager.engine.connect() as conn:
+        return conn.exec_driver_sql(
+            "SELECT day, tag_id, category_id, sessions, focus_seconds FROM daily_stats ORDER BY 1, 2, 3"
+        ).all()
+
+
+def rebuilt_rows(session_manager, log_service) -> list[tuple]:
+    """활성 로그 전체로 다시 계산한 daily_stats 행"""
+    log_service.stats_repo.rebuild()
+    return daily_stats_rows(session_manager)
+
+
+@pytest.fixture
+def tagged(session_manager):
+    """카테고리가 지정된 태그 생성"""
+    tag_repository = TagRepository(session_manager)
+    for name, category_id in TAG_CATEGORIES:
+        tag_repository.update_tag(tag_repository.add_tag(name).id, category_id=category_id)
+
+
+@pytest.fixture
+def study_logs(log_service, tagged):
+    """STUDY_LOGS를 create_study_log로 저장하고 ID 내림차순 로그 ID 반환"""
+    for message, started_at, minutes in STUDY_LOGS:
+        log_service.create_study_log(message, started_at, started_at + timedelta(minutes=minutes))
+    return [log.id for log in log_service.retrieve_recent_logs(len(STUDY_LOGS))]
+
+
+def test_incremental_add_matches_rebuild(session_manager, log_service, study_logs):
+    incremental = daily_stats_rows(session_manager)
+    assert incremental
+    assert incremental == rebuilt_rows(session_manager, log_service)
+
+
+def test_category_row_counts_each_log_once(session_manager, study_logs):
+    rows = {(day, tag_id, category_id): (sessions, seconds)
+            for day, tag_id, category_id, sessions, seconds in daily_stats_rows(session_manager)}
+    # "work"와 "meeting"이 같은 로그에 있어도 카테고리 1 행은 로그 수만큼만 증가
+    assert rows[("2024-06-01", 0, 1)] == (2, (25 + 50) * 60)
+    assert rows[("2024-06-01", 0, 0)] == (3, (25 + 50 + 25) * 60)
+    # 종료 시각이 시작보다 이르면 집중 시간은 0
+    assert rows[("2024-06-02", 0, 0)] == (2, 25 * 60)
+
+
+def test_incremental_remove_matches_rebuild(session_manager, log_service, study_logs):
+    # 같은 ID가 여러 번 있거나 이미 삭제된 로그를 다시 삭제해도 한 번만 뺌
+    log_service.remove_logs_by_ids([study_logs[0], study_logs[2], study_logs[2]])
+    log_service.remove_logs_by_ids([study_logs[2], study_logs[4]])
+
+    incremental = daily_stats_rows(session_manager)
+    assert incremental == rebuilt_rows(session_manager, log_service)
+    # 세션 수가 0이 된 행은 남지 않음
+    assert all(sessions > 0 for _, _, _, sessions, _ in incremental)
+
+
+def test_removing_every_log_empties_daily_stats(session_manager, log_service, study_logs):
+    log_service.remove_logs_by_ids(study_logs)
+    assert daily_stats_rows(session_manager) == []
+
+
+def test_bulk_range_add_matches_rebuild(session_manager, log_service, study_logs):
+    # 일괄 가져오기 경로 (bulk_insert_logs + add_log_range)로 기존 집계에 더함
+    base = datetime(2024, 6, 1, 12, 0)
+    with UnitOfWork() as uow:
+        tag_ids = log_service.tag_repo.ensure_tags(["work", "study"], uow.session)
+        log_ids = log_service.repository.bulk_insert_logs(
+            [
+                (f"가져온 로그 {i}", tag_ids[: i % 3], base + timedelta(hours=7 * i),
+                 base + timedelta(hours=7 * i, minutes=20))
+                for i in range(12)
+            ],
+            uow.session
+        )
+        log_service.stats_repo.add_log_range(log_ids[0], log_ids[-1], uow.session)
+
+    incremental = daily_stats_rows(session_manager)
+    assert incremental == rebuilt_rows(session_manager, log_service)
@@ -0,0 +1,185 @@
+# tests/test_di_container.py
+# DI 컨테이너의 순환 의존성 검사, 생성 계획 캐시, 지연 싱글톤 확인
+
+import threading
+
+import pytest
+
+from pacekeeper.container import CircularDependencyError, DIContainer, LazySingleton
+
+
+class Config:
+    pass
+
+
+class Repository:
+    created = 0
+
+    def __init__(self, config: Config, name="repo"):
+        Repository.created += 1
+        self.config = config
+        self.name = name
+
+    def describe(self) -> str:
+        return f"{self.name} ({type(self.config).__name__})"
+
+
+class Service:
+    def __init__(self, repository: Repository, config: Config, retries=3):
+        self.repository = repository
+        self.config = config
+        self.retries = retries
+
+
+class First:
+    def __init__(self, second: "Second"):
+        self.second = second
+
+
+class Second:
+    def __init__(self, third: "Third"):
+        self.third = third
+
+
+class Third:
+    def __init__(self, first: First):
+        self.first = first
+
+
+# 문자열 어노테이션은 해석하지 않으므로 실제 클래스로 바꿔 둠
+First.__init__.__annotations__["second"] = Second
+Second.__init__.__annotations__["third"] = Third
+
+
+class Unregistered:
+    pass
+
+
+class NeedsUnregistered:
+    def __init__(self, dependency: Unregistered):
+        self.dependency = dependency
+
+
+class OptionalUnregistered:
+    def __init__(self, dependency: Unregistered = None):
+        self.dependency = dependency
+
+
+@pytest.fixture
+def container():
+    container = DIContainer()
+    container.register_singleton(Config, Config)
+    Repository.created = 0
+    return container
+
+
+def test_transient_dependencies_are_resolved_from_cached_plan(container):
+    container.register_transient(Repository, Repository)
+    container.register_transient(Service, Service)
+
+    first = container.resolve(Service)
+    second = container.resolve(Service)
+
+    assert first is not second
+    assert first.repository is not second.repository
+    assert first.config is second.config is container.resolve(Config)
+    assert (first.retries, first.repository.name) == (3, "repo")
+    assert set(container._plans) == {Config, Repository, Service}
+
+
+def test_registering_again_invalidates_plans(container):
+    container.register_transient(Service, Service)
+    container.register_transient(Repository, Repository)
+    container.resolve(Service)
+
+    container.register_singleton(Repository, lambda: "replaced")
+
+    assert container.resolve(Service).repository == "replaced"
+
+
+def test_circular_dependency_reports_the_chain(container):
+    for cls in (First, Second, Third):
+        container.register_transient(cls, cls)
+
+    with pytest.raises(CircularDependencyError) as error:
+        container.resolve(First)
+
+    assert error.value.chain == [First, Second, Third, First]
+    assert str(error.value) == "Circular dependency: First -> Second -> Third -> First"
+    # 실패한 해결 뒤에도 컨테이너는 계속 사용할 수 있음
+    assert container._resolving == []
+    assert isinstance(error.value, ValueError)
+
+
+def test_self_dependency_through_singleton_is_detected(container):
+    container.register_singleton(First, First)
+    container.register_singleton(Second, Second)
+    container.register_singleton(Third, Third)
+
+    with pytest.raises(CircularDependencyError):
+        container.resolve(Second)
+    assert Second not in container._singletons
+
+
+def test_unregistered_dependency_without_default_is_an_error(container):
+    container.register_transient(NeedsUnregistered, NeedsUnregistered)
+    with pytest.raises(ValueError, match="dependency: Unregistered in NeedsUnregistered"):
+        container.resolve(NeedsUnregistered)
+
+    container.register_transient(OptionalUnregistered, OptionalUnregistered)
+    assert container.resolve(OptionalUnregistered).dependency is None
+
+    with pytest.raises(ValueError, match="Service not registered"):
+        container.resolve(Unregistered)
+
+
+def test_lazy_singleton_is_created_on_first_attribute_access(container):
+    container.register_singleton(Repository, Repository, lazy=True)
+
+    proxy = container.resolve(Repository)
+    assert type(proxy) is LazySingleton
+    assert isinstance(proxy, Repository)  # 생성 없이 구현 클래스로 통과
+    assert "not created" in repr(proxy)
+    assert Repository.created == 0
+
+    assert proxy.describe() == "repo (Config)"
+    assert Repository.created == 1
+    # 생성된 뒤에는 프록시 대신 실제 인스턴스를 반환
+    instance = container.resolve(Repository)
+    assert type(instance) is Repository
+    assert instance.name == "repo"
+
+    proxy.name = "renamed"
+    assert instance.name == "renamed"
+    assert Repository.created == 1
+
+
+def test_lazy_singleton_injected_into_eager_service_is_not_created(container):
+    container.register_singleton(Repository, Repository, lazy=True)
+    container.register_singleton(Service, Service)
+
+    service = container.resolve(Service)
+
+    assert Repository.created == 0
+    assert service.repository.name == "repo"
+    assert Repository.created == 1
+
+
+def test_lazy_singleton_is_created_once_across_threads(container):
+    container.register_singleton(Repository, Repository, lazy=True)
+    proxy = container.resolve(Repository)
+    start = threading.Barrier(8)
+    names = []
+
+    def touch():
+        start.wait()
+        names.append(proxy.name)
+
+    threads = [threading.Thread(target=touch) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert names == ["repo"] * 8
+    assert Repository.created == 1
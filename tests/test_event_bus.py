@@ -0,0 +1,158 @@
+# tests/test_event_bus.py
+# EventBus의 약한 참조 구독 정리, 알림 모아 전달, 여러 스레드에서의 사용 확인
+
+import gc
+import threading
+
+import pytest
+
+from pacekeeper.utils.event_bus import ANY_TOPIC, EventBus
+
+
+class Recorder:
+    """받은 알림을 기록하는 구독자"""
+
+    def __init__(self) -> None:
+        self.calls = []
+
+    def on_change(self, topic, old_value, new_value) -> None:
+        self.calls.append((topic, old_value, new_value))
+
+
+class ManualScheduler:
+    """예약된 flush를 테스트에서 직접 실행하는 scheduler"""
+
+    def __init__(self) -> None:
+        self.scheduled = []
+
+    def __call__(self, fn) -> None:
+        self.scheduled.append(fn)
+
+    def run(self) -> None:
+        scheduled, self.scheduled = self.scheduled, []
+        for fn in scheduled:
+            fn()
+
+
+@pytest.fixture
+def scheduler():
+    return ManualScheduler()
+
+
+def test_dead_subscriber_is_removed_without_unsubscribe():
+    bus = EventBus()
+    recorder = Recorder()
+    bus.subscribe("volume", recorder.on_change)
+    bus.subscribe(ANY_TOPIC, recorder.on_change)
+    assert bus.subscriber_count("volume") == 1
+
+    del recorder
+    gc.collect()
+
+    assert bus.subscriber_count("volume") == 0
+    assert bus.subscriber_count(ANY_TOPIC) == 0
+    bus.publish("volume", 1, 2)  # 사라진 구독자를 호출하지 않음
+
+
+def test_functions_are_kept_alive_and_subscribed_once():
+    bus = EventBus()
+    calls = []
+    callback = lambda topic, old, new: calls.append(new)  # noqa: E731
+    bus.subscribe("volume", callback)
+    bus.subscribe("volume", callback)
+
+    gc.collect()
+    bus.publish("volume", 1, 2)
+
+    assert calls == [2]
+
+
+def test_topic_and_any_topic_subscribers_are_called():
+    bus = EventBus()
+    volume, everything = Recorder(), Recorder()
+    bus.subscribe("volume", volume.on_change)
+    bus.subscribe(ANY_TOPIC, everything.on_change)
+
+    bus.publish("volume", 1, 2)
+    bus.publish("language", "ko", "en")
+
+    assert volume.calls == [("volume", 1, 2)]
+    assert everything.calls == [("volume", 1, 2), ("language", "ko", "en")]
+
+
+def test_batched_changes_are_coalesced_per_topic(scheduler):
+    bus = EventBus(scheduler)
+    recorder = Recorder()
+    bus.subscribe(ANY_TOPIC, recorder.on_change)
+
+    bus.publish("volume", 1, 2)
+    bus.publish("volume", 2, 3)
+    bus.publish("language", "ko", "en")
+    bus.publish("language", "en", "ko")  # 원래 값으로 돌아오면 전달하지 않음
+    assert recorder.calls == []
+    assert len(scheduler.scheduled) == 1
+
+    scheduler.run()
+
+    assert recorder.calls == [("volume", 1, 3)]
+
+
+def test_flush_delivers_pending_changes_immediately(scheduler):
+    bus = EventBus(scheduler)
+    recorder = Recorder()
+    bus.subscribe("volume", recorder.on_change)
+
+    bus.publish("volume", 1, 2)
+    bus.flush()
+    scheduler.run()  # 이미 전달했으므로 다시 전달하지 않음
+
+    assert recorder.calls == [("volume", 1, 2)]
+
+
+def test_unsubscribing_during_dispatch_is_safe():
+    bus = EventBus()
+    recorder = Recorder()
+
+    def unsubscribe_others(topic, old, new):
+        bus.unsubscribe(topic, recorder.on_change)
+
+    bus.subscribe("volume", unsubscribe_others)
+    bus.subscribe("volume", recorder.on_change)
+
+    bus.publish("volume", 1, 2)  # 전달 중인 목록은 그대로 호출
+    bus.publish("volume", 2, 3)
+
+    assert recorder.calls == [("volume", 1, 2)]
+
+
+def test_concurrent_subscribe_and_publish(scheduler):
+    bus = EventBus(scheduler)
+    received = Recorder()
+    bus.subscribe(ANY_TOPIC, received.on_change)
+    errors = []
+    start = threading.Barrier(8)
+
+    def churn(index: int) -> None:
+        try:
+            start.wait()
+            recorders = [Recorder() for _ in range(50)]
+            for i, recorder in enumerate(recorders):
+                bus.subscribe(f"topic{index}", recorder.on_change)
+                bus.publish(f"topic{index}-{i}", 0, 1)
+            for recorder in recorders:
+                bus.unsubscribe(f"topic{index}", recorder.on_change)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=churn, args=(index,)) for index in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    scheduler.run()
+
+    assert errors == []
+    assert all(bus.subscriber_count(f"topic{index}") == 0 for index in range(8))
+    # 여러 스레드에서 모은 변경이 빠짐없이 한 번씩 전달됨
+    assert len(received.calls) == 8 * 50
+    assert len(scheduler.scheduled) == 0
@@ -0,0 +1,131 @@
+# tests/test_log_export.py
+# 로그 내보내기(CSV/JSONL) 형식, 조건 적용, 다시 가져오기, 취소 시 기존 파일 유지 확인
+
+import codecs
+import csv
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from pacekeeper.database import DatabaseSessionManager, UnitOfWork
+from pacekeeper.repository.category_repository import CategoryRepository
+from pacekeeper.repository.log_filters import LogFilters
+from pacekeeper.repository.tag_repository import TagRepository
+from pacekeeper.services.log_export import EXPORT_FIELDS, ExportCancelled
+from tests.conftest import reset_session_manager
+
+# (메시지, 시작 시각, 지속 시간(분))
+STUDY_LOGS = [
+    ("#work 보고서 작성", datetime(2024, 6, 1, 9, 0), 25),
+    ("#work #study 알고리즘, \"따옴표\"", datetime(2024, 6, 2, 10, 0), 50),
+    ("태그 없음", datetime(2024, 6, 3, 8, 30), 10),
+    ("#study 삭제될 로그", datetime(2024, 6, 4, 9, 0), 25),
+]
+
+
+@pytest.fixture
+def study_logs(session_manager, log_service):
+    """카테고리가 지정된 태그와 STUDY_LOGS 저장 (마지막 로그는 삭제)"""
+    category = CategoryRepository(session_manager).create_category("업무")
+    tag_repository = TagRepository(session_manager)
+    tag_repository.update_tag(tag_repository.add_tag("work").id, category_id=category.id)
+
+    for message, started_at, minutes in STUDY_LOGS:
+        log_service.create_study_log(message, started_at, started_at + timedelta(minutes=minutes))
+    log_ids = sorted(log.id for log in log_service.retrieve_recent_logs(len(STUDY_LOGS)))
+    log_service.remove_logs_by_ids(log_ids[-1:])
+    return log_ids[:-1]
+
+
+def test_csv_export_has_bom_header_and_name_columns(log_service, study_logs, tmp_path):
+    path = tmp_path / "logs.csv"
+
+    assert log_service.export_logs(str(path), "csv") == 3
+
+    raw = path.read_bytes()
+    assert raw.startswith(codecs.BOM_UTF8)
+    with open(path, encoding="utf-8-sig", newline="") as file:
+        reader = csv.reader(file)
+        assert tuple(next(reader)) == EXPORT_FIELDS
+        rows = [dict(zip(EXPORT_FIELDS, row, strict=True)) for row in reader]
+
+    assert [int(row["id"]) for row in rows] == study_logs
+    assert rows[0] == {
+        "id": str(study_logs[0]), "started_at": "2024-06-01 09:00:00", "ended_at": "2024-06-01 09:25:00",
+        "duration_seconds": "1500", "message": "#work 보고서 작성", "tags": "work", "categories": "업무",
+    }
+    assert rows[1]["message"] == "#work #study 알고리즘, \"따옴표\""
+    assert (rows[1]["tags"], rows[1]["categories"]) == ("work study", "업무")
+    assert (rows[2]["tags"], rows[2]["categories"]) == ("", "")
+
+
+def test_jsonl_export_writes_name_lists_and_applies_filters(log_service, study_logs, tmp_path):
+    path = tmp_path / "logs.jsonl"
+
+    written = log_service.export_logs(str(path), "jsonl", LogFilters(start_date="2024-06-02", tag_keyword="STUDY"))
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert written == len(lines) == 1
+    assert json.loads(lines[0]) == {
+        "id": study_logs[1], "started_at": "2024-06-02 10:00:00", "ended_at": "2024-06-02 10:50:00",
+        "duration_seconds": 3000, "message": "#work #study 알고리즘, \"따옴표\"",
+        "tags": ["work", "study"], "categories": ["업무"],
+    }
+
+
+@pytest.mark.parametrize("export_format", ["csv", "jsonl"])
+def test_exported_file_imports_into_new_database(session_manager, log_service, study_logs, tmp_path, export_format):
+    from pacekeeper.repository.log_repository import LogRepository
+    from pacekeeper.repository.stats_repository import StatsRepository
+    from pacekeeper.services.log_service import LogService
+
+    path = tmp_path / f"logs.{export_format}"
+    log_service.export_logs(str(path), export_format)
+    expected = [(log.message, log.start_date, log.end_date) for log in log_service.retrieve_recent_logs(10)]
+    # 같은 데이터베이스로 다시 가져오면 모두 중복
+    assert log_service.import_logs(str(path)).duplicates == 3
+
+    session_manager.close_all_sessions()
+    reset_session_manager()
+    other = DatabaseSessionManager(database_uri=f"sqlite:///{tmp_path / 'other.db'}")
+    try:
+        other_service = LogService(LogRepository(other), TagRepository(other), StatsRepository(other))
+        result = other_service.import_logs(str(path))
+
+        assert (result.imported, result.skipped, result.duplicates, result.completed) == (3, 0, 0, True)
+        assert [
+            (log.message, log.start_date, log.end_date) for log in other_service.retrieve_recent_logs(10)
+        ] == expected
+    finally:
+        other.close_all_sessions()
+
+
+def test_cancel_mid_export_keeps_existing_file(session_manager, log_service, tmp_path):
+    base = datetime(2024, 6, 1, 9, 0)
+    with UnitOfWork() as uow:
+        log_service.repository.bulk_insert_logs(
+            [(f"로그 {i}", [], base + timedelta(minutes=i), None) for i in range(1500)], uow.session
+        )
+    path = tmp_path / "logs.csv"
+    path.write_text("기존 파일", encoding="utf-8")
+    progress = []
+
+    def cancel(written: int, total: int) -> None:
+        progress.append((written, total))
+        raise ExportCancelled()
+
+    assert log_service.export_logs(str(path), "csv", progress_callback=cancel) == -1
+
+    # 첫 진행 상황 보고(1000행)에서 중단
+    assert progress == [(1000, 1500)]
+    assert path.read_text(encoding="utf-8") == "기존 파일"
+    # 임시 파일도 남지 않음
+    assert not list(tmp_path.glob(".export-*"))
+
+
+def test_unknown_format_writes_nothing(log_service, tmp_path):
+    path = tmp_path / "logs.xml"
+
+    assert log_service.export_logs(str(path), "xml") == -1
+    assert not path.exists()
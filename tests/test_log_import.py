@@ -0,0 +1,117 @@
+# tests/test_log_import.py
+# 일괄 저장(bulk_insert_logs)의 ID 할당과 파일 가져오기의 중복 건너뛰기 확인
+
+import csv
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+import pacekeeper.services.log_service as log_service_module
+from pacekeeper.database import UnitOfWork
+
+CSV_ROWS = [
+    {"Description": "보고서 작성", "Start date": "2024-07-01", "Start time": "09:00:00", "Duration": "00:25:00",
+     "Tags": "work"},
+    {"Description": "#study 알고리즘", "Start date": "2024-07-01", "Start time": "10:00:00", "Duration": "00:50:00",
+     "Tags": "study, reading"},
+    {"Description": "보고서 작성", "Start date": "2024-07-01", "Start time": "09:00:00", "Duration": "00:25:00",
+     "Tags": "work"},  # 파일 안의 중복 행
+    {"Description": "시작 시간 없음", "Start date": "", "Start time": "", "Duration": "00:10:00", "Tags": ""},
+    {"Description": "정리", "Start date": "2024-07-02", "Start time": "08:30:00", "Duration": "", "Tags": ""},
+]
+
+
+def linked_tag_names(session_manager, log_id: int) -> set[str]:
+    """로그에 연결된 태그 이름"""
+    with session_manager.engine.connect() as conn:
+        return set(conn.exec_driver_sql(
+            "SELECT t.name FROM log_tags lt JOIN tags t ON t.id = lt.tag_id WHERE lt.log_id = ?", (log_id,)
+        ).scalars())
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "logs.csv"
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=list(CSV_ROWS[0]))
+        writer.writeheader()
+        writer.writerows(CSV_ROWS)
+    return str(path)
+
+
+def test_bulk_insert_returns_ids_in_input_order(session_manager, log_service):
+    log_service.create_study_log("#work 기존 로그")
+    # 마지막 행을 실제로 지워 다음 rowid가 재사용되는 경우에도 반환한 ID 범위가 맞아야 함
+    log_service.create_study_log("#work 지워질 로그")
+    with session_manager.engine.begin() as conn:
+        conn.exec_driver_sql("DELETE FROM log_tags WHERE log_id = (SELECT MAX(id) FROM pace_logs)")
+        conn.exec_driver_sql("DELETE FROM pace_logs WHERE id = (SELECT MAX(id) FROM pace_logs)")
+
+    base = datetime(2024, 7, 1, 9, 0)
+    with UnitOfWork() as uow:
+        tag_ids = log_service.tag_repo.ensure_tags(["work", "study"], uow.session)
+        new_logs = [
+            (f"일괄 로그 {i}", tag_ids[: i % 3], base + timedelta(hours=i), base + timedelta(hours=i, minutes=25))
+            for i in range(7)
+        ]
+        log_ids = log_service.repository.bulk_insert_logs(new_logs, uow.session)
+
+    assert log_ids == list(range(log_ids[0], log_ids[0] + len(new_logs)))
+    with session_manager.engine.connect() as conn:
+        rows = conn.exec_driver_sql(
+            f"SELECT id, message, tags, started_at FROM pace_logs WHERE id IN ({','.join('?' * len(log_ids))}) "
+            "ORDER BY id", tuple(log_ids)
+        ).all()
+    assert [(log_id, message, json.loads(tags), started_at) for log_id, message, tags, started_at in rows] == [
+        (log_id, message, ids, int(started_at.timestamp()))
+        for log_id, (message, ids, started_at, _) in zip(log_ids, new_logs, strict=True)
+    ]
+    # log_tags 연결도 같은 ID로 저장됨
+    assert linked_tag_names(session_manager, log_ids[2]) == {"work", "study"}
+    assert linked_tag_names(session_manager, log_ids[3]) == set()
+
+
+def test_import_skips_invalid_and_duplicate_rows(session_manager, log_service, csv_path):
+    result = log_service.import_logs(csv_path)
+
+    assert (result.imported, result.skipped, result.duplicates, result.completed) == (3, 1, 1, True)
+    logs = {log.message: log for log in log_service.retrieve_recent_logs(10)}
+    assert set(logs) == {"보고서 작성 #work", "#study 알고리즘 #reading", "정리"}
+    assert linked_tag_names(session_manager, logs["#study 알고리즘 #reading"].id) == {"study", "reading"}
+    assert logs["정리"].end_date is None
+
+
+def test_import_rerun_adds_nothing(session_manager, log_service, csv_path, monkeypatch):
+    # 청크 경계를 넘는 중복도 확인하도록 청크를 작게 설정
+    monkeypatch.setattr(log_service_module, "IMPORT_CHUNK_SIZE", 2)
+    first = log_service.import_logs(csv_path)
+    with session_manager.engine.connect() as conn:
+        stats_before = conn.exec_driver_sql("SELECT * FROM daily_stats ORDER BY 1, 2, 3").all()
+
+    second = log_service.import_logs(csv_path)
+
+    assert first.imported == 3
+    assert (second.imported, second.duplicates) == (0, 4)
+    assert len(log_service.retrieve_recent_logs(10)) == 3
+    with session_manager.engine.connect() as conn:
+        assert conn.exec_driver_sql("SELECT * FROM daily_stats ORDER BY 1, 2, 3").all() == stats_before
+
+
+def test_import_jsonl_skips_logs_already_saved_by_the_app(session_manager, log_service, tmp_path):
+    started_at = datetime(2024, 7, 3, 9, 0)
+    log_service.create_study_log("#work 앱에서 저장", started_at, started_at + timedelta(minutes=25))
+
+    path = tmp_path / "logs.jsonl"
+    path.write_text(
+        "\n".join([
+            json.dumps({"message": "#work 앱에서 저장", "start_date": "2024-07-03 09:00:00",
+                        "end_date": "2024-07-03 09:25:00"}, ensure_ascii=False),
+            "잘못된 줄",
+            json.dumps({"message": "#work 새 로그", "start_date": "2024-07-03 10:00:00"}, ensure_ascii=False),
+        ]),
+        encoding="utf-8"
+    )
+    result = log_service.import_logs(str(path))
+
+    assert (result.imported, result.skipped, result.duplicates) == (1, 1, 1)
@@ -0,0 +1,50 @@
+# tests/test_log_service.py
+# LogService의 로그 저장 트랜잭션 확인
+
+from datetime import datetime
+
+
+def table_counts(session_manager) -> dict[str, int]:
+    """로그 저장에 관련된 테이블의 행 수"""
+    with session_manager.engine.connect() as conn:
+        return {
+            table: conn.exec_driver_sql(f"SELECT COUNT(*) FROM {table}").scalar()
+            for table in ("pace_logs", "tags", "log_tags", "daily_stats")
+        }
+
+
+def test_create_study_log_saves_log_tags_and_stats(session_manager, log_service):
+    started_at = datetime(2024, 5, 1, 9, 0)
+    log_service.create_study_log("#work #study #work 회의", started_at, datetime(2024, 5, 1, 9, 25))
+
+    (log,) = log_service.retrieve_recent_logs(10)
+    with session_manager.engine.connect() as conn:
+        tag_ids = [
+            conn.exec_driver_sql("SELECT id FROM tags WHERE name = ?", (name,)).scalar() for name in ("work", "study")
+        ]
+        links = conn.exec_driver_sql("SELECT tag_id FROM log_tags WHERE log_id = ?", (log.id,)).scalars().all()
+        total = conn.exec_driver_sql(
+            "SELECT sessions, focus_seconds FROM daily_stats WHERE day = '2024-05-01' AND tag_id = 0 AND category_id = 0"
+        ).one()
+    # 메시지의 중복 태그는 한 번만 저장
+    assert log.tags == f"[{tag_ids[0]}, {tag_ids[1]}]"
+    assert log.start_date == "2024-05-01 09:00:00"
+    assert sorted(links) == sorted(tag_ids)
+    assert tuple(total) == (1, 25 * 60)
+
+
+def test_create_study_log_reuses_existing_tags(session_manager, log_service):
+    log_service.create_study_log("#work 첫 번째")
+    log_service.create_study_log("#work 두 번째")
+    assert table_counts(session_manager)["tags"] == 1
+
+
+def test_create_study_log_rolls_back_when_stats_update_fails(session_manager, log_service, monkeypatch):
+    def fail(log_ids, session):
+        raise RuntimeError("stats update failed")
+
+    monkeypatch.setattr(log_service.stats_repo, "add_logs", fail)
+    log_service.create_study_log("#work 실패하는 저장")
+
+    # 태그 생성과 로그 저장도 함께 롤백됨
+    assert table_counts(session_manager) == {"pace_logs": 0, "tags": 0, "log_tags": 0, "daily_stats": 0}
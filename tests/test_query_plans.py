@@ -0,0 +1,140 @@
+# tests/test_query_plans.py
+# 저장소 조회 쿼리가 인덱스를 사용하는지 EXPLAIN QUERY PLAN으로 확인
+#
+# 저장소 메서드를 실제로 호출하여 실행된 SELECT 문장을 모은 뒤 같은 파라미터로 실행 계획을 조회합니다.
+# 계획은 ANALYZE 통계가 없는 상태(새 데이터베이스)에서 확인합니다. 통계가 있으면 거의 모든 로그가
+# 활성인 경우 LIMIT 조회에 rowid 역순 스캔을 고를 수 있으며, 이때도 읽는 행 수는 LIMIT과 같습니다.
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+
+from pacekeeper.repository.log_filters import LogFilters
+from pacekeeper.repository.log_repository import LogRepository
+from pacekeeper.repository.tag_repository import TagRepository
+
+LOG_COUNT = 500
+
+
+@pytest.fixture
+def repositories(session_manager):
+    """태그 몇 개와 로그 LOG_COUNT개가 들어 있는 (로그 저장소, 태그 저장소)"""
+    log_repository = LogRepository(session_manager)
+    tag_repository = TagRepository(session_manager)
+    tag_ids = [tag_repository.add_tag(name).id for name in ("work", "study", "Reading")]
+
+    base = datetime(2024, 1, 1, 9, 0)
+    with session_manager.session_scope() as session:
+        log_ids = log_repository.bulk_insert_logs(
+            [
+                (f"log {i}", tag_ids[: i % 4], base + timedelta(hours=i), base + timedelta(hours=i, minutes=25))
+                for i in range(LOG_COUNT)
+            ],
+            session
+        )
+    log_repository.soft_delete_logs(log_ids[::10])
+    return log_repository, tag_repository
+
+
+def query_plans(session_manager, call) -> list[list[str]]:
+    """
+    call을 실행하는 동안 실행된 SELECT 문장별 실행 계획 반환
+
+    Args:
+        session_manager: 테스트 데이터베이스의 세션 관리자
+        call: 저장소 메서드를 호출하는 함수
+
+    Returns:
+        SELECT 문장별 EXPLAIN QUERY PLAN detail 목록
+    """
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(session_manager.engine, "before_cursor_execute", capture)
+    try:
+        call()
+    finally:
+        event.remove(session_manager.engine, "before_cursor_execute", capture)
+
+    assert statements, "SELECT 문장이 실행되지 않음"
+    with session_manager.engine.connect() as conn:
+        return [
+            [row[3] for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)]
+            for statement, parameters in statements
+        ]
+
+
+def assert_uses_indexes(plans: list[list[str]], *index_prefixes: str) -> None:
+    """모든 문장이 pace_logs 전체 스캔 없이 실행되고, 주어진 인덱스를 각각 한 번 이상 사용하는지 확인"""
+    details = [detail for plan in plans for detail in plan]
+    assert "SCAN pace_logs" not in details, details
+    for prefix in index_prefixes:
+        assert any(f"USING INDEX {prefix}" in d or f"USING COVERING INDEX {prefix}" in d for d in details), details
+
+
+def test_recent_logs_use_active_id_index(session_manager, repositories):
+    log_repository, _ = repositories
+    plans = query_plans(session_manager, lambda: log_repository.get_recent_logs(20))
+    assert_uses_indexes(plans, "ix_pace_logs_state_id")
+
+
+def test_logs_by_period_use_active_started_at_index(session_manager, repositories):
+    log_repository, _ = repositories
+    plans = query_plans(session_manager, lambda: log_repository.get_logs_by_period("2024-01-03", "2024-01-05"))
+    assert_uses_indexes(plans, "ix_pace_logs_state_started_at")
+
+
+def test_logs_page_uses_active_id_index(session_manager, repositories):
+    log_repository, _ = repositories
+    plans = query_plans(session_manager, lambda: log_repository.get_logs_page(after_id=LOG_COUNT // 2, page_size=50))
+    assert_uses_indexes(plans, "ix_pace_logs_state_id")
+
+
+def test_logs_page_with_period_uses_active_started_at_index(session_manager, repositories):
+    log_repository, _ = repositories
+    filters = LogFilters(start_date="2024-01-03", end_date="2024-01-05")
+    plans = query_plans(session_manager, lambda: log_repository.get_logs_page(filters, page_size=50))
+    assert_uses_indexes(plans, "ix_pace_logs_state_")
+
+
+def test_logs_by_tag_use_tag_indexes(session_manager, repositories):
+    log_repository, _ = repositories
+    plans = query_plans(session_manager, lambda: log_repository.get_logs_by_tag("work"))
+    assert_uses_indexes(plans, "ix_tags_lower_name", "ix_log_tags_tag_id_log_id")
+
+
+def test_logs_page_with_tag_uses_tag_indexes(session_manager, repositories):
+    log_repository, _ = repositories
+    plans = query_plans(
+        session_manager, lambda: log_repository.get_logs_page(LogFilters(tag_keyword="reading"), page_size=50)
+    )
+    assert_uses_indexes(plans, "ix_tags_lower_name", "ix_log_tags_tag_id_log_id")
+
+
+def test_tag_keyword_matches_whole_name_ignoring_case(repositories):
+    log_repository, _ = repositories
+    assert log_repository.get_logs_by_tag("READING")
+    assert log_repository.get_logs_by_tag("read") == []
+
+
+def test_tag_name_lookup_uses_name_state_index(session_manager, repositories):
+    _, tag_repository = repositories
+    plans = query_plans(session_manager, lambda: tag_repository.add_tag("study"))
+    assert_uses_indexes(plans, "ix_tags_name_state")
+
+
+def test_active_tag_ids_lookup_uses_name_index(session_manager, repositories):
+    _, tag_repository = repositories
+
+    def ensure_tags():
+        with session_manager.session_scope() as session:
+            tag_repository.ensure_tags(["work", "study"], session)
+
+    plans = query_plans(session_manager, ensure_tags)
+    details = [detail for plan in plans for detail in plan]
+    assert any("ix_tags_name_state" in d or "uq_tags_name_active" in d for d in details), details
+    assert "SCAN tags" not in details, details
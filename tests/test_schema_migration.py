@@ -0,0 +1,187 @@
+# tests/test_schema_migration.py
+# 기준 버전(user_version 0) 형태의 데이터베이스를 열었을 때 스키마 마이그레이션 결과 확인
+
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+from pacekeeper.database import DatabaseSessionManager
+from pacekeeper.database.schema_migration import LOG_FTS_TABLE
+from tests.conftest import reset_session_manager
+
+# 인덱스, log_tags, epoch 컬럼이 없던 기준 버전의 스키마
+BASELINE_SCHEMA = """
+CREATE TABLE categories (
+    id INTEGER NOT NULL PRIMARY KEY,
+    name VARCHAR(16) NOT NULL,
+    description TEXT NOT NULL,
+    color VARCHAR(7) NOT NULL,
+    state SMALLINT
+);
+CREATE TABLE tags (
+    id INTEGER NOT NULL PRIMARY KEY,
+    name VARCHAR(16) NOT NULL,
+    description TEXT,
+    category_id INTEGER NOT NULL,
+    state SMALLINT
+);
+CREATE TABLE pace_logs (
+    id INTEGER NOT NULL PRIMARY KEY,
+    message TEXT NOT NULL,
+    tags TEXT NOT NULL,
+    start_date VARCHAR NOT NULL,
+    end_date VARCHAR,
+    state SMALLINT
+);
+"""
+
+CATEGORIES = [
+    (1, "업무", "", "#FF0000", 1),
+    (2, "공부", "", "#00FF00", 1),
+]
+
+# (id, name, category_id, state) - "work"는 활성 중복, "old"는 삭제된 태그와 활성 태그가 같은 이름
+TAGS = [
+    (1, "work", 1, 1),
+    (2, "study", 2, 1),
+    (3, "work", 1, 1),
+    (4, "old", 0, 0),
+    (5, "old", 0, 1),
+]
+
+# (id, message, tags JSON, start_date, end_date, state)
+LOGS = [
+    (1, "#work 보고서", "[1]", "2024-03-01 09:00:00", "2024-03-01 09:25:00", 1),
+    (2, "#work #study 정리", "[1, 2]", "2024-03-01 10:00:00", "2024-03-01 10:50:00", 1),
+    (3, "#work 중복 태그", "[3]", "2024-03-02 23:30:00", "2024-03-02 23:55:00", 1),
+    (4, "삭제된 로그", "[2]", "2024-03-02 08:00:00", "2024-03-02 08:25:00", 0),
+    (5, "종료 시간 없음", "[2, 2]", "2024-03-03 07:00:00", None, 1),
+    (6, "태그 없음", "", "2024-03-03 12:00:00", "2024-03-03 12:25:00", 1),
+    (7, "잘못된 태그", "not json", "2024-03-04 12:00:00", "2024-03-04 12:10:00", 1),
+]
+
+
+def local_epoch(value: str | None) -> int | None:
+    """로컬 시간 문자열을 epoch 초로 변환"""
+    if value is None:
+        return None
+    return int(datetime.strptime(value, "%Y-%m-%d %H:%M:%S").timestamp())
+
+
+@pytest.fixture
+def migrated_db(tmp_path):
+    """기준 버전 형태로 만든 데이터베이스를 DatabaseSessionManager로 열어 마이그레이션한 뒤 sqlite3 연결 반환"""
+    path = tmp_path / "baseline.db"
+    conn = sqlite3.connect(path)
+    conn.executescript(BASELINE_SCHEMA)
+    conn.executemany("INSERT INTO categories VALUES (?, ?, ?, ?, ?)", CATEGORIES)
+    conn.executemany("INSERT INTO tags (id, name, description, category_id, state) VALUES (?, ?, '', ?, ?)", TAGS)
+    conn.executemany("INSERT INTO pace_logs VALUES (?, ?, ?, ?, ?, ?)", LOGS)
+    conn.commit()
+    conn.close()
+
+    reset_session_manager()
+    manager = DatabaseSessionManager(database_uri=f"sqlite:///{path}")
+    manager.close_all_sessions()
+    reset_session_manager()
+
+    conn = sqlite3.connect(path)
+    yield conn
+    conn.close()
+
+
+def test_all_steps_are_recorded_in_user_version(migrated_db):
+    version = migrated_db.execute("PRAGMA user_version").fetchone()[0]
+    assert version == 6
+
+
+def test_log_tags_are_backfilled_from_tags_json(migrated_db):
+    links = set(migrated_db.execute("SELECT log_id, tag_id FROM log_tags"))
+    # 잘못된 JSON과 빈 문자열은 건너뛰고, 같은 태그가 두 번 있어도 한 번만 연결
+    assert links == {(1, 1), (2, 1), (2, 2), (3, 3), (4, 2), (5, 2)}
+
+
+def test_epoch_columns_are_backfilled_from_local_time_strings(migrated_db):
+    rows = migrated_db.execute("SELECT id, started_at, ended_at FROM pace_logs ORDER BY id").fetchall()
+    expected = [(log_id, local_epoch(start), local_epoch(end)) for log_id, _, _, start, end, _ in LOGS]
+    assert rows == expected
+
+
+def test_legacy_start_date_index_is_replaced_by_partial_indexes(migrated_db):
+    indexes = dict(migrated_db.execute("SELECT name, sql FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL"))
+    assert "ix_pace_logs_state_start_date" not in indexes
+    assert "WHERE state >= 1" in indexes["ix_pace_logs_state_started_at"]
+    assert "WHERE state >= 1" in indexes["ix_pace_logs_state_id"]
+
+
+def test_fts_index_contains_existing_messages(migrated_db):
+    has_fts = migrated_db.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (LOG_FTS_TABLE,)
+    ).fetchone()
+    if not has_fts:
+        pytest.skip("SQLite에 FTS5 trigram 토크나이저가 없음")
+    rows = migrated_db.execute(f"SELECT rowid FROM {LOG_FTS_TABLE} WHERE {LOG_FTS_TABLE} MATCH '보고서'").fetchall()
+    assert rows == [(1,)]
+
+
+def test_migration_is_not_repeated_on_reopen(migrated_db, tmp_path):
+    migrated_db.execute("DELETE FROM log_tags")
+    migrated_db.commit()
+
+    reset_session_manager()
+    DatabaseSessionManager(database_uri=f"sqlite:///{tmp_path / 'baseline.db'}").close_all_sessions()
+    reset_session_manager()
+
+    assert migrated_db.execute("SELECT COUNT(*) FROM log_tags").fetchone()[0] == 0
+
+
+
+def test_duplicate_active_tags_keep_the_oldest(migrated_db):
+    states = dict(migrated_db.execute("SELECT id, state FROM tags"))
+    # 활성 "work" 중 ID가 작은 태그만 남고, 삭제된 "old"가 있어도 활성 "old"는 유지
+    assert states == {1: 1, 2: 1, 3: 0, 4: 0, 5: 1}
+
+
+def test_active_tag_names_are_unique_after_migration(migrated_db):
+    with pytest.raises(sqlite3.IntegrityError):
+        migrated_db.execute("INSERT INTO tags (name, description, category_id, state) VALUES ('work', '', 0, 1)")
+    # 삭제된 태그와 같은 이름은 허용
+    migrated_db.execute("INSERT INTO tags (name, description, category_id, state) VALUES ('work', '', 0, 0)")
+
+
+def test_ensure_tags_reuses_the_kept_tag_and_creates_missing_ones(migrated_db, tmp_path):
+    from pacekeeper.repository.tag_repository import TagRepository
+
+    reset_session_manager()
+    manager = DatabaseSessionManager(database_uri=f"sqlite:///{tmp_path / 'baseline.db'}")
+    try:
+        with manager.session_scope() as session:
+            tag_ids = TagRepository(manager).ensure_tags(["work", "new", "work", "old"], session)
+    finally:
+        manager.close_all_sessions()
+        reset_session_manager()
+
+    new_id = migrated_db.execute("SELECT id FROM tags WHERE name = 'new' AND state >= 1").fetchone()[0]
+    assert tag_ids == [1, new_id, 5]
+
+
+def test_daily_stats_backfill_matches_incremental_add(migrated_db, tmp_path):
+    from pacekeeper.repository.stats_repository import StatsRepository
+
+    query = "SELECT day, tag_id, category_id, sessions, focus_seconds FROM daily_stats ORDER BY 1, 2, 3"
+    migrated = migrated_db.execute(query).fetchall()
+    assert migrated
+
+    # 비운 테이블에 모든 로그를 증분 경로로 더한 결과와 비교 (삭제된 로그는 건너뜀)
+    reset_session_manager()
+    manager = DatabaseSessionManager(database_uri=f"sqlite:///{tmp_path / 'baseline.db'}")
+    try:
+        with manager.session_scope() as session:
+            session.connection().exec_driver_sql("DELETE FROM daily_stats")
+            StatsRepository(manager).add_logs([log[0] for log in LOGS], session)
+    finally:
+        manager.close_all_sessions()
+        reset_session_manager()
+
+    assert migrated_db.execute(query).fetchall() == migrated
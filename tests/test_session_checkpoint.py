@@ -0,0 +1,263 @@
+# tests/test_session_checkpoint.py
+# 학습 세션 체크포인트의 남은 시간 계산, 파일 저장/로드, 다음 실행에서의 복구(이어서/저장/버리기) 확인
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from pacekeeper.controllers.config_controller import ConfigController
+from pacekeeper.controllers.main_controller import (
+    RECOVER_DISCARD,
+    RECOVER_RESUME,
+    RECOVER_SAVE,
+    MainController,
+)
+from pacekeeper.controllers.timer_controller import TimerService
+from pacekeeper.services.app_state_manager import AppStateManager, AppStatus
+from pacekeeper.services.session_checkpoint import CHECKPOINT_VERSION, SessionCheckpoint, SessionCheckpointStore
+from pacekeeper.services.settings_manager import SettingsManager
+from pacekeeper.utils.app_paths import DATA_DIR_ENV
+
+STARTED_AT = datetime(2024, 6, 1, 9, 0)
+SAVED_AT = datetime(2024, 6, 1, 9, 10)
+NOW = datetime(2024, 6, 1, 9, 12)
+
+
+def running_checkpoint(message: str = "#work 보고서", remaining_seconds: int = 900) -> SessionCheckpoint:
+    """SAVED_AT에 남은 시간이 remaining_seconds인 실행 중 체크포인트"""
+    return SessionCheckpoint(
+        status="STUDY",
+        started_at=STARTED_AT,
+        ends_at=SAVED_AT + timedelta(seconds=remaining_seconds),
+        remaining_seconds=remaining_seconds,
+        cycle=3,
+        message=message,
+        saved_at=SAVED_AT,
+    )
+
+
+def paused_checkpoint() -> SessionCheckpoint:
+    """SAVED_AT에 일시정지된 체크포인트"""
+    return SessionCheckpoint(
+        status="PAUSED", started_at=STARTED_AT, ends_at=None, remaining_seconds=900, cycle=2,
+        message="#study 정리", saved_at=SAVED_AT,
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SessionCheckpointStore(str(tmp_path / "session.json"))
+
+
+def test_remaining_time_follows_deadline_unless_paused():
+    checkpoint = running_checkpoint()
+
+    assert checkpoint.remaining_at(SAVED_AT) == 900
+    assert checkpoint.remaining_at(NOW) == 780
+    assert checkpoint.remaining_at(NOW + timedelta(hours=1)) == 0
+    assert paused_checkpoint().remaining_at(NOW + timedelta(hours=1)) == 900
+
+
+def test_focus_end_is_capped_at_deadline_or_saved_time():
+    checkpoint = running_checkpoint()
+
+    assert checkpoint.focus_ended_at(NOW) == NOW
+    assert checkpoint.focus_ended_at(NOW + timedelta(hours=1)) == checkpoint.ends_at
+    assert paused_checkpoint().focus_ended_at(NOW) == SAVED_AT
+
+
+@pytest.mark.parametrize("checkpoint", [running_checkpoint(), paused_checkpoint()], ids=["running", "paused"])
+def test_dict_round_trip(checkpoint):
+    values = checkpoint.to_dict()
+
+    assert values["version"] == CHECKPOINT_VERSION
+    assert values["started_at"] == "2024-06-01T09:00:00"
+    assert json.loads(json.dumps(values)) == values
+    assert SessionCheckpoint.from_dict(values) == checkpoint
+
+
+def test_create_sets_deadline_from_remaining_time():
+    running = SessionCheckpoint.create("STUDY", STARTED_AT, 600, paused=False, cycle=1, message="")
+    paused = SessionCheckpoint.create("PAUSED", STARTED_AT, 600, paused=True, cycle=1, message="")
+
+    assert running.ends_at - running.saved_at == timedelta(seconds=600)
+    assert running.saved_at.microsecond == 0
+    assert paused.is_paused and paused.remaining_seconds == 600
+
+
+@pytest.mark.parametrize("values", [
+    None,
+    [],
+    "session",
+    {**running_checkpoint().to_dict(), "version": CHECKPOINT_VERSION + 1},
+    {key: value for key, value in running_checkpoint().to_dict().items() if key != "started_at"},
+    {**running_checkpoint().to_dict(), "cycle": None},
+    {**running_checkpoint().to_dict(), "saved_at": "어제"},
+])
+def test_from_dict_rejects_invalid_values(values):
+    with pytest.raises(ValueError):
+        SessionCheckpoint.from_dict(values)
+
+
+def test_store_save_load_and_clear(store):
+    assert store.load() is None
+
+    assert store.save(running_checkpoint())
+    assert store.load() == running_checkpoint()
+
+    store.clear()
+    assert store.load() is None
+    store.clear()  # 파일이 없어도 오류 없음
+
+
+@pytest.mark.parametrize("content", [
+    "null",
+    "[]",
+    "{\"version\": 1",
+    json.dumps({**running_checkpoint().to_dict(), "version": 0}),
+])
+def test_store_deletes_unreadable_file(store, tmp_path, content):
+    path = tmp_path / "session.json"
+    path.write_text(content, encoding="utf-8")
+
+    assert store.load() is None
+    assert not path.exists()
+
+
+class FakeInputPanel:
+    def __init__(self) -> None:
+        self.value = ""
+
+    def get_value(self) -> str:
+        return self.value
+
+    def set_value(self, value: str) -> None:
+        self.value = value
+
+
+class FakeMainWindow:
+    """MainController가 복구 중에 사용하는 부분만 가진 메인 윈도우"""
+
+    def __init__(self) -> None:
+        self.log_input_panel = FakeInputPanel()
+        self.button_states = []
+
+    def toggle_buttons(self, status: AppStatus) -> None:
+        self.button_states.append(status)
+
+
+class FakeDbWorker:
+    """제출된 작업을 실행하지 않고 기록만 하는 작업자"""
+
+    def __init__(self) -> None:
+        self.submitted = []
+
+    def submit(self, fn, *args, on_result=None, on_error=None, key=None, **kwargs) -> int:
+        self.submitted.append((fn, args, kwargs))
+        return len(self.submitted)
+
+
+class FakeLogService:
+    def create_study_log(self, message, study_start_time=None, ended_at=None) -> None:
+        pass
+
+    def retrieve_recent_logs(self, limit: int = 20) -> list:
+        return []
+
+
+class Recovery:
+    """테스트용 MainController와 그 의존성 묶음"""
+
+    def __init__(self, controller: MainController, store: SessionCheckpointStore) -> None:
+        self.controller = controller
+        self.store = store
+        self.choice = RECOVER_DISCARD
+
+    @property
+    def config(self) -> ConfigController:
+        return self.controller.config_ctrl
+
+    def run(self, checkpoint: SessionCheckpoint, choice: str, now: datetime = NOW) -> None:
+        """체크포인트를 남긴 뒤 사용자가 choice를 선택한 것으로 복구 실행"""
+        self.store.save(checkpoint)
+        self.choice = choice
+        self.controller.recover_session(now)
+
+
+@pytest.fixture
+def recovery(qapp, tmp_path, monkeypatch, store):
+    monkeypatch.setenv(DATA_DIR_ENV, str(tmp_path))
+    config = ConfigController(SettingsManager(scheduler=None), AppStateManager(store, scheduler=None))
+    holder = {}
+    # 대화상자 대신 테스트가 정한 선택을 반환
+    monkeypatch.setattr(MainController, "_ask_recovery_choice", lambda self, checkpoint, remaining: holder["r"].choice)
+    timer = TimerService(config, update_callback=lambda text: None)
+    controller = MainController(
+        FakeMainWindow(), config, None, None, FakeLogService(), None, timer, None, FakeDbWorker()
+    )
+    holder["r"] = Recovery(controller, store)
+    # 생성자가 예약한 복구는 체크포인트가 없는 지금 실행되어 아무것도 하지 않음
+    qapp.processEvents()
+    yield holder["r"]
+    timer.stop()
+
+
+def test_resume_restarts_timer_with_remaining_time(recovery):
+    recovery.run(running_checkpoint(), RECOVER_RESUME)
+
+    controller = recovery.controller
+    assert controller.timer_service.is_running()
+    assert 779 <= controller.timer_service.remaining_seconds <= 780
+    assert (controller.study_start_time, controller.study_active) == (STARTED_AT, True)
+    assert controller.main_window.log_input_panel.value == "#work 보고서"
+    assert (recovery.config.get_status(), recovery.config.get_cycle()) == (AppStatus.STUDY, 3)
+    # 이어서 진행하는 동안 체크포인트는 그대로 유효
+    assert recovery.store.load() == running_checkpoint()
+
+
+def test_resume_paused_session_stays_paused(recovery):
+    recovery.run(paused_checkpoint(), RECOVER_RESUME)
+
+    controller = recovery.controller
+    assert controller.paused and controller.timer_service.paused
+    assert controller.timer_service.remaining_seconds == 900
+    assert recovery.config.get_status() == AppStatus.PAUSED
+    assert controller.main_window.button_states[-1] == AppStatus.PAUSED
+
+
+def test_save_logs_partial_session_and_clears_checkpoint(recovery):
+    recovery.run(running_checkpoint(), RECOVER_SAVE)
+
+    controller = recovery.controller
+    (fn, args, kwargs), = [job for job in controller.db_worker.submitted if job[0].__name__ == "create_study_log"]
+    assert args == ("#work 보고서",)
+    assert kwargs == {"study_start_time": STARTED_AT, "ended_at": NOW}
+    assert not controller.timer_service.is_running()
+    assert (recovery.config.get_status(), recovery.config.get_cycle()) == (AppStatus.WAIT, 3)
+    assert recovery.store.load() is None
+
+
+def test_discard_clears_checkpoint_without_logging(recovery):
+    recovery.run(running_checkpoint(), RECOVER_DISCARD)
+
+    controller = recovery.controller
+    assert all(job[0].__name__ != "create_study_log" for job in controller.db_worker.submitted)
+    assert not controller.timer_service.is_running()
+    assert recovery.store.load() is None
+
+
+def test_expired_session_cannot_be_resumed(recovery):
+    recovery.run(running_checkpoint(), RECOVER_RESUME, now=NOW + timedelta(hours=1))
+
+    assert not recovery.controller.timer_service.is_running()
+    assert recovery.store.load() is None
+
+
+def test_running_timer_is_not_interrupted(recovery):
+    recovery.controller.timer_service.start(60)
+
+    recovery.run(running_checkpoint(), RECOVER_DISCARD)
+
+    assert recovery.controller.timer_service.is_running()
+    assert recovery.store.load() == running_checkpoint()
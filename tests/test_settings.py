@@ -0,0 +1,116 @@
+# tests/test_settings.py
+# 설정 스키마의 이전 키 마이그레이션과 유효성 검사 확인
+
+import json
+
+import pytest
+
+from pacekeeper.consts.settings import DEFAULT_SETTINGS
+from pacekeeper.services.settings_manager import SettingsManager
+from pacekeeper.services.settings_schema import SETTING_KEYS, Settings
+from pacekeeper.utils.app_paths import DATA_DIR_ENV
+
+
+@pytest.fixture
+def config_dir(tmp_path, monkeypatch):
+    """설정 파일을 테스트마다 새 임시 디렉토리에 둠"""
+    monkeypatch.setenv(DATA_DIR_ENV, str(tmp_path))
+    return tmp_path
+
+
+def write_config(config_dir, values) -> None:
+    (config_dir / "config.json").write_text(json.dumps(values), encoding="utf-8")
+
+
+def read_config(config_dir) -> dict:
+    return json.loads((config_dir / "config.json").read_text(encoding="utf-8"))
+
+
+def test_defaults_match_default_settings():
+    assert Settings().to_dict() == {key: DEFAULT_SETTINGS[key] for key in SETTING_KEYS}
+
+
+def test_legacy_keys_move_to_current_keys():
+    settings, changes = Settings.from_dict({"short_break": 7, "long_break": 20, "cycles": 3, "sound_volume": 40})
+
+    assert (settings.short_break_time, settings.long_break_time, settings.pomodoro_cycles, settings.alarm_volume) \
+        == (7, 20, 3, 40)
+    assert "short_break → short_break_time" in changes
+    assert "sound_volume → alarm_volume" in changes
+
+
+def test_current_key_wins_over_legacy_key():
+    settings, changes = Settings.from_dict({"cycles": 9, "pomodoro_cycles": 4})
+
+    assert settings.pomodoro_cycles == 4
+    assert "cycles: pomodoro_cycles 값 사용" in changes
+
+
+@pytest.mark.parametrize("key, value", [
+    ("study_time", 0),
+    ("study_time", "25"),
+    ("study_time", True),
+    ("long_break_time", 61),
+    ("sound_enable", 1),
+    ("break_color", "red"),
+    ("language", "fr"),
+])
+def test_invalid_values_fall_back_to_defaults(key, value):
+    settings, changes = Settings.from_dict({key: value})
+
+    assert getattr(settings, key) == DEFAULT_SETTINGS[key]
+    assert f"{key}: 잘못된 값 {value!r} (기본값 사용)" in changes
+
+
+def test_unknown_keys_are_dropped_and_complete_file_has_no_changes():
+    settings, changes = Settings.from_dict({"theme": "dark"})
+    assert "theme: 알 수 없는 설정" in changes
+    assert "theme" not in settings.to_dict()
+
+    _, changes = Settings.from_dict(Settings().to_dict())
+    assert changes == []
+
+
+def test_manager_rewrites_legacy_config_file(config_dir):
+    write_config(config_dir, {"study_time": 30, "short_break": 6, "cycles": 2, "unknown": 1})
+
+    manager = SettingsManager(scheduler=None)
+    assert manager.settings.short_break_time == 6
+    assert manager.get_setting("cycles") == 2  # 이전 키로도 읽을 수 있음
+    assert manager.flush()
+
+    saved = read_config(config_dir)
+    assert saved == manager.settings.to_dict()
+    assert saved["study_time"] == 30
+    assert not {"short_break", "cycles", "unknown"} & set(saved)
+
+
+def test_unreadable_config_file_uses_defaults(config_dir):
+    (config_dir / "config.json").write_text("[1, 2", encoding="utf-8")
+    assert SettingsManager(scheduler=None).settings == Settings()
+
+
+def test_set_setting_rejects_invalid_value_and_unknown_key(config_dir):
+    manager = SettingsManager(scheduler=None)
+
+    with pytest.raises(ValueError):
+        manager.set_setting("study_time", 500)
+    with pytest.raises(ValueError):
+        manager.set_setting("theme", "dark")
+    assert manager.settings.study_time == DEFAULT_SETTINGS["study_time"]
+
+    manager.set_setting("short_break", 10)
+    assert manager.settings.short_break_time == 10
+
+
+def test_update_settings_reports_errors_without_applying_anything(config_dir):
+    manager = SettingsManager(scheduler=None)
+
+    errors = manager.update_settings({"study_time": 45, "cycles": 0, "language": "fr"})
+
+    assert set(errors) == {"pomodoro_cycles", "language"}
+    assert all(errors.values())
+    assert manager.settings.study_time == DEFAULT_SETTINGS["study_time"]
+
+    assert manager.update_settings({"study_time": 45, "cycles": 4}) == {}
+    assert (manager.settings.study_time, manager.settings.pomodoro_cycles) == (45, 4)
@@ -0,0 +1,91 @@
+# tests/test_statement_budgets.py
+# 화면 갱신과 다이얼로그 열기가 실행하는 SQL 문장 수가 허용 개수를 넘지 않는지 확인
+#
+# 허용 개수는 benchmarks/bench_query_counts.py의 ACTION_BUDGETS와 같습니다.
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from pacekeeper.database import StatementBudgetExceeded, query_action
+from pacekeeper.repository.log_filters import LogFilters
+
+
+@pytest.fixture
+def tag_service(session_manager):
+    from pacekeeper.repository.tag_repository import TagRepository
+    from pacekeeper.services.tag_service import TagService
+
+    return TagService(TagRepository(session_manager))
+
+
+@pytest.fixture
+def db_worker(qapp):
+    from pacekeeper.controllers.db_worker import DbWorker
+
+    worker = DbWorker()
+    yield worker
+    worker.wait_for_done()
+    worker.deleteLater()
+
+
+@pytest.fixture
+def saved_logs(log_service):
+    """태그가 붙은 로그 30개"""
+    base = datetime.now() - timedelta(days=3)
+    for i in range(30):
+        started_at = base + timedelta(hours=i)
+        log_service.create_study_log(f"#work #topic{i % 5} 로그 {i}", started_at, started_at + timedelta(minutes=25))
+
+
+def settle(qapp, db_worker) -> None:
+    """작업 스레드의 조회와 결과 콜백이 이어서 제출한 조회까지 모두 끝날 때까지 대기"""
+    while db_worker._pending:
+        db_worker.wait_for_done()
+        qapp.processEvents()
+
+
+def test_recent_logs_with_tag_texts_within_budget(saved_logs, log_service, tag_service, statement_budget):
+    with statement_budget(3, "recent_logs"):
+        logs = log_service.retrieve_recent_logs(20)
+        tag_texts = tag_service.get_tag_texts([log.tags for log in logs])
+
+    assert len(logs) == 20
+    assert all("work" in names for names in tag_texts)
+
+
+def test_logs_page_within_budget(saved_logs, log_service, statement_budget):
+    with statement_budget(1, "retrieve_logs_page"):
+        page = log_service.retrieve_logs_page(LogFilters(tag_keyword="topic1"), None, 10)
+
+    assert len(page) == 6
+
+
+def test_log_dialog_open_within_budget(saved_logs, qapp, log_service, tag_service, db_worker, statement_budget):
+    from pacekeeper.views.log_dialog import LogDialog
+
+    # 앱에서는 메인 윈도우의 최근 로그 표시가 태그 이름 캐시를 미리 채워 둠
+    tag_service.get_tag_texts([])
+    # 다이얼로그의 조회는 DbWorker 스레드에서 실행되므로 블록 안에서 작업이 끝나기를 기다려야 셈에 포함됨
+    with statement_budget(2, "LogDialog") as budget:
+        # 메인 윈도우처럼 생성 부분만 작업 이름으로 묶음
+        with query_action("LogDialog"):
+            dialog = LogDialog(None, None, log_service, tag_service, db_worker)
+        settle(qapp, db_worker)
+
+    try:
+        # 작업 스레드의 문장은 다이얼로그 동작이 아니라 DbWorker 작업 이름으로 기록됨
+        assert "LogDialog" not in budget.actions
+        assert "TagService.get_tags" in budget.actions
+        assert dialog.log_model.rowCount() == 30
+    finally:
+        dialog.deleteLater()
+
+
+def test_exceeding_budget_lists_statements(saved_logs, log_service, statement_budget):
+    with pytest.raises(StatementBudgetExceeded, match=r"반복 조회: 2개 실행 \(허용 1개\)") as error:
+        with statement_budget(1, "반복 조회"):
+            log_service.retrieve_recent_logs(5)
+            log_service.retrieve_recent_logs(5)
+
+    assert "LogRepository.get_recent_logs" in str(error.value)
@@ -0,0 +1,133 @@
+# tests/test_stats_dashboard.py
+# 일별 집계 컬럼 배열로 계산하는 통계 대시보드(날짜별 합계, 태그/카테고리 합계, 연속 기록) 확인
+
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from pacekeeper.repository.stats_repository import StatsRepository
+from pacekeeper.repository.stats_totals import DailyStatColumns
+from pacekeeper.repository.tag_repository import TagRepository
+from pacekeeper.services.stats_aggregation import aggregate_dashboard
+from pacekeeper.services.stats_service import StatsService
+
+START = date(2024, 6, 1)
+END = date(2024, 6, 7)
+
+
+def make_columns(rows) -> DailyStatColumns:
+    """(날짜, 태그 ID, 카테고리 ID, 세션 수, 집중 시간(초)) 행으로 컬럼 배열 생성"""
+    columns = DailyStatColumns()
+    for day, tag_id, category_id, sessions, focus_seconds in rows:
+        columns.days.append(day.toordinal())
+        columns.tag_ids.append(tag_id)
+        columns.category_ids.append(category_id)
+        columns.sessions.append(sessions)
+        columns.focus_seconds.append(focus_seconds)
+    return columns
+
+
+def day_rows(sessions_per_day) -> list[tuple]:
+    """START부터 하루씩 전체 합계 행 (세션 수가 0인 날은 행 없음)"""
+    return [
+        (START + timedelta(days=offset), 0, 0, sessions, sessions * 1500)
+        for offset, sessions in enumerate(sessions_per_day)
+        if sessions
+    ]
+
+
+def test_daily_totals_fill_days_without_rows_with_zero():
+    dashboard = aggregate_dashboard(make_columns(day_rows([2, 0, 1, 0, 0, 3, 0])), START, END)
+
+    assert list(dashboard.daily_sessions) == [2, 0, 1, 0, 0, 3, 0]
+    assert list(dashboard.daily_focus_seconds) == [3000, 0, 1500, 0, 0, 4500, 0]
+    assert dashboard.sessions == 6
+
+
+@pytest.mark.parametrize("sessions_per_day, current, longest", [
+    ([1, 1, 0, 1, 1, 1, 1], 4, 4),
+    ([1, 1, 1, 0, 1, 1, 0], 2, 3),  # 오늘 기록이 없으면 어제부터 셈
+    ([1, 1, 1, 0, 1, 0, 0], 0, 3),
+    ([0, 0, 0, 0, 0, 0, 0], 0, 0),
+    ([1, 1, 1, 1, 1, 1, 1], 7, 7),
+])
+def test_current_and_longest_streak(sessions_per_day, current, longest):
+    dashboard = aggregate_dashboard(make_columns(day_rows(sessions_per_day)), START, END)
+
+    assert (dashboard.current_streak, dashboard.longest_streak) == (current, longest)
+
+
+def test_tag_and_category_totals_are_grouped_and_ordered():
+    rows = day_rows([3, 2, 0, 0, 0, 0, 0]) + [
+        # 태그 행: 집중 시간 내림차순, 같으면 세션 수 내림차순, 그다음 ID 오름차순
+        (START, 10, 1, 1, 1500),
+        (START + timedelta(days=1), 10, 1, 1, 1500),
+        (START, 20, 1, 1, 3000),
+        (START, 30, 2, 3, 3000),
+        (START, 40, 0, 1, 600),
+        (START + timedelta(days=1), 50, 0, 1, 600),
+        # 카테고리 합계 행
+        (START, 0, 1, 2, 4500),
+        (START + timedelta(days=1), 0, 1, 1, 1500),
+        (START, 0, 2, 2, 3000),
+    ]
+    dashboard = aggregate_dashboard(make_columns(rows), START, END)
+
+    assert dashboard.tag_totals == [(30, 3, 3000), (10, 2, 3000), (20, 1, 3000), (40, 1, 600), (50, 1, 600)]
+    assert dashboard.category_totals == [(1, 3, 6000), (2, 2, 3000)]
+    # 태그/카테고리 행은 날짜별 합계에 더하지 않음
+    assert list(dashboard.daily_sessions[:2]) == [3, 2]
+
+
+def test_rows_outside_window_are_ignored():
+    rows = [
+        (START - timedelta(days=1), 0, 0, 5, 7500),
+        (START - timedelta(days=1), 10, 1, 5, 7500),
+        (START - timedelta(days=1), 0, 1, 5, 7500),
+        (START, 0, 0, 1, 1500),
+        (START, 10, 1, 1, 1500),
+        (START, 0, 1, 1, 1500),
+        (END + timedelta(days=1), 0, 0, 5, 7500),
+        (END + timedelta(days=1), 10, 1, 5, 7500),
+    ]
+    dashboard = aggregate_dashboard(make_columns(rows), START, END)
+
+    assert dashboard.sessions == 1
+    assert dashboard.tag_totals == [(10, 1, 1500)]
+    assert dashboard.category_totals == [(1, 1, 1500)]
+    assert dashboard.current_streak == 0
+
+
+def test_empty_columns_and_reversed_period():
+    dashboard = aggregate_dashboard(DailyStatColumns(), START, END)
+    assert list(dashboard.daily_sessions) == [0] * 7
+    assert (dashboard.tag_totals, dashboard.category_totals, dashboard.longest_streak) == ([], [], 0)
+
+    reversed_period = aggregate_dashboard(make_columns(day_rows([1])), END, START)
+    assert len(reversed_period.daily_sessions) == 0
+
+
+def test_service_dashboard_from_saved_logs(session_manager, log_service):
+    tag_repository = TagRepository(session_manager)
+    work = tag_repository.add_tag("work")
+    study = tag_repository.add_tag("study")
+    tag_repository.update_tag(work.id, category_id=1)
+    tag_repository.update_tag(study.id, category_id=2)
+
+    for message, started_at, minutes in [
+        ("#work 보고서", datetime(2024, 6, 1, 9, 0), 25),
+        ("#work #study 정리", datetime(2024, 6, 2, 9, 0), 50),
+        ("태그 없음", datetime(2024, 6, 3, 9, 0), 25),
+        ("#study 오늘 기록 없음 전날", datetime(2024, 6, 6, 9, 0), 25),
+        ("#work 기간 밖", datetime(2024, 6, 8, 9, 0), 25),
+    ]:
+        log_service.create_study_log(message, started_at, started_at + timedelta(minutes=minutes))
+
+    dashboard = StatsService(StatsRepository(session_manager)).get_dashboard(START, END)
+
+    assert list(dashboard.daily_sessions) == [1, 1, 1, 0, 0, 1, 0]
+    assert list(dashboard.daily_focus_seconds) == [1500, 3000, 1500, 0, 0, 1500, 0]
+    # 집중 시간과 세션 수가 같으면 ID 순서 (work가 먼저 생성됨)
+    assert dashboard.tag_totals == [(work.id, 2, 4500), (study.id, 2, 4500)]
+    assert dashboard.category_totals == [(1, 2, 4500), (2, 2, 4500)]
+    assert (dashboard.current_streak, dashboard.longest_streak) == (1, 3)
@@ -0,0 +1,127 @@
+# tests/test_timer_service.py
+# TimerService가 틱 횟수가 아니라 종료 시각(deadline)으로 남은 시간을 계산하는지 확인
+#
+# 시계를 직접 움직이고 QTimer가 호출하는 _timer_tick을 직접 호출하여 늦은 틱이나 이벤트 루프 정지를 흉내 냅니다.
+
+import pytest
+
+from pacekeeper.controllers.timer_controller import TIMER_TICK_SLACK_MS, TimerService
+from pacekeeper.services.app_state_manager import AppStatus
+
+
+class FakeClock:
+    """테스트에서 직접 움직이는 monotonic 시계"""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class FakeConfig:
+    """TimerService가 사용하는 앱 상태 부분만 가진 설정 컨트롤러"""
+
+    def __init__(self) -> None:
+        self.status = AppStatus.WAIT
+        self.is_running = False
+
+    def set_status(self, status: AppStatus) -> None:
+        self.status = status
+
+    def get_status(self) -> AppStatus:
+        return self.status
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def displayed():
+    """update_callback으로 전달된 문자열 목록"""
+    return []
+
+
+@pytest.fixture
+def timer(qapp, clock, displayed):
+    service = TimerService(FakeConfig(), update_callback=displayed.append, clock=clock)
+    yield service
+    service.stop()
+
+
+def test_start_shows_full_time_and_schedules_next_second(timer, displayed):
+    timer.start(300)
+    assert displayed == ["05:00"]
+    assert timer.timer.isActive()
+    assert timer.timer.interval() == 1000 + TIMER_TICK_SLACK_MS
+
+
+def test_late_tick_jumps_to_current_remaining_time(timer, clock, displayed):
+    timer.start(300)
+    # 이벤트 루프가 137.25초 동안 멈춘 뒤 한 번의 틱이 도착
+    clock.advance(137.25)
+    timer._timer_tick()
+
+    assert displayed == ["05:00", "02:43"]
+    # 다음 틱은 표시되는 초가 바뀌는 0.75초 뒤(남은 시간 162초)로 예약
+    assert timer.timer.interval() == 750 + TIMER_TICK_SLACK_MS
+
+
+def test_tick_after_deadline_finishes_once(timer, clock, displayed):
+    finished = []
+    timer.on_finish = lambda: finished.append(clock())
+    timer.start(10)
+
+    clock.advance(25)
+    timer._timer_tick()
+    timer._timer_tick()
+
+    assert finished == [clock()]
+    assert displayed == ["00:10", "00:00"]
+    assert not timer.is_running()
+    assert not timer.timer.isActive()
+
+
+def test_pause_freezes_remaining_time_until_resume(timer, clock, displayed):
+    timer.start(60)
+    clock.advance(20)
+    timer.pause()
+
+    clock.advance(500)
+    timer._timer_tick()
+    assert timer.remaining_seconds == 40
+    assert displayed == ["01:00"]
+    assert not timer.timer.isActive()
+
+    timer.resume()
+    assert displayed == ["01:00", "00:40"]
+    clock.advance(30)
+    timer._timer_tick()
+    assert displayed[-1] == "00:10"
+    assert timer.is_running()
+
+
+def test_update_callback_only_fires_when_text_changes(timer, clock, displayed):
+    timer.start(60)
+    for _ in range(3):
+        clock.advance(0.25)
+        timer._timer_tick()
+    assert displayed == ["01:00"]
+
+    clock.advance(0.25)
+    timer._timer_tick()
+    assert displayed == ["01:00", "00:59"]
+
+
+def test_replacing_update_callback_shows_current_time_immediately(timer, clock, displayed):
+    timer.start(60)
+    clock.advance(5.5)
+
+    shown = []
+    timer.update_callback = shown.append
+    assert shown == ["00:55"]